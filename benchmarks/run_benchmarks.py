@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for the trainer's audio, calibration and listing hot paths.
+
+Every fixture is synthetic and generated into a temporary directory, so the
+suite runs offline on any CPU-only machine (numpy and PyYAML are the only
+third-party imports, the same ones the unit tests need). Results are written
+as JSON; pass a previous results file with --baseline to flag regressions.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py [--clips N] [--ambient-hours M] \
+        [--captured K] [--repeat R] [--only NAME ...] [--output results.json] \
+        [--baseline baseline.json] [--threshold 0.10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import wave
+from array import array
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+from unittest.mock import patch
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+SCRIPTS_DIR = ROOT_DIR / "scripts_macos"
+RESULTS_VERSION = 1
+SAMPLE_RATE = 16000
+CALIBRATION_STRIDE = 3
+CALIBRATION_STEP_SECONDS = 0.01
+CALIBRATION_WINDOW_SIZE = 6
+CALIBRATION_COOLDOWN_SLICES = 25
+AMBIENT_TRACK_SECONDS = 600.0
+
+
+def _benchmark(name: str, unit: str, items: int, run: Callable[[], Any]) -> dict[str, Any]:
+    """``run`` is the timed call; ``items`` is the work it does (clips, slices or files)."""
+    return {"name": name, "unit": unit, "items": items, "run": run}
+
+
+def _load_script(name: str):
+    spec = importlib.util.spec_from_file_location(f"bench_{name}", SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_trainer(workspace: Path):
+    if str(ROOT_DIR) not in sys.path:
+        sys.path.insert(0, str(ROOT_DIR))
+    # Keep the import from creating directories under ~/.taterwakewordtrainer.
+    isolated = {"WAKEWORD_TRAINER_SUPPORT_DIR": str(workspace / "support")}
+    isolated.update({key: value for key, value in os.environ.items() if key.startswith("WAKEWORD_TRAINER_")})
+    with patch.dict(os.environ, isolated):
+        import trainer_server
+
+    return trainer_server
+
+
+# -------------------- Fixture generators --------------------
+def synthetic_clip_samples(rng: random.Random, seconds: float) -> array:
+    """Voiced-looking PCM16: a few harmonics under a syllable envelope plus noise."""
+    import numpy as np
+
+    count = int(SAMPLE_RATE * seconds)
+    fundamental = rng.uniform(90.0, 260.0)
+    level = rng.uniform(0.05, 0.45)
+    syllables = rng.randint(2, 4)
+    noise = np.random.default_rng(rng.getrandbits(32)).uniform(-0.02, 0.02, size=count)
+    t = np.arange(count, dtype=np.float64) / SAMPLE_RATE
+    envelope = np.maximum(0.0, np.sin(np.pi * syllables * np.arange(count) / count)) ** 2
+    voiced = sum(np.sin(2.0 * np.pi * fundamental * harmonic * t) / harmonic for harmonic in (1, 2, 3))
+    values = np.clip(level * (envelope * voiced * 0.6 + noise) * 32767.0, -32768, 32767)
+    return array("h", values.astype(np.int16).tolist())
+
+
+def wav_bytes(samples: array) -> bytes:
+    payload = samples
+    if sys.byteorder != "little":
+        payload = array("h", samples)
+        payload.byteswap()
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as stream:
+        stream.setnchannels(1)
+        stream.setsampwidth(2)
+        stream.setframerate(SAMPLE_RATE)
+        stream.writeframes(payload.tobytes())
+    return buffer.getvalue()
+
+
+def make_clips(directory: Path, count: int, *, seed: int = 1, seconds: float = 1.5) -> list[Path]:
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"clip_{index:05d}.wav"
+        path.write_bytes(wav_bytes(synthetic_clip_samples(rng, seconds)))
+        paths.append(path)
+    return paths
+
+
+def make_ambient_probabilities(hours: float, *, seed: int = 2) -> list[Any]:
+    """Detector outputs for ``hours`` of ambient audio, split into 10-minute tracks."""
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    slice_seconds = CALIBRATION_STRIDE * CALIBRATION_STEP_SECONDS
+    total = max(1, int(hours * 3600.0 / slice_seconds))
+    per_track = max(1, int(AMBIENT_TRACK_SECONDS / slice_seconds))
+    tracks = []
+    for start in range(0, total, per_track):
+        length = min(per_track, total - start)
+        track = rng.beta(0.4, 12.0, size=length).astype(np.float32)
+        spikes = rng.random(length) < 0.0005
+        track[spikes] = rng.uniform(0.9, 1.0, size=int(spikes.sum())).astype(np.float32)
+        tracks.append(track)
+    return tracks
+
+
+def make_captured_files(directory: Path, count: int, *, seed: int = 3, write_sidecar=None) -> list[Path]:
+    rng = random.Random(seed)
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = directory / f"captured_{index:05d}.wav"
+        path.write_bytes(wav_bytes(synthetic_clip_samples(rng, rng.uniform(1.0, 3.0))))
+        sidecar = {
+            "saved_as": path.name,
+            "source_device": f"satellite-{index % 4}",
+            "wake_word": "hey_tater",
+            "event_type": rng.choice(["wake_word", "close_miss", "captured"]),
+            "received_at": datetime.now(timezone.utc).isoformat(),
+            "max_probability": round(rng.uniform(0.5, 1.0), 3),
+            "probability_history": [rng.randint(0, 255) for _ in range(40)],
+            "review_status": "pending",
+        }
+        if write_sidecar is not None:
+            write_sidecar(path, sidecar)
+        else:
+            path.with_suffix(".json").write_text(json.dumps(sidecar), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def make_dataset_tree(directory: Path, count: int, *, files_per_dir: int = 100) -> Path:
+    for index in range(count):
+        shard = directory / f"shard_{index // files_per_dir:04d}"
+        shard.mkdir(parents=True, exist_ok=True)
+        (shard / f"feature_{index:06d}.npy").write_bytes(b"\0" * 1024)
+    return directory
+
+
+def build_fixtures(root: Path, *, clips: int, ambient_hours: float, captured: int, trainer=None) -> dict[str, Any]:
+    clip_paths = make_clips(root / "clips", clips)
+    clip_bytes = [path.read_bytes() for path in clip_paths]
+    pcm_payloads = []
+    for data in clip_bytes:
+        with wave.open(io.BytesIO(data), "rb") as stream:
+            pcm_payloads.append(stream.readframes(stream.getnframes()))
+    write_sidecar = trainer._write_sidecar_json if trainer is not None else None
+    make_captured_files(root / "captured_audio", captured, write_sidecar=write_sidecar)
+    return {
+        "root": root,
+        "clips": clip_paths,
+        "clip_bytes": clip_bytes,
+        "pcm_payloads": pcm_payloads,
+        "ambient_tracks": make_ambient_probabilities(ambient_hours),
+        "captured_dir": root / "captured_audio",
+        "dataset_dir": make_dataset_tree(root / "dataset", captured * 10),
+    }
+
+
+# -------------------- Benchmarks --------------------
+def _benchmark_factories() -> dict[str, Callable[[dict[str, Any], Any], dict[str, Any]]]:
+    def read_pcm_metrics(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        module = _load_script("tts_generate_samples")
+        return _benchmark(
+            "read_pcm_metrics",
+            "clips",
+            len(fixtures["clips"]),
+            lambda: [module.read_pcm_metrics(path) for path in fixtures["clips"]],
+        )
+
+    def acoustic_metrics(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        module = _load_script("tts_reference_qa")
+        return _benchmark(
+            "acoustic_metrics",
+            "clips",
+            len(fixtures["clips"]),
+            lambda: [module.acoustic_metrics(path) for path in fixtures["clips"]],
+        )
+
+    def inspect_wav_bytes(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        return _benchmark(
+            "inspect_wav_bytes",
+            "clips",
+            len(fixtures["clip_bytes"]),
+            lambda: [trainer._inspect_wav_bytes(data) for data in fixtures["clip_bytes"]],
+        )
+
+    def boost_target_wav_bytes(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        # Same arguments the capture playback path uses.
+        return _benchmark(
+            "boost_target_wav_bytes",
+            "clips",
+            len(fixtures["clip_bytes"]),
+            lambda: [
+                trainer._boost_target_wav_bytes(
+                    data,
+                    target_peak_ratio=0.88,
+                    target_rms_ratio=0.06,
+                    max_gain_ratio=220.0,
+                    profile=trainer.CAPTURE_GAIN_PROFILE,
+                )
+                for data in fixtures["clip_bytes"]
+            ],
+        )
+
+    def pcm_s16le_to_wav_bytes(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        return _benchmark(
+            "pcm_s16le_to_wav_bytes",
+            "clips",
+            len(fixtures["pcm_payloads"]),
+            lambda: [trainer._pcm_s16le_to_wav_bytes(data) for data in fixtures["pcm_payloads"]],
+        )
+
+    def moving_average_false_accepts_per_hour(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        import numpy as np
+
+        module = _load_script("calibrate_detector")
+        cutoffs = np.arange(0.95, 1.0001, 0.01, dtype=np.float32)
+
+        def run():
+            averaged = [module._moving_average(track, CALIBRATION_WINDOW_SIZE) for track in fixtures["ambient_tracks"]]
+            return module._compute_false_accepts_per_hour(
+                averaged,
+                cutoffs,
+                cooldown_slices=CALIBRATION_COOLDOWN_SLICES,
+                stride=CALIBRATION_STRIDE,
+                step_seconds=CALIBRATION_STEP_SECONDS,
+            )
+
+        slices = sum(len(track) for track in fixtures["ambient_tracks"])
+        return _benchmark("moving_average_false_accepts_per_hour", "slices", slices, run)
+
+    def list_captured_items(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        def run():
+            with patch.object(trainer, "CAPTURED_DIR", fixtures["captured_dir"]):
+                return trainer._list_captured_items()
+
+        count = len(list(fixtures["captured_dir"].glob("*.wav")))
+        return _benchmark("list_captured_items", "files", count, run)
+
+    def managed_path_usage_cold(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        def run():
+            trainer._forget_managed_usage(fixtures["dataset_dir"])
+            return trainer._managed_path_usage(fixtures["dataset_dir"])
+
+        count = sum(1 for _ in fixtures["dataset_dir"].rglob("*.npy"))
+        return _benchmark("managed_path_usage_cold", "files", count, run)
+
+    def managed_path_usage_warm(fixtures: dict[str, Any], trainer) -> dict[str, Any]:
+        count = sum(1 for _ in fixtures["dataset_dir"].rglob("*.npy"))
+        return _benchmark(
+            "managed_path_usage_warm",
+            "files",
+            count,
+            lambda: trainer._managed_path_usage(fixtures["dataset_dir"]),
+        )
+
+    factories = [
+        read_pcm_metrics,
+        acoustic_metrics,
+        inspect_wav_bytes,
+        boost_target_wav_bytes,
+        pcm_s16le_to_wav_bytes,
+        moving_average_false_accepts_per_hour,
+        list_captured_items,
+        managed_path_usage_cold,
+        managed_path_usage_warm,
+    ]
+    return {factory.__name__: factory for factory in factories}
+
+
+BENCHMARK_FACTORIES = _benchmark_factories()
+
+
+def time_benchmark(benchmark: dict[str, Any], repeat: int) -> dict[str, Any]:
+    benchmark["run"]()  # warm caches, imports and first-listing side effects
+    durations = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        benchmark["run"]()
+        durations.append(time.perf_counter() - started)
+    median = statistics.median(durations)
+    return {
+        "unit": benchmark["unit"],
+        "items": benchmark["items"],
+        "repeat": len(durations),
+        "min_seconds": round(min(durations), 6),
+        "median_seconds": round(median, 6),
+        "mean_seconds": round(statistics.fmean(durations), 6),
+        "items_per_second": round(benchmark["items"] / median, 3) if median > 0 else None,
+    }
+
+
+def run_suite(
+    *,
+    clips: int,
+    ambient_hours: float,
+    captured: int,
+    repeat: int,
+    only: list[str] | None = None,
+    log: Callable[[str], None] = print,
+) -> dict[str, Any]:
+    selected = list(only or BENCHMARK_FACTORIES)
+    unknown = sorted(set(selected) - set(BENCHMARK_FACTORIES))
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+    results: dict[str, Any] = {}
+    skipped: dict[str, str] = {}
+    with tempfile.TemporaryDirectory(prefix="mww_bench_") as tmpdir, ExitStack() as stack:
+        workspace = Path(tmpdir)
+        trainer = _load_trainer(workspace)
+        stack.enter_context(patch.object(trainer, "MANAGED_USAGE_INDEX", {}))
+        fixtures = build_fixtures(
+            workspace / "fixtures",
+            clips=clips,
+            ambient_hours=ambient_hours,
+            captured=captured,
+            trainer=trainer,
+        )
+        for name in selected:
+            try:
+                benchmark = BENCHMARK_FACTORIES[name](fixtures, trainer)
+            except ImportError as exc:
+                skipped[name] = f"missing dependency: {exc}"
+                log(f"⚠️ {name}: skipped ({skipped[name]})")
+                continue
+            result = time_benchmark(benchmark, repeat)
+            results[benchmark["name"]] = result
+            log(
+                f"✓ {benchmark['name']}: median {result['median_seconds'] * 1000:.2f} ms "
+                f"({result['items_per_second']} {benchmark['unit']}/s)"
+            )
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "host": {
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "cpu_count": os.cpu_count(),
+        },
+        "params": {"clips": clips, "ambient_hours": ambient_hours, "captured": captured, "repeat": repeat},
+        "benchmarks": results,
+        "skipped": skipped,
+    }
+
+
+def compare_results(current: dict[str, Any], baseline: dict[str, Any], threshold: float) -> dict[str, Any]:
+    """Compare median times; a ratio above 1 + threshold is a regression."""
+    rows = []
+    baseline_benchmarks = baseline.get("benchmarks") or {}
+    for name, result in (current.get("benchmarks") or {}).items():
+        previous = baseline_benchmarks.get(name)
+        if not previous or not previous.get("median_seconds"):
+            rows.append({"name": name, "status": "new"})
+            continue
+        # Normalize to per-item time so a different fixture size still compares.
+        current_per_item = result["median_seconds"] / max(1, result["items"])
+        baseline_per_item = previous["median_seconds"] / max(1, previous.get("items") or 1)
+        ratio = current_per_item / baseline_per_item if baseline_per_item > 0 else math.inf
+        if ratio > 1.0 + threshold:
+            status = "regressed"
+        elif ratio < 1.0 - threshold:
+            status = "improved"
+        else:
+            status = "unchanged"
+        rows.append({"name": name, "status": status, "ratio": round(ratio, 4)})
+    return {
+        "threshold": threshold,
+        "params_match": current.get("params") == baseline.get("params"),
+        "rows": rows,
+        "regressions": [row["name"] for row in rows if row["status"] == "regressed"],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--clips", type=int, default=200, help="synthetic clips for per-clip benchmarks")
+    parser.add_argument("--ambient-hours", type=float, default=1.0, help="hours of ambient detector output")
+    parser.add_argument("--captured", type=int, default=300, help="captured files for listing benchmarks")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", nargs="+", choices=sorted(BENCHMARK_FACTORIES), default=None)
+    parser.add_argument("--output", type=Path, default=None, help="write JSON results here")
+    parser.add_argument("--baseline", type=Path, default=None, help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown ratio (default 0.10)")
+    args = parser.parse_args(argv)
+
+    results = run_suite(
+        clips=max(1, args.clips),
+        ambient_hours=max(0.001, args.ambient_hours),
+        captured=max(1, args.captured),
+        repeat=max(1, args.repeat),
+        only=args.only,
+    )
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        results["comparison"] = compare_results(results, baseline, args.threshold)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"📝 Results written to {args.output}")
+
+    comparison = results.get("comparison")
+    if comparison is None:
+        return 0
+    if not comparison["params_match"]:
+        print("⚠️ Fixture sizes differ from the baseline; comparing per-item times.")
+    for row in comparison["rows"]:
+        ratio = f" x{row['ratio']:.3f}" if "ratio" in row else ""
+        print(f"  {row['status']:>9}  {row['name']}{ratio}")
+    if comparison["regressions"]:
+        print(f"❌ {len(comparison['regressions'])} benchmark(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    print("✅ No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -24,7 +24,14 @@ DEFAULT_CUTOFF_STEP = float(os.environ.get("MWW_CALIBRATION_CUTOFF_STEP", "0.01"
 DEFAULT_CUTOFF_MIN = float(os.environ.get("MWW_CALIBRATION_CUTOFF_MIN", "0.95"))
 DEFAULT_CUTOFF_MAX = float(os.environ.get("MWW_CALIBRATION_CUTOFF_MAX", "1.00"))
 DEFAULT_RECALL_MARGIN = float(os.environ.get("MWW_CALIBRATION_RECALL_MARGIN", "0.005"))
+DEFAULT_BASELINE_RECALL_TOLERANCE = float(
+    os.environ.get("MWW_INCREMENTAL_RECALL_TOLERANCE", "0.005")
+)
+DEFAULT_BASELINE_FAPH_TOLERANCE = float(
+    os.environ.get("MWW_INCREMENTAL_FAPH_TOLERANCE", "0.05")
+)
 PREFERRED_WINDOW_SIZE = 6
+REGRESSION_EXIT_CODE = 3
 
 
 def parse_args() -> argparse.Namespace:
@@ -102,6 +109,26 @@ def parse_args() -> argparse.Namespace:
         default=DEFAULT_CUTOFF_MAX,
         help="Maximum cutoff to evaluate.",
     )
+    parser.add_argument(
+        "--baseline",
+        default="",
+        help=(
+            "Calibration JSON of the previously published model. When set, exit "
+            f"with status {REGRESSION_EXIT_CODE} if the new model regresses against it."
+        ),
+    )
+    parser.add_argument(
+        "--baseline-recall-tolerance",
+        type=float,
+        default=DEFAULT_BASELINE_RECALL_TOLERANCE,
+        help="Recall loss versus the baseline still accepted as noise.",
+    )
+    parser.add_argument(
+        "--baseline-faph-tolerance",
+        type=float,
+        default=DEFAULT_BASELINE_FAPH_TOLERANCE,
+        help="False accepts per hour gained versus the baseline still accepted as noise.",
+    )
     return parser.parse_args()
 
 
@@ -216,6 +243,46 @@ def _select_best_candidate(
     return best, float("inf")
 
 
+def _compare_to_baseline(
+    baseline: dict[str, Any],
+    selected_metrics: dict[str, float],
+    *,
+    recall_tolerance: float,
+    faph_tolerance: float,
+) -> dict[str, Any]:
+    """Report whether the new operating point is worse than the baseline one."""
+    previous = baseline.get("selected_metrics") if isinstance(baseline, dict) else None
+    if not isinstance(previous, dict):
+        return {"regressed": False, "reasons": [], "baseline_available": False}
+
+    reasons = []
+    previous_recall = previous.get("recall")
+    previous_faph = previous.get("false_accepts_per_hour")
+    if previous_recall is not None and (
+        selected_metrics["recall"] < float(previous_recall) - recall_tolerance - 1e-9
+    ):
+        reasons.append(
+            f"recall {selected_metrics['recall']:.4f} < baseline {float(previous_recall):.4f}"
+        )
+    if previous_faph is not None and (
+        selected_metrics["false_accepts_per_hour"]
+        > float(previous_faph) + faph_tolerance + 1e-9
+    ):
+        reasons.append(
+            "false accepts/hour "
+            f"{selected_metrics['false_accepts_per_hour']:.3f} > baseline {float(previous_faph):.3f}"
+        )
+    return {
+        "regressed": bool(reasons),
+        "reasons": reasons,
+        "baseline_available": True,
+        "baseline_recall": previous_recall,
+        "baseline_false_accepts_per_hour": previous_faph,
+        "recall_tolerance": float(recall_tolerance),
+        "faph_tolerance": float(faph_tolerance),
+    }
+
+
 def _load_config(config_path: Path) -> dict:
     with config_path.open("r", encoding="utf-8") as handle:
         return yaml.load(handle.read(), Loader=yaml.Loader)
@@ -441,9 +508,27 @@ def main() -> int:
         "generated_at": datetime.now(timezone.utc).isoformat(),
     }
 
+    comparison = None
+    if args.baseline:
+        try:
+            baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            print(f"⚠️ Could not read baseline calibration ({exc}); skipping comparison.")
+            baseline = {}
+        comparison = _compare_to_baseline(
+            baseline,
+            output["selected_metrics"],
+            recall_tolerance=args.baseline_recall_tolerance,
+            faph_tolerance=args.baseline_faph_tolerance,
+        )
+        output["baseline_comparison"] = comparison
+
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps(output, indent=2) + "\n", encoding="utf-8")
     print(f"📝 Wrote calibration to {output_path}")
+    if comparison and comparison["regressed"]:
+        print("📉 Calibration regressed against the baseline: " + "; ".join(comparison["reasons"]))
+        return REGRESSION_EXIT_CODE
     return 0
 
 
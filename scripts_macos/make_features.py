@@ -1,6 +1,7 @@
 # scripts_macos/make_features.py
 
 import os
+import shutil
 import sys
 
 from mmap_ninja.ragged import RaggedMmap
@@ -31,12 +32,27 @@ background_paths = [
 validate(impulse_paths + background_paths)
 print("⏳ Preparing clip indexes and augmentation pipeline (please wait)…")
 
-tts_wav_count = len(list(Path("./generated_samples").glob("*.wav")))
-print(f"🎤 Generated sample count: {tts_wav_count}")
+# MWW_FEATURE_DELTA_LIST names generated samples added since the existing
+# generated_augmented_features were built; only those are processed and their
+# spectrograms appended. Personal and reviewed negative features are untouched.
+delta_list = os.environ.get("MWW_FEATURE_DELTA_LIST", "").strip()
+# MWW_RECORDED_SAMPLES=0: the recordings belong to another wake phrase.
+use_recorded_samples = os.environ.get("MWW_RECORDED_SAMPLES", "1") != "0"
+tts_input_directory = "./generated_samples"
+if delta_list:
+    delta_dir = Path("./generated_samples_delta")
+    shutil.rmtree(delta_dir, ignore_errors=True)
+    delta_dir.mkdir()
+    for name in Path(delta_list).read_text(encoding="utf-8").split():
+        (delta_dir / name).symlink_to(Path("./generated_samples", name).resolve())
+    tts_input_directory = str(delta_dir)
+
+tts_wav_count = len(list(Path(tts_input_directory).glob("*.wav")))
+print(f"🎤 Generated sample count: {tts_wav_count}" + (" (new since the last feature build)" if delta_list else ""))
 
 # Process TTS generated samples (default)
 clips_tts = Clips(
-    input_directory="./generated_samples",
+    input_directory=tts_input_directory,
     file_pattern="*.wav",
     max_clip_duration_s=5,
     remove_silence=True,
@@ -46,7 +62,11 @@ clips_tts = Clips(
 
 # Process personal recordings if available (optional)
 clips_personal = None
-if os.path.exists("./personal_samples") and any(Path("./personal_samples").glob("*.wav")):
+if delta_list:
+    print("ℹ️ Appending generated samples only; personal features are kept as built")
+elif not use_recorded_samples:
+    print("ℹ️ Personal samples belong to another wake phrase; continuing with generated samples only")
+elif os.path.exists("./personal_samples") and any(Path("./personal_samples").glob("*.wav")):
     clips_personal = Clips(
         input_directory="./personal_samples",
         file_pattern="*.wav",
@@ -61,7 +81,11 @@ else:
 
 # Process reviewed false-positive samples if available (optional)
 clips_reviewed_negative = None
-if os.path.exists("./negative_samples") and any(Path("./negative_samples").glob("*.wav")):
+if delta_list:
+    print("ℹ️ Appending generated samples only; reviewed negative features are kept as built")
+elif not use_recorded_samples:
+    print("ℹ️ Reviewed negatives belong to another wake phrase; continuing with stock negative datasets only")
+elif os.path.exists("./negative_samples") and any(Path("./negative_samples").glob("*.wav")):
     clips_reviewed_negative = Clips(
         input_directory="./negative_samples",
         file_pattern="*.wav",
@@ -103,6 +127,10 @@ split_cfg = {
     "testing":    {"name": "test",       "repetition": 1, "slide_frames": 1},
 }
 
+# Delta appends extend copies of the existing mmaps and only swap them in once
+# every split has been extended, so a crash never leaves a half-appended cache.
+staged_delta = []
+
 # Process TTS samples
 for split, cfg in split_cfg.items():
     out_dir = out_root / split
@@ -115,16 +143,41 @@ for split, cfg in split_cfg.items():
         slide_frames=cfg["slide_frames"],
         step_ms=10,
     )
+    sample_generator = spectros.spectrogram_generator(
+        split=cfg["name"],
+        repeat=cfg["repetition"],
+    )
+    if delta_list:
+        staging = out_dir / "wakeword_mmap.extending"
+        shutil.rmtree(staging, ignore_errors=True)
+        shutil.copytree(out_dir / "wakeword_mmap", staging)
+        existing = RaggedMmap(str(staging))
+        batch = []
+        for spectrogram in sample_generator:
+            batch.append(spectrogram)
+            if len(batch) == 100:
+                existing.extend(batch)
+                batch = []
+        if batch:
+            existing.extend(batch)
+        print(f"✅ {split} (TTS) now holds {len(existing)} spectrograms")
+        staged_delta.append(out_dir)
+        continue
     RaggedMmap.from_generator(
         out_dir=str(out_dir / "wakeword_mmap"),
-        sample_generator=spectros.spectrogram_generator(
-            split=cfg["name"],
-            repeat=cfg["repetition"],
-        ),
+        sample_generator=sample_generator,
         batch_size=100,
         verbose=True,
     )
 
+for out_dir in staged_delta:
+    current = out_dir / "wakeword_mmap"
+    replaced = out_dir / "wakeword_mmap.replaced"
+    shutil.rmtree(replaced, ignore_errors=True)
+    current.rename(replaced)
+    (out_dir / "wakeword_mmap.extending").rename(current)
+    shutil.rmtree(replaced, ignore_errors=True)
+
 # Process personal samples if available
 if clips_personal is not None:
     out_root_personal = Path("personal_augmented_features")
@@ -168,4 +221,6 @@ if clips_reviewed_negative is not None:
             batch_size=100,
             verbose=True,
         )
+if delta_list:
+    shutil.rmtree("./generated_samples_delta", ignore_errors=True)
 print("✅ Features ready.")
@@ -130,6 +130,9 @@ def package_model(
             "microWakeWord-Trainer-AppleSilicon"
         ),
         "model": model_path.name,
+        # Content address of the model; the trainer serves the same bytes
+        # immutably at /api/artifacts/<model_sha256>.tflite.
+        "model_sha256": hashlib.sha256(model_path.read_bytes()).hexdigest(),
         "trained_languages": [language],
         "version": 2,
         "model_format": "tflite_stream_state_internal_quant",
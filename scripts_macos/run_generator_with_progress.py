@@ -1,12 +1,37 @@
 #!/usr/bin/env python3
+"""Run a sample generator and relay its progress as structured events.
+
+The child gets a side pipe whose write end is named by MWW_PROGRESS_FD and may
+write one JSON object per line to it (see ``emit_progress`` in
+tts_generate_samples.py). Events are relayed upward unchanged: to the parent's
+own MWW_PROGRESS_FD when this wrapper is itself nested, otherwise as
+``::progress <json>`` lines on stdout, which the trainer server turns into typed
+``tts_progress`` events. Children that never write events (Piper's
+generate_samples.py) fall back to counting WAV files, at most once every
+FALLBACK_SCAN_SECONDS.
+"""
+
 import argparse
+import json
+import os
 import queue
+import signal
+import stat
 import subprocess
 import sys
 import threading
+import time
 from pathlib import Path
 
 
+PROGRESS_FD_ENV = "MWW_PROGRESS_FD"
+PROGRESS_LINE_PREFIX = "::progress "
+# Count events (anything with "done"/"total") are coalesced to this rate so a
+# 50k-sample run cannot flood the server's event buffer.
+RELAY_INTERVAL_SECONDS = 0.5
+FALLBACK_SCAN_SECONDS = 2.0
+
+
 def _model_args(generator_args):
     values = []
     for idx, arg in enumerate(generator_args):
@@ -31,9 +56,22 @@ def _format_line(line):
 def _reader(stdout, sink):
     try:
         for raw in stdout:
-            sink.put(raw.rstrip("\n"))
+            sink.put(("line", raw.rstrip("\n")))
+    finally:
+        sink.put(("eof", None))
+
+
+def _event_reader(stream, sink):
+    try:
+        for raw in stream:
+            try:
+                event = json.loads(raw)
+            except ValueError:
+                continue
+            if isinstance(event, dict) and event.get("event"):
+                sink.put(("event", event))
     finally:
-        sink.put(None)
+        stream.close()
 
 
 def _progress_step(max_samples):
@@ -44,6 +82,77 @@ def _progress_step(max_samples):
     return 10
 
 
+def _count_wavs(output_dir):
+    try:
+        with os.scandir(output_dir) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".wav"))
+    except OSError:
+        return 0
+
+
+def _parent_progress_fd():
+    value = os.environ.get(PROGRESS_FD_ENV, "")
+    try:
+        fd = int(value)
+        # Only a pipe from tts_generate_samples.py; never a reused fd number.
+        if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+            return None
+    except (ValueError, OSError):
+        return None
+    return fd
+
+
+class ProgressRelay:
+    """Forward events upward, coalescing count events to a bounded rate."""
+
+    def __init__(self, parent_fd=None, step=10, clock=time.monotonic):
+        self.parent_fd = parent_fd
+        self.step = step
+        self.clock = clock
+        self.pending = None
+        self.last_sent = float("-inf")
+        self.last_reported = {}
+
+    def _send(self, event):
+        line = json.dumps(event, ensure_ascii=False, separators=(",", ":"))
+        if self.parent_fd is not None:
+            try:
+                os.write(self.parent_fd, (line + "\n").encode("utf-8"))
+                return
+            except OSError:
+                self.parent_fd = None
+        print(PROGRESS_LINE_PREFIX + line, flush=True)
+
+    def _report(self, event):
+        # Human-readable progress keeps the previous log cadence; a nested
+        # wrapper leaves it to the outermost one.
+        if self.parent_fd is not None:
+            return
+        done, total = int(event["done"]), int(event["total"])
+        key = (event.get("event"), event.get("engine"))
+        last = self.last_reported.get(key, 0)
+        if done > last and (done >= total or done - last >= self.step):
+            label = f"{event['engine']}: " if event.get("engine") else ""
+            print(f"   {label}Generated {done}/{total} samples...", flush=True)
+            self.last_reported[key] = done
+
+    def push(self, event):
+        if "done" not in event or "total" not in event:
+            self.flush()
+            self._send(event)
+            return
+        self._report(event)
+        self.pending = event
+        if int(event["done"]) >= int(event["total"]) or self.clock() - self.last_sent >= RELAY_INTERVAL_SECONDS:
+            self.flush()
+
+    def flush(self):
+        if self.pending is not None:
+            self._send(self.pending)
+            self.pending = None
+            self.last_sent = self.clock()
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--generator", required=True)
@@ -56,6 +165,10 @@ def main():
     if generator_args and generator_args[0] == "--":
         generator_args = generator_args[1:]
 
+    relay = ProgressRelay(_parent_progress_fd(), _progress_step(args.max_samples))
+    read_fd, write_fd = os.pipe()
+    env = dict(os.environ)
+    env[PROGRESS_FD_ENV] = str(write_fd)
     cmd = [sys.executable, args.generator, *generator_args]
     proc = subprocess.Popen(
         cmd,
@@ -63,48 +176,89 @@ def main():
         stderr=subprocess.STDOUT,
         text=True,
         bufsize=1,
+        env=env,
+        pass_fds=(write_fd,),
     )
+    os.close(write_fd)
     assert proc.stdout is not None
 
-    line_queue = queue.Queue()
-    reader = threading.Thread(target=_reader, args=(proc.stdout, line_queue), daemon=True)
-    reader.start()
+    def forward_signal(signum, _frame):
+        # Keep relaying while the child checkpoints and exits.
+        if proc.poll() is None:
+            proc.send_signal(signum)
+
+    signal.signal(signal.SIGTERM, forward_signal)
+    signal.signal(signal.SIGINT, forward_signal)
+
+    sink = queue.Queue()
+    readers = [
+        threading.Thread(target=_reader, args=(proc.stdout, sink), daemon=True),
+        threading.Thread(
+            target=_event_reader,
+            args=(os.fdopen(read_fd, "r", encoding="utf-8"), sink),
+            daemon=True,
+        ),
+    ]
+    for reader in readers:
+        reader.start()
 
     output_dir = Path(args.output_dir)
-    use_sample_progress = _is_onnx_run(generator_args)
-    step = _progress_step(args.max_samples)
-    last_reported = 0
-    stream_done = False
+    scan_fallback = _is_onnx_run(generator_args)
+    saw_events = False
+    next_scan = time.monotonic() + FALLBACK_SCAN_SECONDS
+    stdout_open = True
 
-    while not stream_done or proc.poll() is None:
+    while stdout_open or proc.poll() is None:
         try:
-            line = line_queue.get(timeout=0.2)
+            kind, payload = sink.get(timeout=0.2)
         except queue.Empty:
-            line = None
+            kind, payload = "idle", None
 
-        if line is None:
-            if not stream_done and not line_queue.empty():
-                continue
-            stream_done = proc.poll() is not None or stream_done
-        else:
-            formatted = _format_line(line)
+        if kind == "eof":
+            stdout_open = False
+        elif kind == "line":
+            formatted = _format_line(payload)
             if formatted:
                 print(formatted, flush=True)
+        elif kind == "event":
+            saw_events = True
+            relay.push(payload)
 
-        if use_sample_progress:
-            current = len(list(output_dir.glob("*.wav")))
-            should_report = current > last_reported and (
-                current >= args.max_samples
-                or current - last_reported >= step
+        if scan_fallback and not saw_events and time.monotonic() >= next_scan:
+            next_scan = time.monotonic() + FALLBACK_SCAN_SECONDS
+            relay.push(
+                {
+                    "event": "generated",
+                    "done": _count_wavs(output_dir),
+                    "total": args.max_samples,
+                    "source": "scan",
+                }
             )
-            if should_report:
-                print(f"   Generated {current}/{args.max_samples} samples...", flush=True)
-                last_reported = current
+        if kind == "idle":
+            relay.flush()
 
     rc = proc.wait()
-    final_count = len(list(output_dir.glob("*.wav"))) if use_sample_progress else 0
-    if use_sample_progress and final_count > last_reported:
-        print(f"   Generated {final_count}/{args.max_samples} samples...", flush=True)
+    # The event pipe may outlive the child if a grandchild kept it open; take
+    # whatever has arrived instead of waiting for EOF.
+    readers[1].join(timeout=1.0)
+    while True:
+        try:
+            kind, payload = sink.get_nowait()
+        except queue.Empty:
+            break
+        if kind == "event":
+            saw_events = True
+            relay.push(payload)
+    if scan_fallback and not saw_events:
+        relay.push(
+            {
+                "event": "generated",
+                "done": _count_wavs(output_dir),
+                "total": args.max_samples,
+                "source": "scan",
+            }
+        )
+    relay.flush()
     return rc
 
 
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Profile the stages of one train_microwakeword_macos.sh run.
+
+The training script starts this monitor in the background and appends one
+line per stage boundary to an events file:
+
+    stage<TAB><name><TAB><unix time><TAB><output of the bash `times` builtin>
+    end<TAB><exit code><TAB><unix time><TAB><output of the bash `times` builtin>
+
+For every stage the monitor records wall time, CPU time of the finished
+child processes (from `times`), peak resident memory of the whole process
+tree (sampled with ps), and the net bytes added to the directories that stage
+writes (measured when the monitor sees the boundary, so it is approximate). When
+the script exits it writes run_profile.json next to the packaged artifacts
+and keeps a copy in an archive directory for the trainer API.
+
+Usage:
+    python3 run_profiler.py monitor --pid PID --events FILE --work-dir DIR \
+        --artifacts-dir DIR --slug WAKE_WORD [--archive-dir DIR]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROFILE_VERSION = 1
+ARCHIVE_LIMIT = 50
+TIMES_PATTERN = re.compile(r"(\d+)m([\d.]+)s")
+# Directories (relative to the work dir) each stage writes. Only these are
+# sized at a boundary: walking the whole data directory, datasets included,
+# at every boundary cost more than some of the stages it measured. Stages
+# not listed here report no disk delta.
+STAGE_OUTPUT_DIRS = {
+    "cleanup": ("trained_models",),
+    "tts_generation": ("generated_samples",),
+    "dataset_prep": (
+        "mit_rirs",
+        "audioset",
+        "audioset_16k",
+        "fma",
+        "fma_16k",
+        "chime",
+        "chime_16k",
+        "negative_datasets",
+    ),
+    "features": ("generated_augmented_features", "personal_augmented_features", "reviewed_negative_features"),
+    "training": ("trained_models",),
+}
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from package_model import safe_slug  # noqa: E402
+
+
+def parse_times(raw: str) -> float:
+    """Cumulative user+sys CPU seconds of the shell and its finished children."""
+    return sum(int(minutes) * 60 + float(seconds) for minutes, seconds in TIMES_PATTERN.findall(raw))
+
+
+def directory_bytes(root: Path) -> int:
+    total = 0
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(Path(entry.path))
+                elif entry.is_file(follow_symlinks=False):
+                    total += entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                continue
+    return total
+
+
+def process_tree_rss_bytes(root_pid: int, exclude_pid: int) -> int:
+    try:
+        output = subprocess.run(
+            ["ps", "-A", "-o", "pid=,ppid=,rss="],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return 0
+    children: dict[int, list[int]] = {}
+    rss_kb: dict[int, int] = {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3 or not all(part.isdigit() for part in parts):
+            continue
+        pid, ppid, rss = (int(part) for part in parts)
+        children.setdefault(ppid, []).append(pid)
+        rss_kb[pid] = rss
+    total = 0
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        if pid == exclude_pid:
+            continue
+        total += rss_kb.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * 1024
+
+
+def pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class RunProfile:
+    def __init__(self, work_dir: Path, slug: str):
+        self.work_dir = work_dir
+        self.slug = slug
+        self.started_at = time.time()
+        self.stages: list[dict] = []
+        self.current: dict | None = None
+        self.exit_code: int | None = None
+
+    def stage_output_bytes(self, stage: str) -> int | None:
+        directories = STAGE_OUTPUT_DIRS.get(stage)
+        if not directories:
+            return None
+        return sum(directory_bytes(self.work_dir / name) for name in directories)
+
+    def _close_current(self, now: float, cpu_total: float) -> None:
+        if self.current is None:
+            return
+        stage = self.current
+        stage["wall_seconds"] = round(now - stage.pop("_wall_start"), 3)
+        stage["cpu_seconds"] = round(max(0.0, cpu_total - stage.pop("_cpu_start")), 3)
+        disk_start = stage.pop("_disk_start")
+        if disk_start is not None:
+            stage["disk_bytes_delta"] = (self.stage_output_bytes(stage["stage"]) or 0) - disk_start
+        self.stages.append(stage)
+        self.current = None
+
+    def boundary(self, kind: str, value: str, times_raw: str, now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        cpu_total = parse_times(times_raw)
+        self._close_current(now, cpu_total)
+        if kind == "end":
+            try:
+                self.exit_code = int(value)
+            except ValueError:
+                self.exit_code = None
+            return
+        self.current = {
+            "stage": value,
+            "started_at": datetime.fromtimestamp(now, timezone.utc).isoformat(),
+            "peak_rss_bytes": 0,
+            "_wall_start": now,
+            "_cpu_start": cpu_total,
+            "_disk_start": self.stage_output_bytes(value),
+        }
+
+    def sample_rss(self, rss_bytes: int) -> None:
+        if self.current is not None:
+            self.current["peak_rss_bytes"] = max(self.current["peak_rss_bytes"], rss_bytes)
+
+    def to_dict(self, finished_at: float) -> dict:
+        stages = list(self.stages)
+        if self.current is not None:
+            # The script died mid-stage; report what was observed.
+            open_stage = {key: value for key, value in self.current.items() if not key.startswith("_")}
+            open_stage["wall_seconds"] = round(finished_at - self.current["_wall_start"], 3)
+            open_stage["incomplete"] = True
+            stages.append(open_stage)
+        return {
+            "version": PROFILE_VERSION,
+            "wake_word": self.slug,
+            "started_at": datetime.fromtimestamp(self.started_at, timezone.utc).isoformat(),
+            "finished_at": datetime.fromtimestamp(finished_at, timezone.utc).isoformat(),
+            "exit_code": self.exit_code,
+            "training_mode": os.environ.get("MWW_TRAINING_MODE", "full"),
+            "tts_mode": os.environ.get("MWW_TTS_MODE", ""),
+            "host": {
+                "machine": platform.machine(),
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+            },
+            "totals": {
+                "wall_seconds": round(sum(stage.get("wall_seconds", 0.0) for stage in stages), 3),
+                "cpu_seconds": round(sum(stage.get("cpu_seconds", 0.0) for stage in stages), 3),
+                "peak_rss_bytes": max((stage.get("peak_rss_bytes", 0) for stage in stages), default=0),
+                "disk_bytes_delta": sum(stage.get("disk_bytes_delta", 0) for stage in stages),
+            },
+            "stages": stages,
+        }
+
+
+def read_new_events(events_path: Path, offset: int) -> tuple[list[tuple[str, str, float, str]], int]:
+    try:
+        with events_path.open("r", encoding="utf-8") as stream:
+            stream.seek(offset)
+            chunk = stream.read()
+    except OSError:
+        return [], offset
+    complete, newline, _partial = chunk.rpartition("\n")
+    if not newline:
+        return [], offset
+    events = []
+    for line in complete.split("\n"):
+        parts = line.split("\t", 3)
+        if len(parts) != 4:
+            continue
+        try:
+            events.append((parts[0], parts[1], float(parts[2]), parts[3]))
+        except ValueError:
+            continue
+    return events, offset + len(complete.encode("utf-8")) + 1
+
+
+def write_profile(profile: dict, output: Path, archive_dir: Path | None) -> None:
+    payload = json.dumps(profile, indent=2) + "\n"
+    targets = [output]
+    if archive_dir is not None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        targets.append(archive_dir / f"{stamp}-{profile['wake_word']}.run_profile.json")
+    for target in targets:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.tmp")
+        temp_path.write_text(payload, encoding="utf-8")
+        temp_path.replace(target)
+    if archive_dir is not None:
+        archived = sorted(archive_dir.glob("*.run_profile.json"))
+        for stale in archived[: max(0, len(archived) - ARCHIVE_LIMIT)]:
+            stale.unlink(missing_ok=True)
+
+
+def monitor(args: argparse.Namespace) -> int:
+    profile = RunProfile(args.work_dir, safe_slug(args.slug))
+    offset = 0
+    own_pid = os.getpid()
+    while True:
+        events, offset = read_new_events(args.events, offset)
+        for kind, value, timestamp, times_raw in events:
+            profile.boundary(kind, value, times_raw, timestamp)
+        if any(event[0] == "end" for event in events) or not pid_alive(args.pid):
+            break
+        profile.sample_rss(process_tree_rss_bytes(args.pid, own_pid))
+        time.sleep(args.interval)
+    write_profile(
+        profile.to_dict(time.time()),
+        args.artifacts_dir / f"{profile.slug}.run_profile.json",
+        args.archive_dir,
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    monitor_parser = subparsers.add_parser("monitor")
+    monitor_parser.add_argument("--pid", type=int, required=True)
+    monitor_parser.add_argument("--events", type=Path, required=True)
+    monitor_parser.add_argument("--work-dir", type=Path, required=True)
+    monitor_parser.add_argument("--artifacts-dir", type=Path, required=True)
+    monitor_parser.add_argument("--slug", required=True)
+    monitor_parser.add_argument("--archive-dir", type=Path, default=None)
+    monitor_parser.add_argument("--interval", type=float, default=0.5)
+    args = parser.parse_args()
+    return monitor(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Remote training worker for the WakeWord Trainer.
+
+Registers with a trainer started with TRAINING_EXECUTOR=remote, leases queued
+training jobs, mirrors the personal and reviewed negative samples listed in
+the job manifest, runs train_microwakeword_macos.sh locally, streams the log
+back, and uploads the packaged wake-word artifacts.
+
+Usage:
+    python3 training_worker.py --server http://mac-mini.local:8789 \
+        --secret "$TRAINING_WORKER_SECRET" [--work-dir DIR] [--once]
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_TRAIN_SCRIPT = REPO_ROOT / "train_microwakeword_macos.sh"
+DEFAULT_WORK_DIR = Path.home() / ".taterwakewordtrainer" / "worker"
+SAMPLE_DIRS = {"personal": "personal_samples", "negative": "negative_samples"}
+LOG_FLUSH_SECONDS = 2.0
+LOG_FLUSH_LINES = 50
+REGISTER_PATH = "/api/workers/register"
+REQUEST_ATTEMPTS = 5
+RETRY_BACKOFF_SECONDS = 2.0
+RETRY_BACKOFF_MAX_SECONDS = 60.0
+STOP_GRACE_SECONDS = 30.0
+
+# (method, url, headers, body) -> (status, response bytes)
+Transport = Callable[[str, str, dict, bytes | None], tuple[int, bytes]]
+
+
+def urllib_transport(method: str, url: str, headers: dict, body: bytes | None) -> tuple[int, bytes]:
+    request = Request(url, data=body, headers=headers, method=method)
+    try:
+        with urlopen(request, timeout=120) as response:
+            return response.status, response.read()
+    except HTTPError as exc:
+        return exc.code, exc.read()
+
+
+class LeaseLost(RuntimeError):
+    """The server no longer considers this worker the holder of the job."""
+
+
+def retry_delay(attempt: int) -> float:
+    return min(RETRY_BACKOFF_MAX_SECONDS, RETRY_BACKOFF_SECONDS * 2**attempt)
+
+
+class TrainerClient:
+    def __init__(
+        self,
+        server: str,
+        transport: Transport = urllib_transport,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.server = server.rstrip("/")
+        self.transport = transport
+        self.sleep = sleep
+        self.worker_id = ""
+        self.token = ""
+        self.lease_seconds = 300
+        self._credentials: tuple[str, str] | None = None
+        self._register_lock = threading.Lock()
+
+    def _send(self, method: str, path: str, body: bytes | None = None, content_type: str = "") -> bytes:
+        """Send one request, riding out server restarts and network blips.
+
+        Connection errors and 5xx responses are retried with backoff. A 401
+        means the server forgot this worker (its registry was lost), so the
+        worker registers again, reclaiming its old id and any job leased to
+        it, and retries. A 409 on a job route means the lease is gone and is
+        raised as LeaseLost.
+        """
+
+        for attempt in range(REQUEST_ATTEMPTS):
+            worker_id = self.worker_id
+            headers = {"X-Worker-Token": self.token} if self.token else {}
+            if content_type:
+                headers["Content-Type"] = content_type
+            try:
+                status, data = self.transport(method, f"{self.server}{path}", headers, body)
+            except OSError as exc:
+                status, data = 0, str(exc).encode("utf-8")
+            last_attempt = attempt == REQUEST_ATTEMPTS - 1
+            if status == 401 and path != REGISTER_PATH and self._credentials is not None and not last_attempt:
+                self._reregister(worker_id)
+                path = path.replace(f"/api/workers/{worker_id}/", f"/api/workers/{self.worker_id}/", 1)
+                continue
+            if (status == 0 or status >= 500) and not last_attempt:
+                self.sleep(retry_delay(attempt))
+                continue
+            break
+        message = f"{method} {path} failed ({status}): {data[:300].decode('utf-8', 'replace')}"
+        if status == 409:
+            raise LeaseLost(message)
+        if status == 0 or status >= 400:
+            raise RuntimeError(message)
+        return data
+
+    def _reregister(self, stale_worker_id: str) -> None:
+        with self._register_lock:
+            # Another thread may already have re-registered.
+            if self.worker_id == stale_worker_id and self._credentials is not None:
+                self.register(*self._credentials)
+
+    def call(self, method: str, path: str, payload: dict | None = None) -> dict:
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        return json.loads(self._send(method, path, body, "application/json" if body else ""))
+
+    def register(self, secret: str, name: str) -> None:
+        payload = {"secret": secret, "name": name}
+        if self.worker_id:
+            payload["worker_id"] = self.worker_id
+        result = self.call("POST", REGISTER_PATH, payload)
+        self.worker_id = result["worker_id"]
+        self.token = result["token"]
+        self.lease_seconds = int(result.get("lease_seconds") or self.lease_seconds)
+        self._credentials = (secret, name)
+
+    def lease(self) -> tuple[dict | None, dict]:
+        result = self.call("POST", f"/api/workers/{self.worker_id}/lease")
+        return result.get("job"), result.get("manifest") or {}
+
+    def download(self, path: str) -> bytes:
+        return self._send("GET", path)
+
+    def log(self, job_id: str, lines: list[str]) -> bool:
+        result = self.call("POST", f"/api/workers/{self.worker_id}/jobs/{job_id}/log", {"lines": lines})
+        return bool(result.get("cancel"))
+
+    def upload_artifact(self, job_id: str, path: Path) -> None:
+        boundary = secrets.token_hex(16)
+        body = b"".join(
+            [
+                f"--{boundary}\r\n".encode(),
+                f'Content-Disposition: form-data; name="file"; filename="{path.name}"\r\n'.encode(),
+                b"Content-Type: application/octet-stream\r\n\r\n",
+                path.read_bytes(),
+                f"\r\n--{boundary}--\r\n".encode(),
+            ]
+        )
+        self._send(
+            "POST",
+            f"/api/workers/{self.worker_id}/jobs/{job_id}/artifacts",
+            body,
+            f"multipart/form-data; boundary={boundary}",
+        )
+
+    def complete(self, job_id: str, exit_code: int, error: str = "") -> dict:
+        return self.call(
+            "POST",
+            f"/api/workers/{self.worker_id}/jobs/{job_id}/complete",
+            {"exit_code": exit_code, "error": error},
+        )
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sync_samples(client: TrainerClient, manifest: dict, work_dir: Path) -> dict[str, int]:
+    """Mirror manifest samples into work_dir, downloading only changed files."""
+    counts = {"downloaded": 0, "reused": 0, "removed": 0}
+    wanted: dict[str, set[str]] = {kind: set() for kind in SAMPLE_DIRS}
+    for entry in manifest.get("files") or []:
+        kind = entry.get("kind")
+        name = Path(str(entry.get("name") or "")).name
+        if kind not in SAMPLE_DIRS or not name:
+            continue
+        wanted[kind].add(name)
+        target = work_dir / SAMPLE_DIRS[kind] / name
+        if target.is_file() and _file_digest(target) == entry.get("sha256"):
+            counts["reused"] += 1
+            continue
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{name}.part")
+        temp_path.write_bytes(client.download(entry["url"]))
+        temp_path.replace(target)
+        counts["downloaded"] += 1
+    for kind, dirname in SAMPLE_DIRS.items():
+        directory = work_dir / dirname
+        directory.mkdir(parents=True, exist_ok=True)
+        for stale in directory.glob("*.wav"):
+            if stale.name not in wanted[kind]:
+                stale.unlink()
+                stale.with_suffix(".json").unlink(missing_ok=True)
+                counts["removed"] += 1
+    return counts
+
+
+def stop_process(proc: subprocess.Popen, grace_seconds: float = STOP_GRACE_SECONDS) -> int:
+    """Stop the training script and everything it spawned.
+
+    The script runs in its own session, so signalling the process group
+    reaches the Python and TTS children that bash started, not just bash.
+    """
+
+    def signal_group(sig: int) -> None:
+        if os.name == "posix":
+            with contextlib.suppress(ProcessLookupError):
+                os.killpg(proc.pid, sig)
+        elif sig == signal.SIGTERM:
+            proc.terminate()
+        else:
+            proc.kill()
+
+    signal_group(signal.SIGTERM)
+    try:
+        return proc.wait(timeout=grace_seconds)
+    except subprocess.TimeoutExpired:
+        signal_group(getattr(signal, "SIGKILL", signal.SIGTERM))
+        return proc.wait()
+
+
+class LeaseHeartbeat(threading.Thread):
+    """Renew the job lease on a timer, independent of training output.
+
+    Stages such as feature generation can stay silent for longer than the
+    lease; without this the server would requeue a job that is still running.
+    When the job is cancelled or the lease is lost, the training process is
+    stopped from here so the output loop ends.
+    """
+
+    def __init__(self, client: TrainerClient, job_id: str):
+        super().__init__(name=f"lease-heartbeat-{job_id}", daemon=True)
+        self.client = client
+        self.job_id = job_id
+        self.interval = max(1.0, client.lease_seconds / 3)
+        self.proc: subprocess.Popen | None = None
+        self.cancelled = threading.Event()
+        self.lost = threading.Event()
+        self._stopping = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopping.wait(self.interval):
+            try:
+                if self.client.log(self.job_id, []):
+                    self.cancelled.set()
+            except LeaseLost:
+                self.lost.set()
+            except RuntimeError as exc:
+                print(f"⚠️ Lease heartbeat for job {self.job_id} failed: {exc}", file=sys.stderr, flush=True)
+                continue
+            if self.cancelled.is_set() or self.lost.is_set():
+                if self.proc is not None and self.proc.poll() is None:
+                    stop_process(self.proc)
+                return
+
+    def stop(self) -> None:
+        self._stopping.set()
+        if self.is_alive() and self is not threading.current_thread():
+            self.join()
+
+
+def run_job(
+    client: TrainerClient,
+    job: dict,
+    manifest: dict,
+    *,
+    work_dir: Path,
+    train_script: Path,
+) -> int:
+    """Run one leased job. Returns the exit code, or 999 when the job never ran.
+
+    LeaseLost from any step means the server has requeued or reassigned the
+    job: the training process is stopped and nothing is uploaded or completed.
+    """
+
+    job_id = job["id"]
+    heartbeat = LeaseHeartbeat(client, job_id)
+    heartbeat.start()
+    try:
+        return _run_leased_job(client, job_id, manifest, heartbeat, work_dir=work_dir, train_script=train_script)
+    except LeaseLost as exc:
+        heartbeat.lost.set()
+        print(f"⚠️ Lost the lease on job {job_id}; abandoning it: {exc}", file=sys.stderr, flush=True)
+        return 999
+    finally:
+        heartbeat.stop()
+        if heartbeat.proc is not None and heartbeat.proc.poll() is None:
+            stop_process(heartbeat.proc)
+
+
+def _run_leased_job(
+    client: TrainerClient,
+    job_id: str,
+    manifest: dict,
+    heartbeat: LeaseHeartbeat,
+    *,
+    work_dir: Path,
+    train_script: Path,
+) -> int:
+    work_dir.mkdir(parents=True, exist_ok=True)
+    artifacts_dir = work_dir / "trained_wake_words"
+    try:
+        counts = sync_samples(client, manifest, work_dir)
+    except LeaseLost:
+        raise
+    except Exception as exc:
+        client.complete(job_id, 999, f"Sample sync failed: {exc}")
+        return 999
+    if client.log(
+        job_id,
+        [
+            f"→ Worker {client.worker_id} on {socket.gethostname()}: "
+            f"{counts['downloaded']} samples downloaded, {counts['reused']} reused, {counts['removed']} removed",
+        ],
+    ):
+        return 999
+
+    env = os.environ.copy()
+    env.update({str(key): str(value) for key, value in (manifest.get("env") or {}).items()})
+    env["WAKEWORD_TRAINER_DATA_DIR"] = str(work_dir)
+    env["TRAINED_WAKE_WORDS_DIR"] = str(artifacts_dir)
+    proc = subprocess.Popen(
+        ["bash", str(train_script), manifest["wake_phrase"]],
+        cwd=str(work_dir),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+        env=env,
+        start_new_session=(os.name == "posix"),
+    )
+    heartbeat.proc = proc
+    pending: list[str] = []
+    last_flush = time.monotonic()
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        pending.append(line.rstrip("\n"))
+        if len(pending) >= LOG_FLUSH_LINES or time.monotonic() - last_flush >= LOG_FLUSH_SECONDS:
+            try:
+                if client.log(job_id, pending):
+                    heartbeat.cancelled.set()
+            except LeaseLost:
+                raise
+            except RuntimeError as exc:
+                # Keep the lines for the next flush; the heartbeat holds the lease.
+                print(f"⚠️ Log upload for job {job_id} failed: {exc}", file=sys.stderr, flush=True)
+            else:
+                pending = []
+            last_flush = time.monotonic()
+        if heartbeat.cancelled.is_set() or heartbeat.lost.is_set():
+            stop_process(proc)
+            break
+    rc = proc.wait()
+    if heartbeat.lost.is_set():
+        raise LeaseLost(f"job {job_id} was requeued while training")
+    if pending and client.log(job_id, pending):
+        heartbeat.cancelled.set()
+    if heartbeat.cancelled.is_set():
+        return rc
+
+    error = ""
+    if rc == 0:
+        for name in manifest.get("artifacts") or []:
+            artifact = artifacts_dir / name
+            if artifact.is_file():
+                client.upload_artifact(job_id, artifact)
+            else:
+                error = f"Missing artifact {name}"
+    client.complete(job_id, rc, error)
+    return rc
+
+
+def serve(
+    client: TrainerClient,
+    *,
+    work_dir: Path,
+    train_script: Path,
+    poll_seconds: float = 15.0,
+    once: bool = False,
+) -> int:
+    failures = 0
+    while True:
+        try:
+            job, manifest = client.lease()
+            if job is not None:
+                print(f"🏋️ Training job {job['id']} ({job['wake_phrase']!r})", flush=True)
+                rc = run_job(client, job, manifest, work_dir=work_dir, train_script=train_script)
+                print(f"✓ Job {job['id']} finished (exit_code={rc})", flush=True)
+        except RuntimeError as exc:
+            # The client already retried; wait longer before talking to the server again.
+            print(f"⚠️ {exc}", file=sys.stderr, flush=True)
+            if once:
+                return 1
+            client.sleep(retry_delay(failures))
+            failures += 1
+            continue
+        failures = 0
+        if job is not None:
+            if once:
+                return rc
+            continue
+        if once:
+            return 0
+        time.sleep(poll_seconds)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--server", required=True, help="trainer base URL")
+    parser.add_argument("--secret", default=os.environ.get("TRAINING_WORKER_SECRET", ""))
+    parser.add_argument("--name", default=socket.gethostname())
+    parser.add_argument("--work-dir", type=Path, default=DEFAULT_WORK_DIR)
+    parser.add_argument("--train-script", type=Path, default=DEFAULT_TRAIN_SCRIPT)
+    parser.add_argument("--poll-seconds", type=float, default=15.0)
+    parser.add_argument("--once", action="store_true", help="run at most one job, then exit")
+    args = parser.parse_args()
+    if not args.secret:
+        print("❌ --secret or TRAINING_WORKER_SECRET is required", file=sys.stderr)
+        return 2
+
+    client = TrainerClient(args.server)
+    client.register(args.secret, args.name)
+    print(f"✅ Registered worker {client.worker_id} with {client.server}", flush=True)
+    return serve(
+        client,
+        work_dir=args.work_dir.expanduser().resolve(),
+        train_script=args.train_script,
+        poll_seconds=args.poll_seconds,
+        once=args.once,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
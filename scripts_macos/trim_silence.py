@@ -3,27 +3,148 @@
 Trim silence from the end of wave files using silero-vad.
 
 For wave files in personal_samples (and any subdirectories), this script:
-- Uses silero-vad to detect voice activity
+- Uses silero-vad (ONNX) to detect voice activity, one model per worker process
 - Truncates only from the end of the file
 - Keeps only up to ~20ms of silence, with a 10ms jitter
+- Records the hash of every processed file so unchanged files are skipped on
+  the next training run
 
 Usage:
-    python3 trim_silence.py
+    python3 trim_silence.py [--workers N] [--dry-run] [--report-json PATH]
 """
 
+import argparse
+import hashlib
+import json
 import os
 import random
-import librosa
-import soundfile as sf
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
-from silero_vad import load_silero_vad, get_speech_timestamps
+
+RECORD_FILE_NAME = ".trim_silence_record.json"
+RECORD_VERSION = 1
+
+_vad_model = None
+
+
+def _init_worker() -> None:
+    """Load one ONNX Silero model per process; torch stays single-threaded."""
+    global _vad_model
+    import torch
+    from silero_vad import load_silero_vad
+
+    torch.set_num_threads(1)
+    try:
+        _vad_model = load_silero_vad(onnx=True)
+    except Exception:
+        # Older silero-vad wheels without onnxruntime still ship the JIT model.
+        _vad_model = load_silero_vad()
+
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _trim_one(task: tuple) -> dict:
+    filepath, keep_silence_duration, jitter_enabled, dry_run = task
+    path = Path(filepath)
+    result = {"path": filepath, "action": "error"}
+    try:
+        import librosa
+        import soundfile as sf
+        from silero_vad import get_speech_timestamps
+
+        if _vad_model is None:
+            _init_worker()
+        digest = _file_digest(path)
+        y, sr = librosa.load(filepath, sr=None, mono=True)
+        audio_length = len(y) / sr
+        result["original_s"] = round(audio_length, 3)
+
+        speech_timestamps = get_speech_timestamps(y, _vad_model, sampling_rate=sr, return_seconds=True)
+        if not speech_timestamps:
+            result.update(action="no_speech", sha256=digest)
+            return result
+
+        # Find the actual end time of speech (end of last speech segment)
+        speech_end = speech_timestamps[-1]['end']
+        silence_at_end = audio_length - speech_end
+        result["trailing_silence_ms"] = round(silence_at_end * 1000, 1)
+
+        # Only trim if there's more silence than we want to keep
+        if silence_at_end <= keep_silence_duration:
+            result.update(action="kept", sha256=digest)
+            return result
+
+        # ±10ms jitter on the cut point relative to end of speech, seeded by
+        # content so a dry run reports the same cut a real run would make.
+        cut_point = speech_end
+        if jitter_enabled:
+            cut_point += random.Random(digest).uniform(-0.010, 0.010)
+
+        # Ensure we always keep at least keep_silence_duration at the end
+        cut_point = max(keep_silence_duration, min(cut_point, audio_length))
+        y_trimmed = y[:int(cut_point * sr)]
+        trimmed_duration = len(y_trimmed) / sr
+        result.update(
+            action="trimmed",
+            trimmed_s=round(trimmed_duration, 3),
+            removed_ms=round((audio_length - trimmed_duration) * 1000, 1),
+        )
+        if dry_run:
+            result["sha256"] = digest
+            return result
+
+        temp_path = path.with_name(f".{path.stem}.trim.tmp.wav")
+        sf.write(str(temp_path), y_trimmed, sr, subtype='PCM_16', format='WAV')
+        temp_path.replace(path)
+        result["sha256"] = _file_digest(path)
+    except Exception as exc:
+        result["error"] = str(exc)
+    return result
+
+
+def _load_record(record_file: Path, keep_silence_duration: float, jitter_enabled: bool) -> dict:
+    empty = {
+        "version": RECORD_VERSION,
+        "keep_silence_duration": keep_silence_duration,
+        "jitter_enabled": jitter_enabled,
+        "files": {},
+    }
+    try:
+        record = json.loads(record_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty
+    if (
+        not isinstance(record, dict)
+        or record.get("version") != RECORD_VERSION
+        or record.get("keep_silence_duration") != keep_silence_duration
+        or record.get("jitter_enabled") != jitter_enabled
+        or not isinstance(record.get("files"), dict)
+    ):
+        return empty
+    return record
+
+
+def _write_record(record_file: Path, record: dict) -> None:
+    temp_path = record_file.with_name(f"{record_file.name}.tmp")
+    temp_path.write_text(json.dumps(record, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    temp_path.replace(record_file)
 
 
 def trim_silence(
     input_dir: str = 'personal_samples',
     keep_silence_duration: float = 0.020,
-    jitter_enabled: bool = True
-) -> None:
+    jitter_enabled: bool = True,
+    workers: int | None = None,
+    dry_run: bool = False,
+    record_path: str | None = None,
+) -> dict:
     """
     Trim silence from the end of all wave files in input_dir using silero-vad.
 
@@ -31,73 +152,96 @@ def trim_silence(
         input_dir: Directory containing wave files (traverses subdirectories)
         keep_silence_duration: Maximum silence to keep at the end (seconds)
         jitter_enabled: Whether to add random jitter to the cut point
-        jitter_range: Tuple of (min_jitter, max_jitter) in seconds
-    """
-    # Load VAD model
-    vad_model = load_silero_vad()
-    print("Loaded silero-vad model")
-
-    # Walk through all files
-    processed = 0
-    for root, dirs, files in os.walk(input_dir):
-        for file in files:
-            if file.endswith('.wav'):
-                filepath = os.path.join(root, file)
-                processed += 1
-
-                # Load audio
-                y, sr = librosa.load(filepath, sr=None, mono=True)
-                audio_length = len(y) / sr
-
-                # Get speech timestamps using VAD
-                speech_timestamps = get_speech_timestamps(y, vad_model, sampling_rate=sr, return_seconds=True)
-
-                if not speech_timestamps:
-                    print(f"Warning: No speech detected in {file}, skipping")
-                    continue
-
-                # Find the actual end time of speech (end of last speech segment)
-                speech_end = speech_timestamps[-1]['end']
-
-                # Calculate how much silence is at the end
-                silence_at_end = audio_length - speech_end
+        workers: Worker processes to use (default: up to 4, one per CPU)
+        dry_run: Report what would be trimmed without touching any file
+        record_path: Trim record location (default: input_dir/.trim_silence_record.json)
 
-                # Only trim if there's more silence than we want to keep
-                if silence_at_end > keep_silence_duration:
-                    # Calculate where to cut (with ±10ms jitter)
-                    if jitter_enabled:
-                        # ±10ms jitter on the cut point relative to end of speech
-                        jitter = random.uniform(-0.010, 0.010)
-                        cut_point = speech_end + jitter
-                    else:
-                        cut_point = speech_end
-
-                    # Ensure we always keep at least keep_silence_duration at the end
-                    cut_point = max(keep_silence_duration, min(cut_point, audio_length))
-
-                    # Calculate samples to keep
-                    trim_samples = int(cut_point * sr)
-
-                    # Trim from the end
-                    y_trimmed = y[:trim_samples]
-
-                    # Save the file
-                    sf.write(filepath, y_trimmed, sr, subtype='PCM_16')
-
-                    original_duration = audio_length
-                    trimmed_duration = len(y_trimmed) / sr
-                    trim_amount = original_duration - trimmed_duration
-
-                    print(f"Processed {processed}: {filepath}")
-                    print(f"  Original: {original_duration:.3f}s")
-                    print(f"  Trimmed: {trimmed_duration:.3f}s")
-                    print(f"  Removed: {trim_amount*1000:.1f}ms ({trim_amount/silence_at_end*100:.1f}% of trailing silence)")
-                else:
-                    print(f"Skipped {processed}: {filepath}")
-                    print(f"  Trailing silence: {silence_at_end*1000:.1f}ms (≤ {keep_silence_duration*1000:.1f}ms threshold)")
-
-    print(f"\nDone! Processed {processed} files.")
+    Returns:
+        Report with per-file results and action counts.
+    """
+    root = Path(input_dir)
+    record_file = Path(record_path) if record_path else root / RECORD_FILE_NAME
+    record = _load_record(record_file, keep_silence_duration, jitter_enabled)
+    recorded_files = record["files"]
+
+    skipped = []
+    pending = []
+    present = set()
+    for path in sorted(root.rglob("*.wav")):
+        if not path.is_file() or path.name.startswith("."):
+            continue
+        key = path.relative_to(root).as_posix()
+        present.add(key)
+        entry = recorded_files.get(key)
+        if isinstance(entry, dict) and entry.get("sha256") == _file_digest(path):
+            skipped.append(key)
+        else:
+            pending.append(path)
+
+    print(f"Found {len(present)} files: {len(skipped)} unchanged since last trim, {len(pending)} to check")
+    tasks = [(str(path), keep_silence_duration, jitter_enabled, dry_run) for path in pending]
+    worker_count = max(1, min(workers or min(4, os.cpu_count() or 1), len(tasks) or 1))
+    if worker_count == 1:
+        results = [_trim_one(task) for task in tasks]
+    else:
+        print(f"Trimming with {worker_count} worker processes")
+        with ProcessPoolExecutor(max_workers=worker_count, initializer=_init_worker) as pool:
+            results = list(pool.map(_trim_one, tasks, chunksize=4))
+
+    counts = {"skipped_unchanged": len(skipped), "trimmed": 0, "kept": 0, "no_speech": 0, "error": 0}
+    verb = "Would trim" if dry_run else "Trimmed"
+    for result in results:
+        counts[result["action"]] += 1
+        if result["action"] == "trimmed":
+            print(f"{verb} {result['path']}")
+            print(f"  Original: {result['original_s']:.3f}s")
+            print(f"  Trimmed: {result['trimmed_s']:.3f}s")
+            print(f"  Removed: {result['removed_ms']:.1f}ms of {result['trailing_silence_ms']:.1f}ms trailing silence")
+        elif result["action"] == "no_speech":
+            print(f"Warning: No speech detected in {result['path']}, skipping")
+        elif result["action"] == "error":
+            print(f"Warning: Could not trim {result['path']}: {result.get('error')}")
+
+    if not dry_run:
+        trimmed_at = datetime.now(timezone.utc).isoformat()
+        record["files"] = {key: value for key, value in recorded_files.items() if key in present}
+        for result in results:
+            if result["action"] == "error":
+                continue
+            key = Path(result["path"]).relative_to(root).as_posix()
+            record["files"][key] = {
+                "sha256": result["sha256"],
+                "action": result["action"],
+                "trimmed_at": trimmed_at,
+            }
+        if present or record_file.exists():
+            _write_record(record_file, record)
+
+    summary = ", ".join(f"{name}={value}" for name, value in counts.items())
+    print(f"\nDone{' (dry run)' if dry_run else ''}! {summary}")
+    return {"dry_run": dry_run, "counts": counts, "results": results, "skipped": skipped}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--input-dir", default="personal_samples")
+    parser.add_argument("--keep-silence", type=float, default=0.020)
+    parser.add_argument("--no-jitter", action="store_true")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--dry-run", action="store_true", help="report planned trims without writing")
+    parser.add_argument("--report-json", type=Path, help="also write the per-file report here")
+    args = parser.parse_args()
+    report = trim_silence(
+        input_dir=args.input_dir,
+        keep_silence_duration=args.keep_silence,
+        jitter_enabled=not args.no_jitter,
+        workers=args.workers,
+        dry_run=args.dry_run,
+    )
+    if args.report_json:
+        args.report_json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 1 if report["counts"]["error"] else 0
 
 
 if __name__ == '__main__':
-    trim_silence()
+    raise SystemExit(main())
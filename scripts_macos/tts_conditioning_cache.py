@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""On-disk cache of reference-audio conditioning for the MLX clone workers.
+
+Encoding a reference clip (MOSS prompt codes, Qwen ICL codes and speaker
+embeddings) is a fixed cost paid again by every fallback round and rerun that
+clones from the same accepted carrier. Entries are keyed by model id, the
+SHA-256 of the reference audio, the reference text and the kind of
+conditioning, and stored as safetensors under MWW_CONDITIONING_CACHE.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Callable
+
+
+CONDITIONING_CACHE_ENV = "MWW_CONDITIONING_CACHE"
+CACHE_FORMAT_VERSION = 1
+
+
+def _mlx_save(path: str, arrays: dict) -> None:
+    import mlx.core as mx
+
+    mx.save_safetensors(path, arrays)
+
+
+def _mlx_load(path: str) -> dict:
+    import mlx.core as mx
+
+    return mx.load(path)
+
+
+class ConditioningCache:
+    """Load and store encoded reference conditioning for one model."""
+
+    def __init__(
+        self,
+        root: Path | str | None,
+        model_id: str,
+        save_arrays: Callable[[str, dict], None] = _mlx_save,
+        load_arrays: Callable[[str], dict] = _mlx_load,
+    ):
+        self.root = Path(root) / model_id.replace("/", "--") if root else None
+        self.model_id = model_id
+        self.save_arrays = save_arrays
+        self.load_arrays = load_arrays
+        self.audio_hashes: dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls, model_id: str) -> "ConditioningCache":
+        return cls(os.environ.get(CONDITIONING_CACHE_ENV, "").strip() or None, model_id)
+
+    def audio_hash(self, ref_audio: str) -> str:
+        path = str(Path(ref_audio).resolve())
+        if path not in self.audio_hashes:
+            self.audio_hashes[path] = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        return self.audio_hashes[path]
+
+    def key(self, ref_audio: str, ref_text: str = "", kind: str = "prompt") -> str:
+        material = "\0".join(
+            (str(CACHE_FORMAT_VERSION), self.model_id, kind, self.audio_hash(ref_audio), ref_text)
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> Path | None:
+        return self.root / f"{key}.safetensors" if self.root else None
+
+    def load(self, key: str) -> dict | None:
+        path = self.path(key)
+        if path is None or not path.is_file():
+            self.misses += 1
+            return None
+        try:
+            arrays = self.load_arrays(str(path))
+        except Exception:
+            # A truncated or foreign file is re-encoded and overwritten.
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return arrays
+
+    def store(self, key: str, arrays: dict) -> None:
+        path = self.path(key)
+        if path is None:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{key}.{os.getpid()}.tmp.safetensors")
+        try:
+            self.save_arrays(str(temp_path), arrays)
+            temp_path.replace(path)
+        except OSError:
+            temp_path.unlink(missing_ok=True)
+
+    def summary(self) -> str:
+        return f"conditioning cache: {self.hits} reused, {self.misses} encoded"
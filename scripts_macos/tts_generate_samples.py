@@ -9,20 +9,27 @@ trainer environment without changing TensorFlow, PyTorch, or Transformers.
 from __future__ import annotations
 
 import argparse
+import contextlib
 import fcntl
 import hashlib
 import json
 import math
 import os
 import random
+import re
 import shutil
+import signal
+import socket
+import stat
 import subprocess
 import sys
+import time
 import wave
 from array import array
 from collections import Counter
 from itertools import product
 from pathlib import Path
+from typing import Callable
 
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
@@ -41,9 +48,12 @@ from tts_config import (  # noqa: E402
     QWEN_LANGUAGE_NAMES,
     distribute_samples,
     engines_for_language,
+    estimate_plan_seconds,
     language_for_engine,
     normalize_english_accent,
     normalize_tts_mode,
+    parse_diversity_floors,
+    plan_engine_allocation,
 )
 
 
@@ -61,26 +71,171 @@ SPEEDS = (0.85, 0.95, 1.0, 1.05, 1.15)
 VOICE_PROFILE_STRIDE = 293
 OMNIVOICE_PROMPT_RETRY_ROUNDS = 4
 OMNIVOICE_CORPUS_RETRY_ROUNDS = 3
+# Keep OmniVoice loaded in tts_omnivoice_worker.py across prompt, clone and
+# repair rounds; set MWW_OMNIVOICE_WORKER=0 to launch omnivoice-infer-batch
+# for every job instead.
+OMNIVOICE_PERSISTENT_WORKER = os.environ.get("MWW_OMNIVOICE_WORKER", "1") != "0"
+# A model with no learned history starts at BATCH_INITIAL_SIZE (the old fixed
+# cap) and doubles from there. Learned sizes never grow past
+# TTS_MAX_BATCH_SIZE; a larger batch must beat the best known items/second by
+# BATCH_THROUGHPUT_GAIN to be adopted, and a learned size whose rate later
+# falls more than BATCH_THROUGHPUT_DROP below the stored rate is halved.
+BATCH_INITIAL_SIZE = 4
+TTS_MAX_BATCH_SIZE = int(os.environ.get("MWW_TTS_MAX_BATCH_SIZE", "16"))
+BATCH_THROUGHPUT_GAIN = 0.05
+BATCH_THROUGHPUT_DROP = 0.25
+# Only failures that look like memory pressure lower a learned batch size: a
+# signal death (jetsam / OOM killer, or a shell reporting 128+SIGKILL) or one
+# of these messages in the tail of the model command's stderr.
+MEMORY_FAILURE_PATTERN = re.compile(
+    r"out of memory|outofmemory|insufficient memory|cannot allocate memory|MemoryError|bad_alloc",
+    re.IGNORECASE,
+)
+STDERR_TAIL_BYTES = 16384
+# Generous because the first start may download the model.
+OMNIVOICE_WORKER_START_TIMEOUT_SECONDS = 1800.0
+# Piper is CPU-only; large requests are split across seeded shard processes
+# (tts_piper_shard.py) of PIPER_THREADS_PER_SHARD threads each. MWW_PIPER_SHARDS
+# fixes the shard count; 0 sizes it from the CPU count.
+PIPER_SHARDS = int(os.environ.get("MWW_PIPER_SHARDS", "0"))
+PIPER_THREADS_PER_SHARD = max(1, int(os.environ.get("MWW_PIPER_THREADS_PER_SHARD", "2")))
+PIPER_MAX_SHARDS = 8
+PIPER_MIN_SHARD_SAMPLES = 50
+PIPER_SHARD_SEED = 7340
+PIPER_SHARD_POLL_SECONDS = 2.0
 MOSS_CORPUS_RETRY_ROUNDS = 3
 VOICE_BANK_REPLACEMENT_ROUNDS = 6
 OMNIVOICE_REPLACEMENT_FACTOR = 2.0
 OMNIVOICE_POSITION_TEMPERATURE = 5.0
 OMNIVOICE_CLASS_TEMPERATURE = 0.0
+# First-pass oversampling comes from the acceptance observed for the same
+# engine, language and phrase length (AcceptanceStats); these factors are the
+# prior for combinations without ACCEPTANCE_MIN_CANDIDATES of history.
 DIRECT_CANDIDATE_FACTORS = {
     ENGINE_OMNIVOICE: 1.50,
     ENGINE_QWEN3: 1.08,
     ENGINE_MOSS: 1.25,
     ENGINE_PIPER: 1.05,
 }
+ACCEPTANCE_MIN_CANDIDATES = 20
+# Older runs are down-weighted once an entry holds more candidates than this.
+ACCEPTANCE_WINDOW_CANDIDATES = 2000
+# One-sided 95% lower bound on the acceptance rate.
+ACCEPTANCE_CONFIDENCE_Z = 1.645
+ACCEPTANCE_MIN_RATE = 0.25
+# Fresh corpora keep an even split across engines unless a per-engine floor
+# (MWW_TTS_DIVERSITY_FLOOR=omnivoice:0.8,piper:0.3) or a deadline is set.
+# Each measured engine then keeps at least its floor of the even share, the
+# rest goes to the fastest engine by measured speed and acceptance
+# (tts_config.plan_engine_allocation), and MWW_TTS_DEADLINE_MINUTES lets the
+# planner lower the floors when the estimate would run past it.
+TTS_DIVERSITY_FLOOR = parse_diversity_floors(os.environ.get("MWW_TTS_DIVERSITY_FLOOR", ""))
+TTS_DEADLINE_MINUTES = os.environ.get("MWW_TTS_DEADLINE_MINUTES", "").strip()
 OMNIVOICE_SOCKET_PATH_LIMIT = 104
 OMNIVOICE_SOCKET_SUFFIX_RESERVE = 52
 FFMPEG_CLIP_TIMEOUT_SECONDS = 30.0
+JOURNAL_VERSION = 2
+# Normalization progress is journaled at most this often; stage changes are
+# always written immediately.
+JOURNAL_CHECKPOINT_SECONDS = 10.0
+CORPUS_MANIFEST_NAME = ".generation_manifest.json"
+# One "index<TAB>engine<TAB>sha256" line per sample, so a later run can grow or
+# shrink the corpus without re-reading every WAV.
+CORPUS_INDEX_NAME = ".sample_index.tsv"
+# Sample names added by the most recent growth; lets feature extraction append
+# only the delta. Absent after a fresh build or a shrink.
+ADDED_SAMPLES_NAME = ".added_samples.txt"
+# Write end of the structured progress pipe opened by run_generator_with_progress.py.
+PROGRESS_FD_ENV = "MWW_PROGRESS_FD"
 
 
 class FFmpegRuntimeError(RuntimeError):
     """The selected FFmpeg executable cannot perform required normalization."""
 
 
+class GenerationInterrupted(BaseException):
+    """SIGTERM/SIGINT reached the generator; the journal has been left resumable."""
+
+
+class OmniVoiceWorkerError(RuntimeError):
+    """The persistent OmniVoice worker could not start or dropped a job."""
+
+
+class OmniVoiceWorker:
+    """Client for tts_omnivoice_worker.py, which keeps OmniVoice loaded between jobs."""
+
+    def __init__(self, python: Path, socket_path: Path, env: dict[str, str]):
+        self.python = python
+        self.socket_path = socket_path
+        self.env = env
+        self.process: subprocess.Popen | None = None
+        # Batches of the last job that failed whole and were retried per item,
+        # and how many of those failed for lack of memory.
+        self.batch_failures = 0
+        self.batch_memory_failures = 0
+
+    def start(self, timeout: float = OMNIVOICE_WORKER_START_TIMEOUT_SECONDS) -> None:
+        self.socket_path.unlink(missing_ok=True)
+        self.process = subprocess.Popen(
+            [
+                str(self.python),
+                str(ROOT_DIR / "scripts_macos" / "tts_omnivoice_worker.py"),
+                "--socket",
+                str(self.socket_path),
+                "--model",
+                OMNIVOICE_MODEL,
+            ],
+            env=self.env,
+        )
+        deadline = time.monotonic() + timeout
+        while not self.socket_path.exists():
+            if self.process.poll() is not None:
+                raise OmniVoiceWorkerError(f"worker exited with status {self.process.returncode} while loading")
+            if time.monotonic() >= deadline:
+                raise OmniVoiceWorkerError(f"worker was not ready after {timeout:g}s")
+            time.sleep(0.2)
+
+    def request(self, message: dict) -> list[dict]:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(str(self.socket_path))
+                with client.makefile("rw", encoding="utf-8") as stream:
+                    stream.write(json.dumps(message) + "\n")
+                    stream.flush()
+                    replies = []
+                    for line in stream:
+                        replies.append(json.loads(line))
+                        if replies[-1].get("done"):
+                            return replies
+        except (OSError, ValueError) as error:
+            raise OmniVoiceWorkerError(str(error)) from error
+        raise OmniVoiceWorkerError("worker closed the connection before the job finished")
+
+    def infer(self, argv: list[str]) -> list[str]:
+        """Run one omnivoice-infer-batch argument list; returns the ids that failed."""
+
+        replies = self.request({"argv": argv})
+        if replies[-1].get("failed", 0) < 0:
+            raise OmniVoiceWorkerError(replies[-1].get("error") or "job was rejected")
+        batch_errors = [str(reply.get("error") or "") for reply in replies if "batch_failed" in reply]
+        self.batch_failures = len(batch_errors)
+        self.batch_memory_failures = sum(1 for error in batch_errors if memory_failure(0, error))
+        return [reply["id"] for reply in replies if "id" in reply and not reply.get("ok")]
+
+    def close(self) -> None:
+        if self.socket_path.exists():
+            with contextlib.suppress(OmniVoiceWorkerError):
+                self.request({"shutdown": True})
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=30)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        self.socket_path.unlink(missing_ok=True)
+
+
 def select_omnivoice_tmpdir(configured: str = "") -> Path:
     """Return a macOS-safe base directory for OmniVoice manager sockets."""
 
@@ -122,12 +277,251 @@ def log(message: str) -> None:
     print(message, flush=True)
 
 
-def run(command: list[str], *, env: dict[str, str] | None = None) -> None:
+def progress_fd() -> int | None:
+    """The wrapper's progress pipe, or None.
+
+    Only a pipe counts: an inherited variable can name a descriptor number
+    that is now some unrelated open file, and events must never land in it.
+    """
+
+    try:
+        fd = int(os.environ.get(PROGRESS_FD_ENV, ""))
+        if not stat.S_ISFIFO(os.fstat(fd).st_mode):
+            return None
+    except (ValueError, OSError):
+        return None
+    return fd
+
+
+def without_progress_fd(env: dict[str, str] | None = None) -> dict[str, str]:
+    """A child environment without MWW_PROGRESS_FD, for commands that never read it."""
+
+    child_env = dict(os.environ if env is None else env)
+    child_env.pop(PROGRESS_FD_ENV, None)
+    return child_env
+
+
+def emit_progress(event: str, **fields) -> None:
+    """Write one JSON progress event to the wrapper's side pipe, if there is one."""
+
+    fd = progress_fd()
+    if fd is None:
+        return
+    payload = json.dumps({"event": event, **fields}, ensure_ascii=False, separators=(",", ":"))
+    try:
+        os.write(fd, (payload + "\n").encode("utf-8"))
+    except OSError:
+        pass
+
+
+def run(command: list[str], *, env: dict[str, str] | None = None, progress: bool = False) -> None:
+    """Run a model command, echoing its stderr and keeping the tail for errors.
+
+    Only ``progress`` commands (run_generator_with_progress.py) get the
+    progress pipe; every other child runs without MWW_PROGRESS_FD.
+    """
+
     log("→ " + " ".join(command))
     # Some upstream CLIs terminate their entire process group after a fatal
     # worker error.  Give each model command its own group so that behavior
     # cannot kill the trainer/orchestrator process.
-    subprocess.run(command, check=True, env=env, start_new_session=True)
+    fd = progress_fd() if progress else None
+    child_env = without_progress_fd(env)
+    if fd is not None:
+        child_env[PROGRESS_FD_ENV] = str(fd)
+    tail = b""
+    with subprocess.Popen(
+        command,
+        env=child_env,
+        stderr=subprocess.PIPE,
+        start_new_session=True,
+        pass_fds=() if fd is None else (fd,),
+    ) as proc:
+        assert proc.stderr is not None
+        echo = getattr(sys.stderr, "buffer", None)
+        for chunk in iter(lambda: proc.stderr.read1(65536), b""):
+            if echo is not None:
+                echo.write(chunk)
+                echo.flush()
+            else:
+                sys.stderr.write(chunk.decode("utf-8", "replace"))
+            tail = (tail + chunk)[-STDERR_TAIL_BYTES:]
+        returncode = proc.wait()
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, command, stderr=tail.decode("utf-8", "replace"))
+
+
+def count_wavs(directory: Path) -> int:
+    try:
+        with os.scandir(directory) as entries:
+            return sum(1 for entry in entries if entry.name.endswith(".wav"))
+    except OSError:
+        return 0
+
+
+def host_memory_gib() -> int:
+    try:
+        return round(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2**30)
+    except (AttributeError, OSError, ValueError):
+        return 0
+
+
+def job_item_count(command: list[str]) -> int:
+    """Number of entries in a model command's JSONL input, or 0 if it has none."""
+
+    for flag in ("--test_list", "--input-jsonl"):
+        if flag in command:
+            try:
+                text = Path(command[command.index(flag) + 1]).read_text(encoding="utf-8")
+            except (IndexError, OSError):
+                return 0
+            return sum(1 for line in text.splitlines() if line.strip())
+    return 0
+
+
+def memory_failure(returncode: int, output: str | None = "") -> bool:
+    return returncode < 0 or returncode == 128 + 9 or bool(MEMORY_FAILURE_PATTERN.search(output or ""))
+
+
+def describe_exit(returncode: int) -> str:
+    if returncode < 0:
+        # Jetsam and the kernel OOM killer end a process with SIGKILL.
+        return f"killed by signal {-returncode}, likely memory pressure"
+    return f"exit status {returncode}"
+
+
+class BatchSizes:
+    """Batch sizes learned per (engine, model, host memory), kept across runs.
+
+    A size starts at BATCH_INITIAL_SIZE, grows by doubling while items/second
+    improves by at least BATCH_THROUGHPUT_GAIN, stops below the first size
+    that failed or did not pay off, and halves on failure instead of dropping
+    straight to 1. A learned size that gets clearly slower than it was (swap
+    thrash on unified memory can pass as a slow success) is halved too, and
+    may be probed again from there.
+    """
+
+    def __init__(self, path: Path, maximum: int = TTS_MAX_BATCH_SIZE):
+        self.path = path
+        self.maximum = max(1, maximum)
+        self.host = f"{host_memory_gib()}GiB"
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+        self.entries: dict[str, dict] = entries if isinstance(entries, dict) else {}
+
+    def key(self, engine: str, model: str) -> str:
+        return "|".join((engine, model, self.host))
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        temp_path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        temp_path.replace(self.path)
+
+    def entry(self, key: str, size: int) -> dict:
+        return self.entries.setdefault(key, {"batch_size": size, "items_per_second": 0.0, "limit": None})
+
+    def choose(self, key: str, preferred: int) -> int:
+        entry = self.entries.get(key)
+        if entry is None:
+            return max(1, min(preferred, BATCH_INITIAL_SIZE, self.maximum))
+        return min(int(entry.get("next") or entry["batch_size"]), self.maximum)
+
+    def succeeded(self, key: str, size: int, items: int, seconds: float) -> None:
+        entry = self.entry(key, size)
+        if items < 2 * size or seconds <= 0:
+            # Too small a job to say anything about throughput.
+            return
+        rate = items / seconds
+        best = int(entry["batch_size"])
+        stored = float(entry["items_per_second"])
+        if size == best and size > 1 and rate < stored * (1 - BATCH_THROUGHPUT_DROP):
+            smaller = size // 2
+            log(f"⚠️ Batch size {size} slowed to {rate:.2f} items/s (was {stored:.2f}); later jobs start at {smaller}")
+            entry.update(batch_size=smaller, items_per_second=0.0, next=None)
+        elif size == best or rate >= stored * (1 + BATCH_THROUGHPUT_GAIN):
+            entry.update(batch_size=size, items_per_second=round(rate, 4))
+            grow = min(size * 2, self.maximum)
+            limit = entry.get("limit")
+            entry["next"] = grow if grow > size and (limit is None or grow < limit) else None
+        else:
+            entry.update(limit=size, next=None)
+        self.save()
+
+    def failed(self, key: str, size: int) -> int:
+        entry = self.entry(key, size)
+        smaller = max(1, size // 2)
+        entry["limit"] = min(int(entry.get("limit") or size), size)
+        entry["next"] = None
+        if int(entry["batch_size"]) >= size:
+            entry.update(batch_size=smaller, items_per_second=0.0)
+        self.save()
+        return smaller
+
+
+class AcceptanceStats:
+    """Observed acceptance and speed of each engine, kept across runs.
+
+    Keyed by engine, language and a phrase-length bucket (the expected
+    duration in half seconds). The acceptance rate sizes each engine's first
+    pass so it rarely needs a fallback round; together with the candidates per
+    second it drives the engine allocation.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        try:
+            entries = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entries = {}
+        self.entries: dict[str, dict] = entries if isinstance(entries, dict) else {}
+
+    @staticmethod
+    def key(engine: str, language: str, target_duration: float) -> str:
+        return f"{engine}|{language}|{round(target_duration * 2) / 2:.1f}s"
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f".{self.path.name}.tmp")
+        temp_path.write_text(json.dumps(self.entries, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        temp_path.replace(self.path)
+
+    def record(self, key: str, candidates: int, accepted: float, seconds: float = 0.0) -> None:
+        if candidates <= 0:
+            return
+        entry = self.entries.setdefault(key, {"candidates": 0.0, "accepted": 0.0})
+        entry.setdefault("seconds", 0.0)
+        total = float(entry["candidates"])
+        if total > ACCEPTANCE_WINDOW_CANDIDATES:
+            scale = ACCEPTANCE_WINDOW_CANDIDATES / total
+            for field in ("candidates", "accepted", "seconds"):
+                entry[field] = float(entry[field]) * scale
+        entry["candidates"] = round(float(entry["candidates"]) + candidates, 3)
+        entry["accepted"] = round(float(entry["accepted"]) + min(accepted, candidates), 3)
+        entry["seconds"] = round(float(entry["seconds"]) + max(0.0, seconds), 3)
+        self.save()
+
+    def throughput(self, key: str) -> float | None:
+        """Candidates synthesized, qualified and normalized per second, or None without history."""
+
+        entry = self.entries.get(key)
+        if not entry or float(entry["candidates"]) < ACCEPTANCE_MIN_CANDIDATES:
+            return None
+        seconds = float(entry.get("seconds") or 0)
+        return float(entry["candidates"]) / seconds if seconds > 0 else None
+
+    def rate(self, key: str) -> float | None:
+        """Lower confidence bound on the acceptance rate, or None without enough history."""
+
+        entry = self.entries.get(key)
+        if not entry or float(entry["candidates"]) < ACCEPTANCE_MIN_CANDIDATES:
+            return None
+        candidates = float(entry["candidates"])
+        observed = float(entry["accepted"]) / candidates
+        margin = ACCEPTANCE_CONFIDENCE_Z * math.sqrt(observed * (1 - observed) / candidates)
+        return max(ACCEPTANCE_MIN_RATE, min(1.0, observed - margin))
 
 
 def run_with_batch_retry(
@@ -135,20 +529,58 @@ def run_with_batch_retry(
     batch_flag: str,
     *,
     env: dict[str, str] | None = None,
+    sizes: BatchSizes | None = None,
+    engine: str = "",
+    model: str = "",
 ) -> None:
-    """Retry a failed batched model command with a single-item batch."""
+    """Run a batched model command, retrying failures with smaller batches.
+
+    With ``sizes`` the batch comes from, and feeds back into, the learned size
+    for (engine, model): a memory failure halves it and records the failed
+    size as a limit. Any other failure, and every failure without ``sizes``,
+    retries once with batch size 1 and leaves the learned sizes alone, since
+    a bad input or a crash says nothing about what batch fits in memory.
+    An explicit batch size of 1 is always run as given.
+    """
 
     batch_index = command.index(batch_flag) + 1
     preferred = int(command[batch_index])
-    try:
-        run(command, env=env)
-    except subprocess.CalledProcessError:
-        if preferred <= 1:
-            raise
-        log(f"⚠️ Batch size {preferred} failed; retrying with batch size 1")
-        retry_command = list(command)
-        retry_command[batch_index] = "1"
-        run(retry_command, env=env)
+    if sizes is None or preferred <= 1:
+        try:
+            run(command, env=env)
+        except subprocess.CalledProcessError:
+            if preferred <= 1:
+                raise
+            log(f"⚠️ Batch size {preferred} failed; retrying with batch size 1")
+            retry_command = list(command)
+            retry_command[batch_index] = "1"
+            run(retry_command, env=env)
+        return
+
+    key = sizes.key(engine, model)
+    size = sizes.choose(key, preferred)
+    items = job_item_count(command)
+    while True:
+        attempt = list(command)
+        attempt[batch_index] = str(size)
+        started = time.monotonic()
+        try:
+            run(attempt, env=env)
+        except subprocess.CalledProcessError as error:
+            if size <= 1:
+                raise
+            if not memory_failure(error.returncode, error.stderr):
+                log(f"⚠️ {engine} batch size {size} failed ({describe_exit(error.returncode)}); retrying with batch size 1")
+                retry_command = list(command)
+                retry_command[batch_index] = "1"
+                run(retry_command, env=env)
+                return
+            smaller = sizes.failed(key, size)
+            log(f"⚠️ {engine} batch size {size} failed ({describe_exit(error.returncode)}); retrying with {smaller}")
+            size = smaller
+            continue
+        sizes.succeeded(key, size, items, time.monotonic() - started)
+        return
 
 
 def write_jsonl(path: Path, entries: list[dict]) -> None:
@@ -293,6 +725,42 @@ def valid_sample(path: Path) -> bool:
     return 0.12 <= duration <= 5.0 and rms >= 0.002 and clipped <= 0.08
 
 
+def growth_plan(total: int, engines: list[str], existing: Counter) -> dict[str, int]:
+    """Split the samples missing from ``total`` so each engine moves toward its even share."""
+
+    missing = total - sum(existing.values())
+    target = distribute_samples(total, engines)
+    plan = {engine: max(0, target[engine] - existing.get(engine, 0)) for engine in engines}
+    # Fallback fills can leave an engine above its share; trim the largest
+    # deficits until the plan covers exactly the missing samples.
+    excess = sum(plan.values()) - missing
+    while excess > 0:
+        ranked = sorted(plan, key=lambda engine: plan[engine], reverse=True)
+        runner_up = plan[ranked[1]] if len(ranked) > 1 else 0
+        cut = min(excess, max(1, plan[ranked[0]] - runner_up))
+        plan[ranked[0]] -= cut
+        excess -= cut
+    return {engine: count for engine, count in plan.items() if count}
+
+
+def stable_subset(sample_engines: list[str], total: int, engines: list[str]) -> list[int]:
+    """Pick ``total`` sample indexes, keeping each engine's share and the oldest samples."""
+
+    quotas = distribute_samples(total, engines)
+    keep = []
+    for index, engine in enumerate(sample_engines):
+        if quotas.get(engine, 0) > 0:
+            quotas[engine] -= 1
+            keep.append(index)
+    kept = set(keep)
+    for index in range(len(sample_engines)):
+        if len(keep) >= total:
+            break
+        if index not in kept:
+            keep.append(index)
+    return sorted(keep)
+
+
 class Generator:
     def __init__(self, args: argparse.Namespace):
         self.args = args
@@ -327,10 +795,12 @@ class Generator:
         self.reference_text = reference_text(self.spoken_phrase)
         self.stable_prompt_text = stable_prompt_text(self.spoken_phrase, args.language)
         self.omnivoice_language = language_for_engine(ENGINE_OMNIVOICE, args.language)
-        self.env = dict(os.environ)
+        self.env = without_progress_fd()
         self.env["HF_HOME"] = str(self.hf_home)
         self.env["HUGGINGFACE_HUB_CACHE"] = str(self.hf_home / "hub")
         self.env["PYTORCH_ENABLE_MPS_FALLBACK"] = "1"
+        # Encoded reference conditioning shared by the MOSS and Qwen clone workers.
+        self.env["MWW_CONDITIONING_CACHE"] = str(self.data_dir / ".cache" / "tts_conditioning")
         self.omnivoice_env = dict(self.env)
         configured_omnivoice_tmpdir = os.environ.get("MWW_OMNIVOICE_TMPDIR", "")
         omnivoice_tmp_path = select_omnivoice_tmpdir(configured_omnivoice_tmpdir)
@@ -342,10 +812,21 @@ class Generator:
         self.omnivoice_env["MWW_OMNIVOICE_TMPDIR"] = str(omnivoice_tmp_path)
         for name in ("TMPDIR", "TMP", "TEMP"):
             self.omnivoice_env[name] = str(omnivoice_tmp_path)
+        self.omnivoice_worker: OmniVoiceWorker | None = None
+        self.omnivoice_worker_failed = not OMNIVOICE_PERSISTENT_WORKER
+        self.batch_sizes = BatchSizes(self.data_dir / ".cache" / "tts_batch_sizes.json")
+        self.acceptance = AcceptanceStats(self.data_dir / ".cache" / "tts_acceptance_stats.json")
         self.speed_by_path: dict[Path, float] = {}
         self.actual_counts: dict[str, int] = {}
         self.reference_qa_batch = 0
         self.accepted_hashes: set[str] = set()
+        # (engine, sha256) per accepted sample, parallel to the accepted paths.
+        self.corpus_index: list[tuple[str, str]] = []
+        # Journal of an in-progress build; survives crashes and stop requests.
+        self.journal_path = self.build_dir / "generation_journal.json"
+        self.hashes_path = self.build_dir / "accepted_hashes.tsv"
+        self.journal: dict = {}
+        self.journal_saved_at = 0.0
         self.direct_attempt = Counter()
         self.normalization_rejections = Counter()
         self.minimum_duration, self.target_duration, self.maximum_duration = duration_bounds(
@@ -380,7 +861,9 @@ class Generator:
             piper_available=self.piper_available(),
         )
 
-    def signature(self) -> dict:
+    def identity(self) -> dict:
+        """What the corpus sounds like; the sample count is tracked separately."""
+
         engines = self.engines()
         return {
             "generator_version": GENERATOR_VERSION,
@@ -388,7 +871,6 @@ class Generator:
             "language": self.args.language,
             "english_accent": self.english_accent,
             "tts_mode": self.args.tts_mode,
-            "samples": self.args.samples,
             "engines": engines,
             "models": {
                 "omnivoice": OMNIVOICE_MODEL,
@@ -400,19 +882,221 @@ class Generator:
             "duration_seconds": [self.minimum_duration, self.maximum_duration],
         }
 
-    def cache_hit(self) -> bool:
-        manifest_path = self.output_dir / ".generation_manifest.json"
-        if not manifest_path.is_file():
-            return False
+    def signature(self) -> dict:
+        return {**self.identity(), "samples": self.args.samples}
+
+    def read_manifest(self) -> dict | None:
         try:
-            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            manifest = json.loads((self.output_dir / CORPUS_MANIFEST_NAME).read_text(encoding="utf-8"))
         except Exception:
-            return False
+            return None
+        if not isinstance(manifest, dict):
+            return None
+        if "identity" not in manifest and isinstance(manifest.get("signature"), dict):
+            # Manifests written before identity and size were split.
+            manifest["identity"] = {
+                key: value for key, value in manifest["signature"].items() if key != "samples"
+            }
+            manifest["samples"] = manifest["signature"].get("samples")
+        return manifest
+
+    def cache_hit(self) -> bool:
+        manifest = self.read_manifest()
         return (
-            manifest.get("signature") == self.signature()
+            manifest is not None
+            and manifest.get("identity") == self.identity()
+            and manifest.get("samples") == self.args.samples
             and len(list(self.output_dir.glob("*.wav"))) == self.args.samples
         )
 
+    def existing_corpus(self) -> list[tuple[str, str]] | None:
+        """Return ``(engine, sha256)`` per sample of a reusable corpus of another size.
+
+        Corpora written before the sample index existed are hashed on the fly
+        and their samples attributed to an ``unknown`` engine.
+        """
+
+        manifest = self.read_manifest()
+        if manifest is None or manifest.get("identity") != self.identity():
+            return None
+        try:
+            count = int(manifest.get("samples") or 0)
+        except (TypeError, ValueError):
+            return None
+        paths = [self.output_dir / f"{index}.wav" for index in range(count)]
+        if not count or not all(path.is_file() for path in paths):
+            return None
+        index: dict[int, tuple[str, str]] = {}
+        try:
+            for line in (self.output_dir / CORPUS_INDEX_NAME).read_text(encoding="utf-8").splitlines():
+                number, engine, digest = (line.split("\t") + ["", ""])[:3]
+                if number.isdigit() and digest:
+                    index[int(number)] = (engine or "unknown", digest)
+        except OSError:
+            pass
+        return [
+            index.get(number) or ("unknown", hashlib.sha256(path.read_bytes()).hexdigest())
+            for number, path in enumerate(paths)
+        ]
+
+    def write_corpus_files(self, directory: Path, manifest: dict, added: list[int]) -> None:
+        """Write the sample index, the added-sample list and, last, the manifest."""
+
+        (directory / CORPUS_INDEX_NAME).write_text(
+            "".join(
+                f"{number}\t{engine}\t{digest}\n"
+                for number, (engine, digest) in enumerate(self.corpus_index[: self.args.samples])
+            ),
+            encoding="utf-8",
+        )
+        added_path = directory / ADDED_SAMPLES_NAME
+        if added:
+            added_path.write_text("".join(f"{number}.wav\n" for number in added), encoding="utf-8")
+        else:
+            added_path.unlink(missing_ok=True)
+        manifest_path = directory / CORPUS_MANIFEST_NAME
+        temp_path = manifest_path.with_name(f".{manifest_path.name}.tmp")
+        temp_path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        temp_path.replace(manifest_path)
+
+    def shrink_corpus(self, existing: list[tuple[str, str]], engines: list[str]) -> None:
+        """Keep a stable, engine-balanced subset and renumber it to 0..samples-1 in place."""
+
+        total = self.args.samples
+        keep = stable_subset([engine for engine, _ in existing], total, engines)
+        kept = set(keep)
+        manifest = self.read_manifest() or {}
+        # Without a manifest an interrupted shrink is never mistaken for a valid corpus.
+        (self.output_dir / CORPUS_MANIFEST_NAME).unlink(missing_ok=True)
+        for number in range(len(existing)):
+            if number not in kept:
+                (self.output_dir / f"{number}.wav").unlink(missing_ok=True)
+        holes = [number for number in range(total) if number not in kept]
+        movers = [number for number in keep if number >= total]
+        renumbered = dict(zip(movers, holes))
+        for source, target in renumbered.items():
+            (self.output_dir / f"{source}.wav").replace(self.output_dir / f"{target}.wav")
+        self.corpus_index = [None] * total
+        for number in keep:
+            self.corpus_index[renumbered.get(number, number)] = existing[number]
+        actual_counts = Counter(engine for engine, _ in self.corpus_index)
+        manifest.update(
+            identity=self.identity(),
+            samples=total,
+            signature=self.signature(),
+            actual_counts=dict(actual_counts),
+            resized_from=len(existing),
+        )
+        self.write_corpus_files(self.output_dir, manifest, [])
+        log(f"✅ Shrunk the TTS corpus from {len(existing)} to {total} sample(s) without regenerating")
+        emit_progress("complete", total=total, actual_counts=dict(actual_counts))
+
+    def piper_command(self, destination: Path, requested: int, *extra: str) -> list[str]:
+        """Piper generate_samples.py, wrapped so its progress reaches the event pipe."""
+
+        return [
+            str(self.data_dir / ".venv" / "bin" / "python"),
+            str(ROOT_DIR / "scripts_macos" / "run_generator_with_progress.py"),
+            "--generator",
+            str(self.piper_root / "generate_samples.py"),
+            "--output-dir",
+            str(destination),
+            "--max-samples",
+            str(requested),
+            "--",
+            *self.piper_arguments(destination, requested, *extra),
+        ]
+
+    def piper_arguments(self, destination: Path, requested: int, *extra: str) -> list[str]:
+        command = [
+            self.spoken_phrase,
+            "--max-samples",
+            str(requested),
+            "--batch-size",
+            str(self.args.batch_size),
+            "--output-dir",
+            str(destination),
+            *extra,
+        ]
+        for model in self.piper_models():
+            command.extend(("--model", str(model)))
+        return command
+
+    def piper_shard_count(self, requested: int) -> int:
+        shards = PIPER_SHARDS or (os.cpu_count() or 1) // PIPER_THREADS_PER_SHARD
+        return max(1, min(shards, PIPER_MAX_SHARDS, requested // PIPER_MIN_SHARD_SAMPLES))
+
+    def run_piper(self, destination: Path, requested: int, *extra: str) -> None:
+        """Generate ``requested`` Piper samples into ``destination``, sharded when worthwhile.
+
+        Shard ``n`` owns sample ids ``start_n .. start_n + count_n - 1``, so the
+        merged names do not depend on which shard finishes first.
+        """
+
+        shards = self.piper_shard_count(requested)
+        if shards <= 1:
+            run(self.piper_command(destination, requested, *extra), env=self.env, progress=True)
+            return
+
+        shard_root = destination / ".piper-shards"
+        shutil.rmtree(shard_root, ignore_errors=True)
+        counts = [requested // shards + (1 if index < requested % shards else 0) for index in range(shards)]
+        starts = [sum(counts[:index]) for index in range(shards)]
+        log(f"→ Piper: generating {requested} sample(s) in {shards} shard(s) of {PIPER_THREADS_PER_SHARD} thread(s)")
+        processes: list[tuple[subprocess.Popen, list[str]]] = []
+        shard_dirs = []
+        try:
+            for index, count in enumerate(counts):
+                shard_dir = shard_root / f"{index:02d}"
+                shard_dir.mkdir(parents=True)
+                shard_dirs.append(shard_dir)
+                command = [
+                    str(self.data_dir / ".venv" / "bin" / "python"),
+                    str(ROOT_DIR / "scripts_macos" / "tts_piper_shard.py"),
+                    "--seed",
+                    str(PIPER_SHARD_SEED + starts[index]),
+                    "--threads",
+                    str(PIPER_THREADS_PER_SHARD),
+                    "--",
+                    str(self.piper_root / "generate_samples.py"),
+                    *self.piper_arguments(shard_dir, count, *extra),
+                ]
+                log("→ " + " ".join(command))
+                # Shards run generate_samples.py directly and never write events;
+                # progress comes from counting their WAVs below.
+                process = subprocess.Popen(command, env=self.env, start_new_session=True)
+                processes.append((process, command))
+            while any(process.poll() is None for process, _ in processes):
+                if any(process.returncode for process, _ in processes):
+                    break
+                emit_progress(
+                    "generated",
+                    engine=ENGINE_PIPER,
+                    done=sum(count_wavs(shard_dir) for shard_dir in shard_dirs),
+                    total=requested,
+                    source="scan",
+                )
+                time.sleep(PIPER_SHARD_POLL_SECONDS)
+        finally:
+            for process, _ in processes:
+                if process.poll() is None:
+                    with contextlib.suppress(OSError):
+                        os.killpg(process.pid, signal.SIGTERM)
+                    process.wait()
+        for process, command in processes:
+            if process.returncode:
+                raise subprocess.CalledProcessError(process.returncode, command)
+
+        produced = 0
+        for shard_dir, start in zip(shard_dirs, starts):
+            # generate_samples.py numbers its outputs 0.wav, 1.wav, ...
+            for offset, path in enumerate(sorted(shard_dir.glob("*.wav"), key=lambda path: (len(path.stem), path.stem))):
+                path.replace(destination / f"{start + offset}.wav")
+                produced += 1
+        shutil.rmtree(shard_root, ignore_errors=True)
+        emit_progress("generated", engine=ENGINE_PIPER, done=produced, total=requested, source="scan")
+        log(f"✅ Piper shards produced {produced}/{requested} sample(s)")
+
     def ensure_environment(self, engine: str) -> Path:
         if engine == ENGINE_PIPER:
             return self.data_dir / ".venv" / "bin" / "python"
@@ -429,6 +1113,62 @@ class Generator:
             raise RuntimeError(f"Missing {engine} Python environment: {python}")
         return python
 
+    def run_omnivoice(self, command: list[str]) -> None:
+        """Run an omnivoice-infer-batch command, in the persistent worker when possible.
+
+        Items the worker cannot synthesize are simply missing afterwards; every
+        caller already checks outputs individually and repairs or replaces them.
+        """
+
+        if not self.omnivoice_worker_failed and self.omnivoice_worker is None:
+            worker = OmniVoiceWorker(
+                self.tts_envs / ENGINE_OMNIVOICE / "bin" / "python",
+                Path(self.omnivoice_env["MWW_OMNIVOICE_TMPDIR"]) / f"omni-{os.getpid()}.sock",
+                self.omnivoice_env,
+            )
+            log("→ Loading OmniVoice once for all prompt, clone and repair rounds")
+            try:
+                worker.start()
+            except (OSError, OmniVoiceWorkerError) as error:
+                log(f"⚠️ OmniVoice worker unavailable ({error}); launching omnivoice-infer-batch per job")
+                worker.close()
+                self.omnivoice_worker_failed = True
+            else:
+                self.omnivoice_worker = worker
+        if self.omnivoice_worker is not None:
+            worker_command = list(command)
+            batch_index = worker_command.index("--batch_size") + 1
+            preferred = int(worker_command[batch_index])
+            key = self.batch_sizes.key(ENGINE_OMNIVOICE, OMNIVOICE_MODEL)
+            if preferred > 1:
+                worker_command[batch_index] = str(self.batch_sizes.choose(key, preferred))
+            size = int(worker_command[batch_index])
+            started = time.monotonic()
+            try:
+                failed = self.omnivoice_worker.infer(worker_command[1:])
+            except OmniVoiceWorkerError as error:
+                log(f"⚠️ OmniVoice worker stopped ({error}); rerunning this job with omnivoice-infer-batch")
+                self.close_omnivoice_worker()
+                self.omnivoice_worker_failed = True
+            else:
+                if failed:
+                    log(f"⚠️ OmniVoice could not synthesize {len(failed)} item(s) even one at a time")
+                if preferred > 1 and self.omnivoice_worker.batch_memory_failures:
+                    smaller = self.batch_sizes.failed(key, size)
+                    log(f"⚠️ OmniVoice batch size {size} ran out of memory; later jobs start at {smaller}")
+                elif preferred > 1 and not self.omnivoice_worker.batch_failures:
+                    self.batch_sizes.succeeded(key, size, job_item_count(worker_command), time.monotonic() - started)
+                return
+        self.run_batched(command, "--batch_size", ENGINE_OMNIVOICE, OMNIVOICE_MODEL, env=self.omnivoice_env)
+
+    def run_batched(self, command: list[str], batch_flag: str, engine: str, model: str, *, env: dict[str, str]) -> None:
+        run_with_batch_retry(command, batch_flag, env=env, sizes=self.batch_sizes, engine=engine, model=model)
+
+    def close_omnivoice_worker(self) -> None:
+        if self.omnivoice_worker is not None:
+            self.omnivoice_worker.close()
+            self.omnivoice_worker = None
+
     def _generate_omni_bank(self, count: int, start: int, destination: Path) -> list[dict]:
         if count <= 0:
             return []
@@ -460,12 +1200,12 @@ class Generator:
             "--res_dir",
             str(prompt_dir),
             prompt_batch_flag,
-            str(max(1, min(self.args.batch_size, 4))),
+            str(self.args.batch_size),
             "--lang_id",
             self.omnivoice_language,
         ] + omnivoice_stability_args()
         try:
-            run_with_batch_retry(prompt_command, prompt_batch_flag, env=self.omnivoice_env)
+            self.run_omnivoice(prompt_command)
         except subprocess.CalledProcessError as error:
             log(f"⚠️ Voice seed batch exited early; checking individual outputs: {error}")
 
@@ -492,7 +1232,7 @@ class Generator:
             retry_command[retry_command.index(prompt_input_flag) + 1] = str(retry_input)
             retry_command[retry_command.index(prompt_batch_flag) + 1] = "1"
             try:
-                run(retry_command, env=self.omnivoice_env)
+                self.run_omnivoice(retry_command)
             except subprocess.CalledProcessError as error:
                 log(f"⚠️ Voice seed repair round {retry_round} exited early: {error}")
 
@@ -536,13 +1276,13 @@ class Generator:
             "--res_dir",
             str(destination),
             "--batch_size",
-            str(max(1, min(self.args.batch_size, 4))),
+            str(self.args.batch_size),
             "--lang_id",
             self.omnivoice_language,
         ] + omnivoice_stability_args()
         if not entries:
             return []
-        run_with_batch_retry(clone_command, "--batch_size", env=self.omnivoice_env)
+        self.run_omnivoice(clone_command)
         return entries
 
     def _generate_qwen_bank(self, count: int, destination: Path, start: int = 0) -> list[dict]:
@@ -563,7 +1303,7 @@ class Generator:
         ]
         input_path = destination / "qwen_bank.jsonl"
         write_jsonl(input_path, entries)
-        run_with_batch_retry(
+        self.run_batched(
             [
                 str(python),
                 str(ROOT_DIR / "scripts_macos" / "tts_qwen_mlx_worker.py"),
@@ -574,9 +1314,11 @@ class Generator:
                 "--output-dir",
                 str(destination),
                 "--batch-size",
-                str(max(1, min(self.args.batch_size, 4))),
+                str(self.args.batch_size),
             ],
             "--batch-size",
+            f"{ENGINE_QWEN3}:bank",
+            QWEN_DESIGN_MODEL,
             env=self.env,
         )
         return entries
@@ -987,7 +1729,9 @@ class Generator:
             write_jsonl(retry_input, list(pending.values()))
             retry_command = list(generation_command)
             retry_command[retry_command.index(input_flag) + 1] = str(retry_input)
-            if batch_flag:
+            if engine == ENGINE_OMNIVOICE:
+                self.run_omnivoice(retry_command)
+            elif batch_flag:
                 run_with_batch_retry(retry_command, batch_flag, env=engine_env)
             else:
                 run(retry_command, env=engine_env)
@@ -1000,30 +1744,12 @@ class Generator:
     def generate_engine(self, engine: str, count: int, voices: list[dict], prefix: str = "") -> list[Path]:
         if count <= 0:
             return []
-        destination_name = engine if not prefix else f"{engine}_{prefix.rstrip('_')}"
-        destination = self.raw_dir / destination_name
+        destination = self.raw_destination(engine, prefix)
         destination.mkdir(parents=True, exist_ok=True)
         requested = count + max(2, math.ceil(count * 0.01))
 
         if engine == ENGINE_PIPER:
-            python = self.data_dir / ".venv" / "bin" / "python"
-            generator = self.piper_root / "generate_samples.py"
-            command = [
-                str(python),
-                str(generator),
-                self.spoken_phrase,
-                "--max-samples",
-                str(requested),
-                "--batch-size",
-                str(self.args.batch_size),
-                "--output-dir",
-                str(destination),
-                "--max-speakers",
-                "100",
-            ]
-            for model in self.piper_models():
-                command.extend(("--model", str(model)))
-            run(command, env=self.env)
+            self.run_piper(destination, requested, "--max-speakers", "100")
             for index, path in enumerate(sorted(destination.glob("*.wav"))):
                 self.speed_by_path[path.resolve()] = SPEEDS[index % len(SPEEDS)]
             return sorted(destination.glob("*.wav"))
@@ -1042,15 +1768,11 @@ class Generator:
                 "--res_dir",
                 str(destination),
                 "--batch_size",
-                str(max(1, min(self.args.batch_size, 4))),
+                str(self.args.batch_size),
                 "--lang_id",
                 self.omnivoice_language,
             ] + omnivoice_stability_args()
-            run_with_batch_retry(
-                generation_command,
-                "--batch_size",
-                env=self.omnivoice_env,
-            )
+            self.run_omnivoice(generation_command)
             return self._repair_generated_corpus(
                 engine,
                 entries,
@@ -1062,7 +1784,7 @@ class Generator:
                 batch_flag="--batch_size",
             )
         elif engine == ENGINE_QWEN3:
-            run_with_batch_retry(
+            self.run_batched(
                 [
                     str(python),
                     str(ROOT_DIR / "scripts_macos" / "tts_qwen_mlx_worker.py"),
@@ -1073,9 +1795,11 @@ class Generator:
                     "--output-dir",
                     str(destination),
                     "--batch-size",
-                    str(max(1, min(self.args.batch_size, 4))),
+                    str(self.args.batch_size),
                 ],
                 "--batch-size",
+                f"{ENGINE_QWEN3}:clone",
+                QWEN_CLONE_MODEL,
                 env=self.env,
             )
         elif engine == ENGINE_MOSS:
@@ -1175,6 +1899,58 @@ class Generator:
             self.speed_by_path[(destination / f"{item_id}.wav").resolve()] = 1.0
         return entries
 
+    def acceptance_key(self, engine: str) -> str:
+        return self.acceptance.key(engine, self.args.language, self.target_duration)
+
+    def allocation_plan(self, engines: list[str]) -> tuple[dict[str, int], dict]:
+        """Split the sample target across ``engines``; returns the plan and how it was chosen."""
+
+        throughput: dict[str, float] = {}
+        acceptance: dict[str, float] = {}
+        for engine in engines:
+            key = self.acceptance_key(engine)
+            rate, speed = self.acceptance.rate(key), self.acceptance.throughput(key)
+            if rate is not None and speed is not None:
+                acceptance[engine], throughput[engine] = rate, speed
+        deadline = float(TTS_DEADLINE_MINUTES) * 60 if TTS_DEADLINE_MINUTES else None
+        plan = plan_engine_allocation(
+            self.args.samples,
+            engines,
+            throughput,
+            acceptance,
+            diversity_floor=TTS_DIVERSITY_FLOOR,
+            deadline_seconds=deadline,
+        )
+        allocation = {
+            "diversity_floor": TTS_DIVERSITY_FLOOR,
+            "deadline_seconds": deadline,
+            "measured": {
+                engine: {
+                    "candidates_per_second": round(throughput[engine], 4),
+                    "acceptance": round(acceptance[engine], 4),
+                }
+                for engine in throughput
+            },
+            "estimated_seconds": round(estimate_plan_seconds(plan, throughput, acceptance), 1),
+        }
+        even = distribute_samples(self.args.samples, engines)
+        if plan != even:
+            moved = ", ".join(f"{engine} {even[engine]}→{plan[engine]}" for engine in plan if plan[engine] != even[engine])
+            reason = []
+            if TTS_DIVERSITY_FLOOR:
+                reason.append("diversity floors " + ",".join(f"{engine}:{floor:g}" for engine, floor in TTS_DIVERSITY_FLOOR.items()))
+            if deadline is not None:
+                reason.append(f"deadline {TTS_DEADLINE_MINUTES} min")
+            log(f"→ Engine allocation departs from the even split ({'; '.join(reason)}): {moved}")
+        return plan, allocation
+
+    def candidate_count(self, engine: str, count: int) -> int:
+        """Candidates to synthesize so that ``count`` are likely to survive QA and normalization."""
+
+        rate = self.acceptance.rate(self.acceptance_key(engine))
+        factor = DIRECT_CANDIDATE_FACTORS[engine] if rate is None else 1.0 / rate
+        return max(count, math.ceil(count * factor))
+
     def generate_direct_engine(
         self,
         engine: str,
@@ -1184,10 +1960,9 @@ class Generator:
     ) -> tuple[list[dict], list[Path]]:
         if count <= 0:
             return [], []
-        destination_name = engine if not prefix else f"{engine}_{prefix.rstrip('_')}"
-        destination = self.raw_dir / destination_name
+        destination = self.raw_destination(engine, prefix)
         destination.mkdir(parents=True, exist_ok=True)
-        requested = max(count, math.ceil(count * DIRECT_CANDIDATE_FACTORS[engine]))
+        requested = self.candidate_count(engine, count)
         if engine == ENGINE_MOSS:
             requested = min(requested, len(reference_paths))
             if requested < count:
@@ -1197,20 +1972,7 @@ class Generator:
                 )
 
         if engine == ENGINE_PIPER:
-            command = [
-                str(self.data_dir / ".venv" / "bin" / "python"),
-                str(self.piper_root / "generate_samples.py"),
-                self.spoken_phrase,
-                "--max-samples",
-                str(requested),
-                "--batch-size",
-                str(self.args.batch_size),
-                "--output-dir",
-                str(destination),
-            ]
-            for model in self.piper_models():
-                command.extend(("--model", str(model)))
-            run(command, env=self.env)
+            self.run_piper(destination, requested)
             paths = sorted(destination.glob("*.wav"))
             entries = [
                 {
@@ -1236,7 +1998,7 @@ class Generator:
                 "--res_dir",
                 str(destination),
                 "--batch_size",
-                str(max(1, min(self.args.batch_size, 4))),
+                str(self.args.batch_size),
                 "--lang_id",
                 self.omnivoice_language,
                 "--num_step",
@@ -1246,7 +2008,7 @@ class Generator:
                 "--postprocess_output",
                 "True",
             ] + omnivoice_stability_args()
-            run_with_batch_retry(command, "--batch_size", env=self.omnivoice_env)
+            self.run_omnivoice(command)
         elif engine == ENGINE_QWEN3:
             command = [
                 str(python),
@@ -1258,9 +2020,9 @@ class Generator:
                 "--output-dir",
                 str(destination),
                 "--batch-size",
-                str(max(1, min(self.args.batch_size, 4))),
+                str(self.args.batch_size),
             ]
-            run_with_batch_retry(command, "--batch-size", env=self.env)
+            self.run_batched(command, "--batch-size", f"{ENGINE_QWEN3}:direct", QWEN_DESIGN_MODEL, env=self.env)
         elif engine == ENGINE_MOSS:
             run(
                 [
@@ -1338,10 +2100,19 @@ class Generator:
             )
         return [path for path in paths if path.stem in accepted_ids]
 
-    def normalize(self, paths: list[Path], start_index: int, limit: int) -> list[Path]:
+    def normalize(
+        self,
+        paths: list[Path],
+        start_index: int,
+        limit: int,
+        engine: str = "",
+        checkpoint: Callable[[int, Path | None, str], None] | None = None,
+    ) -> list[Path]:
+        """Normalize ``paths`` into final_dir; ``checkpoint`` sees every clip consumed."""
+
         accepted = []
         self.final_dir.mkdir(parents=True, exist_ok=True)
-        for path in paths:
+        for consumed, path in enumerate(paths, start=1):
             if len(accepted) >= limit:
                 break
             final_path = self.final_dir / f"{start_index + len(accepted)}.wav"
@@ -1381,6 +2152,8 @@ class Generator:
                     f"⚠️ Skipping {path.name}: FFmpeg normalization exceeded "
                     f"{FFMPEG_CLIP_TIMEOUT_SECONDS:g}s"
                 )
+                if checkpoint is not None:
+                    checkpoint(consumed, None, "")
                 continue
             except OSError as error:
                 temp_path.unlink(missing_ok=True)
@@ -1394,42 +2167,265 @@ class Generator:
                 summary = detail_lines[-1] if detail_lines else "unknown FFmpeg error"
                 self.normalization_rejections["ffmpeg_failed"] += 1
                 log(f"⚠️ Skipping {path.name}: FFmpeg normalization failed: {summary}")
+                if checkpoint is not None:
+                    checkpoint(consumed, None, "")
                 continue
             digest = hashlib.sha256(temp_path.read_bytes()).hexdigest() if temp_path.is_file() else ""
             if valid_sample(temp_path) and digest and digest not in self.accepted_hashes:
                 temp_path.replace(final_path)
                 self.accepted_hashes.add(digest)
                 accepted.append(final_path)
+                if checkpoint is not None:
+                    checkpoint(consumed, final_path, digest)
+                emit_progress(
+                    "samples",
+                    engine=engine,
+                    done=start_index + len(accepted),
+                    total=self.args.samples,
+                )
             else:
                 temp_path.unlink(missing_ok=True)
                 self.normalization_rejections["invalid_or_duplicate"] += 1
+                if checkpoint is not None:
+                    checkpoint(consumed, None, "")
         return accepted
 
-    def generate(self) -> None:
-        if self.cache_hit():
-            log("✅ Reusing the matching direct-generated TTS corpus.")
-            return
+    def raw_destination(self, engine: str, prefix: str = "") -> Path:
+        destination_name = engine if not prefix else f"{engine}_{prefix.rstrip('_')}"
+        return self.raw_dir / destination_name
 
-        engines = self.engines()
-        if not engines:
-            raise RuntimeError(
-                f"No TTS engine is available for language={self.args.language} mode={self.args.tts_mode}."
-            )
+    def journal_relative(self, path: Path) -> str:
+        try:
+            return str(path.resolve().relative_to(self.build_dir.resolve()))
+        except ValueError:
+            return str(path.resolve())
+
+    def load_journal(self) -> dict | None:
+        try:
+            journal = json.loads(self.journal_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if (
+            not isinstance(journal, dict)
+            or journal.get("version") != JOURNAL_VERSION
+            or journal.get("signature") != self.signature()
+            or not isinstance(journal.get("steps"), dict)
+        ):
+            return None
+        return journal
+
+    def save_journal(self) -> None:
+        self.journal["actual_counts"] = dict(self.actual_counts)
+        self.journal["normalization_rejections"] = dict(self.normalization_rejections)
+        temp_path = self.journal_path.with_name(f".{self.journal_path.name}.tmp")
+        temp_path.write_text(json.dumps(self.journal, ensure_ascii=False) + "\n", encoding="utf-8")
+        temp_path.replace(self.journal_path)
+        self.journal_saved_at = time.monotonic()
+
+    def start_journal(self, plan: dict[str, int], base: list[tuple[str, str]]) -> list[Path]:
         shutil.rmtree(self.build_dir, ignore_errors=True)
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.final_dir.mkdir(parents=True, exist_ok=True)
-        plan = distribute_samples(self.args.samples, engines)
-        log(f"===== Direct TTS corpus plan ({self.args.tts_mode}, {self.args.language}) =====")
-        if self.args.language == "en" and ENGINE_QWEN3 in plan:
-            log(f"   English accent emphasis: {self.english_accent}")
-        for engine, count in plan.items():
-            log(f"   {engine}: {count} sample(s)")
-        log(
-            f"   safety duration: {self.minimum_duration:.2f}–{self.maximum_duration:.2f}s; "
-            "static, silence, clipping, rambling, and exact duplicates are rejected"
+        self.hashes_path.write_text("", encoding="utf-8")
+        self.journal = {
+            "version": JOURNAL_VERSION,
+            "signature": self.signature(),
+            "plan": plan,
+            "base_count": len(base),
+            "accepted_count": len(base),
+            "steps": {},
+        }
+        self.save_journal()
+        self.corpus_index = list(base)
+        self.accepted_hashes = {digest for _, digest in base}
+        return [self.output_dir / f"{index}.wav" for index in range(len(base))]
+
+    def resume_journal(self, plan: dict[str, int], base: list[tuple[str, str]]) -> list[Path] | None:
+        """Restore accepted samples from an interrupted run with the same signature.
+
+        Anything written after the last checkpoint (final files past
+        ``accepted_count`` and their hash lines) is discarded so the
+        interrupted stage can be replayed from its recorded cursor. Samples
+        below ``base_count`` belong to the corpus being grown.
+        """
+
+        journal = self.load_journal()
+        if journal is None or journal.get("plan") != plan or journal.get("base_count") != len(base):
+            return None
+        count = int(journal.get("accepted_count") or 0)
+        added: dict[int, tuple[str, str]] = {}
+        try:
+            for line in self.hashes_path.read_text(encoding="utf-8").splitlines():
+                index, digest, engine = (line.split("\t") + ["", ""])[:3]
+                if index.isdigit() and len(base) <= int(index) < count and digest:
+                    added[int(index)] = (engine, digest)
+        except OSError:
+            return None
+        accepted = [self.output_dir / f"{index}.wav" for index in range(len(base))]
+        for index in range(len(base), count):
+            # A growth interrupted while being committed has already moved
+            # some of its samples into the output directory.
+            path = self.final_dir / f"{index}.wav"
+            if base and not path.is_file():
+                path = self.output_dir / path.name
+            accepted.append(path)
+        if len(added) != count - len(base) or not all(path.is_file() for path in accepted):
+            return None
+        for path in self.final_dir.glob("*.wav"):
+            if not path.stem.isdigit() or int(path.stem) >= count:
+                path.unlink(missing_ok=True)
+        self.hashes_path.write_text(
+            "".join(
+                f"{index}\t{added[index][1]}\t{added[index][0]}\n" for index in range(len(base), count)
+            ),
+            encoding="utf-8",
         )
+        self.journal = journal
+        self.corpus_index = [*base, *(added[index] for index in range(len(base), count))]
+        self.accepted_hashes = {digest for _, digest in self.corpus_index}
+        self.actual_counts = dict(journal.get("actual_counts") or {})
+        self.normalization_rejections = Counter(journal.get("normalization_rejections") or {})
+        return accepted
 
-        accepted: list[Path] = []
+    def run_journal_step(
+        self,
+        engine: str,
+        count: int,
+        accepted: list[Path],
+        limit: int,
+        prefix: str = "",
+    ) -> int:
+        """Synthesize, qualify and normalize one engine pass, resuming from the journal.
+
+        Accepted samples are appended to ``accepted``; returns how many this
+        pass accepted in total (including any accepted before a restart).
+        """
+
+        key = f"{engine}:{prefix or 'main'}"
+        steps = self.journal["steps"]
+        step = steps.get(key)
+        if step is not None and step.get("stage") in {"done", "failed"}:
+            log(f"↻ {engine}: already accepted {step.get('accepted', 0)} sample(s) before the restart")
+            return int(step.get("accepted") or 0)
+        destination = self.raw_destination(engine, prefix)
+        started = time.monotonic()
+
+        if step is None or step.get("stage") == "planned":
+            step = steps[key] = {"engine": engine, "prefix": prefix, "count": count, "stage": "planned"}
+            self.save_journal()
+            shutil.rmtree(destination, ignore_errors=True)
+            requested = self.candidate_count(engine, count)
+            rate = self.acceptance.rate(self.acceptance_key(engine))
+            if rate is not None and count > 0:
+                log(f"   {engine}: requesting {requested} candidate(s) for {count} from {rate:.0%} observed acceptance")
+            entries, raw_paths = self.generate_direct_engine(engine, count, list(accepted), prefix=prefix)
+            # Piper entries are its outputs, so a Piper shortfall still counts
+            # against the requested candidates; MOSS is capped to its carriers.
+            requested = requested if engine == ENGINE_PIPER else len(entries)
+            step.update(
+                stage="synthesized",
+                requested=requested,
+                candidates=[self.journal_relative(path) for path in raw_paths],
+            )
+            self.save_journal()
+            emit_progress("synthesized", engine=engine, candidates=len(raw_paths))
+        else:
+            input_path = self.build_dir / f"{engine}_{prefix or 'main'}.direct.jsonl"
+            entries = []
+            if input_path.is_file():
+                entries = [
+                    json.loads(line)
+                    for line in input_path.read_text(encoding="utf-8").splitlines()
+                    if line.strip()
+                ]
+            raw_paths = [self.build_dir / name for name in step.get("candidates", [])]
+            log(f"↻ {engine}: resuming at the {step['stage']} checkpoint")
+
+        if step["stage"] == "synthesized":
+            qualified_paths = self.qualify_direct_candidates(engine, entries, raw_paths, prefix=prefix)
+            step.update(stage="qualified", qualified=[self.journal_relative(path) for path in qualified_paths])
+            self.save_journal()
+            emit_progress("qualified", engine=engine, accepted=len(qualified_paths), candidates=len(raw_paths))
+
+        if step["stage"] == "qualified":
+            step.update(stage="normalizing", start_index=len(accepted), limit=limit, cursor=0, accepted=0)
+            self.save_journal()
+
+        qualified_paths = [self.build_dir / name for name in step.get("qualified", [])]
+        base_cursor = int(step["cursor"])
+
+        def checkpoint(consumed: int, final_path: Path | None, digest: str) -> None:
+            # Called after every clip so ``accepted``, the hash log and the
+            # journal never disagree about which final files are committed.
+            if final_path is not None:
+                with self.hashes_path.open("a", encoding="utf-8") as stream:
+                    stream.write(f"{final_path.stem}\t{digest}\t{engine}\n")
+                accepted.append(final_path)
+                self.corpus_index.append((engine, digest))
+                step["accepted"] += 1
+                self.journal["accepted_count"] = len(accepted)
+            step["cursor"] = base_cursor + consumed
+            if time.monotonic() - self.journal_saved_at >= JOURNAL_CHECKPOINT_SECONDS:
+                self.save_journal()
+
+        self.normalize(
+            qualified_paths[base_cursor:],
+            len(accepted),
+            int(step["limit"]) - int(step["accepted"]),
+            engine,
+            checkpoint=checkpoint,
+        )
+        step["stage"] = "done"
+        step["seconds"] = round(float(step.get("seconds") or 0) + time.monotonic() - started, 3)
+        self.record_acceptance(engine, step, len(qualified_paths))
+        if prefix:
+            self.actual_counts[engine] = self.actual_counts.get(engine, 0) + int(step["accepted"])
+        else:
+            self.actual_counts[engine] = int(step["accepted"])
+        self.save_journal()
+        return int(step["accepted"])
+
+    def engine_results(self, plan: dict[str, int]) -> dict[str, dict]:
+        """Planned versus delivered work per engine, summed over its journal steps."""
+
+        results = {
+            engine: {"planned": count, "candidates": 0, "accepted": 0, "seconds": 0.0}
+            for engine, count in plan.items()
+        }
+        for step in self.journal.get("steps", {}).values():
+            result = results.setdefault(
+                step["engine"], {"planned": 0, "candidates": 0, "accepted": 0, "seconds": 0.0}
+            )
+            result["candidates"] += int(step.get("requested") or 0)
+            result["accepted"] += int(step.get("accepted") or 0)
+            result["seconds"] = round(result["seconds"] + float(step.get("seconds") or 0), 3)
+        return results
+
+    def record_acceptance(self, engine: str, step: dict, qualified: int) -> None:
+        """Fold a finished pass into the acceptance statistics.
+
+        Normalization stops once the pass has its share, so its acceptance is
+        measured over the qualified candidates it actually examined.
+        """
+
+        requested = int(step.get("requested") or 0)
+        examined = int(step.get("cursor") or 0)
+        if requested <= 0 or (qualified and not examined):
+            return
+        accepted = int(step["accepted"])
+        expected = qualified * accepted / examined if examined else 0.0
+        self.acceptance.record(self.acceptance_key(engine), requested, expected, float(step.get("seconds") or 0))
+
+    def mark_step_failed(self, engine: str, prefix: str, error: Exception) -> int:
+        step = self.journal["steps"].setdefault(
+            f"{engine}:{prefix or 'main'}",
+            {"engine": engine, "prefix": prefix},
+        )
+        step.update(stage="failed", error=str(error))
+        self.save_journal()
+        return int(step.get("accepted") or 0)
+
+    def _generate_from_journal(self, plan: dict[str, int], engines: list[str], accepted: list[Path]) -> None:
         successful_engines: list[str] = []
         # MOSS Nano is clone-only. Generate the truly direct providers first
         # so MOSS can use a different already-accepted carrier for every take.
@@ -1440,25 +2436,24 @@ class Generator:
         ]
         for engine in ordered_engines:
             count = plan[engine]
+            emit_progress("engine_started", engine=engine, planned=count)
             try:
-                entries, raw_paths = self.generate_direct_engine(
+                engine_accepted = self.run_journal_step(
                     engine,
                     count,
-                    list(accepted),
+                    accepted,
+                    min(count, self.args.samples - len(accepted)),
                 )
-                qualified_paths = self.qualify_direct_candidates(engine, entries, raw_paths)
-                requested_accepts = min(count, self.args.samples - len(accepted))
-                normalized = self.normalize(qualified_paths, len(accepted), requested_accepts)
-                accepted.extend(normalized)
-                self.actual_counts[engine] = len(normalized)
-                if normalized:
+                if engine_accepted:
                     successful_engines.append(engine)
-                log(f"✅ {engine}: accepted {len(normalized)} normalized sample(s)")
+                log(f"✅ {engine}: accepted {engine_accepted} normalized sample(s)")
+                emit_progress("engine_finished", engine=engine, accepted=engine_accepted)
             except FFmpegRuntimeError:
                 raise
             except Exception as error:
-                self.actual_counts[engine] = 0
+                self.actual_counts[engine] = self.mark_step_failed(engine, "", error)
                 log(f"⚠️ {engine} generation failed; another engine will fill its share: {error}")
+                emit_progress("engine_failed", engine=engine, error=str(error))
 
         missing = self.args.samples - len(accepted)
         fallback_candidates = [
@@ -1471,29 +2466,77 @@ class Generator:
             if missing <= 0 or not fallback_candidates:
                 break
             engine = fallback_candidates[attempt % len(fallback_candidates)]
+            prefix = f"fallback{attempt}_"
             log(f"→ Filling {missing} rejected/missing sample(s) with {engine}")
             try:
-                entries, raw_paths = self.generate_direct_engine(
-                    engine,
-                    missing,
-                    list(accepted),
-                    prefix=f"fallback{attempt}_",
-                )
-                qualified_paths = self.qualify_direct_candidates(
-                    engine,
-                    entries,
-                    raw_paths,
-                    prefix=f"fallback{attempt}_",
-                )
-                normalized = self.normalize(qualified_paths, len(accepted), missing)
-                accepted.extend(normalized)
-                self.actual_counts[engine] = self.actual_counts.get(engine, 0) + len(normalized)
+                self.run_journal_step(engine, missing, accepted, missing, prefix=prefix)
             except FFmpegRuntimeError:
                 raise
             except Exception as error:
+                self.mark_step_failed(engine, prefix, error)
                 log(f"⚠️ {engine} fallback failed: {error}")
             missing = self.args.samples - len(accepted)
 
+    def generate(self) -> None:
+        if self.cache_hit():
+            log("✅ Reusing the matching direct-generated TTS corpus.")
+            return
+
+        engines = self.engines()
+        if not engines:
+            raise RuntimeError(
+                f"No TTS engine is available for language={self.args.language} mode={self.args.tts_mode}."
+            )
+        # A corpus with the same identity but another size is resized rather
+        # than rebuilt: shrinking keeps a stable subset, growing generates
+        # only the missing samples.
+        base = self.existing_corpus() or []
+        if len(base) > self.args.samples:
+            self.shrink_corpus(base, engines)
+            return
+        allocation: dict = {}
+        journal = self.load_journal()
+        if base:
+            plan = growth_plan(self.args.samples, engines, Counter(engine for engine, _ in base))
+        elif journal and journal.get("base_count") == 0 and isinstance(journal.get("plan"), dict):
+            # Statistics recorded by the interrupted run must not change the
+            # plan it is resuming.
+            plan = journal["plan"]
+            allocation = journal.get("allocation") or {}
+        else:
+            plan, allocation = self.allocation_plan(engines)
+        accepted = self.resume_journal(plan, base)
+        if accepted is None:
+            accepted = self.start_journal(plan, base)
+        self.journal.setdefault("allocation", allocation)
+        log(f"===== Direct TTS corpus plan ({self.args.tts_mode}, {self.args.language}) =====")
+        if base:
+            log(f"   growing the existing {len(base)}-sample corpus to {self.args.samples}")
+        if self.args.language == "en" and ENGINE_QWEN3 in plan:
+            log(f"   English accent emphasis: {self.english_accent}")
+        for engine, count in plan.items():
+            log(f"   {engine}: {count} sample(s)")
+        if allocation.get("measured"):
+            log(
+                f"   allocation weighted by measured throughput and acceptance; "
+                f"estimated {allocation['estimated_seconds'] / 60:.1f} min for the measured engines"
+            )
+        log(
+            f"   safety duration: {self.minimum_duration:.2f}–{self.maximum_duration:.2f}s; "
+            "static, silence, clipping, rambling, and exact duplicates are rejected"
+        )
+        if len(accepted) > len(base) or self.journal["steps"]:
+            log(f"↻ Resuming from the generation journal with {len(accepted)} accepted sample(s)")
+        emit_progress("plan", total=self.args.samples, engines=plan, resumed=len(accepted) - len(base), existing=len(base))
+
+        try:
+            self._generate_from_journal(plan, engines, accepted)
+        except GenerationInterrupted:
+            self.save_journal()
+            with contextlib.suppress(OSError):
+                log(f"⏸ TTS generation stopped; {len(accepted)} accepted sample(s) are checkpointed for resume")
+            raise
+
         if len(accepted) < self.args.samples:
             raise RuntimeError(
                 f"Only {len(accepted)} of {self.args.samples} samples passed normalization and QA."
@@ -1509,10 +2552,17 @@ class Generator:
             if index >= self.args.samples:
                 path.unlink(missing_ok=True)
 
+        engine_counts = Counter(engine for engine, _ in self.corpus_index[: self.args.samples])
+        actual_counts = {**{engine: 0 for engine in self.actual_counts}, **engine_counts}
         manifest = {
+            "identity": self.identity(),
+            "samples": self.args.samples,
             "signature": self.signature(),
             "planned_counts": plan,
-            "actual_counts": self.actual_counts,
+            "actual_counts": actual_counts,
+            "allocation": self.journal.get("allocation") or {},
+            "engine_results": self.engine_results(plan),
+            "resized_from": len(base),
             "voice_bank": "",
             "generation_strategy": {
                 "direct_final_candidates": True,
@@ -1536,14 +2586,27 @@ class Generator:
                 "normalization_rejections": dict(self.normalization_rejections),
             },
         }
-        (self.final_dir / ".generation_manifest.json").write_text(
-            json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
-            encoding="utf-8",
-        )
-        shutil.rmtree(self.output_dir, ignore_errors=True)
-        shutil.move(str(self.final_dir), str(self.output_dir))
+        if base:
+            # Growth commits in place: new samples first, the manifest last.
+            added = list(range(len(base), self.args.samples))
+            for index in added:
+                source = self.final_dir / f"{index}.wav"
+                if source.is_file():
+                    source.replace(self.output_dir / source.name)
+            for path in list(self.output_dir.glob("*.wav")):
+                if not path.stem.isdigit() or int(path.stem) >= self.args.samples:
+                    path.unlink(missing_ok=True)
+            self.write_corpus_files(self.output_dir, manifest, added)
+        else:
+            self.write_corpus_files(self.final_dir, manifest, [])
+            shutil.rmtree(self.output_dir, ignore_errors=True)
+            shutil.move(str(self.final_dir), str(self.output_dir))
         shutil.rmtree(self.build_dir, ignore_errors=True)
-        log(f"✅ Generated {self.args.samples} ensemble sample(s) in {self.output_dir}")
+        if base:
+            log(f"✅ Added {self.args.samples - len(base)} sample(s); {self.output_dir} now holds {self.args.samples}")
+        else:
+            log(f"✅ Generated {self.args.samples} ensemble sample(s) in {self.output_dir}")
+        emit_progress("complete", total=self.args.samples, actual_counts=actual_counts)
 
 
 def parser() -> argparse.ArgumentParser:
@@ -1605,7 +2668,7 @@ def main() -> int:
             json.dumps(
                 {
                     "signature": generator.signature(),
-                    "plan": distribute_samples(args.samples, engines),
+                    "plan": generator.allocation_plan(engines)[0],
                     "piper_available": generator.piper_available(),
                 },
                 indent=2,
@@ -1613,13 +2676,27 @@ def main() -> int:
         )
         return 0
 
+    def interrupt(signum, _frame):
+        # Stop requests signal the whole process group; only the first one
+        # should unwind the generator.
+        signal.signal(signal.SIGTERM, signal.SIG_IGN)
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        raise GenerationInterrupted(signum)
+
+    signal.signal(signal.SIGTERM, interrupt)
+    signal.signal(signal.SIGINT, interrupt)
     lock_dir = generator.data_dir / ".locks"
     lock_dir.mkdir(parents=True, exist_ok=True)
     with (lock_dir / "tts-apple-accelerator.lock").open("w", encoding="utf-8") as lock_file:
         log("→ Waiting for the Apple accelerator lock")
         fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
         generator.hf_home.mkdir(parents=True, exist_ok=True)
-        generator.generate()
+        try:
+            generator.generate()
+        except GenerationInterrupted as interrupted:
+            return 128 + int(interrupted.args[0])
+        finally:
+            generator.close_omnivoice_worker()
     return 0
 
 
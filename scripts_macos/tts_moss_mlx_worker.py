@@ -12,6 +12,8 @@ import mlx.core as mx
 from mlx_audio.audio_io import write as write_audio
 from mlx_audio.tts import load
 
+from tts_conditioning_cache import ConditioningCache
+
 
 MOSS_MODEL = "mlx-community/MOSS-TTS-Nano-100M"
 
@@ -41,13 +43,28 @@ def main() -> int:
     for item in entries:
         grouped[str(item["ref_audio"])].append(item)
 
-    completed = 0
-    for ref_audio, group in grouped.items():
+    # Reuse prompt codes encoded by earlier rounds; encode only the rest, once
+    # each, before generation starts.
+    cache = ConditioningCache.from_env(MOSS_MODEL)
+    prompt_codes_by_ref: dict[str, mx.array] = {}
+    for ref_audio in grouped:
+        key = cache.key(ref_audio, kind=f"prompt_codes:{model.config.n_vq}")
+        stored = cache.load(key)
+        if stored is not None:
+            prompt_codes_by_ref[ref_audio] = stored["prompt_codes"]
+            continue
         prompt_codes = model.encode_reference_audio(
             ref_audio,
             num_quantizers=model.config.n_vq,
         )
         mx.eval(prompt_codes)
+        cache.store(key, {"prompt_codes": prompt_codes})
+        prompt_codes_by_ref[ref_audio] = prompt_codes
+    print(f"MOSS {cache.summary()}", flush=True)
+
+    completed = 0
+    for ref_audio, group in grouped.items():
+        prompt_codes = prompt_codes_by_ref[ref_audio]
         for item in group:
             mx.random.seed(int(item.get("seed", completed + 1)))
             result = next(
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Persistent OmniVoice worker that keeps k2-fsa/OmniVoice loaded between jobs.
+
+omnivoice-infer-batch reloads the model on every launch, which dominates the
+short prompt-repair and QA-repair rounds. This worker loads it once, listens
+on a Unix socket inside MWW_OMNIVOICE_TMPDIR and accepts one JSON request per
+connection:
+
+    {"argv": [<omnivoice-infer-batch arguments>]}   run a job
+    {"shutdown": true}                               exit
+
+Every job item is answered with {"id", "ok"[, "error"]}; a batch that raises is
+retried one item at a time so a single bad decode cannot fail its neighbours,
+after a {"batch_failed": <size>, "error"} line that lets the client shrink
+later batches when the error was a memory failure.
+The last line of each reply is {"done": true, "failed": <count>}.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Callable
+
+
+def run_job(
+    batches: list[list[tuple]],
+    run_batch: Callable[[list[tuple]], None],
+    reply: Callable[[dict], None],
+) -> int:
+    """Run ``batches`` and report every sample id once; returns the failure count."""
+
+    failed = 0
+    for batch in batches:
+        try:
+            run_batch(batch)
+        except Exception as error:
+            if len(batch) == 1:
+                failed += 1
+                reply({"id": batch[0][0], "ok": False, "error": str(error)})
+                continue
+            print(f"OmniVoice batch of {len(batch)} failed ({error}); retrying one at a time", flush=True)
+            reply({"batch_failed": len(batch), "error": str(error)})
+            for sample in batch:
+                try:
+                    run_batch([sample])
+                except Exception as item_error:
+                    failed += 1
+                    reply({"id": sample[0], "ok": False, "error": str(item_error)})
+                else:
+                    reply({"id": sample[0], "ok": True})
+            continue
+        for sample in batch:
+            reply({"id": sample[0], "ok": True})
+    return failed
+
+
+def serve(socket_path: Path, handle_job: Callable[[list[str], Callable[[dict], None]], int]) -> None:
+    """Accept jobs until a shutdown request arrives."""
+
+    socket_path.unlink(missing_ok=True)
+    # Bind under a temporary name and rename once listening, so the socket
+    # path appearing means the worker is ready.
+    pending_path = socket_path.with_name(f".{socket_path.name}.pending")
+    pending_path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(str(pending_path))
+        os.chmod(pending_path, 0o600)
+        server.listen(1)
+        pending_path.replace(socket_path)
+        while True:
+            connection, _ = server.accept()
+            # A client that went away (e.g. a stopped generator) only ends its own job.
+            with contextlib.suppress(OSError), connection, connection.makefile("rw", encoding="utf-8") as stream:
+
+                def reply(message: dict) -> None:
+                    stream.write(json.dumps(message) + "\n")
+                    stream.flush()
+
+                try:
+                    request = json.loads(stream.readline() or "{}")
+                except ValueError:
+                    request = {}
+                if request.get("shutdown"):
+                    reply({"done": True, "failed": 0})
+                    return
+                try:
+                    failed = handle_job([str(value) for value in request.get("argv", [])], reply)
+                except (Exception, SystemExit) as error:
+                    # A malformed job fails alone; the loaded model stays up.
+                    reply({"done": True, "failed": -1, "error": str(error)})
+                    continue
+                reply({"done": True, "failed": failed})
+    finally:
+        server.close()
+        socket_path.unlink(missing_ok=True)
+        pending_path.unlink(missing_ok=True)
+
+
+def omnivoice_job_handler(model_id: str) -> Callable[[list[str], Callable[[dict], None]], int]:
+    """Load OmniVoice once and return a handler for infer-batch argument lists."""
+
+    import torch
+    from omnivoice.cli import infer_batch
+    from omnivoice.models.omnivoice import OmniVoice
+    from omnivoice.utils.common import get_best_device_with_count
+    from omnivoice.utils.data_utils import read_test_list
+    from omnivoice.utils.duration import RuleDurationEstimator
+
+    device_type, _ = get_best_device_with_count()
+    device = device_type if device_type in {"cpu", "mps"} else f"{device_type}:0"
+    print(f"Loading {model_id} on {device}", flush=True)
+    infer_batch.worker_model = OmniVoice.from_pretrained(model_id, device_map=device, dtype=torch.float16)
+    duration_estimator = RuleDurationEstimator()
+
+    def clear_device_cache() -> None:
+        if device == "mps":
+            torch.mps.empty_cache()
+
+    def handle_job(argv: list[str], reply: Callable[[dict], None]) -> int:
+        args = infer_batch.get_parser().parse_args(argv)
+        os.makedirs(args.res_dir, exist_ok=True)
+        samples = [
+            (
+                item["id"],
+                item.get("ref_text"),
+                item.get("ref_audio"),
+                item["text"],
+                args.lang_id if args.lang_id is not None else item.get("language_id"),
+                item.get("duration"),
+                item.get("speed"),
+                item.get("instruct"),
+            )
+            for item in read_test_list(args.test_list)
+        ]
+        # Clone and non-clone samples cannot share a batch (see infer_batch).
+        batches: list[list[tuple]] = []
+        for subset in (
+            [sample for sample in samples if sample[2] is not None],
+            [sample for sample in samples if sample[2] is None],
+        ):
+            if not subset:
+                continue
+            if args.batch_size > 0:
+                batches.extend(infer_batch.cluster_samples_by_batch_size(subset, duration_estimator, args.batch_size))
+            else:
+                batches.extend(infer_batch.cluster_samples_by_duration(subset, duration_estimator, args.batch_duration))
+
+        job_kwargs = vars(args)
+        completed = 0
+
+        def run_batch(batch: list[tuple]) -> None:
+            nonlocal completed
+            try:
+                infer_batch.run_inference_batch(batch_samples=batch, **job_kwargs)
+            finally:
+                clear_device_cache()
+            completed += len(batch)
+            print(f"OmniVoice generated {completed}/{len(samples)}", flush=True)
+
+        return run_job(batches, run_batch, reply)
+
+    return handle_job
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--socket", type=Path, required=True)
+    parser.add_argument("--model", default="k2-fsa/OmniVoice")
+    args = parser.parse_args()
+    serve(args.socket, omnivoice_job_handler(args.model))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Run piper-sample-generator's generate_samples.py as one seeded, thread-limited shard.
+
+tts_generate_samples.py splits large Piper requests across several of these
+processes, each writing to its own output directory. Seeding every shard
+differently keeps them from synthesizing the same voices and noise, and the
+thread limit keeps N shards from oversubscribing the CPU.
+
+    tts_piper_shard.py --seed N --threads T -- generate_samples.py <arguments>
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import runpy
+import sys
+
+
+THREAD_ENV_VARS = (
+    "OMP_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "VECLIB_MAXIMUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
+
+def limit_threads(threads: int) -> None:
+    # Must happen before numpy, torch or onnxruntime are first imported.
+    for name in THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+
+
+def seed_everything(seed: int) -> None:
+    random.seed(seed)
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        numpy.random.seed(seed % 2**32)
+    try:
+        import torch
+    except ImportError:
+        return
+    torch.manual_seed(seed)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seed", type=int, required=True)
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("generator_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    generator_args = list(args.generator_args)
+    if generator_args and generator_args[0] == "--":
+        generator_args = generator_args[1:]
+    if not generator_args:
+        parser.error("missing generate_samples.py path")
+
+    limit_threads(max(1, args.threads))
+    seed_everything(args.seed)
+    generator = generator_args[0]
+    sys.argv = generator_args
+    sys.path.insert(0, os.path.dirname(os.path.abspath(generator)))
+    runpy.run_path(generator, run_name="__main__")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,16 +5,23 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 from collections import defaultdict
 from pathlib import Path
 
 import mlx.core as mx
 from mlx_audio.audio_io import write as write_audio
 from mlx_audio.tts import load
+from mlx_audio.utils import load_audio
+
+from tts_conditioning_cache import ConditioningCache
 
 
 VOICE_DESIGN_MODEL = "mlx-community/Qwen3-TTS-12Hz-1.7B-VoiceDesign-6bit"
 VOICE_CLONE_MODEL = "mlx-community/Qwen3-TTS-12Hz-0.6B-Base-6bit"
+# MLX keeps freed buffers for reuse; release them only once the cache grows
+# past this, instead of paying a full clear after every item.
+MLX_CACHE_LIMIT_BYTES = int(os.environ.get("MWW_MLX_CACHE_LIMIT_MB", "2048")) * 1024 * 1024
 
 
 def read_jsonl(path: Path) -> list[dict]:
@@ -31,27 +38,58 @@ def chunks(values: list, size: int):
         yield values[index : index + size]
 
 
-def build_bank(entries: list[dict], output_dir: Path) -> None:
+def clear_cache_under_pressure() -> None:
+    get_cache_memory = getattr(mx, "get_cache_memory", None) or mx.metal.get_cache_memory
+    if get_cache_memory() > MLX_CACHE_LIMIT_BYTES:
+        mx.clear_cache()
+
+
+def design_batch(model, batch: list[dict], language_name: str) -> list[tuple[dict, object]]:
+    # One seed per batch: batched sampling shares a single random stream.
+    mx.random.seed(int(batch[0].get("seed", 1)))
+    results = model.batch_generate(
+        texts=[str(item["text"]) for item in batch],
+        instructs=[str(item["instruct"]) for item in batch],
+        lang_code=language_name,
+        max_tokens=768,
+    )
+    return [(batch[int(result.sequence_idx)], result) for result in results]
+
+
+def build_bank(entries: list[dict], output_dir: Path, batch_size: int) -> None:
+    """Create VoiceDesign reference voices in per-language batches."""
+
     model = load(VOICE_DESIGN_MODEL)
     output_dir.mkdir(parents=True, exist_ok=True)
-    for index, item in enumerate(entries, start=1):
-        mx.random.seed(int(item.get("seed", index)))
-        result = next(
-            model.generate(
-                text=str(item["text"]),
-                instruct=str(item["instruct"]),
-                lang_code=str(item["language_name"]),
-                max_tokens=768,
-            )
-        )
-        write_audio(
-            output_dir / f"{item['id']}.wav",
-            result.audio,
-            result.sample_rate,
-        )
-        mx.clear_cache()
-        if index % 10 == 0 or index == len(entries):
-            print(f"Qwen voice design created {index}/{len(entries)}", flush=True)
+    by_language: dict[str, list[dict]] = defaultdict(list)
+    for item in entries:
+        by_language[str(item["language_name"])].append(item)
+
+    completed = 0
+    for language_name, group in by_language.items():
+        for batch in chunks(group, max(1, batch_size)):
+            try:
+                designed = design_batch(model, batch, language_name)
+            except Exception as error:
+                if len(batch) == 1:
+                    raise
+                # Same fallback as the direct path, but only for this batch.
+                print(
+                    f"Qwen voice design batch of {len(batch)} failed ({error}); retrying one at a time",
+                    flush=True,
+                )
+                mx.clear_cache()
+                designed = [pair for item in batch for pair in design_batch(model, [item], language_name)]
+            for item, result in designed:
+                write_audio(
+                    output_dir / f"{item['id']}.wav",
+                    result.audio,
+                    result.sample_rate,
+                )
+            previous, completed = completed, completed + len(batch)
+            clear_cache_under_pressure()
+            if completed // 10 > previous // 10 or completed == len(entries):
+                print(f"Qwen voice design created {completed}/{len(entries)}", flush=True)
 
 
 def generate_direct(entries: list[dict], output_dir: Path, batch_size: int) -> None:
@@ -87,10 +125,44 @@ def generate_direct(entries: list[dict], output_dir: Path, batch_size: int) -> N
             print(f"Qwen direct generation created {completed}/{len(entries)}", flush=True)
 
 
+def audio_fingerprint(audio: mx.array) -> tuple[int, float]:
+    # The same fingerprint mlx-audio uses for its in-process ICL cache.
+    return audio.size, float(audio.sum())
+
+
+def cache_speaker_embeddings(model, cache: ConditioningCache, speaker_keys: dict) -> None:
+    """Serve extract_speaker_embedding from the on-disk cache for known references."""
+
+    encode = getattr(model, "extract_speaker_embedding", None)
+    if encode is None:
+        return
+    loaded: dict[tuple[int, float], mx.array] = {}
+
+    def cached(audio, *args, **kwargs):
+        fingerprint = audio_fingerprint(audio)
+        key = speaker_keys.get(fingerprint)
+        if key is None:
+            return encode(audio, *args, **kwargs)
+        if fingerprint not in loaded:
+            stored = cache.load(key)
+            if stored is not None:
+                loaded[fingerprint] = stored["speaker_embedding"]
+            else:
+                loaded[fingerprint] = encode(audio, *args, **kwargs)
+                cache.store(key, {"speaker_embedding": loaded[fingerprint]})
+        return loaded[fingerprint]
+
+    model.extract_speaker_embedding = cached
+
+
 def generate(
     entries: list[dict], output_dir: Path, batch_size: int
 ) -> None:
     model = load(VOICE_CLONE_MODEL)
+    cache = ConditioningCache.from_env(VOICE_CLONE_MODEL)
+    speaker_keys: dict[tuple[int, float], str] = {}
+    cache_speaker_embeddings(model, cache, speaker_keys)
+    icl_cache = getattr(model, "_icl_cache", None)
     output_dir.mkdir(parents=True, exist_ok=True)
     grouped: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
     for item in entries:
@@ -104,11 +176,23 @@ def generate(
 
     completed = 0
     for (ref_audio, ref_text, language_name), group in grouped.items():
+        # Load the reference once per group and seed the model's ICL cache
+        # (reference codes and text ids) from disk, so no batch re-encodes it.
+        ref_waveform = load_audio(ref_audio, sample_rate=model.sample_rate)
+        fingerprint = audio_fingerprint(ref_waveform)
+        speaker_keys[fingerprint] = cache.key(ref_audio, kind="speaker_embedding")
+        icl_key = cache.key(ref_audio, ref_text, kind="icl")
+        icl_known = icl_cache is None or (ref_text, fingerprint) in icl_cache
+        if not icl_known:
+            stored = cache.load(icl_key)
+            if stored is not None:
+                icl_cache[(ref_text, fingerprint)] = (stored["ref_codes"], stored["ref_text_ids"])
+                icl_known = True
         for batch in chunks(group, max(1, batch_size)):
             mx.random.seed(int(batch[0].get("seed", completed + 1)))
             results = model.batch_generate(
                 texts=[str(item["text"]) for item in batch],
-                ref_audio=ref_audio,
+                ref_audio=ref_waveform,
                 ref_text=ref_text,
                 lang_code=language_name,
                 max_tokens=512,
@@ -124,6 +208,10 @@ def generate(
             mx.clear_cache()
             if completed % 25 == 0 or completed == len(entries):
                 print(f"Qwen generated {completed}/{len(entries)}", flush=True)
+        if not icl_known and (ref_text, fingerprint) in icl_cache:
+            ref_codes, ref_text_ids = icl_cache[(ref_text, fingerprint)]
+            cache.store(icl_key, {"ref_codes": ref_codes, "ref_text_ids": ref_text_ids})
+    print(f"Qwen {cache.summary()}", flush=True)
 
 
 def main() -> int:
@@ -138,7 +226,7 @@ def main() -> int:
     if not entries:
         return 0
     if args.mode == "bank":
-        build_bank(entries, args.output_dir)
+        build_bank(entries, args.output_dir, args.batch_size)
     elif args.mode == "direct":
         generate_direct(entries, args.output_dir, args.batch_size)
     else:
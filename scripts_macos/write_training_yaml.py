@@ -39,6 +39,18 @@ if os.path.exists("reviewed_negative_features/training"):
     config["features"].insert(insert_at, {"features_dir": "reviewed_negative_features", "sampling_weight": 8.0, "penalty_weight": 1.25, "truth": False, "truncation_strategy": "random", "type": "mmap"})
     print("✅ Added reviewed negative features with stronger negative weighting")
 
+# Incremental runs fine-tune the previous checkpoint (restored by
+# model_train_eval from trained_models/wakeword/restore) on a short schedule,
+# leaning harder on the reviewed false positives that triggered the retrain.
+if os.environ.get("MWW_TRAINING_MODE", "full").strip().lower() == "incremental":
+    config["training_steps"] = [int(os.environ.get("MWW_INCREMENTAL_STEPS", "4000"))]
+    config["learning_rates"] = [float(os.environ.get("MWW_INCREMENTAL_LEARNING_RATE", "0.0002"))]
+    config["eval_step_interval"] = 250
+    for feature in config["features"]:
+        if feature["features_dir"] == "reviewed_negative_features":
+            feature["sampling_weight"] = 16.0
+    print(f"✅ Incremental fine-tune: {config['training_steps'][0]} steps at lr {config['learning_rates'][0]}")
+
 with open("training_parameters.yaml", "w") as f:
     yaml.dump(config, f)
 print("📝 Wrote training_parameters.yaml")
@@ -320,6 +320,68 @@ class AutoTrainTests(unittest.TestCase):
             providers=["CoreMLExecutionProvider", "CPUExecutionProvider"],
         )
 
+    def test_stt_pool_keeps_models_across_engines_and_evicts_lru_over_budget(self):
+        fake_whisper_module = SimpleNamespace(WhisperModel=Mock(side_effect=lambda name, **_: f"fw:{name}"))
+        fake_onnx_asr = SimpleNamespace(load_model=Mock(return_value="parakeet"))
+        fake_huggingface_hub = SimpleNamespace(
+            snapshot_download=Mock(return_value=str(trainer.AUTO_TRAIN_MODEL_DIR))
+        )
+        with (
+            patch.dict(
+                sys.modules,
+                {
+                    "faster_whisper": fake_whisper_module,
+                    "onnx_asr": fake_onnx_asr,
+                    "huggingface_hub": fake_huggingface_hub,
+                },
+            ),
+            patch.object(trainer, "_parakeet_onnx_providers", return_value=["CPUExecutionProvider"]),
+            patch.object(trainer, "AUTO_TRAIN_STT_POOL_MAX_MB", 2200),
+            patch.dict(trainer.FASTER_WHISPER_MODEL_CACHE, clear=True),
+            patch.dict(trainer.PARAKEET_ONNX_MODEL_CACHE, clear=True),
+            patch.dict(trainer.STT_LATENCY_STATS, clear=True),
+            patch.object(trainer, "STT_MODEL_POOL", trainer.OrderedDict()),
+        ):
+            trainer._load_faster_whisper_model(model_name="small.en", device="cpu", compute_type="int8")
+            trainer._load_parakeet_onnx_model()
+            trainer._clear_stt_model_caches(keep_engine="parakeet_onnx")
+            self.assertIn(("small.en", "cpu", "int8"), trainer.FASTER_WHISPER_MODEL_CACHE)
+            self.assertEqual(len(trainer.PARAKEET_ONNX_MODEL_CACHE), 1)
+
+            trainer._load_faster_whisper_model(model_name="small.en", device="cpu", compute_type="int8")
+            trainer._load_faster_whisper_model(model_name="small", device="cpu", compute_type="int8")
+            status = trainer._stt_model_pool_status()
+
+            self.assertEqual(fake_whisper_module.WhisperModel.call_count, 2)
+            self.assertEqual(trainer.PARAKEET_ONNX_MODEL_CACHE, {})
+            self.assertEqual(
+                set(trainer.FASTER_WHISPER_MODEL_CACHE),
+                {("small.en", "cpu", "int8"), ("small", "cpu", "int8")},
+            )
+            self.assertEqual([row["model"] for row in status["models"]], ["small", "small.en"])
+            self.assertEqual(status["used_mb"], 1800)
+            self.assertEqual(status["latency"]["faster_whisper"]["load_count"], 2)
+            self.assertEqual(status["latency"]["parakeet_onnx"]["load_count"], 1)
+
+    def test_stt_warmup_transcribes_silence_with_configured_engine(self):
+        trainer.AUTO_TRAIN_CONFIG["stt_engine"] = "parakeet_onnx"
+        seen = {}
+
+        def fake_transcribe(audio_path, *, engine, language):
+            with wave.open(str(audio_path), "rb") as wav_file:
+                seen["frames"] = wav_file.getnframes()
+            seen["engine"] = engine
+            seen["language"] = language
+            return ""
+
+        with patch.object(trainer, "_transcribe_capture", side_effect=fake_transcribe):
+            trainer._warm_up_stt_engine()
+
+        self.assertEqual(seen, {"frames": 8000, "engine": "parakeet_onnx", "language": "en"})
+        self.assertEqual(trainer.STT_WARMUP_STATUS["state"], "ready")
+        with patch.object(trainer, "AUTO_TRAIN_STT_WARMUP", "0"):
+            self.assertFalse(trainer._start_stt_warmup())
+
     def test_ui_exposes_engine_selector_without_model_input(self):
         source = (Path(__file__).resolve().parents[1] / "frontend" / "src" / "TrainerApp.vue").read_text(
             encoding="utf-8"
@@ -589,6 +651,34 @@ class AutoTrainTests(unittest.TestCase):
         self.assertFalse(result["ok"])
         self.assertEqual(result["code"], "TRAINING_LOCKED")
 
+    def test_auto_training_requests_incremental_mode_unless_disabled(self):
+        with trainer.STATE_LOCK:
+            original_state = {key: trainer.STATE.get(key) for key in ("raw_phrase", "safe_word", "language", "english_accent", "tts_mode")}
+            original_running = trainer.STATE["training"]["running"]
+            trainer.STATE["training"]["running"] = False
+        try:
+            with patch.object(trainer, "TRAIN_SCRIPT", __file__), patch.object(
+                trainer, "_start_training_thread"
+            ) as start_thread:
+                result = trainer._start_auto_training()
+                with trainer.STATE_LOCK:
+                    trainer.STATE["training"]["running"] = False
+                trainer._release_training_run_lock(start_thread.call_args.args[3])
+                trainer.AUTO_TRAIN_CONFIG["incremental_training"] = False
+                manual_result = trainer._start_auto_training()
+                trainer._release_training_run_lock(start_thread.call_args.args[3])
+        finally:
+            with trainer.STATE_LOCK:
+                trainer.STATE.update(original_state)
+                trainer.STATE["training"]["running"] = original_running
+
+        self.assertTrue(result["ok"])
+        self.assertEqual(result["training_mode"], "incremental")
+        self.assertEqual(start_thread.call_args_list[0].kwargs["training_mode"], "incremental")
+        self.assertEqual(manual_result["training_mode"], "full")
+        self.assertEqual(start_thread.call_args_list[1].kwargs["training_mode"], "full")
+        self.assertEqual(trainer.AUTO_TRAIN_STATE["last_train_mode"], "full")
+
     def test_tater_notification_sets_new_word_globally_with_token(self):
         trainer.AUTO_TRAIN_CONFIG.update(
             {
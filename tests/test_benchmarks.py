@@ -0,0 +1,59 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "benchmarks" / "run_benchmarks.py"
+SPEC = importlib.util.spec_from_file_location("run_benchmarks", SCRIPT_PATH)
+run_benchmarks = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(run_benchmarks)
+
+
+class BenchmarkSuiteTests(unittest.TestCase):
+    def test_tiny_suite_runs_every_benchmark_and_writes_results(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "results.json"
+            rc = run_benchmarks.main(
+                ["--clips", "2", "--ambient-hours", "0.01", "--captured", "3", "--repeat", "1", "--output", str(output)]
+            )
+            results = json.loads(output.read_text(encoding="utf-8"))
+
+        self.assertEqual(rc, 0)
+        self.assertEqual(set(results["benchmarks"]), set(run_benchmarks.BENCHMARK_FACTORIES))
+        self.assertEqual(results["benchmarks"]["list_captured_items"]["items"], 3)
+        self.assertEqual(results["benchmarks"]["moving_average_false_accepts_per_hour"]["items"], 1200)
+        self.assertGreater(results["benchmarks"]["read_pcm_metrics"]["items_per_second"], 0)
+
+    def test_compare_flags_per_item_regressions(self):
+        baseline = {
+            "params": {"clips": 10},
+            "benchmarks": {
+                "read_pcm_metrics": {"median_seconds": 1.0, "items": 10},
+                "inspect_wav_bytes": {"median_seconds": 1.0, "items": 10},
+            },
+        }
+        current = {
+            "params": {"clips": 20},
+            "benchmarks": {
+                "read_pcm_metrics": {"median_seconds": 2.6, "items": 20},
+                "inspect_wav_bytes": {"median_seconds": 1.0, "items": 20},
+                "pcm_s16le_to_wav_bytes": {"median_seconds": 0.1, "items": 20},
+            },
+        }
+
+        comparison = run_benchmarks.compare_results(current, baseline, threshold=0.10)
+
+        statuses = {row["name"]: row["status"] for row in comparison["rows"]}
+        self.assertEqual(
+            statuses,
+            {"read_pcm_metrics": "regressed", "inspect_wav_bytes": "improved", "pcm_s16le_to_wav_bytes": "new"},
+        )
+        self.assertEqual(comparison["regressions"], ["read_pcm_metrics"])
+        self.assertFalse(comparison["params_match"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -75,6 +75,34 @@ class CalibrationSelectionTests(unittest.TestCase):
         self.assertEqual(best["false_accepts_per_hour"], 0.6)
         self.assertEqual(selected_limit, 0.75)
 
+    def test_baseline_comparison_flags_recall_or_false_accept_regressions(self):
+        baseline = {"selected_metrics": {"recall": 0.98, "false_accepts_per_hour": 0.1}}
+
+        within_noise = calibrate_detector._compare_to_baseline(
+            baseline,
+            {"recall": 0.977, "false_accepts_per_hour": 0.12},
+            recall_tolerance=0.005,
+            faph_tolerance=0.05,
+        )
+        regressed = calibrate_detector._compare_to_baseline(
+            baseline,
+            {"recall": 0.96, "false_accepts_per_hour": 0.3},
+            recall_tolerance=0.005,
+            faph_tolerance=0.05,
+        )
+        no_baseline = calibrate_detector._compare_to_baseline(
+            {},
+            {"recall": 0.5, "false_accepts_per_hour": 9.0},
+            recall_tolerance=0.005,
+            faph_tolerance=0.05,
+        )
+
+        self.assertFalse(within_noise["regressed"])
+        self.assertTrue(regressed["regressed"])
+        self.assertEqual(len(regressed["reasons"]), 2)
+        self.assertFalse(no_baseline["regressed"])
+        self.assertFalse(no_baseline["baseline_available"])
+
     def test_rejects_negative_recall_margin(self):
         with self.assertRaises(ValueError):
             calibrate_detector._select_best_candidate(
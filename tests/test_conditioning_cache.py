@@ -0,0 +1,65 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CACHE_PATH = REPO_ROOT / "scripts_macos" / "tts_conditioning_cache.py"
+SPEC = importlib.util.spec_from_file_location("tts_conditioning_cache", CACHE_PATH)
+cache_module = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(cache_module)
+
+
+def save_json(path, arrays):
+    Path(path).write_text(json.dumps(arrays), encoding="utf-8")
+
+
+def load_json(path):
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+class ConditioningCacheTests(unittest.TestCase):
+    def test_entries_are_keyed_by_model_audio_content_and_text(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            first = root / "carrier.wav"
+            copy = root / "elsewhere" / "carrier_copy.wav"
+            copy.parent.mkdir()
+            first.write_bytes(b"RIFF-carrier")
+            copy.write_bytes(b"RIFF-carrier")
+
+            cache = cache_module.ConditioningCache(root / "cache", "org/moss", save_json, load_json)
+            key = cache.key(str(first), "hey tater", kind="icl")
+            self.assertEqual(cache.key(str(copy), "hey tater", kind="icl"), key)
+            self.assertNotEqual(cache.key(str(first), "hello", kind="icl"), key)
+            self.assertNotEqual(cache.key(str(first), "hey tater", kind="speaker_embedding"), key)
+            other_model = cache_module.ConditioningCache(root / "cache", "org/qwen", save_json, load_json)
+            self.assertNotEqual(other_model.key(str(first), "hey tater", kind="icl"), key)
+
+            self.assertIsNone(cache.load(key))
+            cache.store(key, {"prompt_codes": [[1, 2, 3]]})
+            reopened = cache_module.ConditioningCache(root / "cache", "org/moss", save_json, load_json)
+            self.assertEqual(reopened.load(key), {"prompt_codes": [[1, 2, 3]]})
+            self.assertEqual((reopened.hits, reopened.misses), (1, 0))
+            self.assertEqual([path.name for path in (root / "cache" / "org--moss").iterdir()], [f"{key}.safetensors"])
+
+            cache.path(key).write_text("truncated", encoding="utf-8")
+            self.assertIsNone(reopened.load(key))
+            self.assertFalse(cache.path(key).exists())
+
+    def test_cache_without_a_root_never_touches_disk(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            carrier = Path(temp_dir) / "carrier.wav"
+            carrier.write_bytes(b"RIFF")
+            cache = cache_module.ConditioningCache(None, "org/moss", save_json, load_json)
+            key = cache.key(str(carrier))
+            cache.store(key, {"prompt_codes": [1]})
+            self.assertIsNone(cache.load(key))
+            self.assertEqual(list(Path(temp_dir).iterdir()), [carrier])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
+import os
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import trainer_server as trainer
 
@@ -22,6 +24,7 @@ class DataManagementTests(unittest.TestCase):
             "PIPER_VOICES_DIR": trainer.PIPER_VOICES_DIR,
             "PIPER_CATALOG_CACHE_FILE": trainer.PIPER_CATALOG_CACHE_FILE,
             "OMNIVOICE_CATALOG_CACHE_FILE": trainer.OMNIVOICE_CATALOG_CACHE_FILE,
+            "ARTIFACT_CACHE_DIR": trainer.ARTIFACT_CACHE_DIR,
         }
         trainer.DATA_DIR = root
         trainer.SUPPORT_DIR = root / "support"
@@ -35,10 +38,12 @@ class DataManagementTests(unittest.TestCase):
         trainer.PIPER_VOICES_DIR = trainer.PIPER_ROOT / "voices"
         trainer.PIPER_CATALOG_CACHE_FILE = root / ".cache" / "piper_voices_catalog.json"
         trainer.OMNIVOICE_CATALOG_CACHE_FILE = root / ".cache" / "omnivoice_languages.json"
+        trainer.ARTIFACT_CACHE_DIR = root / "artifact_cache"
         self.original_training_running = trainer.STATE["training"]["running"]
         self.original_review_running = trainer.AUTO_TRAIN_RUNTIME["review_running"]
         trainer.STATE["training"]["running"] = False
         trainer.AUTO_TRAIN_RUNTIME["review_running"] = False
+        trainer._forget_managed_usage()
 
     def tearDown(self):
         for name, value in self.original_paths.items():
@@ -62,12 +67,50 @@ class DataManagementTests(unittest.TestCase):
         self.assertGreater(item["size_bytes"], 0)
         self.assertEqual(item["location"], "generated_samples")
         self.assertEqual(payload["total_file_count"], 2)
+        self.assertEqual(
+            next(row for row in payload["items"] if row["id"] == "artifact_cache")["location"], "artifact_cache"
+        )
 
         deleted = trainer._delete_managed_data_item("generated_samples")
         self.assertFalse(generated.exists())
         self.assertTrue(outside.exists())
         self.assertEqual(deleted["deleted_id"], "generated_samples")
 
+    def test_usage_index_only_rescans_changed_directories(self):
+        generated = trainer.DATA_DIR / "generated_samples"
+        (generated / "nested").mkdir(parents=True)
+        (generated / "one.wav").write_bytes(b"a" * 128)
+        (generated / "nested" / "two.wav").write_bytes(b"b" * 128)
+
+        first = trainer._managed_path_usage(generated)
+        with patch.object(trainer, "_scan_managed_directory", wraps=trainer._scan_managed_directory) as scan:
+            self.assertEqual(trainer._managed_path_usage(generated), first)
+            scan.assert_not_called()
+
+            (generated / "nested" / "three.wav").write_bytes(b"c" * 128)
+            os.utime(generated / "nested", ns=(0, 1))
+            size, count = trainer._managed_path_usage(generated)
+            self.assertEqual(count, 3)
+            self.assertEqual([call.args[0] for call in scan.call_args_list], [str(generated / "nested")])
+
+            scan.reset_mock()
+            trainer._note_managed_usage_change(generated / "one.wav")
+            trainer._managed_path_usage(generated)
+            self.assertEqual([call.args[0] for call in scan.call_args_list], [str(generated)])
+
+        # An in-place rewrite keeps the directory mtime; the scanner's pass re-stats files.
+        before = trainer._managed_path_usage(generated)
+        mtime = (generated / "nested").stat().st_mtime_ns
+        (generated / "nested" / "two.wav").write_bytes(b"b" * 65536)
+        os.utime(generated / "nested", ns=(mtime, mtime))
+        self.assertEqual(trainer._managed_path_usage(generated), before)
+        self.assertGreater(trainer._managed_path_usage(generated, rescan=True)[0], before[0])
+
+        payload = trainer._managed_data_payload()
+        self.assertTrue(payload["usage_computed_at"])
+        self.assertIn("hard-linked", payload["usage_note"])
+        self.assertIsNotNone(payload["usage_scan_seconds"])
+
     def test_unknown_ids_and_active_training_are_rejected(self):
         with self.assertRaises(KeyError):
             trainer._delete_managed_data_item("../../not-allowed")
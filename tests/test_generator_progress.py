@@ -0,0 +1,86 @@
+import json
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+WRAPPER_PATH = REPO_ROOT / "scripts_macos" / "run_generator_with_progress.py"
+
+
+def progress_events(stdout: str):
+    return [json.loads(line[len("::progress "):]) for line in stdout.splitlines() if line.startswith("::progress ")]
+
+
+class GeneratorProgressTests(unittest.TestCase):
+    def run_wrapper(self, root: Path, generator_source: str, *generator_args: str) -> subprocess.CompletedProcess:
+        generator = root / "fake_generator.py"
+        generator.write_text(textwrap.dedent(generator_source), encoding="utf-8")
+        return subprocess.run(
+            [
+                sys.executable,
+                str(WRAPPER_PATH),
+                "--generator",
+                str(generator),
+                "--output-dir",
+                str(root / "out"),
+                "--max-samples",
+                "200",
+                "--",
+                *generator_args,
+            ],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+    def test_child_events_are_relayed_and_coalesced(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = self.run_wrapper(
+                Path(tmp),
+                """
+                import json, os
+                fd = int(os.environ["MWW_PROGRESS_FD"])
+                def emit(**event):
+                    os.write(fd, (json.dumps(event) + "\\n").encode())
+                emit(event="plan", total=200, engines={"piper": 200})
+                for done in range(1, 201):
+                    emit(event="samples", engine="piper", done=done, total=200)
+                print("INFO:__main__:finished", flush=True)
+                """,
+            )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        events = progress_events(result.stdout)
+        self.assertEqual(events[0], {"event": "plan", "total": 200, "engines": {"piper": 200}})
+        samples = [event for event in events if event["event"] == "samples"]
+        self.assertLess(len(samples), 20)
+        self.assertEqual(samples[-1]["done"], 200)
+        self.assertIn("   finished", result.stdout.splitlines())
+        self.assertIn("   piper: Generated 200/200 samples...", result.stdout.splitlines())
+
+    def test_silent_onnx_generator_falls_back_to_counting_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            (root / "out").mkdir()
+            result = self.run_wrapper(
+                root,
+                f"""
+                from pathlib import Path
+                for index in range(3):
+                    (Path({str(root / "out")!r}) / f"{{index}}.wav").write_bytes(b"")
+                """,
+                "--model",
+                "voice.onnx",
+            )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+        events = progress_events(result.stdout)
+        self.assertEqual(events[-1], {"event": "generated", "done": 3, "total": 200, "source": "scan"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import io
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import trainer_server as trainer
+
+
+def silent_wav_bytes(duration_s: float = 0.25) -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b"\x00\x00" * int(16000 * duration_s))
+    return output.getvalue()
+
+
+def metric_value(body: str, sample: str) -> float:
+    for line in body.splitlines():
+        if line.startswith(sample + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{sample} not found in metrics output")
+
+
+class MetricsEndpointTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.patches = [
+            patch.object(trainer, "CAPTURED_DIR", Path(self.tempdir.name) / "captured_audio"),
+            patch.dict(trainer.METRIC_SAMPLES, clear=True),
+            patch.dict(trainer.AUTO_TRAIN_CONFIG, {"enabled": False}),
+            patch.dict(trainer.TRAINING_STAGE_TIMER, {"stage": "", "started": 0.0}),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.client = TestClient(trainer.app)
+
+    def tearDown(self):
+        for patcher in reversed(self.patches):
+            patcher.stop()
+        self.tempdir.cleanup()
+
+    def test_upload_review_and_route_latency_are_exported(self):
+        audio = silent_wav_bytes()
+        response = self.client.post(
+            "/api/upload_captured_audio_raw",
+            content=audio,
+            headers={"X-Audio-Format": "wav", "X-Source-Device": "kitchen"},
+        )
+        self.assertTrue(response.json()["ok"])
+        rejected = self.client.post(
+            "/api/upload_captured_audio_raw",
+            content=b"",
+            headers={"X-Audio-Format": "wav"},
+        )
+        self.assertEqual(rejected.status_code, 400)
+        saved_as = response.json()["item"]["saved_as"]
+        self.client.post(f"/api/captured_audio/{saved_as}/discard")
+
+        body = self.client.get("/metrics").text
+
+        endpoint = 'endpoint="upload_captured_audio_raw"'
+        self.assertEqual(metric_value(body, f"wakeword_trainer_uploads_total{{{endpoint},result=\"ok\"}}"), 1)
+        self.assertEqual(metric_value(body, f"wakeword_trainer_uploads_total{{{endpoint},result=\"error\"}}"), 1)
+        self.assertEqual(metric_value(body, f"wakeword_trainer_upload_bytes_total{{{endpoint}}}"), len(audio))
+        self.assertEqual(metric_value(body, f"wakeword_trainer_ingest_seconds_count{{{endpoint}}}"), 1)
+        self.assertEqual(metric_value(body, 'wakeword_trainer_normalize_seconds_count{converted="false"}'), 1)
+        self.assertEqual(
+            metric_value(body, 'wakeword_trainer_review_outcomes_total{result="discarded",source="manual"}'),
+            1,
+        )
+        self.assertEqual(
+            metric_value(
+                body,
+                'wakeword_trainer_http_request_seconds_bucket{method="POST",'
+                'route="/api/upload_captured_audio_raw",status="400",le="+Inf"}',
+            ),
+            1,
+        )
+        self.assertIn("# TYPE wakeword_trainer_auto_review_queue_depth gauge", body)
+
+    def test_stage_markers_feed_stage_duration_histogram(self):
+        with patch.object(trainer.time, "monotonic", side_effect=[100.0, 160.0, 175.0]):
+            trainer._append_train_log("::stage tts_generation\n")
+            trainer._append_train_log("::stage training\n")
+            trainer._append_train_log("::stage done\n")
+
+        body = trainer._render_metrics()
+        self.assertEqual(metric_value(body, 'wakeword_trainer_training_stage_seconds_sum{stage="tts_generation"}'), 60)
+        self.assertEqual(metric_value(body, 'wakeword_trainer_training_stage_seconds_sum{stage="training"}'), 15)
+        self.assertEqual(
+            metric_value(body, 'wakeword_trainer_training_stage_seconds_bucket{stage="training",le="10"}'),
+            0,
+        )
+        self.assertEqual(
+            metric_value(body, 'wakeword_trainer_training_stage_seconds_bucket{stage="training",le="30"}'),
+            1,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
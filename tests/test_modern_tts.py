@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import argparse
 import importlib.util
+import io
+import hashlib
 import json
 import math
 import os
 import shutil
 import subprocess
+import sys
 import tempfile
 import unittest
 import wave
@@ -331,30 +334,28 @@ class ModernTtsTests(unittest.TestCase):
                 for item in model_entries[:1] if only_first else model_entries:
                     write_tone(output_dir / f"{item['id']}.wav")
 
-            batched_calls = 0
+            batched_commands: list[list[str]] = []
 
             def fake_batched(command, _flag, **_kwargs):
-                nonlocal batched_calls
-                batched_calls += 1
-                create_outputs(command, only_first=batched_calls == 1)
+                batched_commands.append(command)
+                create_outputs(command, only_first=len(batched_commands) == 1)
 
+            # Without an OmniVoice environment the persistent worker cannot
+            # start, so every job takes the omnivoice-infer-batch path.
             with (
                 patch.object(instance, "ensure_environment"),
                 patch.object(generator_module, "run_with_batch_retry", side_effect=fake_batched),
-                patch.object(
-                    generator_module,
-                    "run",
-                    side_effect=lambda command, **_kwargs: create_outputs(command),
-                ) as run_single,
+                patch.object(generator_module, "run") as run_single,
             ):
                 entries = instance._generate_omni_bank(2, 0, destination)
-            retry_command = run_single.call_args.args[0]
+            retry_command = batched_commands[1]
             retry_input = Path(retry_command[retry_command.index("--test_list") + 1])
             retried_ids = [json.loads(line)["id"] for line in retry_input.read_text().splitlines()]
 
         self.assertEqual(len(entries), 2)
-        self.assertEqual(batched_calls, 2)
-        self.assertEqual(run_single.call_count, 1)
+        self.assertEqual(len(batched_commands), 3)
+        self.assertEqual(run_single.call_count, 0)
+        self.assertTrue(instance.omnivoice_worker_failed)
         self.assertEqual(retry_command[retry_command.index("--batch_size") + 1], "1")
         self.assertEqual(retried_ids, ["omni_prompt_0001"])
 
@@ -497,6 +498,60 @@ class ModernTtsTests(unittest.TestCase):
             args.tts_mode = "hybrid"
             self.assertEqual(instance.engines()[-1], "piper")
 
+    def test_piper_shards_are_seeded_separately_and_merged_with_stable_ids(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            args = argparse.Namespace(
+                phrase="hey tater",
+                language="en",
+                tts_mode="piper",
+                samples=10,
+                batch_size=4,
+                voice_count=8,
+                data_dir=data_dir,
+                output_dir=data_dir / "out",
+                ffmpeg="ffmpeg",
+                dry_run=False,
+                piper_models=[],
+            )
+            piper_generator = data_dir / "piper-sample-generator" / "generate_samples.py"
+            piper_generator.parent.mkdir(parents=True)
+            piper_generator.write_text(
+                "import argparse, os, random\n"
+                "from pathlib import Path\n"
+                "parser = argparse.ArgumentParser()\n"
+                "parser.add_argument('text')\n"
+                "parser.add_argument('--max-samples', type=int)\n"
+                "parser.add_argument('--batch-size', type=int)\n"
+                "parser.add_argument('--output-dir')\n"
+                "args = parser.parse_args()\n"
+                "for index in range(args.max_samples):\n"
+                "    Path(args.output_dir, f'{index}.wav').write_text(\n"
+                "        f\"{random.random()} {os.environ['OMP_NUM_THREADS']}\")\n",
+                encoding="utf-8",
+            )
+            piper_python = data_dir / ".venv" / "bin" / "python"
+            piper_python.parent.mkdir(parents=True)
+            piper_python.symlink_to(sys.executable)
+            generator = generator_module.Generator(args)
+            destination = data_dir / "raw"
+            destination.mkdir()
+
+            with (
+                patch.object(generator_module, "PIPER_SHARDS", 3),
+                patch.object(generator_module, "PIPER_MIN_SHARD_SAMPLES", 1),
+                patch.object(generator_module, "PIPER_SHARD_POLL_SECONDS", 0.05),
+            ):
+                self.assertEqual(generator.piper_shard_count(2), 2)
+                generator.run_piper(destination, 11)
+
+            outputs = {path.name: path.read_text(encoding="utf-8") for path in destination.glob("*.wav")}
+            self.assertEqual(set(outputs), {f"{index}.wav" for index in range(11)})
+            # Shards own 0-3, 4-7 and 8-10; each was seeded differently.
+            self.assertEqual(len({outputs[f"{start}.wav"] for start in (0, 4, 8)}), 3)
+            self.assertTrue(all(text.endswith(f" {generator_module.PIPER_THREADS_PER_SHARD}") for text in outputs.values()))
+            self.assertFalse((destination / ".piper-shards").exists())
+
     def test_voice_descriptions_are_distinct_for_default_bank(self) -> None:
         descriptions = generator_module.qwen_descriptions("English", 128)
         self.assertEqual(len(descriptions), 128)
@@ -539,6 +594,144 @@ class ModernTtsTests(unittest.TestCase):
         self.assertEqual(mocked_run.call_count, 2)
         self.assertEqual(mocked_run.call_args_list[1].args[0], ["worker", "--batch-size", "1"])
 
+    def test_learned_batch_size_grows_with_throughput_and_halves_on_failure(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            store = Path(temp_dir) / "batch_sizes.json"
+            sizes = generator_module.BatchSizes(store, maximum=16)
+            key = sizes.key("qwen3", "org/model")
+            # No history: start at the old safe cap even when asked for more.
+            self.assertEqual(sizes.choose(key, 100), 4)
+            self.assertEqual(sizes.choose(key, 2), 2)
+
+            sizes.succeeded(key, 4, 64, 16.0)
+            self.assertEqual(sizes.choose(key, 100), 8)
+            sizes.succeeded(key, 8, 64, 8.0)
+            self.assertEqual(sizes.choose(key, 100), 16)
+            # 16 is no faster than 8, so 8 stays and 16 is not probed again.
+            sizes.succeeded(key, 16, 64, 8.0)
+            self.assertEqual(generator_module.BatchSizes(store, maximum=16).choose(key, 100), 8)
+            sizes.succeeded(key, 8, 64, 7.0)
+            self.assertEqual(sizes.choose(key, 100), 8)
+
+            # A learned size that gets clearly slower is halved and probed again.
+            with patch.object(generator_module, "log"):
+                sizes.succeeded(key, 8, 64, 16.0)
+            self.assertEqual(sizes.choose(key, 100), 4)
+            sizes.succeeded(key, 4, 64, 16.0)
+            self.assertEqual(sizes.choose(key, 100), 8)
+            sizes.succeeded(key, 8, 64, 8.0)
+            self.assertEqual(sizes.choose(key, 100), 8)
+
+            jobs = Path(temp_dir) / "jobs.jsonl"
+            jobs.write_text("".join(f'{{"id": "{index}"}}\n' for index in range(32)), encoding="utf-8")
+            command = ["worker", "--input-jsonl", str(jobs), "--batch-size", "8"]
+            with patch.object(
+                generator_module,
+                "run",
+                side_effect=(subprocess.CalledProcessError(-9, command), None),
+            ) as mocked_run:
+                generator_module.run_with_batch_retry(
+                    command, "--batch-size", sizes=sizes, engine="qwen3", model="org/model"
+                )
+
+            self.assertEqual(
+                [call.args[0][-1] for call in mocked_run.call_args_list],
+                ["8", "4"],
+            )
+            reopened = generator_module.BatchSizes(store, maximum=16)
+            self.assertEqual(reopened.choose(key, 8), 4)
+            self.assertEqual(reopened.entries[key]["limit"], 8)
+
+            # A failure that is not memory pressure retries once at 1 and learns nothing.
+            with patch.object(
+                generator_module,
+                "run",
+                side_effect=(subprocess.CalledProcessError(1, command, stderr="ValueError: bad prompt"), None),
+            ) as mocked_run:
+                generator_module.run_with_batch_retry(
+                    command, "--batch-size", sizes=sizes, engine="qwen3", model="org/model"
+                )
+            self.assertEqual([call.args[0][-1] for call in mocked_run.call_args_list], ["4", "1"])
+            self.assertEqual(generator_module.BatchSizes(store, maximum=16).entries, reopened.entries)
+
+            with patch.object(
+                generator_module,
+                "run",
+                side_effect=(subprocess.CalledProcessError(1, command, stderr="RuntimeError: MPS backend out of memory"), None),
+            ) as mocked_run:
+                generator_module.run_with_batch_retry(
+                    command, "--batch-size", sizes=sizes, engine="qwen3", model="org/model"
+                )
+            self.assertEqual([call.args[0][-1] for call in mocked_run.call_args_list], ["4", "2"])
+            self.assertEqual(generator_module.BatchSizes(store, maximum=16).entries[key]["limit"], 4)
+
+    def test_run_echoes_stderr_and_attaches_its_tail_to_failures(self) -> None:
+        command = [sys.executable, "-c", "import sys; sys.stderr.write('Cannot allocate memory\\n'); sys.exit(3)"]
+        with self.assertRaises(subprocess.CalledProcessError) as raised:
+            generator_module.run(command)
+        self.assertEqual(raised.exception.returncode, 3)
+        self.assertIn("Cannot allocate memory", raised.exception.stderr)
+        self.assertTrue(generator_module.memory_failure(3, raised.exception.stderr))
+        self.assertFalse(generator_module.memory_failure(1, "ValueError"))
+        self.assertTrue(generator_module.memory_failure(-9))
+
+    def test_progress_fd_must_be_a_pipe_and_only_reaches_progress_children(self) -> None:
+        show_env = [sys.executable, "-c", "import os, sys; sys.stderr.write(os.environ.get('MWW_PROGRESS_FD', 'unset'))"]
+        read_fd, write_fd = os.pipe()
+        try:
+            with tempfile.TemporaryFile() as regular:
+                with patch.dict(os.environ, {"MWW_PROGRESS_FD": str(regular.fileno())}):
+                    self.assertIsNone(generator_module.progress_fd())
+            with patch.dict(os.environ, {"MWW_PROGRESS_FD": str(write_fd)}):
+                self.assertEqual(generator_module.progress_fd(), write_fd)
+                self.assertNotIn("MWW_PROGRESS_FD", generator_module.without_progress_fd())
+                with patch.object(generator_module, "log"), patch.object(sys, "stderr") as stderr:
+                    stderr.buffer = io.BytesIO()
+                    generator_module.run(show_env)
+                    self.assertEqual(stderr.buffer.getvalue(), b"unset")
+                    stderr.buffer = io.BytesIO()
+                    generator_module.run(show_env, progress=True)
+                    self.assertEqual(stderr.buffer.getvalue(), str(write_fd).encode())
+        finally:
+            os.close(read_fd)
+            os.close(write_fd)
+
+    def test_first_pass_is_sized_from_observed_acceptance(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            args = argparse.Namespace(
+                phrase="hey tater",
+                language="en",
+                tts_mode="modern",
+                samples=100,
+                batch_size=4,
+                voice_count=8,
+                data_dir=data_dir,
+                output_dir=data_dir / "out",
+                ffmpeg="ffmpeg",
+                dry_run=False,
+                piper_models=[],
+            )
+            instance = generator_module.Generator(args)
+            # No history: the static prior.
+            self.assertEqual(instance.candidate_count("omnivoice", 100), 150)
+
+            # OmniVoice delivered 190 of 200 candidates; QA passed 190 and
+            # normalization accepted 95 of the first 100 it needed to look at.
+            step = {"requested": 200, "cursor": 100, "accepted": 95}
+            instance.record_acceptance("omnivoice", step, 190)
+            instance.record_acceptance("qwen3", {"requested": 100, "cursor": 40, "accepted": 20}, 80)
+
+            reopened = generator_module.Generator(args)
+            omnivoice = reopened.candidate_count("omnivoice", 100)
+            self.assertLess(omnivoice, 150)
+            self.assertGreater(omnivoice, 100 / 0.9025)
+            # Qwen kept only 40% of its candidates, so it now asks for more than its 1.08 prior.
+            self.assertGreater(reopened.candidate_count("qwen3", 100), 250)
+            # Another language learns separately.
+            args.language = "de"
+            self.assertEqual(generator_module.Generator(args).candidate_count("omnivoice", 100), 150)
+
     def test_acoustic_qa_accepts_speech_like_pcm_and_rejects_silence(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
@@ -761,6 +954,157 @@ class ModernTtsTests(unittest.TestCase):
             self.assertTrue((output_dir / ".generation_manifest.json").is_file())
             self.assertTrue(instance.cache_hit())
 
+    def test_interrupted_generation_resumes_from_the_journal(self) -> None:
+        synthesized: list[list[str]] = [[], []]
+        tones = iter(range(10_000))
+
+        class JournalGenerator(generator_module.Generator):
+            run_index = 0
+
+            def generate_direct_engine(self, engine, count, reference_paths, prefix=""):
+                synthesized[self.run_index].append(f"{engine}:{prefix or 'main'}")
+                destination = self.raw_destination(engine, prefix)
+                destination.mkdir(parents=True, exist_ok=True)
+                paths = []
+                for index in range(count):
+                    path = destination / f"{engine}_{prefix}{index}.wav"
+                    write_tone(path, frequency=180 + next(tones))
+                    paths.append(path)
+                return [], paths
+
+            def qualify_direct_candidates(self, engine, entries, paths, prefix=""):
+                return paths
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            fake_ffmpeg = data_dir / "ffmpeg"
+            fake_ffmpeg.write_text(
+                "#!/usr/bin/env python3\n"
+                "import shutil, sys\n"
+                "shutil.copyfile(sys.argv[sys.argv.index('-i') + 1], sys.argv[-1])\n",
+                encoding="utf-8",
+            )
+            fake_ffmpeg.chmod(0o755)
+            output_dir = data_dir / "work" / "wake_word_samples"
+            args = argparse.Namespace(
+                phrase="hey tater",
+                language="en",
+                tts_mode="modern",
+                samples=13,
+                batch_size=4,
+                voice_count=8,
+                data_dir=data_dir,
+                output_dir=output_dir,
+                ffmpeg=str(fake_ffmpeg),
+                dry_run=False,
+                piper_models=[],
+            )
+
+            def stop_after_six(event, **fields):
+                if event == "samples" and fields["done"] == 6:
+                    raise generator_module.GenerationInterrupted(15)
+
+            first = JournalGenerator(args)
+            with patch.object(generator_module, "emit_progress", side_effect=stop_after_six):
+                with self.assertRaises(generator_module.GenerationInterrupted):
+                    first.generate()
+            journal = json.loads(first.journal_path.read_text(encoding="utf-8"))
+            self.assertEqual(journal["accepted_count"], 6)
+            interrupted_step = synthesized[0][-1]
+            self.assertEqual(journal["steps"][interrupted_step]["stage"], "normalizing")
+            self.assertFalse(output_dir.exists())
+
+            second = JournalGenerator(args)
+            second.run_index = 1
+            second.generate()
+
+            self.assertTrue(set(synthesized[0]).isdisjoint(synthesized[1]), synthesized)
+            self.assertEqual(sorted(int(path.stem) for path in output_dir.glob("*.wav")), list(range(13)))
+            manifest = json.loads((output_dir / ".generation_manifest.json").read_text(encoding="utf-8"))
+            self.assertEqual(sum(manifest["actual_counts"].values()), 13)
+            self.assertFalse(second.build_dir.exists())
+
+    def test_changing_the_sample_target_resizes_the_corpus_in_place(self) -> None:
+        requested: list[tuple[str, int]] = []
+        tones = iter(range(10_000))
+
+        class CountingGenerator(generator_module.Generator):
+            def generate_direct_engine(self, engine, count, reference_paths, prefix=""):
+                requested.append((engine, count))
+                destination = self.raw_destination(engine, prefix)
+                destination.mkdir(parents=True, exist_ok=True)
+                paths = []
+                for index in range(count):
+                    path = destination / f"{engine}_{prefix}{index}.wav"
+                    write_tone(path, frequency=180 + next(tones))
+                    paths.append(path)
+                return [], paths
+
+            def qualify_direct_candidates(self, engine, entries, paths, prefix=""):
+                return paths
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            fake_ffmpeg = data_dir / "ffmpeg"
+            fake_ffmpeg.write_text(
+                "#!/usr/bin/env python3\n"
+                "import shutil, sys\n"
+                "shutil.copyfile(sys.argv[sys.argv.index('-i') + 1], sys.argv[-1])\n",
+                encoding="utf-8",
+            )
+            fake_ffmpeg.chmod(0o755)
+            output_dir = data_dir / "work" / "wake_word_samples"
+
+            def build(samples):
+                requested.clear()
+                CountingGenerator(
+                    argparse.Namespace(
+                        phrase="hey tater",
+                        language="en",
+                        tts_mode="modern",
+                        samples=samples,
+                        batch_size=4,
+                        voice_count=8,
+                        data_dir=data_dir,
+                        output_dir=output_dir,
+                        ffmpeg=str(fake_ffmpeg),
+                        dry_run=False,
+                        piper_models=[],
+                    )
+                ).generate()
+                return json.loads((output_dir / ".generation_manifest.json").read_text(encoding="utf-8"))
+
+            built = build(12)
+            original = {path.name: path.read_bytes() for path in output_dir.glob("*.wav")}
+            self.assertEqual(
+                {engine: (result["planned"], result["accepted"]) for engine, result in built["engine_results"].items()},
+                {engine: (4, 4) for engine in built["planned_counts"]},
+            )
+            self.assertEqual(built["allocation"]["measured"], {})
+
+            grown = build(18)
+            self.assertEqual(sum(count for _, count in requested), 6)
+            self.assertEqual(sorted(int(path.stem) for path in output_dir.glob("*.wav")), list(range(18)))
+            self.assertTrue(all((output_dir / name).read_bytes() == data for name, data in original.items()))
+            self.assertEqual(sorted(grown["actual_counts"].values()), [6, 6, 6])
+            self.assertEqual(
+                (output_dir / ".added_samples.txt").read_text(encoding="utf-8").split(),
+                [f"{index}.wav" for index in range(12, 18)],
+            )
+
+            shrunk = build(9)
+            self.assertEqual(requested, [])
+            self.assertEqual(sorted(int(path.stem) for path in output_dir.glob("*.wav")), list(range(9)))
+            self.assertEqual(sorted(shrunk["actual_counts"].values()), [3, 3, 3])
+            self.assertFalse((output_dir / ".added_samples.txt").exists())
+            index = (output_dir / ".sample_index.tsv").read_text(encoding="utf-8").splitlines()
+            for line in index:
+                number, _engine, digest = line.split("\t")
+                self.assertEqual(
+                    hashlib.sha256((output_dir / f"{number}.wav").read_bytes()).hexdigest(),
+                    digest,
+                )
+
     def test_apple_training_and_ui_are_wired_for_modern_tts(self) -> None:
         training_script = (REPO_ROOT / "train_microwakeword_macos.sh").read_text(encoding="utf-8")
         self.assertIn("tts_generate_samples.py", training_script)
@@ -794,6 +1138,24 @@ class ModernTtsTests(unittest.TestCase):
         self.assertIn("tts_mode: trainer.ttsMode", store)
         self.assertIn("OmniVoice", store)
 
+    def test_training_preflight_cache_gates_setup_work(self) -> None:
+        training_script = (REPO_ROOT / "train_microwakeword_macos.sh").read_text(encoding="utf-8")
+        self.assertIn('PREFLIGHT_STATE_FILE=".venv/.preflight_state"', training_script)
+        self.assertIn("MWW_FORCE_PREFLIGHT", training_script)
+        setup_start = training_script.index("run_full_environment_preflight() {")
+        setup_end = training_script.index('\nPREFLIGHT_FINGERPRINT=""', setup_start)
+        setup_body = training_script[setup_start:setup_end]
+        for expensive_step in (
+            "git pull --ff-only",
+            'pip install -q "${AUXILIARY_PIP_DEPENDENCIES[@]}"',
+            "pip install -q -e ./micro-wake-word",
+            "import tensorflow as tf",
+            'bash "$SOURCE_DIR/scripts_macos/get_piper_generator.sh"',
+        ):
+            self.assertIn(expensive_step, setup_body)
+            self.assertEqual(training_script.count(expensive_step), setup_body.count(expensive_step), expensive_step)
+        self.assertIn("reuse_preflight_ffmpeg", training_script)
+
     def test_omnivoice_socket_temp_falls_back_from_long_macos_path(self) -> None:
         long_path = "/var/folders/" + ("x" * 80) + "/T/tater-wake-omnivoice"
         selected = generator_module.select_omnivoice_tmpdir(long_path)
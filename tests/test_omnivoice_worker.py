@@ -0,0 +1,93 @@
+import argparse
+import importlib.util
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+def load_script(name: str):
+    spec = importlib.util.spec_from_file_location(name, REPO_ROOT / "scripts_macos" / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+generator_module = load_script("tts_generate_samples")
+worker_module = load_script("tts_omnivoice_worker")
+
+
+class OmniVoiceWorkerTests(unittest.TestCase):
+    def test_jobs_share_one_worker_and_failed_batches_retry_per_item(self):
+        calls: list[list[str]] = []
+        jobs: list[list[str]] = []
+
+        def run_batch(batch):
+            calls.append([sample[0] for sample in batch])
+            if "bad" in {sample[0] for sample in batch}:
+                raise RuntimeError("decoder collapse")
+
+        def handle_job(argv, reply):
+            jobs.append(argv)
+            ids = argv[argv.index("--test_list") + 1].split(",")
+            batches = [[(item_id,) for item_id in ids[index : index + 2]] for index in range(0, len(ids), 2)]
+            return worker_module.run_job(batches, run_batch, reply)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            socket_path = Path(temp_dir) / "omni-test.sock"
+            server = threading.Thread(target=worker_module.serve, args=(socket_path, handle_job), daemon=True)
+            server.start()
+            client = generator_module.OmniVoiceWorker(Path("python"), socket_path, {})
+            for _ in range(200):
+                if socket_path.exists():
+                    break
+                threading.Event().wait(0.01)
+
+            failed = client.infer(["--test_list", "a,bad,c", "--res_dir", temp_dir])
+            repaired = client.infer(["--test_list", "d", "--res_dir", temp_dir])
+            client.close()
+            server.join(timeout=5)
+
+            self.assertEqual(failed, ["bad"])
+            self.assertEqual(repaired, [])
+            self.assertEqual(calls, [["a", "bad"], ["a"], ["bad"], ["c"], ["d"]])
+            self.assertEqual(len(jobs), 2)
+            self.assertFalse(server.is_alive())
+            self.assertFalse(socket_path.exists())
+
+    def test_generator_falls_back_to_the_cli_when_the_worker_cannot_start(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            args = argparse.Namespace(
+                phrase="hey tater",
+                language="en",
+                tts_mode="modern",
+                samples=4,
+                batch_size=4,
+                voice_count=8,
+                data_dir=data_dir,
+                output_dir=data_dir / "out",
+                ffmpeg="ffmpeg",
+                dry_run=False,
+                piper_models=[],
+            )
+            generator = generator_module.Generator(args)
+            generator.omnivoice_worker_failed = False
+            command = ["omnivoice-infer-batch", "--model", "m", "--test_list", "x.jsonl", "--batch_size", "4"]
+            with patch.object(generator_module, "run_with_batch_retry") as cli:
+                generator.run_omnivoice(command)
+                generator.run_omnivoice(command)
+
+            self.assertEqual(cli.call_count, 2)
+            self.assertEqual(cli.call_args.args, (command, "--batch_size"))
+            self.assertTrue(generator.omnivoice_worker_failed)
+            self.assertIsNone(generator.omnivoice_worker)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import trainer_server as trainer
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts_macos" / "run_profiler.py"
+SPEC = importlib.util.spec_from_file_location("run_profiler", SCRIPT_PATH)
+run_profiler = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(run_profiler)
+
+
+class RunProfilerTests(unittest.TestCase):
+    def test_stage_boundaries_aggregate_wall_cpu_rss_and_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            work_dir = Path(tmp)
+            events_path = work_dir / ".run_profile_events"
+            events_path.write_text(
+                "stage\ttts_generation\t100.0\t0m0.010s 0m0.005s 0m1.000s 0m0.500s \n"
+                "stage\ttraining\t160.5\t0m0.020s 0m0.005s 1m2.000s 0m0.500s \n"
+                "end\t0\t",
+                encoding="utf-8",
+            )
+            events, offset = run_profiler.read_new_events(events_path, 0)
+            self.assertEqual([event[:3] for event in events], [("stage", "tts_generation", 100.0), ("stage", "training", 160.5)])
+
+            profile = run_profiler.RunProfile(work_dir, "hey_tater")
+            kind, value, timestamp, times_raw = events[0]
+            profile.boundary(kind, value, times_raw, timestamp)
+            profile.sample_rss(300 * 1024 * 1024)
+            (work_dir / "generated_samples").mkdir()
+            (work_dir / "generated_samples" / "clip.wav").write_bytes(b"x" * 4096)
+            (work_dir / "unrelated.bin").write_bytes(b"x" * 100)
+            kind, value, timestamp, times_raw = events[1]
+            profile.boundary(kind, value, times_raw, timestamp)
+            profile.sample_rss(900 * 1024 * 1024)
+
+            with events_path.open("a", encoding="utf-8") as stream:
+                stream.write("200.0\t0m0.030s 0m0.005s 1m40.000s 0m1.500s \n")
+            (kind, value, timestamp, times_raw), = run_profiler.read_new_events(events_path, offset)[0]
+            profile.boundary(kind, value, times_raw, timestamp)
+
+        result = profile.to_dict(200.0)
+        self.assertEqual(result["exit_code"], 0)
+        tts, training = result["stages"]
+        self.assertEqual((tts["stage"], tts["wall_seconds"], tts["cpu_seconds"]), ("tts_generation", 60.5, 61.01))
+        self.assertEqual(tts["disk_bytes_delta"], 4096)
+        self.assertEqual(training["disk_bytes_delta"], 0)
+        self.assertEqual(tts["peak_rss_bytes"], 300 * 1024 * 1024)
+        self.assertEqual((training["wall_seconds"], training["cpu_seconds"]), (39.5, 39.01))
+        self.assertEqual(result["totals"]["peak_rss_bytes"], 900 * 1024 * 1024)
+        self.assertEqual(result["totals"]["wall_seconds"], 100.0)
+
+    def test_only_the_stage_outputs_are_sized_at_a_boundary(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profile = run_profiler.RunProfile(Path(tmp), "hey_tater")
+            with patch.object(run_profiler, "directory_bytes", return_value=0) as sized:
+                profile.boundary("stage", "environment_setup", "", 1.0)
+                profile.boundary("stage", "tts_generation", "", 2.0)
+                profile.boundary("end", "0", "", 3.0)
+
+        self.assertEqual([call.args[0].name for call in sized.call_args_list], ["generated_samples", "generated_samples"])
+        setup, tts = profile.to_dict(3.0)["stages"]
+        self.assertNotIn("disk_bytes_delta", setup)
+        self.assertEqual(tts["disk_bytes_delta"], 0)
+
+    def test_profiles_api_lists_newest_first_with_stage_deltas(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profile_dir = Path(tmp)
+            for stamp, training_wall in (("20261001T000000Z", 300.0), ("20261002T000000Z", 240.0)):
+                profile = {
+                    "wake_word": "hey_tater",
+                    "stages": [
+                        {"stage": "tts_generation", "wall_seconds": 120.0},
+                        {"stage": "training", "wall_seconds": training_wall},
+                    ],
+                }
+                (profile_dir / f"{stamp}-hey_tater.run_profile.json").write_text(json.dumps(profile), encoding="utf-8")
+
+            with patch.object(trainer, "RUN_PROFILE_DIR", profile_dir):
+                latest = trainer.list_run_profiles(limit=1)["profiles"]
+                both = trainer.list_run_profiles()["profiles"]
+
+        self.assertEqual(len(latest), 1)
+        self.assertEqual(latest[0]["file"], "20261002T000000Z-hey_tater.run_profile.json")
+        self.assertEqual(latest[0]["stage_wall_delta_seconds"], {"tts_generation": 0.0, "training": -60.0})
+        self.assertNotIn("stage_wall_delta_seconds", both[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
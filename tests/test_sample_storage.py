@@ -0,0 +1,93 @@
+import io
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import trainer_server as trainer
+
+
+def silent_wav_bytes(duration_s: float = 0.25) -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(b"\x00\x00" * int(16000 * duration_s))
+    return output.getvalue()
+
+
+class SampleStorageTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name)
+        self.patches = [
+            patch.object(trainer, "CAPTURED_DIR", self.root / "captured_audio"),
+            patch.object(trainer, "PERSONAL_DIR", self.root / "personal_samples"),
+            patch.object(trainer, "NEGATIVE_DIR", self.root / "negative_samples"),
+            patch.dict(trainer.AUTO_TRAIN_CONFIG, {"enabled": False}),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+
+    def tearDown(self):
+        for patcher in reversed(self.patches):
+            patcher.stop()
+        self.tempdir.cleanup()
+
+    def test_sequence_continues_past_four_digits_without_listing_the_bucket(self):
+        directory = trainer.PERSONAL_DIR
+        directory.mkdir()
+        (directory / "sample_9999_take.wav").write_bytes(b"audio")
+
+        self.assertEqual(trainer._next_personal_sample_name("take.wav"), "sample_10000_take.wav")
+        (directory / "sample_10000_take.wav").write_bytes(b"audio")
+        with patch.object(trainer, "_list_audio_samples", side_effect=AssertionError("listed")):
+            self.assertEqual(trainer._next_personal_sample_name("take.wav"), "sample_10001_take.wav")
+        self.assertEqual((directory / ".sample.sequence").read_text(encoding="utf-8"), "10002\n")
+
+        # A counter restored from an older backup skips names that already exist.
+        (directory / "sample_10002.wav").write_bytes(b"audio")
+        self.assertEqual(trainer._next_personal_sample_name("wakeword.wav"), "sample_10003.wav")
+        # A lost counter is rebuilt from the bucket.
+        (directory / ".sample.sequence").write_text("garbage", encoding="utf-8")
+        self.assertEqual(trainer._next_personal_sample_name("wakeword.wav"), "sample_10003.wav")
+
+    def test_date_sharded_captures_are_listed_resolved_moved_and_served(self):
+        flat = trainer.CAPTURED_DIR / "captured_0001.wav"
+        flat.parent.mkdir()
+        flat.write_bytes(silent_wav_bytes())
+
+        with patch.object(trainer, "CAPTURED_DATE_SHARDS", True):
+            client = TestClient(trainer.app)
+            response = client.post(
+                "/api/upload_captured_audio_raw",
+                content=silent_wav_bytes(),
+                headers={"X-Audio-Format": "wav"},
+            )
+            self.assertTrue(response.json()["ok"])
+            saved_as = response.json()["item"]["saved_as"]
+            shard = trainer._audio_shard_dir(trainer.CAPTURED_DIR, saved_as)
+            self.assertIsNotNone(shard)
+            self.assertEqual(len(shard.relative_to(trainer.CAPTURED_DIR).parts), 3)
+            self.assertTrue((shard / saved_as).is_file())
+            self.assertTrue(saved_as.startswith("captured_0002_"))
+
+            self.assertEqual(trainer._list_captured_sample_names(), sorted(["captured_0001.wav", saved_as]))
+            self.assertEqual(trainer._resolve_audio_path(trainer.CAPTURED_DIR, saved_as), (shard / saved_as).resolve())
+            self.assertEqual(trainer._resolve_audio_path(trainer.CAPTURED_DIR, "captured_0001.wav"), flat.resolve())
+            self.assertEqual(client.get(f"/api/audio/captured/{saved_as}").status_code, 200)
+
+            moved = trainer._move_captured_audio(
+                saved_as, trainer.NEGATIVE_DIR, target_prefix="negative", review_status="approved_negative"
+            )
+            self.assertTrue((trainer.NEGATIVE_DIR / moved["saved_as"]).is_file())
+            self.assertFalse((shard / saved_as).exists())
+            self.assertEqual(moved["captured_remaining"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
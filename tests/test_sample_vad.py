@@ -0,0 +1,110 @@
+import io
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+from unittest.mock import patch
+
+import trainer_server as trainer
+
+
+def tone_wav_bytes(level: int = 0, duration_s: float = 0.5) -> bytes:
+    output = io.BytesIO()
+    with wave.open(output, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(16000)
+        wav_file.writeframes(int(level).to_bytes(2, "little", signed=True) * int(16000 * duration_s))
+    return output.getvalue()
+
+
+class SampleVadCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.original_personal_dir = trainer.PERSONAL_DIR
+        trainer.PERSONAL_DIR = Path(self.tempdir.name) / "personal_samples"
+        trainer.PERSONAL_DIR.mkdir(parents=True)
+        with trainer.VAD_SEGMENT_CACHE_LOCK:
+            trainer.VAD_SEGMENT_CACHE.clear()
+
+    def tearDown(self):
+        trainer.PERSONAL_DIR = self.original_personal_dir
+        with trainer.VAD_SEGMENT_CACHE_LOCK:
+            trainer.VAD_SEGMENT_CACHE.clear()
+        self.tempdir.cleanup()
+
+    def test_vad_route_reuses_segments_for_unchanged_audio(self):
+        path = trainer.PERSONAL_DIR / "sample_0001.wav"
+        path.write_bytes(tone_wav_bytes())
+        segments = [{"start": 0.1, "end": 0.45}]
+        with patch.object(trainer, "_detect_speech_segments", return_value=segments) as detect:
+            first = trainer.vad_segments("personal", path.name)
+            second = trainer.vad_segments("personal", path.name)
+            with trainer.VAD_SEGMENT_CACHE_LOCK:
+                trainer.VAD_SEGMENT_CACHE.clear()
+            third = trainer.vad_segments("personal", path.name)
+
+        detect.assert_called_once()
+        self.assertEqual(first, second)
+        self.assertEqual(first, third)
+        stored = trainer._load_sidecar_json(path)["vad_cache"]
+        self.assertEqual(stored["segments"], segments)
+
+        path.write_bytes(tone_wav_bytes(level=12))
+        with patch.object(trainer, "_detect_speech_segments", return_value=[]) as detect:
+            changed = trainer.vad_segments("personal", path.name)
+        detect.assert_called_once()
+        self.assertEqual(changed["segment_count"], 0)
+
+    def test_negative_samples_and_replaced_audio_get_no_sidecar_entry(self):
+        negative_dir = Path(self.tempdir.name) / "negative_samples"
+        negative_dir.mkdir()
+        negative = negative_dir / "negative_0001.wav"
+        negative.write_bytes(tone_wav_bytes(level=7))
+        personal = trainer.PERSONAL_DIR / "sample_0001.wav"
+        personal.write_bytes(tone_wav_bytes(level=9))
+
+        def replace_while_detecting(_data):
+            personal.write_bytes(tone_wav_bytes(level=11))
+            return []
+
+        with patch.object(trainer, "NEGATIVE_DIR", negative_dir):
+            with patch.object(trainer, "_detect_speech_segments", return_value=[]):
+                self.assertTrue(trainer.vad_segments("negative", negative.name)["ok"])
+            with patch.object(trainer, "_detect_speech_segments", side_effect=replace_while_detecting):
+                trainer.vad_segments("personal", personal.name)
+
+        self.assertFalse(trainer._audio_sidecar_path(negative).exists())
+        self.assertNotIn("vad_cache", trainer._load_sidecar_json(personal))
+
+    def test_memory_cache_evicts_least_recently_used_digest(self):
+        with patch.object(trainer, "VAD_SEGMENT_CACHE_MAX_ENTRIES", 2):
+            trainer._remember_vad_segments("a", [])
+            trainer._remember_vad_segments("b", [])
+            trainer._remember_vad_segments("a", [])
+            trainer._remember_vad_segments("c", [])
+        self.assertEqual(list(trainer.VAD_SEGMENT_CACHE), ["a", "c"])
+
+    def test_precompute_only_analyses_untrimmed_personal_samples(self):
+        untrimmed = trainer.PERSONAL_DIR / "sample_0001.wav"
+        trimmed = trainer.PERSONAL_DIR / "sample_0002.wav"
+        untrimmed.write_bytes(tone_wav_bytes(level=3))
+        trimmed.write_bytes(tone_wav_bytes(level=5))
+        trainer._write_sidecar_json(trimmed, {"trimmed": True})
+
+        with patch.object(trainer, "_detect_speech_segments", return_value=[]) as detect:
+            status = trainer._start_personal_vad_precompute()
+            trainer.VAD_PRECOMPUTE_THREAD.join(timeout=5)
+
+        self.assertTrue(status["started"])
+        self.assertEqual(status["total"], 1)
+        detect.assert_called_once()
+        self.assertIn("vad_cache", trainer._load_sidecar_json(untrimmed))
+        self.assertNotIn("vad_cache", trainer._load_sidecar_json(trimmed))
+        result = trainer.personal_vad_precompute_status()
+        self.assertFalse(result["running"])
+        self.assertEqual(result["computed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,190 @@
+import gzip
+import hashlib
+import json
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import trainer_server as trainer
+
+
+def write_wake_word(directory: Path, slug: str, cutoff: float = 0.97) -> None:
+    (directory / f"{slug}.tflite").write_bytes(b"model-" + slug.encode())
+    (directory / f"{slug}.json").write_text(
+        json.dumps({"wake_word": slug.replace("_", " "), "model": f"{slug}.tflite", "micro": {"probability_cutoff": cutoff}}),
+        encoding="utf-8",
+    )
+
+
+class TrainedWakeWordCatalogTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        root = Path(self.tempdir.name)
+        self.trained_dir = root / "trained_wake_words"
+        self.trained_dir.mkdir()
+        write_wake_word(self.trained_dir, "hey_tater")
+        self.patches = [
+            patch.object(trainer, "DATA_DIR", root),
+            patch.object(trainer, "TRAINED_WAKE_WORDS_DIR", self.trained_dir),
+            patch.object(trainer, "ARTIFACT_CACHE_DIR", root / "artifact_cache"),
+            patch.object(trainer, "CATALOG_LONG_POLL_INTERVAL_SECONDS", 0.02),
+            patch.object(trainer, "_advertised_base_url", return_value="http://trainer.test"),
+            patch.dict(
+                trainer.TRAINED_WAKE_WORD_CATALOG,
+                {
+                    "signature": None,
+                    "data_dir_mtime_ns": None,
+                    "rows": [],
+                    "digest": "",
+                    "version": 0,
+                    "artifacts": {},
+                    "retired_artifacts": {},
+                    "pruned_at": 0.0,
+                },
+            ),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        self.client = TestClient(trainer.app)
+
+    def tearDown(self):
+        for patcher in reversed(self.patches):
+            patcher.stop()
+        self.tempdir.cleanup()
+
+    def test_unchanged_catalog_is_served_from_cache_with_304(self):
+        with patch.object(trainer, "_scan_trained_wake_words", wraps=trainer._scan_trained_wake_words) as scan:
+            first = self.client.get("/api/trained_wake_words/catalog")
+            etag = first.headers["etag"]
+            second = self.client.get("/api/trained_wake_words/catalog", headers={"If-None-Match": etag})
+            self.assertEqual(scan.call_count, 1)
+
+            write_wake_word(self.trained_dir, "hey_tater", cutoff=0.9)
+            third = self.client.get("/api/trained_wake_words/catalog", headers={"If-None-Match": etag})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()["wake_words"][0]["json_url"], "http://trainer.test/api/trained_wake_words/hey_tater.json")
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.headers["etag"], etag)
+        self.assertEqual(third.status_code, 200)
+        self.assertNotEqual(third.headers["etag"], etag)
+        self.assertGreater(third.json()["version"], first.json()["version"])
+        self.assertEqual(third.json()["wake_words"][0]["threshold"], 0.9)
+
+    def test_long_poll_returns_when_a_new_model_is_published(self):
+        version = self.client.get("/api/trained_wake_words/catalog").json()["version"]
+
+        def publish():
+            write_wake_word(self.trained_dir, "hello_norman")
+            trainer._invalidate_trained_wake_word_catalog()
+
+        timer = threading.Timer(0.2, publish)
+        timer.start()
+        try:
+            response = self.client.get(f"/api/trained_wake_words/catalog?since={version}&wait=10")
+        finally:
+            timer.join()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(response.json()["version"], version)
+        self.assertEqual(
+            sorted(row["key"] for row in response.json()["wake_words"]),
+            ["hello_norman", "hey_tater"],
+        )
+
+        timed_out = self.client.get(
+            f"/api/trained_wake_words/catalog?since={response.json()['version']}&wait=0.1"
+        )
+        self.assertEqual(timed_out.status_code, 200)
+        self.assertEqual(timed_out.json()["version"], response.json()["version"])
+
+    def test_models_are_served_immutably_by_content_hash(self):
+        model_bytes = b"\x00" * 4096 + b"tflite"
+        (self.trained_dir / "hey_tater.tflite").write_bytes(model_bytes)
+        digest = hashlib.sha256(model_bytes).hexdigest()
+
+        row = self.client.get("/api/trained_wake_words/catalog").json()["wake_words"][0]
+        self.assertEqual(row["model_sha256"], digest)
+        self.assertEqual(row["model_hash_url"], f"http://trainer.test/api/artifacts/{digest}.tflite")
+
+        url = f"/api/artifacts/{digest}.tflite"
+        full = self.client.get(url, headers={"Accept-Encoding": "identity"})
+        self.assertEqual(full.content, model_bytes)
+        self.assertEqual(full.headers["etag"], f'"{digest}"')
+        self.assertIn("immutable", full.headers["cache-control"])
+
+        partial = self.client.get(url, headers={"Range": "bytes=4096-", "Accept-Encoding": "gzip"})
+        self.assertEqual(partial.status_code, 206)
+        self.assertEqual(partial.content, b"tflite")
+
+        compressed = self.client.get(url, headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(compressed.headers["content-encoding"], "gzip")
+        self.assertEqual(compressed.content, model_bytes)
+        self.assertTrue((self.trained_dir.parent / "artifact_cache" / f"{digest}.tflite.gz").is_file())
+
+        # Rewriting the named model in place never changes what the old hash serves.
+        (self.trained_dir / "hey_tater.tflite").write_bytes(b"retrained")
+        self.assertEqual(self.client.get(url, headers={"Accept-Encoding": "identity"}).status_code, 404)
+        (self.trained_dir / "hey_tater.tflite").write_bytes(model_bytes)
+        self.assertEqual(self.client.get(url, headers={"Accept-Encoding": "identity"}).content, model_bytes)
+
+        revalidated = self.client.get(url, headers={"If-None-Match": full.headers["etag"]})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(self.client.get("/api/artifacts/" + "0" * 64 + ".tflite").status_code, 404)
+        self.assertEqual(self.client.get("/api/artifacts/hey_tater.tflite").status_code, 400)
+
+    def test_copies_of_retired_hashes_are_pruned_after_the_grace_period(self):
+        cache_dir = self.trained_dir.parent / "artifact_cache"
+        old_digest = self.client.get("/api/trained_wake_words/catalog").json()["wake_words"][0]["model_sha256"]
+        self.client.get(f"/api/artifacts/{old_digest}.tflite", headers={"Accept-Encoding": "gzip"})
+        (self.trained_dir / "hey_tater.tflite").write_bytes(b"retrained")
+        new_digest = self.client.get("/api/trained_wake_words/catalog").json()["wake_words"][0]["model_sha256"]
+
+        # Within the grace period the old copy stays; the hourly check removes it afterwards.
+        self.assertTrue((cache_dir / f"{old_digest}.tflite").is_file())
+        with trainer.TRAINED_WAKE_WORD_CATALOG_LOCK:
+            trainer.TRAINED_WAKE_WORD_CATALOG["retired_artifacts"][old_digest] -= trainer.ARTIFACT_CACHE_GRACE_SECONDS + 1
+            trainer.TRAINED_WAKE_WORD_CATALOG["pruned_at"] = 0.0
+        self.client.get("/api/trained_wake_words/catalog")
+
+        self.assertEqual(sorted(path.name for path in cache_dir.iterdir()), [f"{new_digest}.tflite"])
+        self.assertEqual(trainer.TRAINED_WAKE_WORD_CATALOG["retired_artifacts"], {})
+
+    def test_mutable_names_revalidate_and_metadata_references_the_hash(self):
+        digest = hashlib.sha256(b"model-hey_tater").hexdigest()
+
+        metadata = self.client.get("/api/trained_wake_words/hey_tater.json")
+        self.assertEqual(metadata.json()["model_sha256"], digest)
+        self.assertEqual(metadata.json()["model_hash_url"], f"/api/artifacts/{digest}.tflite")
+        self.assertEqual(metadata.json()["model"], "hey_tater.tflite")
+        cached = self.client.get(
+            "/api/trained_wake_words/hey_tater.json",
+            headers={"If-None-Match": metadata.headers["etag"]},
+        )
+        self.assertEqual(cached.status_code, 304)
+
+        model = self.client.get("/api/trained_wake_words/hey_tater.tflite")
+        self.assertEqual(model.headers["etag"], f'"{digest}"')
+        self.assertEqual(model.headers["cache-control"], "no-cache")
+        unchanged = self.client.get(
+            "/api/trained_wake_words/hey_tater.tflite",
+            headers={"If-None-Match": model.headers["etag"]},
+        )
+        self.assertEqual(unchanged.status_code, 304)
+
+        write_wake_word(self.trained_dir, "hey_tater")
+        (self.trained_dir / "hey_tater.tflite").write_bytes(b"retrained")
+        changed = self.client.get(
+            "/api/trained_wake_words/hey_tater.tflite",
+            headers={"If-None-Match": model.headers["etag"]},
+        )
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.content, b"retrained")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import threading
+import unittest
+from collections import deque
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import trainer_server as trainer
+
+
+def parse_sse(body: str):
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line and not line.startswith(":"))
+        if "event" in fields:
+            events.append((int(fields["id"]), fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TrainingEventStreamTests(unittest.TestCase):
+    def setUp(self):
+        self.patches = [
+            patch.object(trainer, "TRAINING_EVENTS", deque(maxlen=8)),
+            patch.object(trainer, "TRAINING_EVENT_SEQUENCE", trainer.itertools.count(1)),
+            patch.object(trainer, "TRAINING_EVENT_WAITERS", {}),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        with trainer.STATE_LOCK:
+            self.original_training = dict(trainer.STATE["training"])
+
+    def tearDown(self):
+        with trainer.STATE_LOCK:
+            trainer.STATE["training"] = self.original_training
+        for patcher in reversed(self.patches):
+            patcher.stop()
+        trainer.TRAINING_SHUTDOWN_EVENT.clear()
+
+    def test_stage_markers_and_step_metrics_become_structured_events(self):
+        start = trainer._publish_training_event("run", state="started")
+        with trainer.STATE_LOCK:
+            trainer.STATE["training"]["log_start_seq"] = start
+        trainer._append_train_log("::stage training\n")
+        trainer._append_train_log("Step #500: rate 0.001, accuracy 93.5%, recall 88.25%, cross entropy 0.1234\n")
+
+        events = trainer._training_events_after(0)
+        self.assertEqual([event["type"] for event in events], ["run", "stage", "log", "progress"])
+        self.assertEqual(events[1]["stage"], "training")
+        self.assertEqual(events[3]["step"], 500)
+        self.assertEqual(events[3]["metrics"], {"accuracy": 93.5, "recall": 88.25, "loss": 0.1234})
+        self.assertEqual(
+            trainer.train_status()["training"]["log_lines"],
+            ["Step #500: rate 0.001, accuracy 93.5%, recall 88.25%, cross entropy 0.1234"],
+        )
+
+    def test_tts_progress_lines_become_typed_events(self):
+        start = trainer._publish_training_event("run", state="started")
+        with trainer.STATE_LOCK:
+            trainer.STATE["training"]["log_start_seq"] = start
+        trainer._append_train_log('::progress {"event":"samples","engine":"piper","done":40,"total":100}\n')
+        trainer._append_train_log("::progress not-json\n")
+
+        events = trainer._training_events_after(0)
+        self.assertEqual([event["type"] for event in events], ["run", "tts_progress", "log"])
+        self.assertEqual((events[1]["event"], events[1]["done"], events[1]["total"]), ("samples", 40, 100))
+        status = trainer.train_status()["training"]
+        self.assertEqual(status["tts_progress"]["engine"], "piper")
+        self.assertEqual(status["log_lines"], ["::progress not-json"])
+
+    def test_sse_resumes_after_sequence_and_reports_dropped_events(self):
+        for index in range(12):
+            trainer._append_train_log(f"line {index}")
+
+        # Shutting down ends the stream after one pass over the buffer.
+        trainer.TRAINING_SHUTDOWN_EVENT.set()
+        response = TestClient(trainer.app).get("/api/train/events", headers={"Last-Event-ID": "2"})
+
+        self.assertEqual(response.headers["content-type"].split(";")[0], "text/event-stream")
+        events = parse_sse(response.text)
+        self.assertEqual(events[0][1], "gap")
+        self.assertEqual((events[0][2]["missed_from"], events[0][2]["missed_to"]), (3, 4))
+        self.assertEqual([seq for seq, _type, _data in events[1:]], list(range(5, 13)))
+        self.assertEqual(events[-1][2]["line"], "line 11")
+
+    def test_sse_resets_a_client_resuming_from_before_a_restart(self):
+        trainer._append_train_log("after restart")
+
+        trainer.TRAINING_SHUTDOWN_EVENT.set()
+        response = TestClient(trainer.app).get("/api/train/events", headers={"Last-Event-ID": "4120"})
+
+        events = parse_sse(response.text)
+        self.assertEqual(events[0][:2], (0, "reset"))
+        self.assertEqual((events[0][2]["requested_after"], events[0][2]["latest"]), (4120, 1))
+        self.assertEqual([(seq, data["line"]) for seq, _type, data in events[1:]], [(1, "after restart")])
+
+    def test_concurrent_publishers_keep_the_ring_in_order_and_wake_streams(self):
+        async def wait_for_publish():
+            wake = asyncio.Event()
+            with trainer.TRAINING_EVENT_LOCK:
+                trainer.TRAINING_EVENT_WAITERS[wake] = asyncio.get_running_loop()
+            publishers = [
+                threading.Thread(target=lambda: [trainer._append_train_log("line") for _ in range(200)])
+                for _ in range(4)
+            ]
+            for thread in publishers:
+                thread.start()
+            await asyncio.wait_for(wake.wait(), timeout=5)
+            for thread in publishers:
+                thread.join()
+
+        asyncio.run(wait_for_publish())
+        self.assertEqual([event["seq"] for event in trainer.TRAINING_EVENTS], list(range(793, 801)))
+        self.assertEqual(trainer._latest_training_event_seq(), 800)
+        self.assertEqual([event["seq"] for event in trainer._training_events_after(797)], [798, 799, 800])
+        self.assertEqual(len(trainer._training_events_after(0)), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
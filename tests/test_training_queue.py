@@ -0,0 +1,96 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import trainer_server as trainer
+
+
+class TrainingQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        root = Path(self.tempdir.name)
+        self.original_paths = (
+            trainer.DATA_DIR,
+            trainer.TRAIN_SCRIPT,
+            trainer.TRAINING_LOCK_FILE,
+            trainer.TRAINING_QUEUE_FILE,
+            trainer.TRAINING_JOB_LOG_DIR,
+        )
+        trainer.DATA_DIR = root / "data"
+        trainer.DATA_DIR.mkdir()
+        script = root / "train.sh"
+        script.write_text("#!/bin/sh\nprintf 'training %s\\n' \"$1\"\n", encoding="utf-8")
+        trainer.TRAIN_SCRIPT = str(script)
+        trainer.TRAINING_LOCK_FILE = root / "training.lock"
+        trainer.TRAINING_QUEUE_FILE = root / "training_queue.json"
+        trainer.TRAINING_JOB_LOG_DIR = root / "training_jobs"
+        with trainer.TRAINING_QUEUE_LOCK:
+            self.original_queue = list(trainer.TRAINING_QUEUE)
+            trainer.TRAINING_QUEUE.clear()
+        with trainer.STATE_LOCK:
+            self.original_training = dict(trainer.STATE["training"])
+            trainer.STATE["training"]["running"] = False
+
+    def tearDown(self):
+        (
+            trainer.DATA_DIR,
+            trainer.TRAIN_SCRIPT,
+            trainer.TRAINING_LOCK_FILE,
+            trainer.TRAINING_QUEUE_FILE,
+            trainer.TRAINING_JOB_LOG_DIR,
+        ) = self.original_paths
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer.TRAINING_QUEUE[:] = self.original_queue
+        with trainer.STATE_LOCK:
+            trainer.STATE["training"] = self.original_training
+        self.tempdir.cleanup()
+
+    def test_highest_priority_job_starts_first_and_queue_survives_restart(self):
+        low = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        high = trainer._enqueue_training_job("hello norman", "en", "modern", "mixed", priority=5)
+        self.assertEqual(low["position"], 1)
+        self.assertEqual(trainer.get_training_job(low["id"])["job"]["position"], 2)
+
+        with patch.object(trainer, "_start_training_thread") as start_thread:
+            started = trainer._maybe_start_queued_training_job()
+            self.assertIsNone(trainer._maybe_start_queued_training_job())
+        trainer._release_training_run_lock(start_thread.call_args.args[3])
+
+        self.assertEqual(started["id"], high["id"])
+        self.assertEqual(start_thread.call_args.args[0], "hello_norman")
+        self.assertEqual(start_thread.call_args.kwargs["job_id"], high["id"])
+        reloaded = {job["id"]: job for job in trainer._load_training_queue()}
+        self.assertEqual(reloaded[high["id"]]["status"], "queued")
+        self.assertEqual(reloaded[low["id"]]["status"], "queued")
+
+    def test_queued_job_runs_with_its_own_phrase_and_log(self):
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        trainer._maybe_start_queued_training_job()
+        with trainer.TRAINING_RUNTIME_LOCK:
+            thread = trainer.TRAINING_THREAD
+        self.assertIsNotNone(thread)
+        thread.join(timeout=10)
+
+        result = trainer.get_training_job(job["id"])["job"]
+        self.assertEqual(result["status"], "succeeded")
+        self.assertEqual(result["exit_code"], 0)
+        log = trainer.get_training_job_log(job["id"])
+        self.assertIn("training hey tater", log["log_lines"])
+        self.assertFalse(trainer.STATE["training"]["running"])
+
+    def test_cancelled_job_is_never_started(self):
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        cancelled = trainer.cancel_training_job(job["id"])
+
+        with patch.object(trainer, "_start_training_thread") as start_thread:
+            self.assertIsNone(trainer._maybe_start_queued_training_job())
+
+        self.assertEqual(cancelled["job"]["status"], "cancelled")
+        start_thread.assert_not_called()
+        listing = trainer.list_training_jobs()
+        self.assertEqual([item["status"] for item in listing["jobs"]], ["cancelled"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,329 @@
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+import unittest
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+import trainer_server as trainer
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts_macos" / "training_worker.py"
+SPEC = importlib.util.spec_from_file_location("training_worker", SCRIPT_PATH)
+training_worker = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(training_worker)
+
+FAKE_TRAIN_SCRIPT = """#!/bin/sh
+set -e
+echo "training $1 in $MWW_LANGUAGE"
+ls personal_samples
+mkdir -p "$TRAINED_WAKE_WORDS_DIR"
+for suffix in tflite json esphome.json; do
+  printf 'model' > "$TRAINED_WAKE_WORDS_DIR/$MWW_ARTIFACT_SLUG.$suffix"
+done
+"""
+
+
+def process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as status:
+            return not any(line.startswith("State:") and "Z" in line for line in status)
+    except OSError:
+        return True
+
+
+class RemoteTrainingWorkerTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        root = Path(self.tempdir.name)
+        self.patches = [
+            patch.object(trainer, "TRAINING_EXECUTOR", "remote"),
+            patch.object(trainer, "TRAINING_WORKER_SECRET", "worker-secret"),
+            patch.object(trainer, "PERSONAL_DIR", root / "server" / "personal_samples"),
+            patch.object(trainer, "NEGATIVE_DIR", root / "server" / "negative_samples"),
+            patch.object(trainer, "TRAINED_WAKE_WORDS_DIR", root / "server" / "trained_wake_words"),
+            patch.object(trainer, "TRAINING_QUEUE_FILE", root / "server" / "training_queue.json"),
+            patch.object(trainer, "TRAINING_WORKERS_FILE", root / "server" / "training_workers.json"),
+            patch.object(trainer, "TRAINING_JOB_LOG_DIR", root / "server" / "training_jobs"),
+        ]
+        for patcher in self.patches:
+            patcher.start()
+        trainer.PERSONAL_DIR.mkdir(parents=True)
+        trainer.NEGATIVE_DIR.mkdir(parents=True)
+        (trainer.PERSONAL_DIR / "sample_0001.wav").write_bytes(b"personal-audio")
+        (trainer.NEGATIVE_DIR / "neg_0001.wav").write_bytes(b"negative-audio")
+        with trainer.TRAINING_QUEUE_LOCK:
+            self.original_queue = list(trainer.TRAINING_QUEUE)
+            self.original_workers = dict(trainer.TRAINING_WORKERS)
+            trainer.TRAINING_QUEUE.clear()
+            trainer.TRAINING_WORKERS.clear()
+
+        self.work_dir = root / "worker"
+        self.train_script = root / "fake_train.sh"
+        self.train_script.write_text(FAKE_TRAIN_SCRIPT, encoding="utf-8")
+        http = TestClient(trainer.app)
+
+        def transport(method, url, headers, body):
+            response = http.request(method, url, headers=headers, content=body)
+            return response.status_code, response.content
+
+        self.transport = transport
+        self.sleeps = []
+        self.client = training_worker.TrainerClient("http://testserver", transport, sleep=self.sleeps.append)
+
+    def tearDown(self):
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer.TRAINING_QUEUE[:] = self.original_queue
+            trainer.TRAINING_WORKERS.clear()
+            trainer.TRAINING_WORKERS.update(self.original_workers)
+        for patcher in reversed(self.patches):
+            patcher.stop()
+        self.tempdir.cleanup()
+
+    def run_worker_once(self):
+        return training_worker.serve(
+            self.client,
+            work_dir=self.work_dir,
+            train_script=self.train_script,
+            once=True,
+        )
+
+    def test_worker_runs_leased_job_and_uploads_artifacts(self):
+        self.client.register("worker-secret", "stand-in")
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+
+        self.assertEqual(self.run_worker_once(), 0)
+
+        result = trainer.get_training_job(job["id"])["job"]
+        self.assertEqual(result["status"], "succeeded")
+        self.assertEqual(result["worker_id"], self.client.worker_id)
+        self.assertEqual(sorted(result["artifacts"]), ["hey_tater.esphome.json", "hey_tater.json", "hey_tater.tflite"])
+        self.assertEqual((trainer.TRAINED_WAKE_WORDS_DIR / "hey_tater.tflite").read_bytes(), b"model")
+        self.assertEqual((self.work_dir / "negative_samples" / "neg_0001.wav").read_bytes(), b"negative-audio")
+        log_lines = trainer.get_training_job_log(job["id"])["log_lines"]
+        self.assertIn("training hey tater in en", log_lines)
+        self.assertIn("sample_0001.wav", log_lines)
+
+        (trainer.NEGATIVE_DIR / "neg_0001.wav").unlink()
+        second = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        self.run_worker_once()
+        self.assertFalse((self.work_dir / "negative_samples" / "neg_0001.wav").exists())
+        sync_line = trainer.get_training_job_log(second["id"])["log_lines"][0]
+        self.assertIn("0 samples downloaded, 1 reused, 1 removed", sync_line)
+
+    def test_registration_requires_secret_and_worker_token(self):
+        with self.assertRaisesRegex(RuntimeError, "401"):
+            self.client.register("wrong", "stand-in")
+        stranger = training_worker.TrainerClient("http://testserver", self.transport)
+        stranger.worker_id, stranger.token = "unknown", "forged"
+        with self.assertRaisesRegex(RuntimeError, "401"):
+            stranger.lease()
+
+    def test_leased_job_survives_a_server_restart(self):
+        self.client.register("worker-secret", "stand-in")
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        leased, _manifest = self.client.lease()
+        with trainer.TRAINING_QUEUE_LOCK:
+            lease_expires_at = trainer._training_job_locked(job["id"])["lease_expires_at"]
+
+        # Restart: queue and worker registry are rebuilt from disk.
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer.TRAINING_QUEUE[:] = trainer._load_training_queue()
+            trainer.TRAINING_WORKERS.clear()
+            trainer.TRAINING_WORKERS.update(trainer._load_training_workers())
+            reloaded = dict(trainer._training_job_locked(job["id"]))
+        self.assertEqual(reloaded["status"], "running")
+        self.assertEqual(reloaded["worker_id"], self.client.worker_id)
+        self.assertEqual(reloaded["lease_expires_at"], lease_expires_at)
+        self.assertNotIn("token", trainer.TRAINING_WORKERS[self.client.worker_id])
+
+        self.assertFalse(self.client.log(leased["id"], ["still training"]))
+        self.assertEqual(self.sleeps, [])
+        trainer._maybe_start_queued_training_job()
+        self.assertEqual(trainer.get_training_job(job["id"])["job"]["status"], "running")
+
+    def test_client_reclaims_its_id_when_the_server_forgot_it_and_retries_transient_errors(self):
+        self.client.register("worker-secret", "stand-in")
+        first_id = self.client.worker_id
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        leased, _manifest = self.client.lease()
+        self.assertEqual(leased["id"], job["id"])
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer.TRAINING_WORKERS.clear()
+
+        self.assertFalse(self.client.log(job["id"], ["registry lost"]))
+        self.assertEqual(self.client.worker_id, first_id)
+        self.assertEqual(trainer.get_training_job(job["id"])["job"]["worker_id"], first_id)
+
+        failures = [OSError("connection refused"), (503, b"restarting")]
+
+        def flaky(method, url, headers, body):
+            if failures:
+                failure = failures.pop(0)
+                if isinstance(failure, Exception):
+                    raise failure
+                return failure
+            return self.transport(method, url, headers, body)
+
+        self.client.transport = flaky
+        self.assertFalse(self.client.log(job["id"], ["still here"]))
+        self.assertEqual(self.sleeps, [2.0, 4.0])
+
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer._training_job_locked(job["id"]).update(status="queued", worker_id="")
+        with self.assertRaises(training_worker.LeaseLost):
+            self.client.log(job["id"], [])
+
+    def test_expired_lease_returns_job_to_queue(self):
+        self.client.register("worker-secret", "stand-in")
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        leased, manifest = self.client.lease()
+        self.assertEqual(leased["id"], job["id"])
+        self.assertEqual({entry["kind"] for entry in manifest["files"]}, {"personal", "negative"})
+
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer._training_job_locked(job["id"])["lease_expires_at"] = (
+                trainer._utc_now() - timedelta(seconds=1)
+            ).isoformat()
+        trainer._maybe_start_queued_training_job()
+
+        self.assertEqual(trainer.get_training_job(job["id"])["job"]["status"], "queued")
+
+    def test_jobs_for_another_phrase_do_not_train_on_the_session_recordings(self):
+        self.client.register("worker-secret", "stand-in")
+        with patch.dict(trainer.STATE, {"raw_phrase": "hello norman", "safe_word": "hello_norman"}):
+            other = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+            own = trainer._enqueue_training_job("hello norman", "en", "modern", "mixed", priority=1)
+            self.assertFalse(other["recorded_samples"])
+
+            leased, manifest = self.client.lease()
+            self.assertEqual(leased["id"], own["id"])
+            self.assertEqual(len(manifest["files"]), 2)
+            self.assertEqual(manifest["env"]["MWW_RECORDED_SAMPLES"], "1")
+            self.client.complete(own["id"], 1, "stop")
+
+            leased, manifest = self.client.lease()
+            self.assertEqual(leased["id"], other["id"])
+            self.assertEqual(manifest["files"], [])
+            self.assertEqual(manifest["env"]["MWW_RECORDED_SAMPLES"], "0")
+
+    def test_uploads_are_staged_until_the_leaseholder_completes(self):
+        self.client.register("worker-secret", "stand-in")
+        trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        leased, manifest = self.client.lease()
+        artifact_dir = self.work_dir / "artifacts"
+        artifact_dir.mkdir(parents=True)
+        for name in manifest["artifacts"]:
+            (artifact_dir / name).write_bytes(b"late model")
+            self.client.upload_artifact(leased["id"], artifact_dir / name)
+        published = trainer.TRAINED_WAKE_WORDS_DIR / "hey_tater.tflite"
+        self.assertFalse(published.exists())
+
+        with trainer.TRAINING_QUEUE_LOCK:
+            trainer._training_job_locked(leased["id"])["lease_expires_at"] = (
+                trainer._utc_now() - timedelta(seconds=1)
+            ).isoformat()
+        trainer._maybe_start_queued_training_job()
+        with self.assertRaises(training_worker.LeaseLost):
+            self.client.complete(leased["id"], 0)
+        self.assertFalse(published.exists())
+
+        # The next leaseholder starts from an empty staging area.
+        leased, manifest = self.client.lease()
+        self.assertEqual(trainer.get_training_job(leased["id"])["job"]["artifacts"], [])
+        for name in manifest["artifacts"]:
+            (artifact_dir / name).write_bytes(b"model")
+            self.client.upload_artifact(leased["id"], artifact_dir / name)
+        self.assertEqual(self.client.complete(leased["id"], 0)["job"]["status"], "succeeded")
+        self.assertEqual(published.read_bytes(), b"model")
+        self.assertFalse(trainer._training_job_staging_dir(leased["id"]).exists())
+
+    def run_silent_job(self, interrupt):
+        """Run a job whose script forks a child and then prints nothing."""
+
+        pid_file = self.work_dir / "child.pid"
+        self.train_script.write_text(
+            f"#!/bin/sh\nsleep 60 &\necho $! > '{pid_file}'\nwait\n", encoding="utf-8"
+        )
+        self.client.register("worker-secret", "stand-in")
+        self.client.lease_seconds = 3
+        job = trainer._enqueue_training_job("hey tater", "en", "modern", "mixed")
+        leased, manifest = self.client.lease()
+        timer = threading.Timer(0.5, interrupt, args=(job["id"],))
+        timer.start()
+        started = time.monotonic()
+        try:
+            rc = training_worker.run_job(
+                self.client, leased, manifest, work_dir=self.work_dir, train_script=self.train_script
+            )
+        finally:
+            timer.cancel()
+        self.assertLess(time.monotonic() - started, 20)
+        child = int(pid_file.read_text(encoding="utf-8"))
+        deadline = time.monotonic() + 5
+        while process_alive(child) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        self.assertFalse(process_alive(child), "training child survived the job")
+        return job, rc
+
+    def test_heartbeat_sees_cancellation_and_kills_the_process_group(self):
+        job, _rc = self.run_silent_job(trainer._cancel_training_job)
+        self.assertEqual(trainer.get_training_job(job["id"])["job"]["status"], "cancelled")
+
+    def test_lost_lease_stops_the_job_without_completing_it(self):
+        def expire(job_id):
+            with trainer.TRAINING_QUEUE_LOCK:
+                trainer._training_job_locked(job_id)["lease_expires_at"] = (
+                    trainer._utc_now() - timedelta(seconds=1)
+                ).isoformat()
+            trainer._maybe_start_queued_training_job()
+
+        job, rc = self.run_silent_job(expire)
+        self.assertEqual(rc, 999)
+        self.assertEqual(trainer.get_training_job(job["id"])["job"]["status"], "queued")
+
+    def test_remote_auto_run_consumes_pending_negatives_after_upload(self):
+        self.client.register("worker-secret", "stand-in")
+        with trainer.AUTO_TRAIN_LOCK:
+            original_config = dict(trainer.AUTO_TRAIN_CONFIG)
+            original_state = dict(trainer.AUTO_TRAIN_STATE)
+            trainer.AUTO_TRAIN_CONFIG.update({"wake_phrase": "hey tater", "language": "en"})
+            trainer.AUTO_TRAIN_STATE["pending_negative_count"] = 4
+        try:
+            with (
+                patch.object(trainer, "AUTO_TRAIN_STATE_FILE", Path(self.tempdir.name) / "auto_state.json"),
+                patch.object(trainer, "_notify_tater_satellites", return_value={"ok": True, "count": 2}) as notify,
+            ):
+                started = trainer._start_auto_training()
+                self.assertFalse(trainer._start_auto_training()["ok"])
+                with trainer.TRAINING_QUEUE_LOCK:
+                    job = dict(trainer._training_job_locked(started["job_id"]))
+                self.assertTrue(job["auto_run"])
+                self.assertEqual(job["priority"], 100)
+                trainer.AUTO_TRAIN_STATE["pending_negative_count"] = 6
+                self.assertEqual(self.run_worker_once(), 0)
+                pending = trainer.AUTO_TRAIN_STATE["pending_negative_count"]
+        finally:
+            with trainer.AUTO_TRAIN_LOCK:
+                trainer.AUTO_TRAIN_CONFIG.clear()
+                trainer.AUTO_TRAIN_CONFIG.update(original_config)
+                trainer.AUTO_TRAIN_STATE.clear()
+                trainer.AUTO_TRAIN_STATE.update(original_state)
+
+        self.assertTrue(started["queued"])
+        notify.assert_called_once_with("hey_tater")
+        self.assertEqual(pending, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import importlib.util
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+SCRIPT_PATH = Path(__file__).resolve().parents[1] / "scripts_macos" / "trim_silence.py"
+SPEC = importlib.util.spec_from_file_location("trim_silence", SCRIPT_PATH)
+trim_silence = importlib.util.module_from_spec(SPEC)
+assert SPEC.loader is not None
+SPEC.loader.exec_module(trim_silence)
+
+
+def fake_trim(task):
+    filepath, _keep, _jitter, dry_run = task
+    path = Path(filepath)
+    if not dry_run:
+        path.write_bytes(path.read_bytes()[:-1])
+    return {
+        "path": filepath,
+        "action": "trimmed",
+        "original_s": 1.0,
+        "trimmed_s": 0.5,
+        "removed_ms": 500.0,
+        "trailing_silence_ms": 520.0,
+        "sha256": trim_silence._file_digest(path),
+    }
+
+
+class TrimSilenceRecordTests(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tempdir.name) / "personal_samples"
+        (self.root / "nested").mkdir(parents=True)
+        (self.root / "sample_0001.wav").write_bytes(b"one-audio")
+        (self.root / "nested" / "sample_0002.wav").write_bytes(b"two-audio")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def run_trim(self, **kwargs):
+        with patch.object(trim_silence, "_trim_one", side_effect=fake_trim) as trim_one:
+            report = trim_silence.trim_silence(str(self.root), workers=1, **kwargs)
+        return report, trim_one
+
+    def test_unchanged_files_are_skipped_on_the_next_run(self):
+        first, first_calls = self.run_trim()
+        second, second_calls = self.run_trim()
+
+        self.assertEqual(first_calls.call_count, 2)
+        self.assertEqual(first["counts"]["trimmed"], 2)
+        second_calls.assert_not_called()
+        self.assertEqual(second["counts"]["skipped_unchanged"], 2)
+        record = json.loads((self.root / trim_silence.RECORD_FILE_NAME).read_text())
+        self.assertEqual(set(record["files"]), {"sample_0001.wav", "nested/sample_0002.wav"})
+
+        (self.root / "sample_0001.wav").write_bytes(b"re-recorded")
+        (self.root / "nested" / "sample_0002.wav").unlink()
+        third, third_calls = self.run_trim()
+        self.assertEqual(third_calls.call_count, 1)
+        record = json.loads((self.root / trim_silence.RECORD_FILE_NAME).read_text())
+        self.assertEqual(set(record["files"]), {"sample_0001.wav"})
+
+    def test_dry_run_reports_without_writing_audio_or_record(self):
+        report, trim_one = self.run_trim(dry_run=True)
+
+        self.assertTrue(report["dry_run"])
+        self.assertEqual(report["counts"]["trimmed"], 2)
+        self.assertEqual(trim_one.call_args_list[0].args[0][3], True)
+        self.assertEqual((self.root / "sample_0001.wav").read_bytes(), b"one-audio")
+        self.assertFalse((self.root / trim_silence.RECORD_FILE_NAME).exists())
+
+    def test_changed_settings_invalidate_the_record(self):
+        self.run_trim()
+        _report, trim_one = self.run_trim(keep_silence_duration=0.05)
+        self.assertEqual(trim_one.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
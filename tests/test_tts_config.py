@@ -9,9 +9,12 @@ from tts_config import (
     ENGINE_QWEN3,
     distribute_samples,
     engines_for_language,
+    estimate_plan_seconds,
     language_for_engine,
     normalize_english_accent,
     normalize_tts_mode,
+    parse_diversity_floors,
+    plan_engine_allocation,
     quality_for_engines,
 )
 
@@ -49,6 +52,59 @@ class TtsConfigTests(unittest.TestCase):
         )
         self.assertEqual(sum(distribute_samples(50000, ["a", "b", "c"]).values()), 50000)
 
+    def test_allocation_favors_the_fastest_engine_above_a_diversity_floor(self) -> None:
+        engines = [ENGINE_OMNIVOICE, ENGINE_QWEN3, ENGINE_PIPER]
+        self.assertEqual(
+            plan_engine_allocation(90, engines, {}, {}),
+            distribute_samples(90, engines),
+        )
+
+        throughput = {ENGINE_OMNIVOICE: 1.0, ENGINE_QWEN3: 2.0, ENGINE_PIPER: 10.0}
+        acceptance = {ENGINE_OMNIVOICE: 0.6, ENGINE_QWEN3: 0.9, ENGINE_PIPER: 0.95}
+        plan = plan_engine_allocation(90, engines, throughput, acceptance, diversity_floor=0.5)
+        self.assertEqual(plan, {ENGINE_OMNIVOICE: 15, ENGINE_QWEN3: 15, ENGINE_PIPER: 60})
+        self.assertLess(
+            estimate_plan_seconds(plan, throughput, acceptance),
+            estimate_plan_seconds(distribute_samples(90, engines), throughput, acceptance),
+        )
+
+        # Without a configured floor or deadline the even split stands.
+        self.assertEqual(plan_engine_allocation(90, engines, throughput, acceptance), distribute_samples(90, engines))
+        floors = parse_diversity_floors("omnivoice:0.8, Piper:0.3")
+        self.assertEqual(floors, {ENGINE_OMNIVOICE: 0.8, ENGINE_PIPER: 0.3})
+        self.assertEqual(
+            plan_engine_allocation(90, engines, throughput, acceptance, diversity_floor=floors),
+            {ENGINE_OMNIVOICE: 24, ENGINE_QWEN3: 30, ENGINE_PIPER: 36},
+        )
+        self.assertEqual(parse_diversity_floors("0.5,qwen3:2"), {"*": 0.5, ENGINE_QWEN3: 1.0})
+        self.assertEqual(parse_diversity_floors(""), {})
+        with self.assertRaises(ValueError):
+            parse_diversity_floors("omnivoice:lots")
+
+        # Unmeasured engines keep their even share.
+        partial = plan_engine_allocation(90, engines, {ENGINE_PIPER: 10.0}, {ENGINE_PIPER: 0.95})
+        self.assertEqual(partial, {ENGINE_OMNIVOICE: 30, ENGINE_QWEN3: 30, ENGINE_PIPER: 30})
+
+        # A tight deadline lowers the floor; an impossible one ends at zero.
+        relaxed = plan_engine_allocation(
+            90, engines, throughput, acceptance, diversity_floor=0.5, deadline_seconds=30
+        )
+        self.assertLess(relaxed[ENGINE_OMNIVOICE], 15)
+        self.assertLessEqual(estimate_plan_seconds(relaxed, throughput, acceptance), 30)
+        self.assertEqual(
+            plan_engine_allocation(90, engines, throughput, acceptance, deadline_seconds=1),
+            {ENGINE_OMNIVOICE: 0, ENGINE_QWEN3: 0, ENGINE_PIPER: 90},
+        )
+
+    def test_allocation_never_gives_moss_more_than_its_carriers(self) -> None:
+        engines = [ENGINE_OMNIVOICE, ENGINE_QWEN3, ENGINE_MOSS]
+        throughput = {ENGINE_OMNIVOICE: 1.0, ENGINE_QWEN3: 2.0, ENGINE_MOSS: 20.0}
+        acceptance = {ENGINE_OMNIVOICE: 0.6, ENGINE_QWEN3: 0.9, ENGINE_MOSS: 0.9}
+        plan = plan_engine_allocation(90, engines, throughput, acceptance, diversity_floor=0.2)
+        self.assertEqual(sum(plan.values()), 90)
+        self.assertLessEqual(plan[ENGINE_MOSS], plan[ENGINE_OMNIVOICE] + plan[ENGINE_QWEN3])
+        self.assertGreater(plan[ENGINE_QWEN3], plan[ENGINE_OMNIVOICE])
+
     def test_invalid_mode_falls_back_to_four_provider_route(self) -> None:
         self.assertEqual(normalize_tts_mode("unknown"), "hybrid")
 
@@ -81,17 +81,31 @@ if [[ "$(uname -s)" != "Darwin" ]]; then
   echo "❌ This script is intended for macOS (Apple Silicon)."; exit 1
 fi
 
-# ── Ensure system deps ────────────────────────────────────────────────────────
-if ! command -v brew &>/dev/null; then
-  echo "❌ Homebrew is required but not found. Install from https://brew.sh/ first."
-  exit 1
-fi
-
-echo "📦 Ensuring FFmpeg + wget are installed (via Homebrew)…"
+# ── Environment preflight cache ───────────────────────────────────────────────
+# A fingerprint of the dependency spec, the installed distributions, and the
+# source checkouts lets a retrain skip every install and verification step
+# below when nothing has changed. Any drift (or MWW_FORCE_PREFLIGHT=1, or a
+# cache older than MWW_PREFLIGHT_MAX_AGE_HOURS) falls back to the full path.
+PREFLIGHT_STATE_FILE=".venv/.preflight_state"
+PREFLIGHT_MAX_AGE_HOURS="${MWW_PREFLIGHT_MAX_AGE_HOURS:-168}"
+
+read_preflight_value() {
+  local key="$1"
+  [[ -f "$PREFLIGHT_STATE_FILE" ]] || return 0
+  awk -v key="$key" 'index($0, key "=") == 1 { print substr($0, length(key) + 2); exit }' "$PREFLIGHT_STATE_FILE"
+}
 
-# wget first
-brew list wget &>/dev/null || brew install wget
+preflight_state_recent() {
+  local written_at now
+  [[ "${MWW_FORCE_PREFLIGHT:-0}" != "1" && -f "$PREFLIGHT_STATE_FILE" ]] || return 1
+  [[ "$PREFLIGHT_MAX_AGE_HOURS" =~ ^[0-9]+$ ]] || return 1
+  written_at="$(read_preflight_value written_at)"
+  [[ "$written_at" =~ ^[0-9]+$ ]] || return 1
+  now="$(date +%s)"
+  (( now - written_at < PREFLIGHT_MAX_AGE_HOURS * 3600 ))
+}
 
+# ── Ensure system deps ────────────────────────────────────────────────────────
 ffmpeg_health_check() {
   [[ -x "$FFMPEG_BIN" ]] && "$FFMPEG_BIN" \
     -nostdin \
@@ -124,22 +138,49 @@ select_ffmpeg_formula() {
   FFMPEG_BIN="$FFMPEG_PREFIX/bin/ffmpeg"
 }
 
-# Prefer ffmpeg@7 for stable audio tooling compatibility. Keep the selected
-# formula and executable paired; mixing one formula's libraries with another
-# ffmpeg from PATH can leave normalization unusable after a Homebrew cleanup.
-if brew info ffmpeg@7 &>/dev/null; then
-  select_ffmpeg_formula "ffmpeg@7"
-  if ! ffmpeg_health_check; then
-    repair_selected_ffmpeg
-    select_ffmpeg_formula "ffmpeg@7"
+ensure_homebrew_ffmpeg() {
+  if ! command -v brew &>/dev/null; then
+    echo "❌ Homebrew is required but not found. Install from https://brew.sh/ first."
+    exit 1
   fi
-  if ! ffmpeg_health_check; then
-    echo "⚠️ ffmpeg@7 is still unhealthy; trying the default FFmpeg formula."
+
+  echo "📦 Ensuring FFmpeg + wget are installed (via Homebrew)…"
+
+  # wget first
+  brew list wget &>/dev/null || brew install wget
+
+  # Prefer ffmpeg@7 for stable audio tooling compatibility. Keep the selected
+  # formula and executable paired; mixing one formula's libraries with another
+  # ffmpeg from PATH can leave normalization unusable after a Homebrew cleanup.
+  if brew info ffmpeg@7 &>/dev/null; then
+    select_ffmpeg_formula "ffmpeg@7"
+    if ! ffmpeg_health_check; then
+      repair_selected_ffmpeg
+      select_ffmpeg_formula "ffmpeg@7"
+    fi
+    if ! ffmpeg_health_check; then
+      echo "⚠️ ffmpeg@7 is still unhealthy; trying the default FFmpeg formula."
+      select_ffmpeg_formula "ffmpeg"
+    fi
+  else
+    echo "⚠️ ffmpeg@7 is unavailable; using the default FFmpeg formula."
     select_ffmpeg_formula "ffmpeg"
   fi
+}
+
+reuse_preflight_ffmpeg() {
+  preflight_state_recent || return 1
+  FFMPEG_FORMULA="$(read_preflight_value ffmpeg_formula)"
+  FFMPEG_PREFIX="$(read_preflight_value ffmpeg_prefix)"
+  FFMPEG_BIN="$(read_preflight_value ffmpeg_bin)"
+  [[ -n "$FFMPEG_FORMULA" && -n "$FFMPEG_PREFIX" && -n "$FFMPEG_BIN" ]] || return 1
+  command -v wget &>/dev/null && ffmpeg_health_check
+}
+
+if reuse_preflight_ffmpeg; then
+  echo "✅ Reusing $FFMPEG_FORMULA verified by the last environment preflight."
 else
-  echo "⚠️ ffmpeg@7 is unavailable; using the default FFmpeg formula."
-  select_ffmpeg_formula "ffmpeg"
+  ensure_homebrew_ffmpeg
 fi
 
 if ! ffmpeg_health_check; then
@@ -284,6 +325,46 @@ fi
 export PYTHONUNBUFFERED=1
 export TORCH_VERSION TORCHAUDIO_VERSION
 
+# ── Run profile ────────────────────────────────────────────────────────────────
+# run_profiler.py samples the process tree in the background and turns the
+# stage boundaries below into <slug>.run_profile.json next to the artifacts.
+# `times` is a builtin, so it reports this shell's own CPU accounting.
+RUN_PROFILE_EVENTS="$WORK_DIR/.run_profile_events"
+RUN_PROFILE_TIMES="$WORK_DIR/.run_profile_times"
+: > "$RUN_PROFILE_EVENTS"
+"$PY" "$SOURCE_DIR/scripts_macos/run_profiler.py" monitor \
+  --pid "$$" \
+  --events "$RUN_PROFILE_EVENTS" \
+  --work-dir "$WORK_DIR" \
+  --artifacts-dir "${TRAINED_WAKE_WORDS_DIR:-trained_wake_words}" \
+  --slug "${ARTIFACT_SLUG:-$TARGET_WORD}" \
+  --archive-dir "$WORK_DIR/run_profiles" &
+RUN_PROFILER_PID=$!
+
+record_profile_event() {
+  local now
+  times > "$RUN_PROFILE_TIMES"
+  now="$("$PY" -c 'import time; print(f"{time.time():.3f}")')"
+  printf '%s\t%s\t%s\t%s\n' "$1" "$2" "$now" "$(tr '\n' ' ' < "$RUN_PROFILE_TIMES")" >> "$RUN_PROFILE_EVENTS"
+}
+
+finish_run_profile() {
+  local rc=$?
+  record_profile_event end "$rc"
+  wait "$RUN_PROFILER_PID" 2>/dev/null || true
+  rm -f "$RUN_PROFILE_EVENTS" "$RUN_PROFILE_TIMES"
+}
+trap finish_run_profile EXIT
+
+# Machine-readable stage markers; the trainer UI turns these into progress
+# events and hides them from the log, and the run profile splits on them.
+mark_stage() {
+  record_profile_event stage "$1"
+  printf '::stage %s\n' "$1"
+}
+
+mark_stage environment_setup
+
 ensure_torch_audio_stack() {
   if "$PY" - <<PY
 import importlib.metadata as md
@@ -336,42 +417,95 @@ else
   echo "✅ Reusing existing .venv (no upgrades)"
 fi
 
-ensure_torch_audio_stack
+AUXILIARY_GIT_DEPENDENCIES=(
+  "git+https://github.com/puddly/pymicro-features@puddly/minimum-cpp-version"
+  "git+https://github.com/whatsnowplaying/audio-metadata@d4ebb238e6a401bb1a5aaaac60c9e2b3cb30929f"
+)
+AUXILIARY_PIP_DEPENDENCIES=(
+  datasets librosa scipy numpy tqdm pyyaml requests ipython jupyter silero-vad
+)
+
+compute_preflight_fingerprint() {
+  {
+    printf 'pin=%s\n' "$TF_VERSION" "$TF_METAL_VERSION" "$KERAS_VERSION" "$PROTOBUF_VERSION" \
+      "$FLATBUFFERS_VERSION" "$TORCH_VERSION" "$TORCHAUDIO_VERSION"
+    printf 'dependency=%s\n' "${AUXILIARY_GIT_DEPENDENCIES[@]}" "${AUXILIARY_PIP_DEPENDENCIES[@]}"
+    printf 'python_bin=%s\n' "$PYTHON_BIN"
+    printf 'tts_mode=%s\n' "$TTS_MODE"
+    printf 'ffmpeg=%s\n' "$FFMPEG_BIN"
+    stat -f 'script=%N:%m:%z' \
+      "$SOURCE_DIR/train_microwakeword_macos.sh" \
+      "$SOURCE_DIR/scripts_macos/get_piper_generator.sh"
+    for checkout in micro-wake-word piper-sample-generator; do
+      printf '%s=%s\n' "$checkout" "$(git -C "$checkout" rev-parse HEAD 2>/dev/null || echo missing)"
+    done
+    "$PY" - <<'PY'
+import importlib.metadata as md
+import platform
+import sys
 
-# ── HARD FAIL: ensure pip is the venv pip ────────────────────────────────────
-VENV_PREFIX="$("$PY" -c 'import sys; print(sys.prefix)')"
-"$PY" -m pip -V | grep -q "$VENV_PREFIX" || {
-  echo "❌ pip is not using venv ($VENV_PREFIX)"
-  "$PY" -m pip -V
-  exit 1
+print("python", sys.version.split()[0], platform.machine())
+installed = {
+    str(dist.metadata["Name"] or "").lower(): dist.version
+    for dist in md.distributions()
 }
+for name, version in sorted(installed.items()):
+    print(f"dist={name}=={version}")
+PY
+  } | shasum -a 256 | awk '{print $1}'
+}
+
+write_preflight_state() {
+  local fingerprint="$1"
+  [[ -n "$fingerprint" ]] || return 0
+  {
+    printf 'fingerprint=%s\n' "$fingerprint"
+    printf 'written_at=%s\n' "$(date +%s)"
+    printf 'ffmpeg_formula=%s\n' "$FFMPEG_FORMULA"
+    printf 'ffmpeg_prefix=%s\n' "$FFMPEG_PREFIX"
+    printf 'ffmpeg_bin=%s\n' "$FFMPEG_BIN"
+  } > "$PREFLIGHT_STATE_FILE.tmp"
+  mv "$PREFLIGHT_STATE_FILE.tmp" "$PREFLIGHT_STATE_FILE"
+}
+
+run_full_environment_preflight() {
+  PREFLIGHT_COMPLETE=1
+  ensure_torch_audio_stack
 
-# ── Sanity prints ────────────────────────────────────────────────────────────
-echo "python: $PY"
-echo "pip:    $("$PY" -m pip -V | awk '{print $1, $2, $3, $4, $5}')"
-"$PY" - <<'PY'
+  # ── HARD FAIL: ensure pip is the venv pip ────────────────────────────────────
+  VENV_PREFIX="$("$PY" -c 'import sys; print(sys.prefix)')"
+  "$PY" -m pip -V | grep -q "$VENV_PREFIX" || {
+    echo "❌ pip is not using venv ($VENV_PREFIX)"
+    "$PY" -m pip -V
+    exit 1
+  }
+
+  # ── Sanity prints ────────────────────────────────────────────────────────────
+  echo "python: $PY"
+  echo "pip:    $("$PY" -m pip -V | awk '{print $1, $2, $3, $4, $5}')"
+  "$PY" - <<'PY'
 import platform, sys
 print("Python:", sys.version.replace("\n"," "))
 print("Arch:  ", platform.machine())
 PY
 
-# ── Ensure we’re on arm64 + supported Python ─────────────────────────────────
-ARCH=$("$PY" -c 'import platform; print(platform.machine())')
-PYVER=$("$PY" -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')
+  # ── Ensure we’re on arm64 + supported Python ─────────────────────────────────
+  ARCH=$("$PY" -c 'import platform; print(platform.machine())')
+  PYVER=$("$PY" -c 'import sys; print(f"{sys.version_info.major}.{sys.version_info.minor}")')
 
-if [[ "$ARCH" != "arm64" ]]; then
-  echo "❌ venv arch is $ARCH (needs arm64). Recreate with:"
-  echo "   rm -rf .venv && arch -arm64 $PYTHON_BIN -m venv .venv"
-  exit 1
-fi
-case "$PYVER" in
-  3.10|3.11) : ;;
-  *) echo "❌ Detected Python $PYVER. Use 3.10 or 3.11 for tensorflow-macos."
-     exit 1 ;;
-esac
+  if [[ "$ARCH" != "arm64" ]]; then
+    echo "❌ venv arch is $ARCH (needs arm64). Recreate with:"
+    echo "   rm -rf .venv && arch -arm64 $PYTHON_BIN -m venv .venv"
+    exit 1
+  fi
+  case "$PYVER" in
+    3.10|3.11) : ;;
+    *) echo "❌ Detected Python $PYVER. Use 3.10 or 3.11 for tensorflow-macos."
+       exit 1 ;;
+  esac
 
-# ── HARD FAIL: verify pinned versions (no silent drift) ──────────────────────
-"$PY" - <<PY
+  # ── HARD FAIL: verify pinned versions (no silent drift) ──────────────────────
+  "$PY" - <<PY
 import sys
 import importlib.metadata as md
 import tensorflow as tf
@@ -410,37 +544,37 @@ if bad:
 print("✅ Pinned ML stack verified.")
 PY
 
-# Other deps (best-effort)
-"$PY" -m pip install -q "git+https://github.com/puddly/pymicro-features@puddly/minimum-cpp-version" \
-                           "git+https://github.com/whatsnowplaying/audio-metadata@d4ebb238e6a401bb1a5aaaac60c9e2b3cb30929f" || true
-"$PY" -m pip install -q datasets librosa scipy numpy tqdm pyyaml requests ipython jupyter silero-vad || true
+  # Other deps (best-effort; a failure only forces the full preflight next time)
+  "$PY" -m pip install -q "${AUXILIARY_GIT_DEPENDENCIES[@]}" || PREFLIGHT_COMPLETE=0
+  "$PY" -m pip install -q "${AUXILIARY_PIP_DEPENDENCIES[@]}" || PREFLIGHT_COMPLETE=0
 
-# microWakeWord source (editable)
-if [[ ! -d "micro-wake-word" ]]; then
-  echo "⬇️ Cloning microWakeWord…"
-  git clone https://github.com/TaterTotterson/micro-wake-word.git >/dev/null
-else
-  echo "🔁 Updating microWakeWord…"
-  (cd micro-wake-word && git pull --ff-only origin main || true)
-fi
+  # microWakeWord source (editable)
+  if [[ ! -d "micro-wake-word" ]]; then
+    echo "⬇️ Cloning microWakeWord…"
+    git clone https://github.com/TaterTotterson/micro-wake-word.git >/dev/null
+  else
+    echo "🔁 Updating microWakeWord…"
+    (cd micro-wake-word && git pull --ff-only origin main) || PREFLIGHT_COMPLETE=0
+  fi
 
-"$PY" -m pip install -q -e ./micro-wake-word || true
+  "$PY" -m pip install -q -e ./micro-wake-word || PREFLIGHT_COMPLETE=0
 
-# Piper is no longer installed for the default modern stack. It remains
-# available as an explicit compatibility/fallback option.
-if [[ "$TTS_MODE" == "piper" ]]; then
-  bash "$SOURCE_DIR/scripts_macos/get_piper_generator.sh"
-  ensure_torch_audio_stack
-elif [[ "$TTS_MODE" == "hybrid" ]]; then
-  if bash "$SOURCE_DIR/scripts_macos/get_piper_generator.sh"; then
+  # Piper is no longer installed for the default modern stack. It remains
+  # available as an explicit compatibility/fallback option.
+  if [[ "$TTS_MODE" == "piper" ]]; then
+    bash "$SOURCE_DIR/scripts_macos/get_piper_generator.sh"
     ensure_torch_audio_stack
-  else
-    echo "⚠️  Piper setup failed; hybrid mode will continue with modern TTS only."
+  elif [[ "$TTS_MODE" == "hybrid" ]]; then
+    if bash "$SOURCE_DIR/scripts_macos/get_piper_generator.sh"; then
+      ensure_torch_audio_stack
+    else
+      echo "⚠️  Piper setup failed; hybrid mode will continue with modern TTS only."
+      PREFLIGHT_COMPLETE=0
+    fi
   fi
-fi
 
-# ── verify Metal GPU (optional) ───────────────────────────────────────────────
-"$PY" - <<'PY'
+  # ── verify Metal GPU (optional) ───────────────────────────────────────────────
+  "$PY" - <<'PY'
 import tensorflow as tf
 devs = tf.config.list_logical_devices()
 print("✅ TF logical devices:", [d.name for d in devs])
@@ -448,6 +582,25 @@ if not any(d.device_type == "GPU" for d in devs):
     print("⚠️  No GPU logical device detected. Will run on CPU.")
 PY
 
+  if [[ "$PREFLIGHT_COMPLETE" == "1" ]]; then
+    write_preflight_state "$(compute_preflight_fingerprint)"
+  else
+    rm -f "$PREFLIGHT_STATE_FILE"
+    echo "⚠️ Some setup steps failed; the next run will repeat the full environment preflight."
+  fi
+}
+
+PREFLIGHT_FINGERPRINT=""
+if [[ -f ".venv/.pinned_installed" ]] && preflight_state_recent; then
+  PREFLIGHT_FINGERPRINT="$(compute_preflight_fingerprint || true)"
+fi
+if [[ -n "$PREFLIGHT_FINGERPRINT" && "$PREFLIGHT_FINGERPRINT" == "$(read_preflight_value fingerprint)" ]]; then
+  echo "✅ Environment unchanged since the last preflight (${PREFLIGHT_FINGERPRINT:0:12}); skipping installs and verification."
+  echo "   Set MWW_FORCE_PREFLIGHT=1 to run the full setup and update path."
+else
+  run_full_environment_preflight
+fi
+
 # ── export for inline python ──────────────────────────────────────────────────
 export TARGET_WORD MAX_TTS_SAMPLES BATCH_SIZE LANGUAGE MWW_LANGUAGE TTS_MODE TTS_VOICE_COUNT
 
@@ -516,6 +669,12 @@ dir_has_matching_files() {
   [[ -n "$first_match" ]]
 }
 
+# MWW_RECORDED_SAMPLES=0 (a queued job for a phrase other than the one the
+# recordings belong to) trains on generated samples only.
+recorded_samples_present() {
+  [[ "${MWW_RECORDED_SAMPLES:-1}" != "0" ]] && dir_has_matching_files "$1" "*.wav"
+}
+
 features_dir_ready() {
   local dir="$1"
   [[ -d "$dir/training" && -d "$dir/validation" && -d "$dir/testing" ]]
@@ -538,7 +697,6 @@ write_cache_key() {
 compute_sample_cache_key() {
   {
     printf 'target=%s\n' "$TARGET_WORD"
-    printf 'samples=%s\n' "$MAX_TTS_SAMPLES"
     printf 'batch=%s\n' "$BATCH_SIZE"
     printf 'language=%s\n' "$LANGUAGE"
     printf 'english_accent=%s\n' "$ENGLISH_ACCENT"
@@ -562,7 +720,7 @@ compute_sample_cache_key() {
 }
 
 compute_personal_cache_key() {
-  if ! dir_has_matching_files "personal_samples" "*.wav"; then
+  if ! recorded_samples_present "personal_samples"; then
     echo "none"
     return
   fi
@@ -572,7 +730,7 @@ compute_personal_cache_key() {
 }
 
 compute_reviewed_negative_cache_key() {
-  if ! dir_has_matching_files "negative_samples" "*.wav"; then
+  if ! recorded_samples_present "negative_samples"; then
     echo "none"
     return
   fi
@@ -598,20 +756,62 @@ compute_feature_cache_key() {
 
 SAMPLE_CACHE_KEY_FILE="generated_samples/.cache_key"
 SAMPLE_CACHE_STAMP_FILE="generated_samples/.cache_stamp"
+# Written by tts_generate_samples.py when it grew an existing corpus; the
+# stamp file remembers which corpus the growth started from.
+SAMPLE_ADDED_LIST_FILE="generated_samples/.added_samples.txt"
+SAMPLE_GROWN_FROM_FILE="generated_samples/.grown_from_stamp"
+# Smaller growths rebuild features; a tiny delta cannot be split three ways.
+FEATURE_DELTA_MIN_SAMPLES=20
 FEATURE_CACHE_KEY_FILE="generated_augmented_features/.cache_key"
 PERSONAL_FEATURE_CACHE_KEY_FILE="personal_augmented_features/.cache_key"
 REVIEWED_NEGATIVE_FEATURE_CACHE_KEY_FILE="reviewed_negative_features/.cache_key"
 SAMPLE_CACHE_KEY="$(compute_sample_cache_key)"
 
 # ── (A) clean previous run artifacts that must always be rebuilt ─────────────
+mark_stage cleanup
+# Incremental runs (requested by Auto Training) keep only the previous
+# checkpoint so model_train_eval warm-starts from it. A checkpoint trained for
+# another wake word or model shape is never reused.
+TRAINING_MODE="${MWW_TRAINING_MODE:-full}"
+CALIBRATION_JSON="trained_models/wakeword/tflite_stream_state_internal_quant/detection_calibration.json"
+BASELINE_CALIBRATION_JSON="trained_models/baseline_calibration.json"
+WARM_START_KEY_FILE="trained_models/wakeword/.warm_start_key"
+MODEL_ARGS=(
+  mixednet
+  --pointwise_filters "128,128,128,128"
+  --repeat_in_block "1,1,1,1"
+  --mixconv_kernel_sizes "[5], [7,11], [9,15], [23]"
+  --residual_connection "0,0,0,0"
+  --first_conv_filters 64
+  --first_conv_kernel_size 5
+  --stride 2
+)
+WARM_START_KEY="$(printf '%s\n' "$TARGET_WORD" "$LANGUAGE" "${MODEL_ARGS[@]}" | shasum -a 256 | awk '{print $1}')"
+
 echo "🧹 Cleaning previous training outputs…"
 rm -f training_parameters.yaml
-rm -rf trained_models
+if [[ "$TRAINING_MODE" == "incremental" ]]; then
+  if [[ -d trained_models/wakeword/restore && -f "$CALIBRATION_JSON" ]] \
+    && [[ "$(read_cache_key "$WARM_START_KEY_FILE")" == "$WARM_START_KEY" ]]; then
+    cp "$CALIBRATION_JSON" "$BASELINE_CALIBRATION_JSON"
+    find trained_models/wakeword -mindepth 1 -maxdepth 1 ! -name restore -exec rm -rf {} +
+    echo "♻️ Incremental run: warm-starting from the previous checkpoint."
+  else
+    echo "ℹ️ No compatible previous checkpoint; running full training instead."
+    TRAINING_MODE=full
+  fi
+fi
+if [[ "$TRAINING_MODE" != "incremental" ]]; then
+  TRAINING_MODE=full
+  rm -rf trained_models
+fi
+export MWW_TRAINING_MODE="$TRAINING_MODE"
 echo "✅ Training outputs cleared."
 
 mkdir -p generated_samples
 
 # ── (B) bulk TTS (skip if enough files present) ──────────────────────────────
+mark_stage tts_generation
 sample_cache_hit=false
 count_existing=$(count_matching_files "generated_samples" "*.wav")
 cached_sample_key="$(read_cache_key "$SAMPLE_CACHE_KEY_FILE")"
@@ -620,7 +820,11 @@ if [[ "${count_existing:-0}" -eq "$MAX_TTS_SAMPLES" && -n "$cached_sample_key" &
   sample_cache_hit=true
   echo "✅ Reusing generated samples for the same wake word and voice setup."
 else
-  if [[ "${count_existing:-0}" -gt 0 || -n "$cached_sample_key" || -n "$cached_sample_stamp" ]]; then
+  # The sample count is not part of the key: the generator grows or shrinks a
+  # corpus with the same voice setup instead of regenerating it.
+  if [[ "${count_existing:-0}" -gt 0 && -n "$cached_sample_key" && "$cached_sample_key" == "$SAMPLE_CACHE_KEY" ]]; then
+    echo "📏 Resizing generated samples from ${count_existing} to ${MAX_TTS_SAMPLES}."
+  elif [[ "${count_existing:-0}" -gt 0 || -n "$cached_sample_key" || -n "$cached_sample_stamp" ]]; then
     echo "♻️ Generated sample cache changed or is incomplete; rebuilding generated samples."
     rm -rf generated_samples
     mkdir -p generated_samples
@@ -633,9 +837,15 @@ if [[ "$sample_cache_hit" != "true" ]]; then
   ensure_reference_qa_environment
   configure_cli_omnivoice_tmpdir
   echo "🎤 Generating ${MAX_TTS_SAMPLES} samples for '${TARGET_WORD}' with ${TTS_MODE} TTS…"
+  # The wrapper relays the generator's structured progress events to the
+  # trainer as ::progress lines.
   generator_cmd=(
     "$PY"
-    "$SOURCE_DIR/scripts_macos/tts_generate_samples.py"
+    "$SOURCE_DIR/scripts_macos/run_generator_with_progress.py"
+    "--generator" "$SOURCE_DIR/scripts_macos/tts_generate_samples.py"
+    "--output-dir" "generated_samples"
+    "--max-samples" "$MAX_TTS_SAMPLES"
+    "--"
     "$TARGET_WORD"
     "--language" "$LANGUAGE"
     "--english-accent" "$ENGLISH_ACCENT"
@@ -660,6 +870,11 @@ if [[ "$sample_cache_hit" != "true" ]]; then
     echo "❌ Expected ${MAX_TTS_SAMPLES} generated samples, but found ${generated_files}."
     exit 1
   fi
+  if [[ -s "$SAMPLE_ADDED_LIST_FILE" && -n "$cached_sample_stamp" && "$cached_sample_key" == "$SAMPLE_CACHE_KEY" ]]; then
+    write_cache_key "$SAMPLE_GROWN_FROM_FILE" "$cached_sample_stamp"
+  else
+    rm -f "$SAMPLE_GROWN_FROM_FILE"
+  fi
   write_cache_key "$SAMPLE_CACHE_KEY_FILE" "$SAMPLE_CACHE_KEY"
   write_cache_key "$SAMPLE_CACHE_STAMP_FILE" "${SAMPLE_CACHE_KEY}:$(date +%s)"
 else
@@ -667,11 +882,12 @@ else
 fi
 
 # ── (C) pull/prepare augmentation datasets (RIR, Audioset, FMA) ──────────────
+mark_stage dataset_prep
 echo "📚 Preparing augmentation datasets (MIT RIR, AudioSet, FMA, CHiME)…"
 "$PY" "$SOURCE_DIR/scripts_macos/prepare_datasets.py"
 
 # ── (D) trim silence from personal samples, if any exists
-if dir_has_matching_files "personal_samples" "*.wav"; then
+if recorded_samples_present "personal_samples"; then
   echo "✂️ Trimming silence from personal samples…"
   "$PY" "$SOURCE_DIR/scripts_macos/trim_silence.py"
 else
@@ -679,45 +895,72 @@ else
 fi
 
 # ── (E) build augmenter + spectrogram feature mmaps ───────────────────────────
+mark_stage features
 PERSONAL_CACHE_KEY="$(compute_personal_cache_key)"
 REVIEWED_NEGATIVE_CACHE_KEY="$(compute_reviewed_negative_cache_key)"
 SAMPLE_CACHE_STAMP="$(read_cache_key "$SAMPLE_CACHE_STAMP_FILE")"
 FEATURE_CACHE_KEY="$(compute_feature_cache_key "${SAMPLE_CACHE_KEY}:${SAMPLE_CACHE_STAMP}" "$PERSONAL_CACHE_KEY" "$REVIEWED_NEGATIVE_CACHE_KEY")"
 feature_cache_hit=false
+feature_delta_list=""
 cached_feature_key="$(read_cache_key "$FEATURE_CACHE_KEY_FILE")"
 cached_personal_feature_key="$(read_cache_key "$PERSONAL_FEATURE_CACHE_KEY_FILE")"
 cached_reviewed_negative_feature_key="$(read_cache_key "$REVIEWED_NEGATIVE_FEATURE_CACHE_KEY_FILE")"
 
-if features_dir_ready "generated_augmented_features" && [[ -n "$cached_feature_key" && "$cached_feature_key" == "$FEATURE_CACHE_KEY" ]]; then
-  personal_feature_cache_ok=false
+feature_caches_match() {
+  local key="$1"
+  features_dir_ready "generated_augmented_features" && [[ -n "$cached_feature_key" && "$cached_feature_key" == "$key" ]] || return 1
+
   if [[ "$PERSONAL_CACHE_KEY" == "none" ]]; then
-    personal_feature_cache_ok=true
     if [[ -d "personal_augmented_features" ]]; then
       echo "♻️ Removing stale personal feature cache (no personal samples present)."
       rm -rf personal_augmented_features
     fi
-  elif features_dir_ready "personal_augmented_features" && [[ -n "$cached_personal_feature_key" && "$cached_personal_feature_key" == "$FEATURE_CACHE_KEY" ]]; then
-    personal_feature_cache_ok=true
+  elif ! features_dir_ready "personal_augmented_features" || [[ -z "$cached_personal_feature_key" || "$cached_personal_feature_key" != "$key" ]]; then
+    return 1
   fi
 
-  reviewed_negative_feature_cache_ok=false
   if [[ "$REVIEWED_NEGATIVE_CACHE_KEY" == "none" ]]; then
-    reviewed_negative_feature_cache_ok=true
     if [[ -d "reviewed_negative_features" ]]; then
       echo "♻️ Removing stale reviewed negative feature cache (no reviewed negative samples present)."
       rm -rf reviewed_negative_features
     fi
-  elif features_dir_ready "reviewed_negative_features" && [[ -n "$cached_reviewed_negative_feature_key" && "$cached_reviewed_negative_feature_key" == "$FEATURE_CACHE_KEY" ]]; then
-    reviewed_negative_feature_cache_ok=true
+  elif ! features_dir_ready "reviewed_negative_features" || [[ -z "$cached_reviewed_negative_feature_key" || "$cached_reviewed_negative_feature_key" != "$key" ]]; then
+    return 1
   fi
+}
 
-  if [[ "$personal_feature_cache_ok" == "true" && "$reviewed_negative_feature_cache_ok" == "true" ]]; then
-    feature_cache_hit=true
+record_feature_cache_keys() {
+  write_cache_key "$FEATURE_CACHE_KEY_FILE" "$FEATURE_CACHE_KEY"
+  if [[ "$PERSONAL_CACHE_KEY" != "none" && -d "personal_augmented_features" ]]; then
+    write_cache_key "$PERSONAL_FEATURE_CACHE_KEY_FILE" "$FEATURE_CACHE_KEY"
+  fi
+  if [[ "$REVIEWED_NEGATIVE_CACHE_KEY" != "none" && -d "reviewed_negative_features" ]]; then
+    write_cache_key "$REVIEWED_NEGATIVE_FEATURE_CACHE_KEY_FILE" "$FEATURE_CACHE_KEY"
+  fi
+}
+
+if feature_caches_match "$FEATURE_CACHE_KEY"; then
+  feature_cache_hit=true
+else
+  # Features built from the corpus this run grew from only need the added
+  # samples appended; personal and reviewed negative inputs must be unchanged.
+  grown_from_stamp="$(read_cache_key "$SAMPLE_GROWN_FROM_FILE")"
+  if [[ -n "$grown_from_stamp" && -s "$SAMPLE_ADDED_LIST_FILE" ]] \
+    && [[ "$(wc -l < "$SAMPLE_ADDED_LIST_FILE" | tr -d ' ')" -ge "$FEATURE_DELTA_MIN_SAMPLES" ]] \
+    && feature_caches_match "$(compute_feature_cache_key "${SAMPLE_CACHE_KEY}:${grown_from_stamp}" "$PERSONAL_CACHE_KEY" "$REVIEWED_NEGATIVE_CACHE_KEY")"; then
+    feature_delta_list="$SAMPLE_ADDED_LIST_FILE"
   fi
 fi
 
 if [[ "$feature_cache_hit" == "true" ]]; then
   echo "✅ Reusing augmented feature caches for the current wake word, personal samples, and reviewed negatives."
+elif [[ -n "$feature_delta_list" ]]; then
+  echo "➕ Appending augmented features for $(wc -l < "$feature_delta_list" | tr -d ' ') new generated samples…"
+  # Consumed up front: if the append dies, the next run rebuilds instead of
+  # appending the same samples a second time.
+  rm -f "$SAMPLE_GROWN_FROM_FILE"
+  MWW_FEATURE_DELTA_LIST="$feature_delta_list" "$PY" "$SOURCE_DIR/scripts_macos/make_features.py"
+  record_feature_cache_keys
 else
   if [[ -d "generated_augmented_features" || -d "personal_augmented_features" || -d "reviewed_negative_features" ]]; then
     echo "♻️ Feature cache changed; rebuilding augmented features."
@@ -725,64 +968,94 @@ else
   fi
   echo "🧪 Building augmented feature sets…"
   "$PY" "$SOURCE_DIR/scripts_macos/make_features.py"
-  write_cache_key "$FEATURE_CACHE_KEY_FILE" "$FEATURE_CACHE_KEY"
-  if [[ "$PERSONAL_CACHE_KEY" != "none" && -d "personal_augmented_features" ]]; then
-    write_cache_key "$PERSONAL_FEATURE_CACHE_KEY_FILE" "$FEATURE_CACHE_KEY"
-  fi
-  if [[ "$REVIEWED_NEGATIVE_CACHE_KEY" != "none" && -d "reviewed_negative_features" ]]; then
-    write_cache_key "$REVIEWED_NEGATIVE_FEATURE_CACHE_KEY_FILE" "$FEATURE_CACHE_KEY"
-  fi
+  record_feature_cache_keys
 fi
 
 # ── (F) download precomputed negative spectrograms ────────────────────────────
+mark_stage dataset_prep
 echo "⬇️ Fetching negative datasets…"
 "$PY" "$SOURCE_DIR/scripts_macos/fetch_negatives.py"
 
 # ── (G) write training YAML (tuned for your notebook) ────────────────────────
+mark_stage training
 echo "📝 Writing training config…"
 "$PY" "$SOURCE_DIR/scripts_macos/write_training_yaml.py"
 
 # ── (H) train + export (Metal TF) ────────────────────────────────────────────
-echo "🏋️ Starting model training and TFLite export (this is the longest stage)…"
+train_wake_word_model() {
+  "$PY" -m microwakeword.model_train_eval \
+    --training_config=training_parameters.yaml \
+    --train 1 \
+    --restore_checkpoint 1 \
+    --test_tf_nonstreaming 0 \
+    --test_tflite_nonstreaming 0 \
+    --test_tflite_nonstreaming_quantized 0 \
+    --test_tflite_streaming 0 \
+    --test_tflite_streaming_quantized 1 \
+    --use_weights "best_weights" \
+    "${MODEL_ARGS[@]}"
+}
+
+# Exits 3 when an incremental model regresses against the published baseline.
+calibrate_wake_word_model() {
+  local baseline_args=()
+  if [[ "$TRAINING_MODE" == "incremental" ]]; then
+    baseline_args=(--baseline "$BASELINE_CALIBRATION_JSON")
+  fi
+  "$PY" "$SOURCE_DIR/scripts_macos/calibrate_detector.py" \
+    --training-config "trained_models/wakeword/training_config.yaml" \
+    --model "trained_models/wakeword/tflite_stream_state_internal_quant/stream_state_internal_quant.tflite" \
+    --output "$CALIBRATION_JSON" \
+    --target-faph "${MWW_CALIBRATION_TARGET_FAPH:-0.25}" \
+    --recall-margin "${MWW_CALIBRATION_RECALL_MARGIN:-0.005}" \
+    --window-sizes "${MWW_CALIBRATION_WINDOW_SIZES:-5,6,7}" \
+    --cutoff-min "${MWW_CALIBRATION_CUTOFF_MIN:-0.95}" \
+    --cutoff-max "${MWW_CALIBRATION_CUTOFF_MAX:-1.00}" \
+    ${baseline_args[@]+"${baseline_args[@]}"}
+}
+
+if [[ "$TRAINING_MODE" == "incremental" ]]; then
+  echo "🏋️ Fine-tuning the previous model on the updated data…"
+else
+  echo "🏋️ Starting model training and TFLite export (this is the longest stage)…"
+fi
 echo "🧠 Model quality: high_accuracy_plus"
-"$PY" -m microwakeword.model_train_eval \
-  --training_config=training_parameters.yaml \
-  --train 1 \
-  --restore_checkpoint 1 \
-  --test_tf_nonstreaming 0 \
-  --test_tflite_nonstreaming 0 \
-  --test_tflite_nonstreaming_quantized 0 \
-  --test_tflite_streaming 0 \
-  --test_tflite_streaming_quantized 1 \
-  --use_weights "best_weights" \
-  mixednet \
-  --pointwise_filters "128,128,128,128" \
-  --repeat_in_block "1,1,1,1" \
-  --mixconv_kernel_sizes "[5], [7,11], [9,15], [23]" \
-  --residual_connection "0,0,0,0" \
-  --first_conv_filters 64 \
-  --first_conv_kernel_size 5 \
-  --stride 2
+train_wake_word_model
 
 # ── (I) calibrate detector metadata ────────────────────────────────────────────
-CALIBRATION_JSON="trained_models/wakeword/tflite_stream_state_internal_quant/detection_calibration.json"
+mark_stage calibration
 echo "🎯 Calibrating detector settings for on-device use…"
-if "$PY" "$SOURCE_DIR/scripts_macos/calibrate_detector.py" \
-  --training-config "trained_models/wakeword/training_config.yaml" \
-  --model "trained_models/wakeword/tflite_stream_state_internal_quant/stream_state_internal_quant.tflite" \
-  --output "$CALIBRATION_JSON" \
-  --target-faph "${MWW_CALIBRATION_TARGET_FAPH:-0.25}" \
-  --recall-margin "${MWW_CALIBRATION_RECALL_MARGIN:-0.005}" \
-  --window-sizes "${MWW_CALIBRATION_WINDOW_SIZES:-5,6,7}" \
-  --cutoff-min "${MWW_CALIBRATION_CUTOFF_MIN:-0.95}" \
-  --cutoff-max "${MWW_CALIBRATION_CUTOFF_MAX:-1.00}"; then
+calibration_status=0
+calibrate_wake_word_model || calibration_status=$?
+if [[ "$TRAINING_MODE" == "incremental" && "$calibration_status" -ne 0 ]]; then
+  # Never publish an unverified fine-tune: fall back to the full schedule.
+  if [[ "$calibration_status" -eq 3 ]]; then
+    echo "📉 Fine-tuned model regressed against the published one; retraining from scratch."
+  else
+    echo "⚠️ Could not verify the fine-tuned model; retraining from scratch."
+  fi
+  TRAINING_MODE=full
+  export MWW_TRAINING_MODE="$TRAINING_MODE"
+  rm -rf trained_models
+  rm -f training_parameters.yaml
+  mark_stage training
+  "$PY" "$SOURCE_DIR/scripts_macos/write_training_yaml.py"
+  train_wake_word_model
+  mark_stage calibration
+  calibration_status=0
+  calibrate_wake_word_model || calibration_status=$?
+fi
+if [[ "$calibration_status" -eq 0 ]]; then
   echo "✅ Detector calibration complete."
 else
   echo "⚠️ Detector calibration failed; packaging with default detector settings."
   rm -f "$CALIBRATION_JSON"
 fi
+rm -f "$BASELINE_CALIBRATION_JSON"
+write_cache_key "$WARM_START_KEY_FILE" "$WARM_START_KEY"
 
 # ── (J) package artifacts (name by wake word) ─────────────────────────────────
+mark_stage packaging
 echo "📦 Packaging final model artifacts…"
 "$PY" "$SOURCE_DIR/scripts_macos/package_model.py" \
   "$TARGET_WORD" \
@@ -792,4 +1065,5 @@ echo "📦 Packaging final model artifacts…"
   --artifact-slug "$ARTIFACT_SLUG" \
   --name-by-wake-word
 
+mark_stage done
 echo "🎉 Done."
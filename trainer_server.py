@@ -1,11 +1,14 @@
 #!/usr/bin/env python3
 
 # trainer_server.py
+import asyncio
 import contextlib
 import fcntl
 import gc
+import gzip
 import hashlib
 import io
+import itertools
 import os
 import queue
 import re
@@ -23,6 +26,7 @@ import time
 import unicodedata
 import wave
 from array import array
+from collections import OrderedDict, deque
 from datetime import datetime, timedelta, timezone
 from difflib import SequenceMatcher
 from math import isfinite, log10
@@ -33,7 +37,7 @@ from urllib.error import HTTPError
 from urllib.request import Request as URLRequest, urlopen
 
 from fastapi import FastAPI, UploadFile, File, Form, Header, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
 ROOT_DIR = Path(__file__).resolve().parent
@@ -72,6 +76,9 @@ STATIC_DIR = Path(os.environ.get("STATIC_DIR", str(ROOT_DIR / "static"))).resolv
 PERSONAL_DIR = Path(os.environ.get("PERSONAL_DIR", str(DATA_DIR / "personal_samples"))).resolve()
 CAPTURED_DIR = Path(os.environ.get("CAPTURED_DIR", str(DATA_DIR / "captured_audio"))).resolve()
 NEGATIVE_DIR = Path(os.environ.get("NEGATIVE_DIR", str(DATA_DIR / "negative_samples"))).resolve()
+# With CAPTURED_AUDIO_LAYOUT=date new captures are stored under
+# captured_audio/YYYY/MM/DD/; flat files from before keep working either way.
+CAPTURED_DATE_SHARDS = os.environ.get("CAPTURED_AUDIO_LAYOUT", "flat").strip().lower() == "date"
 TRIM_HISTORY_DIR = Path(os.environ.get("TRIM_HISTORY_DIR", str(DATA_DIR / "trim_history"))).resolve()
 TRIM_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
 TRAINED_WAKE_WORDS_DIR = Path(
@@ -86,6 +93,36 @@ AUTO_TRAIN_STATE_FILE = Path(
 AUTO_TRAIN_MODEL_DIR = Path(
     os.environ.get("AUTO_TRAIN_MODEL_DIR", str(DATA_DIR / "auto_train_models"))
 ).resolve()
+TRAINING_QUEUE_FILE = Path(
+    os.environ.get("TRAINING_QUEUE_FILE", str(DATA_DIR / "training_queue.json"))
+).resolve()
+TRAINING_JOB_LOG_DIR = Path(
+    os.environ.get("TRAINING_JOB_LOG_DIR", str(DATA_DIR / "training_jobs"))
+).resolve()
+# Registered remote workers (token hashes only), so leases survive a restart.
+TRAINING_WORKERS_FILE = Path(
+    os.environ.get("TRAINING_WORKERS_FILE", str(DATA_DIR / "training_workers.json"))
+).resolve()
+TRAINING_QUEUE_HISTORY_LIMIT = max(1, int(os.environ.get("TRAINING_QUEUE_HISTORY_LIMIT", "50")))
+# Archive written by scripts_macos/run_profiler.py (one profile per training run).
+RUN_PROFILE_DIR = Path(os.environ.get("RUN_PROFILE_DIR", str(DATA_DIR / "run_profiles"))).resolve()
+RUN_PROFILE_SUFFIX = ".run_profile.json"
+# Content-addressed model delivery (/api/artifacts/<sha256>.tflite). Gzip
+# variants are built on first request and kept here, keyed by the same hash.
+ARTIFACT_CACHE_DIR = Path(os.environ.get("ARTIFACT_CACHE_DIR", str(DATA_DIR / "artifact_cache"))).resolve()
+ARTIFACT_PRECOMPRESS = os.environ.get("ARTIFACT_PRECOMPRESS", "1").strip().lower() in {"1", "true", "yes", "on"}
+ARTIFACT_IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+ARTIFACT_NAME_PATTERN = re.compile(r"^([0-9a-f]{64})\.tflite$")
+ARTIFACT_CACHE_FILE_PATTERN = re.compile(r"^([0-9a-f]{64})\.tflite(?:\.gz)?$")
+# Copies whose hash left the catalog are deleted after this long, checked on
+# every catalog rebuild and at most once per ARTIFACT_CACHE_PRUNE_INTERVAL_SECONDS.
+ARTIFACT_CACHE_GRACE_SECONDS = max(0, int(os.environ.get("ARTIFACT_CACHE_GRACE_SECONDS", "86400")))
+ARTIFACT_CACHE_PRUNE_INTERVAL_SECONDS = 3600.0
+# "local" runs TRAIN_SCRIPT on this host; "remote" hands queued and automatic
+# runs to workers registered over HTTP (scripts_macos/training_worker.py).
+TRAINING_EXECUTOR = os.environ.get("TRAINING_EXECUTOR", "local").strip().lower() or "local"
+TRAINING_WORKER_SECRET = os.environ.get("TRAINING_WORKER_SECRET", "").strip()
+TRAINING_WORKER_LEASE_SECONDS = max(30, int(os.environ.get("TRAINING_WORKER_LEASE_SECONDS", "300")))
 TRAINING_LOCK_FILE = Path(
     os.environ.get(
         "WAKEWORD_TRAINER_TRAINING_LOCK_FILE",
@@ -185,6 +222,19 @@ DEFAULT_PARAKEET_ONNX_REPO = os.environ.get(
     "istupakov/parakeet-tdt-0.6b-v3-onnx",
 )
 DEFAULT_PARAKEET_ONNX_QUANTIZATION = "int8"
+AUTO_TRAIN_STT_POOL_MAX_MB = max(0, int(os.environ.get("AUTO_TRAIN_STT_POOL_MAX_MB", "3072")))
+AUTO_TRAIN_STT_WARMUP = os.environ.get("AUTO_TRAIN_STT_WARMUP", "0")
+# Approximate resident memory once loaded; used only to keep the STT pool
+# inside AUTO_TRAIN_STT_POOL_MAX_MB, so rough numbers are fine.
+STT_MODEL_SIZE_ESTIMATES_MB = {
+    "tiny": 150,
+    "base": 300,
+    "small": 900,
+    "medium": 2200,
+    "turbo": 1800,
+    "large": 4200,
+}
+PARAKEET_ONNX_MODEL_SIZE_ESTIMATE_MB = 1200
 WAKE_PHRASE_GUIDANCE_MIN_SIMILARITY = 0.68
 
 AUTO_TRAIN_DEFAULT_CONFIG: Dict[str, Any] = {
@@ -205,6 +255,7 @@ AUTO_TRAIN_DEFAULT_CONFIG: Dict[str, Any] = {
     "tater_linked_at": "",
     "tater_link_tater_name": "",
     "notify_satellites": True,
+    "incremental_training": True,
 }
 
 AUTO_TRAIN_DEFAULT_STATE: Dict[str, Any] = {
@@ -222,6 +273,7 @@ AUTO_TRAIN_DEFAULT_STATE: Dict[str, Any] = {
     "last_train_started_at": "",
     "last_train_finished_at": "",
     "last_train_exit_code": None,
+    "last_train_mode": "",
     "last_notify_at": "",
     "last_notify_count": None,
     "last_notify_error": "",
@@ -265,9 +317,10 @@ STATE: Dict[str, Any] = {
     "training": {
         "running": False,
         "exit_code": None,
-        "log_lines": [],
+        "log_start_seq": 0,
         "log_path": None,
         "safe_word": None,
+        "job_id": None,
     },
 }
 
@@ -280,13 +333,47 @@ AUTO_TRAIN_LOCK = threading.RLock()
 AUTO_TRAIN_WAKE_EVENT = threading.Event()
 AUTO_TRAIN_STOP_EVENT = threading.Event()
 AUTO_TRAIN_REVIEW_QUEUE: queue.Queue[str] = queue.Queue()
-AUTO_TRAIN_QUEUED_FILES: set[str] = set()
+# File name -> time.monotonic() when it was queued (for the wait-time metric).
+AUTO_TRAIN_QUEUED_FILES: Dict[str, float] = {}
 AUTO_TRAIN_WORKER: threading.Thread | None = None
 TRAINING_RUNTIME_LOCK = threading.RLock()
 TRAINING_SHUTDOWN_EVENT = threading.Event()
 TRAINING_STOP_EVENT = threading.Event()
 TRAINING_PROCESS: subprocess.Popen | None = None
 TRAINING_THREAD: threading.Thread | None = None
+# Training output is published to a bounded ring of sequenced events. Several
+# threads publish (the log reader, worker log posts, stop messages), so the
+# sequence number is taken and the event appended under TRAINING_EVENT_LOCK:
+# the ring is always in seq order, and readers slice it from the end. The lock
+# is never held across I/O, so the subprocess reader does not wait on clients.
+# SSE streams park on an asyncio.Event that the publisher sets.
+TRAINING_EVENT_BUFFER_SIZE = max(250, int(os.environ.get("TRAINING_EVENT_BUFFER_SIZE", "4000")))
+TRAINING_EVENTS: "deque[Dict[str, Any]]" = deque(maxlen=TRAINING_EVENT_BUFFER_SIZE)
+TRAINING_EVENT_SEQUENCE = itertools.count(1)
+TRAINING_EVENT_LOCK = threading.Lock()
+TRAINING_EVENT_WAITERS: Dict[asyncio.Event, asyncio.AbstractEventLoop] = {}
+TRAINING_EVENT_KEEPALIVE_SECONDS = 15.0
+TRAINING_STATUS_LOG_LINES = 250
+# Local training stage currently being timed for the stage-duration histogram.
+TRAINING_STAGE_TIMER: Dict[str, Any] = {"stage": "", "started": 0.0}
+TRAINING_STAGE_MARKER = re.compile(r"^::stage\s+([a-z_]+)\s*$")
+# Structured TTS progress relayed by scripts_macos/run_generator_with_progress.py.
+TRAINING_PROGRESS_PREFIX = "::progress "
+TRAINING_STEP_PATTERN = re.compile(r"\bStep\s*#?(\d+)\b")
+TRAINING_METRIC_PATTERNS = {
+    name: re.compile(rf"\b{pattern}\s*(?:=|:)?\s*(-?\d+(?:\.\d+)?)", re.IGNORECASE)
+    for name, pattern in (
+        ("accuracy", "accuracy"),
+        ("recall", "recall"),
+        ("precision", "precision"),
+        ("loss", "(?:cross entropy|loss)"),
+        ("auc", "auc"),
+        ("false_positives_per_hour", "false positives per hour"),
+    )
+}
+TRAINING_QUEUE_LOCK = threading.RLock()
+TRAINING_QUEUE: List[Dict[str, Any]] = []
+TRAINING_WORKERS: Dict[str, Dict[str, Any]] = {}
 AUTO_TRAIN_RUNTIME: Dict[str, Any] = {
     "review_running": False,
     "review_file": "",
@@ -301,6 +388,96 @@ MLX_WHISPER_TRANSCRIBE_LOCK = threading.RLock()
 PARAKEET_ONNX_MODEL_LOCK = threading.RLock()
 PARAKEET_ONNX_MODEL_CACHE: Dict[tuple[str, str, tuple[str, ...]], Any] = {}
 PARAKEET_ONNX_TRANSCRIBE_LOCK = threading.RLock()
+STT_MODEL_POOL_LOCK = threading.RLock()
+STT_MODEL_POOL: "OrderedDict[tuple[str, Any], Dict[str, Any]]" = OrderedDict()
+STT_LATENCY_STATS: Dict[str, Dict[str, Any]] = {}
+STT_WARMUP_STATUS: Dict[str, Any] = {
+    "state": "idle",
+    "engine": "",
+    "started_at": "",
+    "finished_at": "",
+    "error": "",
+}
+STT_WARMUP_THREAD: threading.Thread | None = None
+# Prometheus metrics served at /metrics. Samples are keyed by (name, labels);
+# counters hold a float and histograms hold cumulative bucket counts.
+METRICS_LOCK = threading.Lock()
+METRIC_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+METRIC_WAIT_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0, 3600.0)
+METRIC_TRAINING_BUCKETS = (10.0, 30.0, 60.0, 300.0, 600.0, 1800.0, 3600.0, 7200.0, 14400.0, 28800.0)
+METRIC_DEFINITIONS: Dict[str, tuple[str, str, tuple[float, ...]]] = {
+    "wakeword_trainer_uploads_total": ("counter", "Audio uploads by endpoint and result.", ()),
+    "wakeword_trainer_upload_bytes_total": ("counter", "Audio bytes received by endpoint.", ()),
+    "wakeword_trainer_ingest_seconds": (
+        "histogram",
+        "Time to read, normalize and store an upload.",
+        METRIC_LATENCY_BUCKETS,
+    ),
+    "wakeword_trainer_normalize_seconds": (
+        "histogram",
+        "Time to convert and post-process uploaded audio to 16 kHz mono WAV.",
+        METRIC_LATENCY_BUCKETS,
+    ),
+    "wakeword_trainer_auto_review_wait_seconds": (
+        "histogram",
+        "Time a capture waited in the auto-review queue.",
+        METRIC_WAIT_BUCKETS,
+    ),
+    "wakeword_trainer_stt_seconds": (
+        "histogram",
+        "STT model load and inference time by engine and model.",
+        METRIC_LATENCY_BUCKETS,
+    ),
+    "wakeword_trainer_review_outcomes_total": ("counter", "Captured audio review outcomes.", ()),
+    "wakeword_trainer_training_runs_total": ("counter", "Finished local training runs by result.", ()),
+    "wakeword_trainer_training_run_seconds": (
+        "histogram",
+        "Wall time of local training runs.",
+        METRIC_TRAINING_BUCKETS,
+    ),
+    "wakeword_trainer_training_stage_seconds": (
+        "histogram",
+        "Wall time of each training script stage.",
+        METRIC_TRAINING_BUCKETS,
+    ),
+    "wakeword_trainer_http_request_seconds": (
+        "histogram",
+        "Time until response headers, by route.",
+        METRIC_LATENCY_BUCKETS,
+    ),
+}
+METRIC_SAMPLES: Dict[tuple[str, tuple[tuple[str, str], ...]], Any] = {}
+# Parsed trained-wake-word catalog. Rows hold relative URLs and are rebuilt
+# only when the artifact directory listing (names, sizes, mtimes) changes or
+# the packaging/publish path invalidates it; "version" increments whenever the
+# catalog content changes so satellites can long-poll for new models.
+TRAINED_WAKE_WORD_CATALOG_LOCK = threading.Lock()
+TRAINED_WAKE_WORD_CATALOG: Dict[str, Any] = {
+    "signature": None,
+    "data_dir_mtime_ns": None,
+    "rows": [],
+    "digest": "",
+    "version": 0,
+    "artifacts": {},
+    # Hash -> time.time() it was first seen missing from the catalog.
+    "retired_artifacts": {},
+    "pruned_at": 0.0,
+}
+CATALOG_LONG_POLL_MAX_SECONDS = 60.0
+CATALOG_LONG_POLL_INTERVAL_SECONDS = 0.5
+CATALOG_URL_FIELDS = ("url", "json_url", "esphome_json_url", "model_url", "model_hash_url")
+MANAGED_USAGE_SCAN_INTERVAL_SECONDS = max(
+    30, int(os.environ.get("MANAGED_DATA_SCAN_INTERVAL_SECONDS", "600"))
+)
+MANAGED_USAGE_LOCK = threading.Lock()
+MANAGED_USAGE_INDEX: Dict[str, Dict[str, Any]] = {}
+MANAGED_USAGE_RUNTIME: Dict[str, Any] = {
+    "last_computed_at": "",
+    "last_scan_seconds": None,
+    "scanner_running": False,
+}
+MANAGED_USAGE_WAKE_EVENT = threading.Event()
+MANAGED_USAGE_SCANNER: threading.Thread | None = None
 PIPER_CATALOG_CACHE: Dict[str, Any] = {
     "fetched_at": 0.0,
     "entries": None,
@@ -354,6 +531,7 @@ def _managed_data_registry() -> List[Dict[str, Any]]:
 
         {"id": "training_workspace", "label": "Model training workspace", "category": "Training results", "description": "Checkpoints, logs, and intermediate files from the latest model run.", "paths": [DATA_DIR / "trained_models"], "rebuild_note": rebuild},
         {"id": "published_models", "label": "Published wake-word models", "category": "Training results", "description": "Finished TFLite models and JSON packages shown in Wake Words.", "paths": [TRAINED_WAKE_WORDS_DIR], "rebuild_note": "Tater links to these files will stop working. Train again to recreate them."},
+        {"id": "artifact_cache", "label": "Hash-addressed model copies", "category": "Training results", "description": "Hash-named copies of published models, and their gzip variants, served from /api/artifacts.", "paths": [ARTIFACT_CACHE_DIR], "rebuild_note": "The trainer copies current models here again when the Wake Words catalog is next loaded."},
         {"id": "training_log", "label": "Training console log", "category": "Training results", "description": "Saved console output from the most recent training run.", "paths": [DATA_DIR / "recorder_training.log"], "rebuild_note": "The deleted history cannot be restored; the next run creates a new log."},
 
         {"id": "archived_voice_banks", "label": "Archived legacy voice banks", "category": "Legacy and quarantined data", "description": "Older reference banks retained outside the active training workspace.", "paths": [SUPPORT_DIR / "voice-bank-archive"], "rebuild_note": "These archived references cannot be restored automatically."},
@@ -371,14 +549,51 @@ def _managed_data_location(paths: List[Path]) -> str:
     return ", ".join(locations)
 
 
-def _managed_path_usage(path: Path) -> tuple[int, int]:
-    """Return allocated bytes and file count without following symbolic links."""
+def _scan_managed_directory(directory: str, directory_stat: os.stat_result) -> Dict[str, Any]:
+    """Shallow-scan one directory: allocated bytes and count of its non-directory entries."""
+    own_bytes = 0
+    own_files = 0
+    subdirectories: List[str] = []
+    seen: set[tuple[int, int]] = set()
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            try:
+                stat = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if stat_module.S_ISDIR(stat.st_mode):
+                subdirectories.append(entry.path)
+                continue
+            inode = (int(stat.st_dev), int(stat.st_ino))
+            if inode in seen:
+                continue
+            seen.add(inode)
+            allocated = int(getattr(stat, "st_blocks", 0) or 0) * 512
+            own_bytes += allocated or int(stat.st_size)
+            own_files += 1
+    return {
+        "inode": (int(directory_stat.st_dev), int(directory_stat.st_ino)),
+        "mtime_ns": int(directory_stat.st_mtime_ns),
+        "bytes": own_bytes,
+        "files": own_files,
+        "subdirectories": subdirectories,
+    }
+
+
+def _managed_path_usage(path: Path, *, rescan: bool = False) -> tuple[int, int]:
+    """Return allocated bytes and file count without following symbolic links.
+
+    Directory contents come from ``MANAGED_USAGE_INDEX``; a directory is only
+    re-listed when its mtime or inode changed, so large datasets cost one
+    ``lstat`` per directory instead of one per file. A directory mtime misses
+    files rewritten in place, so the background scanner passes ``rescan`` to
+    re-stat every file. Hard links are counted once per directory.
+    """
     if not os.path.lexists(path):
         return 0, 0
     total_bytes = 0
     file_count = 0
     stack = [os.fspath(path)]
-    seen: set[tuple[int, int]] = set()
     while stack:
         current = stack.pop()
         try:
@@ -386,49 +601,119 @@ def _managed_path_usage(path: Path) -> tuple[int, int]:
         except OSError:
             continue
         if stat_module.S_ISLNK(stat.st_mode) or not stat_module.S_ISDIR(stat.st_mode):
-            inode = (int(stat.st_dev), int(stat.st_ino))
-            if inode in seen:
-                continue
-            seen.add(inode)
             allocated = int(getattr(stat, "st_blocks", 0) or 0) * 512
             total_bytes += allocated or int(stat.st_size)
             file_count += 1
             continue
-        try:
-            with os.scandir(current) as entries:
-                stack.extend(entry.path for entry in entries)
-        except OSError:
-            continue
+        with MANAGED_USAGE_LOCK:
+            entry = MANAGED_USAGE_INDEX.get(current)
+        if (
+            rescan
+            or entry is None
+            or entry["mtime_ns"] != int(stat.st_mtime_ns)
+            or entry["inode"] != (int(stat.st_dev), int(stat.st_ino))
+        ):
+            try:
+                entry = _scan_managed_directory(current, stat)
+            except OSError:
+                continue
+            with MANAGED_USAGE_LOCK:
+                MANAGED_USAGE_INDEX[current] = entry
+        total_bytes += entry["bytes"]
+        file_count += entry["files"]
+        stack.extend(entry["subdirectories"])
     return total_bytes, file_count
 
 
-def _managed_data_payload() -> Dict[str, Any]:
+def _note_managed_usage_change(path: Path) -> None:
+    """Drop the cached listing of ``path``'s directory after an in-place write.
+
+    Creating or removing files updates the directory mtime on its own; this
+    covers rewrites of an existing file, which only change the file itself.
+    """
+    with MANAGED_USAGE_LOCK:
+        MANAGED_USAGE_INDEX.pop(os.fspath(Path(path).parent), None)
+
+
+def _forget_managed_usage(path: Path | None = None) -> None:
+    prefix = os.fspath(path) if path is not None else ""
+    with MANAGED_USAGE_LOCK:
+        if not prefix:
+            MANAGED_USAGE_INDEX.clear()
+            return
+        for key in [
+            key
+            for key in MANAGED_USAGE_INDEX
+            if key == prefix or key.startswith(prefix + os.sep)
+        ]:
+            MANAGED_USAGE_INDEX.pop(key, None)
+
+
+def _managed_data_payload(*, rescan: bool = False) -> Dict[str, Any]:
     items: List[Dict[str, Any]] = []
     total_size = 0
     total_files = 0
-    with DATA_MANAGEMENT_LOCK:
-        for definition in _managed_data_registry():
-            paths = [Path(path) for path in definition["paths"]]
-            usages = [_managed_path_usage(path) for path in paths]
-            size_bytes = sum(size for size, _ in usages)
-            file_count = sum(count for _, count in usages)
-            total_size += size_bytes
-            total_files += file_count
-            items.append({
-                **{key: value for key, value in definition.items() if key != "paths"},
-                "location": _managed_data_location(paths),
-                "size_bytes": size_bytes,
-                "file_count": file_count,
-                "exists": any(os.path.lexists(path) for path in paths),
-            })
+    started = time.monotonic()
+    for definition in _managed_data_registry():
+        paths = [Path(path) for path in definition["paths"]]
+        usages = [_managed_path_usage(path, rescan=rescan) for path in paths]
+        size_bytes = sum(size for size, _ in usages)
+        file_count = sum(count for _, count in usages)
+        total_size += size_bytes
+        total_files += file_count
+        items.append({
+            **{key: value for key, value in definition.items() if key != "paths"},
+            "location": _managed_data_location(paths),
+            "size_bytes": size_bytes,
+            "file_count": file_count,
+            "exists": any(os.path.lexists(path) for path in paths),
+        })
+    with MANAGED_USAGE_LOCK:
+        MANAGED_USAGE_RUNTIME["last_computed_at"] = _iso_now()
+        MANAGED_USAGE_RUNTIME["last_scan_seconds"] = round(time.monotonic() - started, 3)
+        usage_runtime = dict(MANAGED_USAGE_RUNTIME)
     return {
         "ok": True,
         "items": items,
         "total_size_bytes": total_size,
         "total_file_count": total_files,
+        "usage_computed_at": usage_runtime["last_computed_at"],
+        "usage_scan_seconds": usage_runtime["last_scan_seconds"],
+        "usage_note": (
+            "Sizes are refreshed per directory when files are added or removed. "
+            "Files rewritten in place are picked up by the next background scan. "
+            "A file hard-linked into several directories is counted in each."
+        ),
     }
 
 
+def _managed_usage_scanner_loop() -> None:
+    with MANAGED_USAGE_LOCK:
+        MANAGED_USAGE_RUNTIME["scanner_running"] = True
+    try:
+        while not TRAINING_SHUTDOWN_EVENT.is_set():
+            with contextlib.suppress(Exception):
+                _managed_data_payload(rescan=True)
+            MANAGED_USAGE_WAKE_EVENT.wait(MANAGED_USAGE_SCAN_INTERVAL_SECONDS)
+            MANAGED_USAGE_WAKE_EVENT.clear()
+    finally:
+        with MANAGED_USAGE_LOCK:
+            MANAGED_USAGE_RUNTIME["scanner_running"] = False
+
+
+def _start_managed_usage_scanner() -> None:
+    global MANAGED_USAGE_SCANNER
+    with MANAGED_USAGE_LOCK:
+        if MANAGED_USAGE_SCANNER is not None and MANAGED_USAGE_SCANNER.is_alive():
+            return
+        MANAGED_USAGE_SCANNER = threading.Thread(
+            target=_managed_usage_scanner_loop,
+            name="managed-usage-scanner",
+            daemon=True,
+        )
+        MANAGED_USAGE_SCANNER.start()
+
+
 def _remove_managed_path(path: Path) -> None:
     if not os.path.lexists(path):
         return
@@ -466,6 +751,7 @@ def _delete_managed_data_item(item_id: str) -> Dict[str, Any]:
         previous_size = sum(_managed_path_usage(path)[0] for path in paths)
         for path in paths:
             _remove_managed_path(path)
+            _forget_managed_usage(path)
         if item_id == "personal_samples":
             PERSONAL_DIR.mkdir(parents=True, exist_ok=True)
             _sync_personal_samples_state()
@@ -479,6 +765,8 @@ def _delete_managed_data_item(item_id: str) -> Dict[str, Any]:
             _clear_auto_review_queue()
         elif item_id == "trim_history":
             TRIM_HISTORY_DIR.mkdir(parents=True, exist_ok=True)
+        elif item_id in {"published_models", "artifact_cache"}:
+            _invalidate_trained_wake_word_catalog()
     payload = _managed_data_payload()
     payload.update({"deleted_id": item_id, "released_bytes": previous_size})
     return payload
@@ -489,6 +777,21 @@ _silero_vad_utils = None
 _SILERO_VAD_LOCK = threading.Lock()
 VAD_SELECTION_PAD_START_S = 0.08
 VAD_SELECTION_PAD_END_S = 0.08
+VAD_SEGMENT_CACHE_VERSION = 1
+VAD_SEGMENT_CACHE_MAX_ENTRIES = max(1, int(os.environ.get("VAD_SEGMENT_CACHE_MAX_ENTRIES", "512")))
+VAD_SEGMENT_CACHE: "OrderedDict[str, List[Dict[str, float]]]" = OrderedDict()
+VAD_SEGMENT_CACHE_LOCK = threading.Lock()
+VAD_PRECOMPUTE_LOCK = threading.Lock()
+VAD_PRECOMPUTE_THREAD: threading.Thread | None = None
+VAD_PRECOMPUTE_RUNTIME: Dict[str, Any] = {
+    "running": False,
+    "total": 0,
+    "computed": 0,
+    "cached": 0,
+    "failed": 0,
+    "started_at": "",
+    "finished_at": "",
+}
 
 
 def _load_silero_vad():
@@ -528,6 +831,117 @@ def _detect_speech_segments(wav_bytes: bytes) -> List[Dict[str, float]]:
     return [{"start": round(ts["start"], 3), "end": round(ts["end"], 3)} for ts in timestamps]
 
 
+def _remember_vad_segments(digest: str, segments: List[Dict[str, float]]) -> None:
+    with VAD_SEGMENT_CACHE_LOCK:
+        VAD_SEGMENT_CACHE[digest] = [dict(segment) for segment in segments]
+        VAD_SEGMENT_CACHE.move_to_end(digest)
+        while len(VAD_SEGMENT_CACHE) > VAD_SEGMENT_CACHE_MAX_ENTRIES:
+            VAD_SEGMENT_CACHE.popitem(last=False)
+
+
+def _cached_speech_segments(
+    audio_path: Path,
+    wav_bytes: bytes | None = None,
+    *,
+    persist: bool = False,
+) -> tuple[List[Dict[str, float]], bool]:
+    """Return Silero segments for a sample, reusing results keyed by content hash.
+
+    Results live in an in-memory LRU and, with ``persist`` (personal samples
+    only), in the sample sidecar, so a trimmed or replaced file is re-analysed
+    while an unchanged one is never run twice.
+    """
+    data = audio_path.read_bytes() if wav_bytes is None else wav_bytes
+    digest = hashlib.sha256(data).hexdigest()
+    with VAD_SEGMENT_CACHE_LOCK:
+        cached = VAD_SEGMENT_CACHE.get(digest)
+        if cached is not None:
+            VAD_SEGMENT_CACHE.move_to_end(digest)
+            return [dict(segment) for segment in cached], True
+
+    stored = _load_sidecar_json(audio_path).get("vad_cache")
+    if (
+        isinstance(stored, dict)
+        and stored.get("version") == VAD_SEGMENT_CACHE_VERSION
+        and stored.get("sha256") == digest
+        and isinstance(stored.get("segments"), list)
+    ):
+        segments = [
+            {"start": float(row["start"]), "end": float(row["end"])}
+            for row in stored["segments"]
+            if isinstance(row, dict) and "start" in row and "end" in row
+        ]
+        _remember_vad_segments(digest, segments)
+        return segments, True
+
+    segments = _detect_speech_segments(data)
+    _remember_vad_segments(digest, segments)
+    if persist:
+        # The sidecar is shared with uploads, trims and moves; re-check that
+        # the file still holds the analysed audio before recording the result.
+        with SAMPLES_LOCK:
+            with contextlib.suppress(OSError):
+                if hashlib.sha256(audio_path.read_bytes()).hexdigest() == digest:
+                    metadata = _load_sidecar_json(audio_path)
+                    metadata["vad_cache"] = {
+                        "version": VAD_SEGMENT_CACHE_VERSION,
+                        "sha256": digest,
+                        "segments": segments,
+                        "computed_at": _iso_now(),
+                    }
+                    _write_sidecar_json(audio_path, metadata)
+    return segments, False
+
+
+def _precompute_personal_vad(file_names: List[str]) -> None:
+    try:
+        for file_name in file_names:
+            if TRAINING_SHUTDOWN_EVENT.is_set():
+                break
+            try:
+                cache_hit = _cached_speech_segments(PERSONAL_DIR / file_name, persist=True)[1]
+            except Exception:
+                with VAD_PRECOMPUTE_LOCK:
+                    VAD_PRECOMPUTE_RUNTIME["failed"] += 1
+                continue
+            with VAD_PRECOMPUTE_LOCK:
+                VAD_PRECOMPUTE_RUNTIME["cached" if cache_hit else "computed"] += 1
+    finally:
+        with VAD_PRECOMPUTE_LOCK:
+            VAD_PRECOMPUTE_RUNTIME["running"] = False
+            VAD_PRECOMPUTE_RUNTIME["finished_at"] = _iso_now()
+
+
+def _start_personal_vad_precompute() -> Dict[str, Any]:
+    """Warm the VAD cache for every untrimmed personal sample in the background."""
+    global VAD_PRECOMPUTE_THREAD
+    with VAD_PRECOMPUTE_LOCK:
+        if VAD_PRECOMPUTE_RUNTIME["running"]:
+            return {"started": False, **VAD_PRECOMPUTE_RUNTIME}
+        file_names = [
+            name
+            for name in _list_personal_samples()
+            if not _load_sidecar_json(PERSONAL_DIR / name).get("trimmed")
+        ]
+        VAD_PRECOMPUTE_RUNTIME.update(
+            running=True,
+            total=len(file_names),
+            computed=0,
+            cached=0,
+            failed=0,
+            started_at=_iso_now(),
+            finished_at="",
+        )
+        VAD_PRECOMPUTE_THREAD = threading.Thread(
+            target=_precompute_personal_vad,
+            args=(file_names,),
+            name="vad-precompute",
+            daemon=True,
+        )
+        VAD_PRECOMPUTE_THREAD.start()
+        return {"started": True, **VAD_PRECOMPUTE_RUNTIME}
+
+
 def _reset_personal_samples_dir():
     _reset_audio_dir(PERSONAL_DIR)
 
@@ -542,9 +956,18 @@ def _reset_audio_dir(directory: Path):
                 pass
 
 
-def _list_audio_samples(directory: Path) -> List[str]:
+def _audio_bucket_is_date_sharded(directory: Path) -> bool:
+    return CAPTURED_DATE_SHARDS and directory.resolve() == CAPTURED_DIR.resolve()
+
+
+def _audio_sample_paths(directory: Path) -> List[Path]:
+    """Every WAV in a bucket, flat and in YYYY/MM/DD shards."""
     directory.mkdir(parents=True, exist_ok=True)
-    return sorted(p.name for p in directory.glob("*.wav"))
+    return [*directory.glob("*.wav"), *directory.glob("[0-9][0-9][0-9][0-9]/[0-9][0-9]/[0-9][0-9]/*.wav")]
+
+
+def _list_audio_samples(directory: Path) -> List[str]:
+    return sorted(p.name for p in _audio_sample_paths(directory))
 
 
 def _list_personal_samples() -> List[str]:
@@ -611,14 +1034,12 @@ def _esphome_manifest(metadata: Dict[str, Any]) -> Dict[str, Any]:
     return {key: metadata[key] for key in ESPHOME_MANIFEST_KEYS if key in metadata}
 
 
-def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
-    _sync_trained_wake_word_artifacts()
-    base = str(base_url or "").rstrip("/")
-    rows: List[Dict[str, str]] = []
+def _scan_trained_wake_words() -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
     seen: set[str] = set()
 
     for json_path in sorted(TRAINED_WAKE_WORDS_DIR.glob("*.json")):
-        if json_path.name.endswith(ESPHOME_MANIFEST_SUFFIX):
+        if json_path.name.endswith((ESPHOME_MANIFEST_SUFFIX, RUN_PROFILE_SUFFIX)):
             continue
         try:
             meta = json.loads(json_path.read_text(encoding="utf-8"))
@@ -635,6 +1056,10 @@ def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
         safe = json_path.stem
         if safe in seen:
             continue
+        try:
+            model_sha256, model_size = _publish_hashed_artifact(model_path)
+        except OSError:
+            continue
         seen.add(safe)
 
         wake_word = str(meta.get("wake_word") or safe.replace("_", " ")).strip()
@@ -653,10 +1078,7 @@ def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
         json_url = f"/api/trained_wake_words/{quote(json_path.name)}"
         esphome_json_url = f"/api/trained_wake_words/{quote(safe + ESPHOME_MANIFEST_SUFFIX)}"
         model_url = f"/api/trained_wake_words/{quote(model_path.name)}"
-        if base:
-            json_url = f"{base}{json_url}"
-            esphome_json_url = f"{base}{esphome_json_url}"
-            model_url = f"{base}{model_url}"
+        model_hash_url = f"/api/artifacts/{model_sha256}.tflite"
 
         rows.append(
             {
@@ -670,8 +1092,11 @@ def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
                 "json_url": json_url,
                 "esphome_json_url": esphome_json_url,
                 "model_url": model_url,
+                "model_hash_url": model_hash_url,
                 "json_file": json_path.name,
                 "model_file": model_path.name,
+                "model_sha256": model_sha256,
+                "model_size": model_size,
                 "threshold": round(threshold, 3) if threshold is not None else None,
                 "sliding_window": sliding_window,
                 "close_miss_threshold": round(close_miss_threshold, 3) if close_miss_threshold is not None else None,
@@ -688,6 +1113,132 @@ def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
     return rows
 
 
+def _publish_hashed_artifact(model_path: Path) -> tuple[str, int]:
+    """Copy a model to ARTIFACT_CACHE_DIR/<sha256>.tflite; return (sha256, size).
+
+    /api/artifacts serves only these copies. The named .tflite is replaced on
+    every retrain, so serving it under an immutable hash URL could hand a client
+    bytes that no longer match the hash. The copy is hashed from the same bytes
+    it is written from.
+    """
+
+    data = model_path.read_bytes()
+    digest = hashlib.sha256(data).hexdigest()
+    target = ARTIFACT_CACHE_DIR / f"{digest}.tflite"
+    if not target.is_file():
+        ARTIFACT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(target)
+    return digest, len(data)
+
+
+def _trained_wake_word_dir_signature() -> tuple:
+    try:
+        with os.scandir(TRAINED_WAKE_WORDS_DIR) as entries:
+            files = sorted(
+                (entry.name, stat.st_mtime_ns, stat.st_size)
+                for entry in entries
+                if entry.name.endswith((".json", ".tflite"))
+                for stat in (entry.stat(),)
+            )
+    except FileNotFoundError:
+        files = []
+    return (str(TRAINED_WAKE_WORDS_DIR), tuple(files))
+
+
+def _invalidate_trained_wake_word_catalog() -> None:
+    with TRAINED_WAKE_WORD_CATALOG_LOCK:
+        TRAINED_WAKE_WORD_CATALOG["signature"] = None
+        TRAINED_WAKE_WORD_CATALOG["data_dir_mtime_ns"] = None
+
+
+def _prune_artifact_cache_locked(catalog: Dict[str, Any]) -> None:
+    """Delete hash-keyed copies that left the catalog ARTIFACT_CACHE_GRACE_SECONDS ago.
+
+    The grace period starts when a hash is first seen missing (or at server
+    start), so a client that fetched the catalog just before a retrain can
+    still finish; it restarts after a server restart, which only keeps files
+    longer.
+    """
+
+    now = time.time()
+    catalog["pruned_at"] = now
+    retired = catalog["retired_artifacts"]
+    present: set[str] = set()
+    try:
+        with os.scandir(ARTIFACT_CACHE_DIR) as entries:
+            names = [entry.name for entry in entries]
+    except FileNotFoundError:
+        names = []
+    for name in names:
+        match = ARTIFACT_CACHE_FILE_PATTERN.match(name)
+        if match is None:
+            continue
+        digest = match.group(1)
+        if digest in catalog["artifacts"]:
+            continue
+        if now - retired.setdefault(digest, now) < ARTIFACT_CACHE_GRACE_SECONDS:
+            present.add(digest)
+            continue
+        try:
+            (ARTIFACT_CACHE_DIR / name).unlink()
+        except OSError:
+            present.add(digest)
+    for digest in list(retired):
+        if digest not in present:
+            retired.pop(digest)
+
+
+def _trained_wake_word_catalog() -> Dict[str, Any]:
+    """Return the cached catalog (relative-URL rows, digest, version), refreshing it if stale.
+
+    A refresh has side effects on disk: it copies each published model into
+    ARTIFACT_CACHE_DIR under its hash, and prunes copies of hashes that left
+    the catalog more than ARTIFACT_CACHE_GRACE_SECONDS ago.
+    """
+    with TRAINED_WAKE_WORD_CATALOG_LOCK:
+        catalog = TRAINED_WAKE_WORD_CATALOG
+        with contextlib.suppress(OSError):
+            if DATA_DIR.stat().st_mtime_ns != catalog["data_dir_mtime_ns"]:
+                # Root-level legacy outputs only appear as new DATA_DIR entries.
+                _sync_trained_wake_word_artifacts()
+                catalog["data_dir_mtime_ns"] = DATA_DIR.stat().st_mtime_ns
+        signature = _trained_wake_word_dir_signature()
+        if signature != catalog["signature"]:
+            rows = _scan_trained_wake_words()
+            digest = hashlib.sha256(json.dumps(rows, sort_keys=True).encode("utf-8")).hexdigest()
+            if digest != catalog["digest"]:
+                catalog["digest"] = digest
+                # Millisecond-based so versions keep increasing across restarts.
+                catalog["version"] = max(int(catalog["version"]) + 1, int(time.time() * 1000))
+            catalog["rows"] = rows
+            catalog["artifacts"] = {row["model_sha256"]: row["model_file"] for row in rows}
+            catalog["signature"] = signature
+            _prune_artifact_cache_locked(catalog)
+        elif time.time() - float(catalog["pruned_at"]) >= ARTIFACT_CACHE_PRUNE_INTERVAL_SECONDS:
+            _prune_artifact_cache_locked(catalog)
+        return {
+            "rows": [dict(row) for row in catalog["rows"]],
+            "digest": catalog["digest"],
+            "version": catalog["version"],
+            "artifacts": dict(catalog["artifacts"]),
+        }
+
+
+def _catalog_rows_with_base(rows: List[Dict[str, Any]], base_url: str = "") -> List[Dict[str, Any]]:
+    base = str(base_url or "").rstrip("/")
+    if base:
+        for row in rows:
+            for field in CATALOG_URL_FIELDS:
+                row[field] = f"{base}{row[field]}"
+    return rows
+
+
+def _list_trained_wake_words(base_url: str = "") -> List[Dict[str, Any]]:
+    return _catalog_rows_with_base(_trained_wake_word_catalog()["rows"], base_url)
+
+
 def _request_base_url(request: Request) -> str:
     return str(request.base_url).rstrip("/")
 
@@ -830,6 +1381,7 @@ def _normalize_auto_train_config(values: Dict[str, Any] | None, *, base: Dict[st
         "tater_linked_at": str(source.get("tater_linked_at") or "").strip(),
         "tater_link_tater_name": str(source.get("tater_link_tater_name") or "").strip(),
         "notify_satellites": _config_bool(source.get("notify_satellites"), True),
+        "incremental_training": _config_bool(source.get("incremental_training"), True),
     }
 
 
@@ -854,6 +1406,61 @@ def _save_auto_train_state_locked() -> None:
     _write_json_object(AUTO_TRAIN_STATE_FILE, persisted)
 
 
+def _load_training_queue() -> List[Dict[str, Any]]:
+    jobs = _read_json_object(TRAINING_QUEUE_FILE).get("jobs")
+    loaded: List[Dict[str, Any]] = []
+    for job in jobs if isinstance(jobs, list) else []:
+        if not isinstance(job, dict) or not job.get("id") or not job.get("wake_phrase"):
+            continue
+        if job.get("status") == "running" and not (TRAINING_EXECUTOR == "remote" and job.get("worker_id")):
+            # The server stopped mid-run; the job goes back in line. A remote
+            # worker keeps training through the restart, so its job stays
+            # leased until the lease actually expires.
+            job["status"] = "queued"
+            job["started_at"] = ""
+            job["worker_id"] = ""
+            job["lease_expires_at"] = ""
+        loaded.append(job)
+    return loaded
+
+
+def _load_training_workers() -> Dict[str, Dict[str, Any]]:
+    workers = _read_json_object(TRAINING_WORKERS_FILE).get("workers")
+    loaded: Dict[str, Dict[str, Any]] = {}
+    for worker in workers if isinstance(workers, list) else []:
+        if isinstance(worker, dict) and worker.get("id") and worker.get("token_sha256"):
+            loaded[str(worker["id"])] = worker
+    return loaded
+
+
+def _save_training_workers_locked() -> None:
+    _write_json_object(TRAINING_WORKERS_FILE, {"workers": list(TRAINING_WORKERS.values())})
+
+
+def _save_training_queue_locked() -> None:
+    finished = [job for job in TRAINING_QUEUE if job.get("status") not in {"queued", "running"}]
+    for job in finished[: max(0, len(finished) - TRAINING_QUEUE_HISTORY_LIMIT)]:
+        TRAINING_QUEUE.remove(job)
+        with contextlib.suppress(OSError):
+            _training_job_log_path(str(job["id"])).unlink()
+        shutil.rmtree(_training_job_staging_dir(str(job["id"])), ignore_errors=True)
+    _write_json_object(TRAINING_QUEUE_FILE, {"jobs": TRAINING_QUEUE})
+
+
+def _training_job_log_path(job_id: str) -> Path:
+    return TRAINING_JOB_LOG_DIR / f"{safe_name(job_id)}.log"
+
+
+def _training_job_staging_dir(job_id: str) -> Path:
+    """Where a remote worker's uploads wait until the job completes."""
+
+    return TRAINING_JOB_LOG_DIR / f"{safe_name(job_id)}.artifacts"
+
+
+TRAINING_QUEUE.extend(_load_training_queue())
+TRAINING_WORKERS.update(_load_training_workers())
+
+
 def _parse_iso_datetime(value: Any) -> datetime | None:
     token = str(value or "").strip()
     if not token:
@@ -895,6 +1502,7 @@ def _auto_train_status_payload() -> Dict[str, Any]:
             "state": dict(AUTO_TRAIN_STATE),
             "runtime": dict(AUTO_TRAIN_RUNTIME),
             "stt_engines": _stt_engine_catalog(language),
+            "stt_pool": _stt_model_pool_status(),
             "advertised_base_url": _advertised_base_url(),
             "trainer_link": _tater_link_public_status(),
         }
@@ -1158,6 +1766,115 @@ def _auto_train_model_environment():
                 os.environ[key] = value
 
 
+def _metric_key(name: str, labels: Dict[str, Any]) -> tuple[str, tuple[tuple[str, str], ...]]:
+    if name not in METRIC_DEFINITIONS:
+        raise KeyError(f"Unknown metric {name}")
+    return name, tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _metric_inc(name: str, amount: float = 1.0, **labels: Any) -> None:
+    key = _metric_key(name, labels)
+    with METRICS_LOCK:
+        METRIC_SAMPLES[key] = float(METRIC_SAMPLES.get(key) or 0.0) + amount
+
+
+def _metric_observe(name: str, value: float, **labels: Any) -> None:
+    key = _metric_key(name, labels)
+    bounds = METRIC_DEFINITIONS[name][2]
+    value = max(0.0, float(value))
+    with METRICS_LOCK:
+        sample = METRIC_SAMPLES.get(key)
+        if sample is None:
+            sample = METRIC_SAMPLES[key] = {"buckets": [0] * len(bounds), "sum": 0.0, "count": 0}
+        for index, bound in enumerate(bounds):
+            if value <= bound:
+                sample["buckets"][index] += 1
+        sample["sum"] += value
+        sample["count"] += 1
+
+
+def _format_metric_labels(labels: tuple[tuple[str, str], ...] | List[tuple[str, str]]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        (key, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")) for key, value in labels
+    )
+    return "{" + ",".join(f'{key}="{value}"' for key, value in escaped) + "}"
+
+
+def _format_metric_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _metrics_gauges() -> List[tuple[str, str, List[tuple[tuple[tuple[str, str], ...], float]]]]:
+    now = time.monotonic()
+    with AUTO_TRAIN_LOCK:
+        queued_at = list(AUTO_TRAIN_QUEUED_FILES.values())
+        review_running = bool(AUTO_TRAIN_RUNTIME.get("review_running"))
+    with STATE_LOCK:
+        training_running = bool(STATE["training"]["running"])
+    with TRAINING_QUEUE_LOCK:
+        job_counts: Dict[str, int] = {}
+        for job in TRAINING_QUEUE:
+            status = str(job.get("status") or "")
+            job_counts[status] = job_counts.get(status, 0) + 1
+    return [
+        (
+            "wakeword_trainer_auto_review_queue_depth",
+            "Captures waiting for or undergoing auto-review.",
+            [((), float(max(len(queued_at), int(review_running))))],
+        ),
+        (
+            "wakeword_trainer_auto_review_oldest_wait_seconds",
+            "Age of the oldest capture in the auto-review queue.",
+            [((), max((now - started for started in queued_at), default=0.0))],
+        ),
+        ("wakeword_trainer_training_running", "1 while a local training run is active.", [((), float(training_running))]),
+        (
+            "wakeword_trainer_training_jobs",
+            "Training queue jobs by status.",
+            [((("status", status),), float(count)) for status, count in sorted(job_counts.items())],
+        ),
+    ]
+
+
+def _render_metrics() -> str:
+    with METRICS_LOCK:
+        samples = {
+            key: (dict(value, buckets=list(value["buckets"])) if isinstance(value, dict) else value)
+            for key, value in METRIC_SAMPLES.items()
+        }
+    lines: List[str] = []
+    for name, (metric_type, help_text, bounds) in METRIC_DEFINITIONS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for (sample_name, labels), value in sorted(samples.items()):
+            if sample_name != name:
+                continue
+            if metric_type == "counter":
+                lines.append(f"{name}{_format_metric_labels(labels)} {_format_metric_value(value)}")
+                continue
+            for bound, count in zip(bounds, value["buckets"]):
+                bucket_labels = [*labels, ("le", _format_metric_value(bound))]
+                lines.append(f"{name}_bucket{_format_metric_labels(bucket_labels)} {count}")
+            lines.append(f"{name}_bucket{_format_metric_labels([*labels, ('le', '+Inf')])} {value['count']}")
+            lines.append(f"{name}_sum{_format_metric_labels(labels)} {_format_metric_value(round(value['sum'], 6))}")
+            lines.append(f"{name}_count{_format_metric_labels(labels)} {value['count']}")
+    for name, help_text, gauge_samples in _metrics_gauges():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} gauge")
+        for labels, value in gauge_samples:
+            lines.append(f"{name}{_format_metric_labels(labels)} {_format_metric_value(round(value, 3))}")
+    return "\n".join(lines) + "\n"
+
+
+def _record_upload(endpoint: str, size: int, started: float, *, ok: bool) -> None:
+    _metric_inc("wakeword_trainer_uploads_total", endpoint=endpoint, result="ok" if ok else "error")
+    _metric_inc("wakeword_trainer_upload_bytes_total", float(size), endpoint=endpoint)
+    if ok:
+        _metric_observe("wakeword_trainer_ingest_seconds", time.monotonic() - started, endpoint=endpoint)
+
+
 def _record_stt_runtime(
     *,
     engine: str,
@@ -1173,6 +1890,96 @@ def _record_stt_runtime(
         _save_auto_train_state_locked()
 
 
+def _estimate_stt_model_mb(engine: str, model_name: str) -> int:
+    if engine == STT_ENGINE_PARAKEET_ONNX:
+        return PARAKEET_ONNX_MODEL_SIZE_ESTIMATE_MB
+    token = Path(str(model_name or "")).name.lower()
+    for size_name, megabytes in STT_MODEL_SIZE_ESTIMATES_MB.items():
+        if size_name in token:
+            return megabytes
+    return STT_MODEL_SIZE_ESTIMATES_MB["small"]
+
+
+def _stt_model_cache_slots(engine: str):
+    if engine == STT_ENGINE_PARAKEET_ONNX:
+        return PARAKEET_ONNX_MODEL_CACHE, PARAKEET_ONNX_MODEL_LOCK, PARAKEET_ONNX_TRANSCRIBE_LOCK
+    return FASTER_WHISPER_MODEL_CACHE, FASTER_WHISPER_MODEL_LOCK, FASTER_WHISPER_TRANSCRIBE_LOCK
+
+
+def _admit_stt_model(engine: str, cache_key: tuple, model_name: str) -> None:
+    now = _iso_now()
+    with STT_MODEL_POOL_LOCK:
+        STT_MODEL_POOL[(engine, cache_key)] = {
+            "engine": engine,
+            "model": model_name,
+            "size_mb": _estimate_stt_model_mb(engine, model_name),
+            "loaded_at": now,
+            "last_used_at": now,
+        }
+        STT_MODEL_POOL.move_to_end((engine, cache_key))
+
+
+def _touch_stt_model(engine: str, cache_key: tuple) -> None:
+    with STT_MODEL_POOL_LOCK:
+        entry = STT_MODEL_POOL.get((engine, cache_key))
+        if entry is not None:
+            entry["last_used_at"] = _iso_now()
+            STT_MODEL_POOL.move_to_end((engine, cache_key))
+
+
+def _trim_stt_model_pool(*, keep_keys: set | None = None) -> List[tuple]:
+    """Evict least-recently-used STT models until the pool fits its RAM budget.
+
+    Must be called without holding any per-engine model lock: eviction takes
+    the victim engine's transcribe and model locks in the same order as the
+    transcription paths do.
+    """
+    protected = set(keep_keys or ())
+    evicted: List[tuple] = []
+    while True:
+        with STT_MODEL_POOL_LOCK:
+            used_mb = sum(int(entry["size_mb"]) for entry in STT_MODEL_POOL.values())
+            if used_mb <= AUTO_TRAIN_STT_POOL_MAX_MB:
+                break
+            victim = next((key for key in STT_MODEL_POOL if key not in protected), None)
+            if victim is None:
+                break
+            STT_MODEL_POOL.pop(victim)
+        engine, cache_key = victim
+        cache, model_lock, transcribe_lock = _stt_model_cache_slots(engine)
+        with transcribe_lock:
+            with model_lock:
+                cache.pop(cache_key, None)
+        evicted.append(victim)
+    if evicted:
+        gc.collect()
+    return evicted
+
+
+def _record_stt_latency(engine: str, phase: str, seconds: float, model: str = "") -> None:
+    _metric_observe("wakeword_trainer_stt_seconds", seconds, engine=engine, model=model, phase=phase)
+    with STT_MODEL_POOL_LOCK:
+        stats = STT_LATENCY_STATS.setdefault(engine, {})
+        count = int(stats.get(f"{phase}_count") or 0) + 1
+        total = float(stats.get(f"{phase}_seconds_total") or 0.0) + max(0.0, seconds)
+        stats[f"{phase}_count"] = count
+        stats[f"{phase}_seconds_total"] = round(total, 4)
+        stats[f"{phase}_last_seconds"] = round(max(0.0, seconds), 4)
+        stats[f"{phase}_mean_seconds"] = round(total / count, 4)
+
+
+def _stt_model_pool_status() -> Dict[str, Any]:
+    with STT_MODEL_POOL_LOCK:
+        models = [dict(entry) for entry in reversed(STT_MODEL_POOL.values())]
+        return {
+            "budget_mb": AUTO_TRAIN_STT_POOL_MAX_MB,
+            "used_mb": sum(int(entry["size_mb"]) for entry in models),
+            "models": models,
+            "latency": {engine: dict(stats) for engine, stats in STT_LATENCY_STATS.items()},
+            "warmup": dict(STT_WARMUP_STATUS),
+        }
+
+
 def _resolve_faster_whisper_runtime() -> tuple[str, str]:
     cuda_devices = 0
     with contextlib.suppress(Exception):
@@ -1187,6 +1994,7 @@ def _load_faster_whisper_model(*, model_name: str, device: str, compute_type: st
     with FASTER_WHISPER_MODEL_LOCK:
         cached = FASTER_WHISPER_MODEL_CACHE.get(cache_key)
         if cached is not None:
+            _touch_stt_model(STT_ENGINE_FASTER_WHISPER, cache_key)
             return cached
         try:
             from faster_whisper import WhisperModel
@@ -1194,15 +2002,18 @@ def _load_faster_whisper_model(*, model_name: str, device: str, compute_type: st
             raise RuntimeError(f"faster-whisper is unavailable: {exc}") from exc
 
         AUTO_TRAIN_MODEL_DIR.mkdir(parents=True, exist_ok=True)
+        started = time.monotonic()
         model = WhisperModel(
             model_name,
             device=device,
             compute_type=compute_type,
             download_root=str(AUTO_TRAIN_MODEL_DIR),
         )
-        FASTER_WHISPER_MODEL_CACHE.clear()
         FASTER_WHISPER_MODEL_CACHE[cache_key] = model
-        return model
+        _admit_stt_model(STT_ENGINE_FASTER_WHISPER, cache_key, model_name)
+    _record_stt_latency(STT_ENGINE_FASTER_WHISPER, "load", time.monotonic() - started, model_name)
+    _trim_stt_model_pool(keep_keys={(STT_ENGINE_FASTER_WHISPER, cache_key)})
+    return model
 
 
 def _transcribe_capture_with_faster_whisper(
@@ -1218,6 +2029,7 @@ def _transcribe_capture_with_faster_whisper(
         compute_type=compute_type,
     )
     with FASTER_WHISPER_TRANSCRIBE_LOCK:
+        started = time.monotonic()
         segments, _info = whisper_model.transcribe(
             str(audio_path),
             language=language or None,
@@ -1229,6 +2041,7 @@ def _transcribe_capture_with_faster_whisper(
             " ",
             " ".join(str(segment.text or "").strip() for segment in segments),
         ).strip()
+        _record_stt_latency(STT_ENGINE_FASTER_WHISPER, "inference", time.monotonic() - started, model)
     _record_stt_runtime(
         engine=STT_ENGINE_FASTER_WHISPER,
         model=model,
@@ -1255,6 +2068,7 @@ def _transcribe_capture_with_faster_whisper_guided(
         compute_type=compute_type,
     )
     with FASTER_WHISPER_TRANSCRIBE_LOCK:
+        started = time.monotonic()
         segments, _info = whisper_model.transcribe(
             str(audio_path),
             language=language or None,
@@ -1265,11 +2079,13 @@ def _transcribe_capture_with_faster_whisper_guided(
             initial_prompt=f'The wake phrase is "{normalized_phrase}".',
             hotwords=normalized_phrase,
         )
-        return re.sub(
+        transcript = re.sub(
             r"\s+",
             " ",
             " ".join(str(segment.text or "").strip() for segment in segments),
         ).strip()
+        _record_stt_latency(STT_ENGINE_FASTER_WHISPER, "inference", time.monotonic() - started, model)
+        return transcript
 
 
 def _transcribe_capture_with_mlx(audio_path: Path, *, model: str, language: str) -> str:
@@ -1286,10 +2102,14 @@ def _transcribe_capture_with_mlx(audio_path: Path, *, model: str, language: str)
         kwargs["language"] = language
     with _auto_train_model_environment():
         with MLX_WHISPER_TRANSCRIBE_LOCK:
+            started = time.monotonic()
             try:
                 result = mlx_whisper.transcribe(str(audio_path), **kwargs)
             except TypeError:
                 result = mlx_whisper.transcribe(str(audio_path), path_or_hf_repo=model)
+            # mlx-whisper loads and holds its own model, so the first call's
+            # load time is folded into this inference figure.
+            _record_stt_latency(STT_ENGINE_MLX_WHISPER, "inference", time.monotonic() - started, model)
     text = result.get("text") if isinstance(result, dict) else result
     transcript = re.sub(r"\s+", " ", str(text or "")).strip()
     _record_stt_runtime(
@@ -1332,6 +2152,7 @@ def _load_parakeet_onnx_model():
     with PARAKEET_ONNX_MODEL_LOCK:
         cached = PARAKEET_ONNX_MODEL_CACHE.get(cache_key)
         if cached is not None:
+            _touch_stt_model(STT_ENGINE_PARAKEET_ONNX, cache_key)
             return cached
         suffix = (
             f".{DEFAULT_PARAKEET_ONNX_QUANTIZATION}"
@@ -1354,6 +2175,7 @@ def _load_parakeet_onnx_model():
         ]
         if not DEFAULT_PARAKEET_ONNX_QUANTIZATION:
             required_model_files.append("encoder-model.onnx.data")
+        started = time.monotonic()
         with _auto_train_model_environment():
             snapshot_root = AUTO_TRAIN_MODEL_DIR
             if not all(
@@ -1375,9 +2197,11 @@ def _load_parakeet_onnx_model():
                 quantization=DEFAULT_PARAKEET_ONNX_QUANTIZATION,
                 providers=list(providers),
             )
-        PARAKEET_ONNX_MODEL_CACHE.clear()
         PARAKEET_ONNX_MODEL_CACHE[cache_key] = model
-        return model
+        _admit_stt_model(STT_ENGINE_PARAKEET_ONNX, cache_key, DEFAULT_PARAKEET_ONNX_MODEL)
+    _record_stt_latency(STT_ENGINE_PARAKEET_ONNX, "load", time.monotonic() - started, DEFAULT_PARAKEET_ONNX_MODEL)
+    _trim_stt_model_pool(keep_keys={(STT_ENGINE_PARAKEET_ONNX, cache_key)})
+    return model
 
 
 def _normalized_wav_float32(audio_path: Path):
@@ -1405,10 +2229,12 @@ def _transcribe_capture_with_parakeet(audio_path: Path, *, model: str, language:
     if language:
         kwargs["language"] = language
     with PARAKEET_ONNX_TRANSCRIBE_LOCK:
+        started = time.monotonic()
         result = parakeet_model.recognize(
             _normalized_wav_float32(audio_path),
             **kwargs,
         )
+        _record_stt_latency(STT_ENGINE_PARAKEET_ONNX, "inference", time.monotonic() - started, model)
     providers = _parakeet_onnx_providers()
     _record_stt_runtime(
         engine=STT_ENGINE_PARAKEET_ONNX,
@@ -1442,25 +2268,61 @@ def _transcribe_capture(audio_path: Path, *, engine: str, language: str) -> str:
 
 
 def _clear_stt_model_caches(*, keep_engine: str) -> None:
+    """Favour ``keep_engine`` in the STT pool and evict others only past the budget."""
     token = _normalize_stt_engine(keep_engine)
-    cleared = False
-    if token != STT_ENGINE_FASTER_WHISPER:
-        with FASTER_WHISPER_TRANSCRIBE_LOCK:
-            with FASTER_WHISPER_MODEL_LOCK:
-                cleared = bool(FASTER_WHISPER_MODEL_CACHE) or cleared
-                FASTER_WHISPER_MODEL_CACHE.clear()
-    if token != STT_ENGINE_PARAKEET_ONNX:
-        with PARAKEET_ONNX_TRANSCRIBE_LOCK:
-            with PARAKEET_ONNX_MODEL_LOCK:
-                cleared = bool(PARAKEET_ONNX_MODEL_CACHE) or cleared
-                PARAKEET_ONNX_MODEL_CACHE.clear()
+    with STT_MODEL_POOL_LOCK:
+        kept = {key for key in STT_MODEL_POOL if key[0] == token}
+        for key in kept:
+            STT_MODEL_POOL.move_to_end(key)
+    _trim_stt_model_pool(keep_keys=kept)
     if token != STT_ENGINE_MLX_WHISPER:
         with contextlib.suppress(Exception):
             import mlx.core as mlx_core
 
             mlx_core.clear_cache()
-    if cleared:
-        gc.collect()
+
+
+def _warm_up_stt_engine() -> None:
+    with AUTO_TRAIN_LOCK:
+        engine = _normalize_stt_engine(AUTO_TRAIN_CONFIG.get("stt_engine"))
+        language = str(AUTO_TRAIN_CONFIG.get("language") or DEFAULT_LANGUAGE)
+    with STT_MODEL_POOL_LOCK:
+        STT_WARMUP_STATUS.update(
+            state="running",
+            engine=engine,
+            started_at=_iso_now(),
+            finished_at="",
+            error="",
+        )
+    try:
+        with tempfile.TemporaryDirectory(prefix="stt-warmup-") as temp_dir:
+            warmup_path = Path(temp_dir) / "warmup.wav"
+            warmup_path.write_bytes(
+                _pcm_s16le_to_wav_bytes(b"\x00\x00" * (TARGET_SAMPLE_RATE // 2))
+            )
+            _transcribe_capture(warmup_path, engine=engine, language=language)
+    except Exception as exc:
+        with STT_MODEL_POOL_LOCK:
+            STT_WARMUP_STATUS.update(state="failed", finished_at=_iso_now(), error=str(exc))
+        return
+    with STT_MODEL_POOL_LOCK:
+        STT_WARMUP_STATUS.update(state="ready", finished_at=_iso_now())
+
+
+def _start_stt_warmup() -> bool:
+    global STT_WARMUP_THREAD
+    if not _config_bool(AUTO_TRAIN_STT_WARMUP):
+        return False
+    with STT_MODEL_POOL_LOCK:
+        if STT_WARMUP_THREAD is not None and STT_WARMUP_THREAD.is_alive():
+            return False
+        STT_WARMUP_THREAD = threading.Thread(
+            target=_warm_up_stt_engine,
+            name="stt-warmup",
+            daemon=True,
+        )
+        STT_WARMUP_THREAD.start()
+    return True
 
 
 def _queue_auto_review(file_name: str) -> bool:
@@ -1470,7 +2332,7 @@ def _queue_auto_review(file_name: str) -> bool:
     with AUTO_TRAIN_LOCK:
         if safe_file_name in AUTO_TRAIN_QUEUED_FILES:
             return False
-        AUTO_TRAIN_QUEUED_FILES.add(safe_file_name)
+        AUTO_TRAIN_QUEUED_FILES[safe_file_name] = time.monotonic()
     AUTO_TRAIN_REVIEW_QUEUE.put(safe_file_name)
     AUTO_TRAIN_WAKE_EVENT.set()
     return True
@@ -1482,8 +2344,7 @@ def _queue_pending_auto_reviews(*, force: bool = False) -> int:
         config = dict(AUTO_TRAIN_CONFIG)
     if not config.get("enabled"):
         return queued
-    CAPTURED_DIR.mkdir(parents=True, exist_ok=True)
-    for audio_path in sorted(CAPTURED_DIR.glob("*.wav")):
+    for audio_path in sorted(_audio_sample_paths(CAPTURED_DIR)):
         metadata = _load_sidecar_json(audio_path)
         if not _captured_event_is_auto_reviewable(metadata, config):
             continue
@@ -1510,6 +2371,7 @@ def _queue_pending_auto_reviews(*, force: bool = False) -> int:
 
 
 def _record_auto_review_result(*, file_name: str, transcript: str = "", result: str = "", error: str = "") -> None:
+    _metric_inc("wakeword_trainer_review_outcomes_total", source="auto", result=result or "unknown")
     with AUTO_TRAIN_LOCK:
         AUTO_TRAIN_STATE["last_review_at"] = _iso_now()
         AUTO_TRAIN_STATE["last_review_file"] = file_name
@@ -1886,6 +2748,8 @@ def _start_training_thread(
     training_lock,
     tts_mode: str = DEFAULT_SERVER_TTS_MODE,
     english_accent: str = DEFAULT_SERVER_ENGLISH_ACCENT,
+    training_mode: str = "full",
+    job_id: str = "",
 ) -> threading.Thread:
     global TRAINING_THREAD
     if TRAINING_SHUTDOWN_EVENT.is_set():
@@ -1893,7 +2757,7 @@ def _start_training_thread(
 
     thread = threading.Thread(
         target=_run_training_background,
-        args=(safe_word, language, auto_run, training_lock, tts_mode, english_accent),
+        args=(safe_word, language, auto_run, training_lock, tts_mode, english_accent, training_mode, job_id),
         daemon=True,
         name="wake-word-training",
     )
@@ -1938,6 +2802,7 @@ def _stop_current_training(timeout: float = 20.0) -> bool:
 
 def _stop_training_runtime(timeout: float = 20.0) -> bool:
     TRAINING_SHUTDOWN_EVENT.set()
+    _wake_training_event_streams()
     return _stop_current_training(timeout=timeout)
 
 
@@ -1961,6 +2826,11 @@ def _start_auto_training() -> Dict[str, Any]:
     tts_mode = _resolve_tts_mode_for_language(
         DEFAULT_SERVER_TTS_MODE, language, available_languages
     )
+    # Auto runs fine-tune the last model; the script falls back to a full run
+    # when no compatible checkpoint exists or calibration regresses.
+    training_mode = "incremental" if config.get("incremental_training") else "full"
+    if TRAINING_EXECUTOR == "remote":
+        return _queue_remote_auto_training(wake_phrase, language, tts_mode, english_accent, training_mode)
     with DATA_MANAGEMENT_LOCK:
         with STATE_LOCK:
             if STATE["training"]["running"]:
@@ -1984,6 +2854,7 @@ def _start_auto_training() -> Dict[str, Any]:
     try:
         with AUTO_TRAIN_LOCK:
             AUTO_TRAIN_STATE["last_train_started_at"] = _iso_now()
+            AUTO_TRAIN_STATE["last_train_mode"] = training_mode
             AUTO_TRAIN_RUNTIME["training_pending_consumed"] = int(
                 AUTO_TRAIN_STATE.get("pending_negative_count") or 0
             )
@@ -1995,6 +2866,7 @@ def _start_auto_training() -> Dict[str, Any]:
             training_lock,
             tts_mode=tts_mode,
             english_accent=english_accent,
+            training_mode=training_mode,
         )
     except Exception as exc:
         with STATE_LOCK:
@@ -2010,6 +2882,46 @@ def _start_auto_training() -> Dict[str, Any]:
         "language": language,
         "english_accent": english_accent,
         "tts_mode": tts_mode,
+        "training_mode": training_mode,
+    }
+
+
+def _queue_remote_auto_training(
+    wake_phrase: str,
+    language: str,
+    tts_mode: str,
+    english_accent: str,
+    training_mode: str,
+) -> Dict[str, Any]:
+    with TRAINING_QUEUE_LOCK:
+        if any(job.get("auto_run") and job.get("status") in {"queued", "running"} for job in TRAINING_QUEUE):
+            return {"ok": False, "error": "Training already running."}
+    with AUTO_TRAIN_LOCK:
+        pending = int(AUTO_TRAIN_STATE.get("pending_negative_count") or 0)
+        AUTO_TRAIN_STATE["last_train_started_at"] = _iso_now()
+        AUTO_TRAIN_STATE["last_train_mode"] = training_mode
+        _save_auto_train_state_locked()
+    # Auto runs jump the queue; the published model should track review.
+    job = _enqueue_training_job(
+        wake_phrase,
+        language,
+        tts_mode,
+        english_accent,
+        100,
+        auto_run=True,
+        training_mode=training_mode,
+        pending_negatives_consumed=pending,
+    )
+    return {
+        "ok": True,
+        "started": True,
+        "queued": True,
+        "job_id": job["id"],
+        "safe_word": job["safe_word"],
+        "language": language,
+        "english_accent": english_accent,
+        "tts_mode": tts_mode,
+        "training_mode": training_mode,
     }
 
 
@@ -2041,6 +2953,307 @@ def _maybe_run_scheduled_auto_training() -> None:
             _save_auto_train_state_locked()
 
 
+def _training_job_locked(job_id: str) -> Dict[str, Any] | None:
+    return next((job for job in TRAINING_QUEUE if job.get("id") == job_id), None)
+
+
+def _public_training_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    payload = dict(job)
+    if job.get("status") == "queued":
+        ahead = [
+            other
+            for other in TRAINING_QUEUE
+            if other.get("status") == "queued" and _training_job_sort_key(other) < _training_job_sort_key(job)
+        ]
+        payload["position"] = len(ahead) + 1
+    return payload
+
+
+def _training_job_sort_key(job: Dict[str, Any]) -> tuple:
+    return (-int(job.get("priority") or 0), str(job.get("created_at") or ""), int(job.get("sequence") or 0))
+
+
+def _recorded_samples_safe_word() -> str:
+    """Wake word the personal and reviewed negative samples were collected for.
+
+    The active recording session owns them; without one, Auto Training's phrase
+    does. An empty string means nothing claims them.
+    """
+
+    with STATE_LOCK:
+        session_word = str(STATE.get("safe_word") or "")
+    if session_word:
+        return session_word
+    with AUTO_TRAIN_LOCK:
+        auto_phrase = str(AUTO_TRAIN_CONFIG.get("wake_phrase") or "").strip()
+    return safe_name(auto_phrase) if auto_phrase else ""
+
+
+def _training_job_uses_recorded_samples(job: Dict[str, Any]) -> bool:
+    """Whether a job may train on the shared recorded samples.
+
+    Decided at enqueue time and re-checked when the job starts, so a job queued
+    for another phrase, or one whose session changed while it waited, trains on
+    generated samples only instead of on another wake word's recordings.
+    """
+
+    if not job.get("recorded_samples", True):
+        return False
+    return _recorded_samples_safe_word() in {"", str(job["safe_word"])}
+
+
+def _enqueue_training_job(
+    wake_phrase: str,
+    language: str,
+    tts_mode: str,
+    english_accent: str,
+    priority: int = 0,
+    *,
+    auto_run: bool = False,
+    training_mode: str = "full",
+    pending_negatives_consumed: int = 0,
+) -> Dict[str, Any]:
+    recorded_samples = _recorded_samples_safe_word() in {"", safe_name(wake_phrase)}
+    with TRAINING_QUEUE_LOCK:
+        sequence = max((int(job.get("sequence") or 0) for job in TRAINING_QUEUE), default=0) + 1
+        job = {
+            "id": secrets.token_hex(6),
+            "sequence": sequence,
+            "wake_phrase": wake_phrase,
+            "safe_word": safe_name(wake_phrase),
+            "language": language,
+            "tts_mode": tts_mode,
+            "english_accent": english_accent,
+            "priority": int(priority),
+            "auto_run": bool(auto_run),
+            "training_mode": training_mode,
+            "pending_negatives_consumed": int(pending_negatives_consumed),
+            "recorded_samples": recorded_samples,
+            "status": "queued",
+            "created_at": _iso_now(),
+            "started_at": "",
+            "finished_at": "",
+            "exit_code": None,
+            "error": "",
+            "worker_id": "",
+            "lease_expires_at": "",
+            "artifacts": [],
+        }
+        TRAINING_QUEUE.append(job)
+        _save_training_queue_locked()
+        public_job = _public_training_job(job)
+    AUTO_TRAIN_WAKE_EVENT.set()
+    return public_job
+
+
+def _next_queued_training_job_locked() -> Dict[str, Any] | None:
+    queued = [job for job in TRAINING_QUEUE if job.get("status") == "queued"]
+    return min(queued, key=_training_job_sort_key) if queued else None
+
+
+def _maybe_start_queued_training_job() -> Dict[str, Any] | None:
+    executor = TRAINING_EXECUTORS.get(TRAINING_EXECUTOR, _start_next_local_training_job)
+    return executor()
+
+
+def _start_next_local_training_job() -> Dict[str, Any] | None:
+    """Start the highest-priority queued job when no training is running.
+
+    Jobs run one at a time: every run shares the data directory, so the
+    negative datasets and cached sample/feature stages built by one job are
+    reused by the next instead of being prepared per job.
+    """
+
+    if TRAINING_SHUTDOWN_EVENT.is_set() or TRAINING_STOP_EVENT.is_set():
+        return None
+    with TRAINING_QUEUE_LOCK:
+        job = _next_queued_training_job_locked()
+        if job is None:
+            return None
+        job_id = str(job["id"])
+    if not Path(TRAIN_SCRIPT).exists():
+        return None
+    with DATA_MANAGEMENT_LOCK:
+        with STATE_LOCK:
+            if STATE["training"]["running"]:
+                return None
+            try:
+                training_lock = _try_acquire_training_run_lock()
+            except Exception:
+                return None
+            if training_lock is None:
+                return None
+            STATE["training"]["running"] = True
+    with TRAINING_QUEUE_LOCK:
+        job = _training_job_locked(job_id)
+        if job is None or job.get("status") != "queued":
+            with STATE_LOCK:
+                STATE["training"]["running"] = False
+            _release_training_run_lock(training_lock)
+            return None
+        job.update(status="running", started_at=_iso_now(), finished_at="", exit_code=None, error="")
+        _save_training_queue_locked()
+        started = dict(job)
+    try:
+        _start_training_thread(
+            started["safe_word"],
+            started["language"],
+            bool(started.get("auto_run")),
+            training_lock,
+            tts_mode=started["tts_mode"],
+            english_accent=started["english_accent"],
+            training_mode=str(started.get("training_mode") or "full"),
+            job_id=job_id,
+        )
+    except Exception as exc:
+        with STATE_LOCK:
+            STATE["training"]["running"] = False
+        _release_training_run_lock(training_lock)
+        _finish_training_job(job_id, "failed", error=f"Could not start training: {exc}")
+        return None
+    return started
+
+
+def _finish_training_job(job_id: str, status: str, *, exit_code: int | None = None, error: str = "") -> None:
+    with TRAINING_QUEUE_LOCK:
+        job = _training_job_locked(job_id)
+        if job is None:
+            return
+        if status == "queued":
+            job.update(status="queued", started_at="", worker_id="", lease_expires_at="")
+        else:
+            job.update(status=status, finished_at=_iso_now(), exit_code=exit_code, error=error)
+        _save_training_queue_locked()
+    AUTO_TRAIN_WAKE_EVENT.set()
+
+
+def _cancel_training_job(job_id: str) -> Dict[str, Any] | None:
+    with TRAINING_QUEUE_LOCK:
+        job = _training_job_locked(job_id)
+        if job is None:
+            return None
+        if job.get("status") == "queued" or (job.get("status") == "running" and job.get("worker_id")):
+            # A remote worker sees the cancellation on its next log upload.
+            job.update(status="cancelled", finished_at=_iso_now())
+            _save_training_queue_locked()
+            return _public_training_job(job)
+        running = job.get("status") == "running"
+    with STATE_LOCK:
+        active = running and STATE["training"].get("job_id") == job_id
+    if active:
+        _stop_current_training()
+    with TRAINING_QUEUE_LOCK:
+        job = _training_job_locked(job_id)
+        return _public_training_job(job) if job is not None else None
+
+
+def _requeue_expired_worker_leases() -> None:
+    """Remote executor tick: return jobs from silent workers to the queue."""
+
+    now = _utc_now()
+    with TRAINING_QUEUE_LOCK:
+        expired = [
+            job
+            for job in TRAINING_QUEUE
+            if job.get("status") == "running"
+            and job.get("worker_id")
+            and (_parse_iso_datetime(job.get("lease_expires_at")) or now) <= now
+        ]
+        for job in expired:
+            job.update(status="queued", started_at="", worker_id="", lease_expires_at="")
+        if expired:
+            _save_training_queue_locked()
+    return None
+
+
+TRAINING_EXECUTORS: Dict[str, Callable[[], Dict[str, Any] | None]] = {
+    "local": _start_next_local_training_job,
+    "remote": _requeue_expired_worker_leases,
+}
+
+
+def _renew_worker_lease_locked(job: Dict[str, Any]) -> None:
+    job["lease_expires_at"] = (_utc_now() + timedelta(seconds=TRAINING_WORKER_LEASE_SECONDS)).isoformat()
+
+
+def _worker_token_sha256(token: str | None) -> str:
+    return hashlib.sha256(str(token or "").encode("utf-8")).hexdigest()
+
+
+def _authorized_training_worker(worker_id: str, token: str | None) -> Dict[str, Any] | None:
+    with TRAINING_QUEUE_LOCK:
+        worker = TRAINING_WORKERS.get(worker_id)
+        if worker is None or not secrets.compare_digest(
+            str(worker.get("token_sha256") or ""), _worker_token_sha256(token)
+        ):
+            return None
+        worker["last_seen_at"] = _iso_now()
+        return worker
+
+
+def _worker_job_locked(worker_id: str, job_id: str) -> Dict[str, Any] | None:
+    job = _training_job_locked(job_id)
+    if job is None or job.get("worker_id") != worker_id:
+        return None
+    return job
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as stream:
+        for chunk in iter(lambda: stream.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _training_job_manifest(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Samples a remote worker must mirror before running TRAIN_SCRIPT."""
+
+    files = []
+    recorded_samples = _training_job_uses_recorded_samples(job)
+    sample_sets = (
+        (
+            ("personal", PERSONAL_DIR, _list_personal_samples()),
+            ("negative", NEGATIVE_DIR, _list_negative_samples()),
+        )
+        if recorded_samples
+        else ()
+    )
+    for kind, directory, names in sample_sets:
+        for name in names:
+            path = directory / name
+            with contextlib.suppress(OSError):
+                files.append(
+                    {
+                        "kind": kind,
+                        "name": name,
+                        "size": path.stat().st_size,
+                        "sha256": _file_sha256(path),
+                        "url": f"/api/workers/{job['worker_id']}/jobs/{job['id']}/files/{kind}/{quote(name)}",
+                    }
+                )
+    return {
+        "wake_phrase": job["wake_phrase"],
+        "safe_word": job["safe_word"],
+        "env": {
+            "MWW_LANGUAGE": job["language"],
+            "MWW_TTS_MODE": job["tts_mode"],
+            "MWW_ENGLISH_ACCENT": job["english_accent"],
+            "MWW_TTS_VOICE_COUNT": str(DEFAULT_TTS_VOICE_COUNT),
+            "MWW_ARTIFACT_SLUG": job["safe_word"],
+            "MWW_TRAINING_MODE": str(job.get("training_mode") or "full"),
+            "MWW_RECORDED_SAMPLES": "1" if recorded_samples else "0",
+        },
+        "files": files,
+        "artifacts": _training_job_artifact_names(job),
+    }
+
+
+def _training_job_artifact_names(job: Dict[str, Any]) -> List[str]:
+    safe_word = str(job["safe_word"])
+    return [f"{safe_word}.tflite", f"{safe_word}.json", f"{safe_word}.esphome.json"]
+
+
 def _auto_train_worker_loop() -> None:
     with AUTO_TRAIN_LOCK:
         AUTO_TRAIN_RUNTIME["scheduler_running"] = True
@@ -2052,14 +3265,19 @@ def _auto_train_worker_loop() -> None:
             except queue.Empty:
                 file_name = ""
             if file_name:
+                with AUTO_TRAIN_LOCK:
+                    queued_at = AUTO_TRAIN_QUEUED_FILES.get(file_name)
+                if queued_at is not None:
+                    _metric_observe("wakeword_trainer_auto_review_wait_seconds", time.monotonic() - queued_at)
                 try:
                     with DATA_MANAGEMENT_LOCK:
                         _auto_review_capture(file_name)
                 finally:
                     with AUTO_TRAIN_LOCK:
-                        AUTO_TRAIN_QUEUED_FILES.discard(file_name)
+                        AUTO_TRAIN_QUEUED_FILES.pop(file_name, None)
                     AUTO_TRAIN_REVIEW_QUEUE.task_done()
             _maybe_run_scheduled_auto_training()
+            _maybe_start_queued_training_job()
             AUTO_TRAIN_WAKE_EVENT.wait(1.0)
             AUTO_TRAIN_WAKE_EVENT.clear()
     finally:
@@ -2571,17 +3789,75 @@ def _next_captured_sample_name(original_name: str) -> str:
     return _next_directory_sample_name(CAPTURED_DIR, "captured", original_name)
 
 
-def _next_directory_sample_name(directory: Path, prefix: str, original_name: str) -> str:
-    current = _list_audio_samples(directory)
+def _scan_next_sample_index(directory: Path, prefix: str) -> int:
     next_index = 1
-    for name in current:
-        match = re.match(rf"{re.escape(prefix)}_(\d{{4}})", name)
+    for name in _list_audio_samples(directory):
+        match = re.match(rf"{re.escape(prefix)}_(\d+)", name)
         if match:
             next_index = max(next_index, int(match.group(1)) + 1)
+    return next_index
+
+
+def _allocate_sample_index(directory: Path, prefix: str) -> int:
+    """Reserve the next index for ``prefix`` in ``directory`` without listing it.
 
+    The counter lives in ``.<prefix>.sequence`` and is advanced durably before
+    the index is handed out, so a crash can skip an index but never reuse one.
+    A missing or unreadable counter is rebuilt from one scan of the bucket.
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    sequence_path = directory / f".{prefix}.sequence"
+    with (directory / f".{prefix}.sequence.lock").open("a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            try:
+                next_index = max(1, int(sequence_path.read_text(encoding="utf-8").strip()))
+            except (OSError, ValueError):
+                next_index = _scan_next_sample_index(directory, prefix)
+            tmp_path = sequence_path.with_name(f"{sequence_path.name}.tmp")
+            with tmp_path.open("w", encoding="utf-8") as handle:
+                handle.write(f"{next_index + 1}\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+            tmp_path.replace(sequence_path)
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    return next_index
+
+
+def _next_directory_sample_name(directory: Path, prefix: str, original_name: str) -> str:
     stem = safe_name(Path(original_name or "sample").stem)
     suffix = f"_{stem[:32]}" if stem and stem != "wakeword" else ""
-    return f"{prefix}_{next_index:04d}{suffix}.wav"
+    date_tag = ""
+    if _audio_bucket_is_date_sharded(directory):
+        date_tag = f"_{datetime.now().strftime('%Y%m%d')}"
+    while True:
+        name = f"{prefix}_{_allocate_sample_index(directory, prefix):04d}{date_tag}{suffix}.wav"
+        # A counter restored from an older backup must not overwrite newer files.
+        if not _audio_sample_path(directory, name).exists():
+            return name
+
+
+def _audio_shard_dir(directory: Path, file_name: str) -> Path | None:
+    """YYYY/MM/DD shard named by a ``<prefix>_<index>_<YYYYMMDD>`` sample name."""
+    match = re.match(r"[A-Za-z]+_\d+_(\d{4})(\d{2})(\d{2})(?:_|\.wav$)", file_name)
+    if not match:
+        return None
+    try:
+        datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+    return directory / match.group(1) / match.group(2) / match.group(3)
+
+
+def _audio_sample_path(directory: Path, file_name: str) -> Path:
+    """Where ``file_name`` lives, or will be written, inside a bucket."""
+    shard_dir = _audio_shard_dir(directory, file_name)
+    if shard_dir is None or (directory / file_name).exists():
+        return directory / file_name
+    if (shard_dir / file_name).exists() or _audio_bucket_is_date_sharded(directory):
+        return shard_dir / file_name
+    return directory / file_name
 
 
 def _parse_bool(value: Any) -> bool:
@@ -2643,6 +3919,7 @@ def _write_sidecar_json(audio_path: Path, payload: Dict[str, Any]):
         json.dumps(payload, indent=2, ensure_ascii=True),
         encoding="utf-8",
     )
+    _note_managed_usage_change(audio_path)
 
 
 def _remove_audio_with_sidecar(audio_path: Path):
@@ -2657,8 +3934,9 @@ def _resolve_audio_path(directory: Path, file_name: str) -> Path:
     candidate = Path(file_name or "").name
     if not candidate or candidate != (file_name or "") or not candidate.endswith(".wav"):
         raise FileNotFoundError("Invalid audio file name.")
-    path = (directory / candidate).resolve()
-    if path.parent != directory.resolve() or not path.exists():
+    root = directory.resolve()
+    path = _audio_sample_path(root, candidate).resolve()
+    if path.parent not in {root, (_audio_shard_dir(root, candidate) or root).resolve()} or not path.exists():
         raise FileNotFoundError("Audio file not found.")
     return path
 
@@ -2840,6 +4118,7 @@ def _save_audio_sample(
     if not data:
         raise ValueError("Empty or invalid audio file.")
 
+    started = time.monotonic()
     original_info = _inspect_wav_bytes(data) or _format_hint_from_filename(original_name)
     normalized = _is_target_wav(original_info)
     final_bytes = data if normalized else _normalize_audio_to_target_wav(data, original_name)
@@ -2847,14 +4126,19 @@ def _save_audio_sample(
     if postprocess_target_wav is not None:
         final_bytes, postprocess_info = postprocess_target_wav(final_bytes)
     final_info = _inspect_wav_bytes(final_bytes)
+    _metric_observe(
+        "wakeword_trainer_normalize_seconds",
+        time.monotonic() - started,
+        converted=str(not normalized).lower(),
+    )
 
     if not _is_target_wav(final_info):
         raise ValueError("Uploaded audio could not be normalized to 16 kHz mono 16-bit PCM WAV.")
 
     with SAMPLES_LOCK:
-        target_dir.mkdir(parents=True, exist_ok=True)
         final_name = out_name
-        out_path = target_dir / final_name
+        out_path = _audio_sample_path(target_dir, final_name)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_bytes(final_bytes)
 
     return {
@@ -2970,8 +4254,7 @@ def _captured_item_from_path(audio_path: Path) -> Dict[str, Any]:
 
 def _list_captured_items() -> List[Dict[str, Any]]:
     items: List[Dict[str, Any]] = []
-    CAPTURED_DIR.mkdir(parents=True, exist_ok=True)
-    for audio_path in sorted(CAPTURED_DIR.glob("*.wav"), key=lambda p: p.stat().st_mtime, reverse=True):
+    for audio_path in sorted(_audio_sample_paths(CAPTURED_DIR), key=lambda p: p.stat().st_mtime, reverse=True):
         try:
             items.append(_captured_item_from_path(audio_path))
         except Exception:
@@ -3048,8 +4331,8 @@ def _move_captured_audio(file_name: str, target_dir: Path, *, target_prefix: str
         else:
             target_name = _next_negative_sample_name(original_name)
 
-        target_dir.mkdir(parents=True, exist_ok=True)
-        dst_path = target_dir / target_name
+        dst_path = _audio_sample_path(target_dir, target_name)
+        dst_path.parent.mkdir(parents=True, exist_ok=True)
         src_path.replace(dst_path)
 
         metadata["review_status"] = review_status
@@ -3070,13 +4353,132 @@ def _move_captured_audio(file_name: str, target_dir: Path, *, target_prefix: str
     }
 
 
+def _wake_training_event_streams_locked() -> None:
+    for wake, loop in TRAINING_EVENT_WAITERS.items():
+        if not wake.is_set():
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(wake.set)
+
+
+def _wake_training_event_streams() -> None:
+    with TRAINING_EVENT_LOCK:
+        _wake_training_event_streams_locked()
+
+
+def _publish_training_event(event_type: str, **data: Any) -> int:
+    with TRAINING_EVENT_LOCK:
+        seq = next(TRAINING_EVENT_SEQUENCE)
+        TRAINING_EVENTS.append({"seq": seq, "type": event_type, "at": time.time(), **data})
+        _wake_training_event_streams_locked()
+    return seq
+
+
+def _training_events_after(seq: int) -> List[Dict[str, Any]]:
+    with TRAINING_EVENT_LOCK:
+        if not TRAINING_EVENTS:
+            return []
+        # Sequence numbers in the ring are contiguous, so the newer events are
+        # exactly the last (latest - seq) entries.
+        count = min(len(TRAINING_EVENTS), max(0, int(TRAINING_EVENTS[-1]["seq"]) - seq))
+        total = len(TRAINING_EVENTS)
+        return [TRAINING_EVENTS[index] for index in range(total - count, total)]
+
+
+def _latest_training_event_seq() -> int:
+    with TRAINING_EVENT_LOCK:
+        return int(TRAINING_EVENTS[-1]["seq"]) if TRAINING_EVENTS else 0
+
+
+def _parse_training_progress(line: str) -> Dict[str, Any] | None:
+    step_match = TRAINING_STEP_PATTERN.search(line)
+    if step_match is None:
+        return None
+    metrics = {}
+    for name, pattern in TRAINING_METRIC_PATTERNS.items():
+        match = pattern.search(line)
+        if match is not None:
+            metrics[name] = float(match.group(1))
+    if not metrics:
+        return None
+    return {"step": int(step_match.group(1)), "metrics": metrics}
+
+
+def _parse_tts_progress(payload: str) -> Dict[str, Any] | None:
+    try:
+        event = json.loads(payload)
+    except ValueError:
+        return None
+    if not isinstance(event, dict) or not isinstance(event.get("event"), str):
+        return None
+    return {key: value for key, value in event.items() if key not in {"seq", "type", "at"}}
+
+
+def _advance_training_stage_timer(stage: str = "") -> None:
+    """Close the timed stage (if any) and start timing ``stage``."""
+    now = time.monotonic()
+    with METRICS_LOCK:
+        previous = TRAINING_STAGE_TIMER["stage"]
+        elapsed = now - float(TRAINING_STAGE_TIMER["started"])
+        TRAINING_STAGE_TIMER.update(stage=stage, started=now)
+    if previous:
+        _metric_observe("wakeword_trainer_training_stage_seconds", elapsed, stage=previous)
+
+
 def _append_train_log(line: str):
     line = (line or "").rstrip("\n")
-    with STATE_LOCK:
-        buf: List[str] = STATE["training"]["log_lines"]
-        buf.append(line)
-        if len(buf) > 250:
-            del buf[: len(buf) - 250]
+    stage_match = TRAINING_STAGE_MARKER.match(line.strip())
+    if stage_match is not None:
+        # Stage markers from TRAIN_SCRIPT become structured events only.
+        stage = stage_match.group(1)
+        _advance_training_stage_timer("" if stage == "done" else stage)
+        _publish_training_event("stage", stage=stage)
+        return
+    if line.startswith(TRAINING_PROGRESS_PREFIX):
+        progress = _parse_tts_progress(line[len(TRAINING_PROGRESS_PREFIX):])
+        if progress is not None:
+            _publish_training_event("tts_progress", **progress)
+            return
+    _publish_training_event("log", line=line)
+    progress = _parse_training_progress(line)
+    if progress is not None:
+        _publish_training_event("progress", **progress)
+
+
+def _training_log_tail(start_seq: int, limit: int = TRAINING_STATUS_LOG_LINES) -> List[str]:
+    lines = [event["line"] for event in _training_events_after(start_seq - 1) if event["type"] == "log"]
+    return lines[-limit:]
+
+
+def _finish_auto_training_run(
+    safe_word: str,
+    rc: int,
+    consumed: int,
+    *,
+    publish: bool,
+    log: Callable[[str], None] = _append_train_log,
+) -> None:
+    with AUTO_TRAIN_LOCK:
+        AUTO_TRAIN_STATE["last_train_finished_at"] = _iso_now()
+        AUTO_TRAIN_STATE["last_train_exit_code"] = rc
+        AUTO_TRAIN_STATE["pending_negative_count"] = max(
+            0,
+            int(AUTO_TRAIN_STATE.get("pending_negative_count") or 0) - int(consumed or 0),
+        )
+        _save_auto_train_state_locked()
+    _invalidate_trained_wake_word_catalog()
+    if not publish:
+        return
+    log("→ Publishing the newly trained wake word to Tater and all satellites")
+    notify_result = _notify_tater_satellites(safe_word)
+    if notify_result.get("ok"):
+        if notify_result.get("skipped"):
+            log("→ Wake-word publish skipped (disabled in Auto Training)")
+        else:
+            count = notify_result.get("count")
+            suffix = f" ({count} connected)" if count is not None else ""
+            log(f"✓ New wake word activated through Tater{suffix}")
+    else:
+        log(f"✗ Tater wake-word activation failed: {notify_result.get('error')}")
 
 
 def _run_training_background(
@@ -3086,6 +4488,8 @@ def _run_training_background(
     training_lock=None,
     tts_mode: str = DEFAULT_SERVER_TTS_MODE,
     english_accent: str = DEFAULT_SERVER_ENGLISH_ACCENT,
+    training_mode: str = "full",
+    job_id: str = "",
 ):
     global TRAINING_PROCESS, TRAINING_THREAD
     language = (language or DEFAULT_LANGUAGE).strip().lower() or DEFAULT_LANGUAGE
@@ -3093,14 +4497,28 @@ def _run_training_background(
     english_accent = normalize_english_accent(english_accent, language)
     rc = 999
     proc: subprocess.Popen | None = None
+    run_started = time.monotonic()
+    _advance_training_stage_timer()
+
+    job_phrase = ""
+    recorded_samples = True
+    if job_id:
+        with TRAINING_QUEUE_LOCK:
+            job = dict(_training_job_locked(job_id) or {})
+        job_phrase = str(job.get("wake_phrase") or "").strip()
+        if job:
+            recorded_samples = _training_job_uses_recorded_samples(job)
 
     with STATE_LOCK:
-        raw_phrase = str(STATE.get("raw_phrase") or "").strip()
+        raw_phrase = job_phrase or str(STATE.get("raw_phrase") or "").strip()
         STATE["training"]["running"] = True
         STATE["training"]["exit_code"] = None
-        STATE["training"]["log_lines"] = []
+        STATE["training"]["log_start_seq"] = _publish_training_event(
+            "run", state="started", safe_word=safe_word, job_id=job_id or None
+        )
         STATE["training"]["safe_word"] = safe_word
-        log_path = str(DATA_DIR / "recorder_training.log")
+        STATE["training"]["job_id"] = job_id or None
+        log_path = str(_training_job_log_path(job_id) if job_id else DATA_DIR / "recorder_training.log")
         STATE["training"]["log_path"] = log_path
 
     training_phrase = raw_phrase or safe_word
@@ -3109,11 +4527,17 @@ def _run_training_background(
     _append_train_log(f"→ Running: {' '.join(cmd)}")
     _append_train_log(f"→ Language: {language}")
     _append_train_log(f"→ TTS mode: {tts_mode}")
+    _append_train_log(f"→ Training mode: {training_mode}")
     if language == "en":
         _append_train_log(f"→ English accent emphasis: {english_accent}")
+    if not recorded_samples:
+        _append_train_log(
+            "→ Recorded samples belong to another wake phrase; training on generated samples only."
+        )
 
     try:
         DATA_DIR.mkdir(parents=True, exist_ok=True)
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
         if language != "en" and tts_mode == "piper":
             _ensure_non_english_language_voices(language, _append_train_log)
         elif language != "en" and tts_mode == "hybrid":
@@ -3131,6 +4555,8 @@ def _run_training_background(
             env["MWW_ENGLISH_ACCENT"] = english_accent
             env["MWW_TTS_VOICE_COUNT"] = str(DEFAULT_TTS_VOICE_COUNT)
             env["MWW_ARTIFACT_SLUG"] = safe_word
+            env["MWW_TRAINING_MODE"] = training_mode
+            env["MWW_RECORDED_SAMPLES"] = "1" if recorded_samples else "0"
             env["WAKEWORD_TRAINER_SUPPORT_DIR"] = str(SUPPORT_DIR)
             env["WAKEWORD_TRAINER_DATA_DIR"] = str(DATA_DIR)
             env["TRAINED_WAKE_WORDS_DIR"] = str(TRAINED_WAKE_WORDS_DIR)
@@ -3179,28 +4605,10 @@ def _run_training_background(
     try:
         if auto_run:
             with AUTO_TRAIN_LOCK:
-                AUTO_TRAIN_STATE["last_train_finished_at"] = _iso_now()
-                AUTO_TRAIN_STATE["last_train_exit_code"] = rc
-                if rc == 0 and not TRAINING_SHUTDOWN_EVENT.is_set() and not TRAINING_STOP_EVENT.is_set():
-                    consumed = int(AUTO_TRAIN_RUNTIME.get("training_pending_consumed") or 0)
-                    AUTO_TRAIN_STATE["pending_negative_count"] = max(
-                        0,
-                        int(AUTO_TRAIN_STATE.get("pending_negative_count") or 0) - consumed,
-                    )
+                consumed = int(AUTO_TRAIN_RUNTIME.get("training_pending_consumed") or 0)
                 AUTO_TRAIN_RUNTIME["training_pending_consumed"] = 0
-                _save_auto_train_state_locked()
-            if rc == 0 and not TRAINING_SHUTDOWN_EVENT.is_set() and not TRAINING_STOP_EVENT.is_set():
-                _append_train_log("→ Publishing the newly trained wake word to Tater and all satellites")
-                notify_result = _notify_tater_satellites(safe_word)
-                if notify_result.get("ok"):
-                    if notify_result.get("skipped"):
-                        _append_train_log("→ Wake-word publish skipped (disabled in Auto Training)")
-                    else:
-                        count = notify_result.get("count")
-                        suffix = f" ({count} connected)" if count is not None else ""
-                        _append_train_log(f"✓ New wake word activated through Tater{suffix}")
-                else:
-                    _append_train_log(f"✗ Tater wake-word activation failed: {notify_result.get('error')}")
+            succeeded = rc == 0 and not TRAINING_SHUTDOWN_EVENT.is_set() and not TRAINING_STOP_EVENT.is_set()
+            _finish_auto_training_run(safe_word, rc, consumed if succeeded else 0, publish=succeeded)
     finally:
         with TRAINING_RUNTIME_LOCK:
             if TRAINING_PROCESS is proc:
@@ -3209,22 +4617,81 @@ def _run_training_background(
                 TRAINING_THREAD = None
         with STATE_LOCK:
             STATE["training"]["running"] = False
+            exit_code = STATE["training"]["exit_code"]
+        _publish_training_event("run", state="finished", safe_word=safe_word, job_id=job_id or None, exit_code=exit_code)
         _release_training_run_lock(training_lock)
+        if (TRAINING_SHUTDOWN_EVENT.is_set() or TRAINING_STOP_EVENT.is_set()) and rc != 0:
+            run_result = "interrupted"
+        else:
+            run_result = "succeeded" if rc == 0 else "failed"
+        _advance_training_stage_timer()
+        _invalidate_trained_wake_word_catalog()
+        _metric_inc("wakeword_trainer_training_runs_total", result=run_result)
+        _metric_observe("wakeword_trainer_training_run_seconds", time.monotonic() - run_started, result=run_result)
+        if job_id:
+            if TRAINING_SHUTDOWN_EVENT.is_set() and rc != 0:
+                _finish_training_job(job_id, "queued")
+            elif TRAINING_STOP_EVENT.is_set() and rc != 0:
+                _finish_training_job(job_id, "cancelled", exit_code=rc)
+            else:
+                _finish_training_job(job_id, "succeeded" if rc == 0 else "failed", exit_code=rc)
+        # Training rewrites checkpoints and feature files in place; rebuild
+        # the usage index in the background rather than on the next request.
+        _forget_managed_usage()
+        MANAGED_USAGE_WAKE_EVENT.set()
         if not TRAINING_SHUTDOWN_EVENT.is_set():
             TRAINING_STOP_EVENT.clear()
 
 
 # -------------------- Routes --------------------
+class _RequestMetricsMiddleware:
+    """Observe time-to-headers per matched route (streams are not held open)."""
+
+    def __init__(self, asgi_app):
+        self.app = asgi_app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        started = time.monotonic()
+
+        async def send_with_metrics(message):
+            if message["type"] == "http.response.start":
+                route = getattr(scope.get("route"), "path", "") or "unmatched"
+                _metric_observe(
+                    "wakeword_trainer_http_request_seconds",
+                    time.monotonic() - started,
+                    method=scope["method"],
+                    route=route,
+                    status=message["status"],
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_metrics)
+
+
+app.add_middleware(_RequestMetricsMiddleware)
+
+
+@app.get("/metrics")
+def metrics():
+    return PlainTextResponse(_render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 @app.on_event("startup")
 def start_auto_train_worker_event():
     TRAINING_SHUTDOWN_EVENT.clear()
     _start_auto_train_worker()
+    _start_managed_usage_scanner()
+    _start_stt_warmup()
 
 
 @app.on_event("shutdown")
 def stop_auto_train_worker_event():
     worker_stopped = _stop_auto_train_worker(timeout=5.0)
     training_stopped = _stop_training_runtime(timeout=20.0)
+    MANAGED_USAGE_WAKE_EVENT.set()
     if not worker_stopped:
         _append_train_log("⚠ Auto-training worker did not stop before shutdown.")
     if not training_stopped:
@@ -3497,13 +4964,16 @@ async def upload_take(
 
     out_name = f"speaker{speaker_index:02d}_take{take_index:02d}.wav"
 
+    started = time.monotonic()
     data = await file.read()
     try:
         result = _save_personal_sample(data, file.filename or out_name, out_name=out_name)
     except Exception as e:
+        _record_upload("upload_take", len(data), started, ok=False)
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
     takes = _sync_personal_samples_state()
+    _record_upload("upload_take", len(data), started, ok=True)
     return {"ok": True, **result, "takes_received": len(takes)}
 
 
@@ -3515,13 +4985,16 @@ async def upload_personal_sample(file: UploadFile = File(...)):
     if not safe_word:
         return JSONResponse({"ok": False, "error": "No active session. Call /api/start_session first."}, status_code=400)
 
+    started = time.monotonic()
     data = await file.read()
     try:
         result = _save_personal_sample(data, file.filename or "sample")
     except Exception as e:
+        _record_upload("upload_personal_sample", len(data), started, ok=False)
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
     takes = _sync_personal_samples_state()
+    _record_upload("upload_personal_sample", len(data), started, ok=True)
     return {"ok": True, **result, "takes_received": len(takes)}
 
 
@@ -3538,10 +5011,12 @@ async def upload_captured_audio(
     notes: str | None = Form(None),
     metadata_json: str | None = Form(None),
 ):
+    started = time.monotonic()
     data = await file.read()
     try:
         result = _save_captured_sample(data, file.filename or "captured")
     except Exception as e:
+        _record_upload("upload_captured_audio", len(data), started, ok=False)
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
     extra_meta: Dict[str, Any] = {}
@@ -3556,7 +5031,7 @@ async def upload_captured_audio(
     with STATE_LOCK:
         current_safe_word = STATE.get("safe_word")
 
-    audio_path = CAPTURED_DIR / result["saved_as"]
+    audio_path = _audio_sample_path(CAPTURED_DIR, result["saved_as"])
     sidecar = {
         **extra_meta,
         "saved_as": result["saved_as"],
@@ -3594,6 +5069,7 @@ async def upload_captured_audio(
         auto_review_config = dict(AUTO_TRAIN_CONFIG)
     if auto_review_config.get("enabled") and _captured_event_is_auto_reviewable(sidecar, auto_review_config):
         _queue_auto_review(audio_path.name)
+    _record_upload("upload_captured_audio", len(data), started, ok=True)
 
     return {
         "ok": True,
@@ -3625,6 +5101,7 @@ async def upload_captured_audio_raw(
     x_probability_history: str | None = Header(default=None),
     x_notes: str | None = Header(default=None),
 ):
+    started = time.monotonic()
     raw_data = await request.body()
     audio_format = (x_audio_format or "wav").strip().lower()
 
@@ -3640,12 +5117,13 @@ async def upload_captured_audio_raw(
 
         result = _save_captured_sample(data, original_name)
     except Exception as e:
+        _record_upload("upload_captured_audio_raw", len(raw_data), started, ok=False)
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
 
     with STATE_LOCK:
         current_safe_word = STATE.get("safe_word")
 
-    audio_path = CAPTURED_DIR / result["saved_as"]
+    audio_path = _audio_sample_path(CAPTURED_DIR, result["saved_as"])
     sidecar = {
         "saved_as": result["saved_as"],
         "original_name": result["original_name"],
@@ -3680,6 +5158,7 @@ async def upload_captured_audio_raw(
         auto_review_config = dict(AUTO_TRAIN_CONFIG)
     if auto_review_config.get("enabled") and _captured_event_is_auto_reviewable(sidecar, auto_review_config):
         _queue_auto_review(audio_path.name)
+    _record_upload("upload_captured_audio_raw", len(raw_data), started, ok=True)
 
     return {
         "ok": True,
@@ -3781,7 +5260,7 @@ def vad_segments(bucket: str, file_name: str):
 
     wav_bytes = path.read_bytes()
     try:
-        all_segments = _detect_speech_segments(wav_bytes)
+        all_segments, _cached = _cached_speech_segments(path, wav_bytes, persist=bucket == "personal")
     except Exception as e:
         return JSONResponse({"ok": False, "error": f"VAD failed: {str(e)}"}, status_code=500)
 
@@ -3803,6 +5282,17 @@ def vad_segments(bucket: str, file_name: str):
     return {"ok": True, "file_name": file_name, "segments": [segment], "segment_count": 1}
 
 
+@app.post("/api/samples/vad/precompute")
+def precompute_personal_vad():
+    return {"ok": True, **_start_personal_vad_precompute()}
+
+
+@app.get("/api/samples/vad/precompute")
+def personal_vad_precompute_status():
+    with VAD_PRECOMPUTE_LOCK:
+        return {"ok": True, **VAD_PRECOMPUTE_RUNTIME}
+
+
 @app.post("/api/samples/trim")
 async def trim_sample_upload(
     file: UploadFile = File(...),
@@ -3852,6 +5342,7 @@ async def trim_sample_upload(
 
     # Replace the original file with trimmed audio
     orig_path.write_bytes(data)
+    _note_managed_usage_change(orig_path)
 
     # Update sidecar with trim metadata
     old_sidecar = _load_sidecar_json(orig_path)
@@ -3899,6 +5390,7 @@ def revert_trim(
 
     # Restore original from backup
     shutil.copy2(backup_path, file_path)
+    _note_managed_usage_change(file_path)
     # Restore sidecar
     backup_sidecar = _audio_sidecar_path(backup_path)
     if backup_sidecar.exists():
@@ -3921,6 +5413,7 @@ def approve_captured_audio_to_personal(file_name: str):
         return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
     except Exception as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
+    _metric_inc("wakeword_trainer_review_outcomes_total", source="manual", result="approved_personal")
     return {"ok": True, **result}
 
 
@@ -3932,6 +5425,7 @@ def mark_captured_audio_negative(file_name: str):
         return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
     except Exception as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=400)
+    _metric_inc("wakeword_trainer_review_outcomes_total", source="manual", result="approved_negative")
     return {"ok": True, **result}
 
 
@@ -3942,20 +5436,139 @@ def discard_captured_audio(file_name: str):
         _remove_audio_with_sidecar(path)
     except FileNotFoundError as e:
         return JSONResponse({"ok": False, "error": str(e)}, status_code=404)
+    _metric_inc("wakeword_trainer_review_outcomes_total", source="manual", result="discarded")
     return {"ok": True, "captured_count": len(_list_captured_sample_names())}
 
 
+def _catalog_etag(catalog: Dict[str, Any], base_url: str) -> str:
+    digest = hashlib.sha256(f"{catalog['digest']}\n{base_url}".encode("utf-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
 @app.get("/api/trained_wake_words/catalog")
-def trained_wake_words_catalog(request: Request):
-    return {
-        "ok": True,
-        "base_url": _advertised_base_url(request),
-        "wake_words": _list_trained_wake_words(_advertised_base_url(request)),
-    }
+async def trained_wake_words_catalog(request: Request, since: int | None = None, wait: float = 0.0):
+    """Serve the catalog with a strong ETag.
+
+    If-None-Match returns 304 when nothing changed. ``?since=<version>`` (or
+    If-None-Match) with ``wait=<seconds>`` long-polls until the catalog moves
+    on or the wait expires. Although this is a GET, a stale catalog is rebuilt
+    here, which writes hash-keyed model copies to ARTIFACT_CACHE_DIR and
+    prunes retired ones.
+    """
+
+    base_url = _advertised_base_url(request)
+    if_none_match = request.headers.get("if-none-match")
+    catalog = await asyncio.to_thread(_trained_wake_word_catalog)
+
+    def unchanged(current: Dict[str, Any]) -> bool:
+        if since is not None:
+            return int(current["version"]) <= since
+        return _etag_matches(if_none_match, _catalog_etag(current, base_url))
+
+    deadline = time.monotonic() + min(max(0.0, float(wait or 0.0)), CATALOG_LONG_POLL_MAX_SECONDS)
+    while unchanged(catalog) and time.monotonic() < deadline and not TRAINING_SHUTDOWN_EVENT.is_set():
+        if await request.is_disconnected():
+            break
+        await asyncio.sleep(CATALOG_LONG_POLL_INTERVAL_SECONDS)
+        catalog = await asyncio.to_thread(_trained_wake_word_catalog)
+
+    etag = _catalog_etag(catalog, base_url)
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "X-Catalog-Version": str(catalog["version"])}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(
+        {
+            "ok": True,
+            "base_url": base_url,
+            "version": catalog["version"],
+            "wake_words": _catalog_rows_with_base(catalog["rows"], base_url),
+        },
+        headers=headers,
+    )
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    for part in str(accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() not in {"gzip", "*"}:
+            continue
+        quality = params.replace(" ", "").lower()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _precompressed_artifact(digest: str, source: Path) -> Path | None:
+    """Return a gzip variant of a hashed artifact when it is actually smaller."""
+
+    target = ARTIFACT_CACHE_DIR / f"{digest}.tflite.gz"
+    if not target.is_file():
+        try:
+            ARTIFACT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            compressed = gzip.compress(source.read_bytes(), compresslevel=9, mtime=0)
+            temp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+            temp_path.write_bytes(compressed)
+            temp_path.replace(target)
+        except OSError:
+            return None
+    with contextlib.suppress(OSError):
+        if target.stat().st_size < source.stat().st_size:
+            return target
+    return None
+
+
+@app.get("/api/artifacts/{artifact}")
+def content_addressed_artifact(artifact: str, request: Request):
+    """Serve a packaged model by its SHA-256 so clients can cache it forever.
+
+    The body behind a hash never changes, so responses are immutable. Range
+    requests are honoured for the identity encoding, and a gzip variant is
+    sent to clients that accept it when compression actually helps.
+    """
+
+    match = ARTIFACT_NAME_PATTERN.match(artifact or "")
+    if match is None:
+        return JSONResponse({"ok": False, "error": "Unsupported artifact address."}, status_code=400)
+    digest = match.group(1)
+    # Only published models are served, and always from the hash-keyed copy.
+    artifact_path = ARTIFACT_CACHE_DIR / f"{digest}.tflite"
+    if digest not in _trained_wake_word_catalog()["artifacts"] or not artifact_path.is_file():
+        return JSONResponse({"ok": False, "error": "Wake word artifact not found."}, status_code=404)
+
+    etag = f'"{digest}"'
+    gzip_etag = f'"{digest}-gzip"'
+    headers = {"Cache-Control": ARTIFACT_IMMUTABLE_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if _etag_matches(if_none_match, etag) or _etag_matches(if_none_match, gzip_etag):
+        return Response(status_code=304, headers={**headers, "ETag": etag})
+    if (
+        ARTIFACT_PRECOMPRESS
+        and "range" not in request.headers
+        and _accepts_gzip(request.headers.get("accept-encoding"))
+    ):
+        compressed_path = _precompressed_artifact(digest, artifact_path)
+        if compressed_path is not None:
+            return FileResponse(
+                str(compressed_path),
+                media_type="application/octet-stream",
+                headers={**headers, "ETag": gzip_etag, "Content-Encoding": "gzip"},
+            )
+    return FileResponse(str(artifact_path), media_type="application/octet-stream", headers={**headers, "ETag": etag})
 
 
 @app.get("/api/trained_wake_words/{filename}")
-def trained_wake_word_artifact(filename: str):
+def trained_wake_word_artifact(filename: str, request: Request = None):
     safe_filename = Path(filename or "").name
     if not safe_filename or Path(safe_filename).suffix.lower() not in {".json", ".tflite"}:
         return JSONResponse({"ok": False, "error": "Unsupported wake word artifact."}, status_code=400)
@@ -3981,6 +5594,39 @@ def trained_wake_word_artifact(filename: str):
     artifact_path = TRAINED_WAKE_WORDS_DIR / safe_filename
     if not artifact_path.exists() or not artifact_path.is_file():
         return JSONResponse({"ok": False, "error": "Wake word artifact not found."}, status_code=404)
+    if_none_match = request.headers.get("if-none-match") if request is not None else None
+    # Mutable names are revalidated on every use; the ETag lets an unchanged
+    # model or package come back as 304 instead of a full transfer.
+    catalog = _trained_wake_word_catalog()
+    if artifact_path.suffix.lower() == ".tflite":
+        digest = next((sha for sha, name in catalog["artifacts"].items() if name == safe_filename), "")
+        if digest:
+            headers = {"ETag": f'"{digest}"', "Cache-Control": "no-cache"}
+            if _etag_matches(if_none_match, headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            return FileResponse(
+                str(artifact_path),
+                media_type="application/octet-stream",
+                filename=artifact_path.name,
+                headers=headers,
+            )
+    else:
+        row = next((row for row in catalog["rows"] if row["json_file"] == safe_filename), None)
+        metadata = None
+        if row is not None:
+            with contextlib.suppress(Exception):
+                metadata = json.loads(artifact_path.read_text(encoding="utf-8"))
+        if isinstance(metadata, dict):
+            metadata["model_sha256"] = row["model_sha256"]
+            metadata["model_hash_url"] = row["model_hash_url"]
+            body = json.dumps(metadata, indent=2).encode("utf-8")
+            headers = {
+                "ETag": f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+                "Cache-Control": "no-cache",
+            }
+            if _etag_matches(if_none_match, headers["ETag"]):
+                return Response(status_code=304, headers=headers)
+            return Response(content=body, media_type="application/json", headers=headers)
     media_type = "application/json" if artifact_path.suffix.lower() == ".json" else "application/octet-stream"
     return FileResponse(str(artifact_path), media_type=media_type, filename=artifact_path.name)
 
@@ -4080,7 +5726,428 @@ def train_now(payload: Dict[str, Any] = None):
 @app.get("/api/train_status")
 def train_status():
     with STATE_LOCK:
-        return {"ok": True, "training": dict(STATE["training"])}
+        training = dict(STATE["training"])
+    start_seq = int(training.get("log_start_seq") or 0)
+    training["log_lines"] = _training_log_tail(start_seq)
+    tts_progress = [event for event in _training_events_after(start_seq - 1) if event["type"] == "tts_progress"]
+    training["tts_progress"] = (
+        {key: value for key, value in tts_progress[-1].items() if key not in {"seq", "type"}} if tts_progress else None
+    )
+    return {"ok": True, "training": training}
+
+
+def _format_sse_event(event: Dict[str, Any]) -> str:
+    data = {key: value for key, value in event.items() if key != "type"}
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.get("/api/train/events")
+async def train_events(request: Request, after: int | None = None):
+    """Stream training log lines and stage/progress events as SSE.
+
+    Clients resume with ?after=<seq> or the Last-Event-ID header; a "gap"
+    event reports lines that already fell out of the ring buffer. Sequence
+    numbers restart with the server, so an id newer than anything published
+    gets a "reset" event (id 0) and the stream replays the buffer from the start.
+    """
+
+    last_event_id = request.headers.get("last-event-id")
+    if after is None:
+        after = _parse_int(last_event_id)
+    if after is None:
+        with STATE_LOCK:
+            after = int(STATE["training"].get("log_start_seq") or 1) - 1
+
+    async def stream():
+        last_seq = max(0, int(after))
+        wake = asyncio.Event()
+        with TRAINING_EVENT_LOCK:
+            TRAINING_EVENT_WAITERS[wake] = asyncio.get_running_loop()
+        try:
+            yield "retry: 2000\n\n"
+            latest_seq = _latest_training_event_seq()
+            if last_seq > latest_seq:
+                yield _format_sse_event({"seq": 0, "type": "reset", "requested_after": last_seq, "latest": latest_seq})
+                last_seq = 0
+            while True:
+                # Cleared before reading, so an event published after the read
+                # sets it again and the wait below returns at once.
+                wake.clear()
+                events = _training_events_after(last_seq)
+                if events and events[0]["seq"] > last_seq + 1 and last_seq > 0:
+                    yield _format_sse_event(
+                        {"seq": events[0]["seq"] - 1, "type": "gap", "missed_from": last_seq + 1, "missed_to": events[0]["seq"] - 1}
+                    )
+                for event in events:
+                    yield _format_sse_event(event)
+                    last_seq = event["seq"]
+                if TRAINING_SHUTDOWN_EVENT.is_set() or await request.is_disconnected():
+                    break
+                if events:
+                    continue
+                try:
+                    await asyncio.wait_for(wake.wait(), timeout=TRAINING_EVENT_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+        finally:
+            with TRAINING_EVENT_LOCK:
+                TRAINING_EVENT_WAITERS.pop(wake, None)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _run_profile_stage_walls(profile: Dict[str, Any]) -> Dict[str, float]:
+    walls: Dict[str, float] = {}
+    for stage in profile.get("stages") or []:
+        if isinstance(stage, dict) and stage.get("stage"):
+            name = str(stage["stage"])
+            walls[name] = walls.get(name, 0.0) + float(stage.get("wall_seconds") or 0.0)
+    return walls
+
+
+@app.get("/api/train/profiles")
+def list_run_profiles(limit: int = 10):
+    """Newest run profiles first, each with per-stage wall-time deltas vs the run before it."""
+    limit = _bounded_int(limit, 10, 1, 50)
+    profiles: List[Dict[str, Any]] = []
+    for path in sorted(RUN_PROFILE_DIR.glob(f"*{RUN_PROFILE_SUFFIX}"), reverse=True):
+        profile = _read_json_object(path)
+        if not profile:
+            continue
+        profile["file"] = path.name
+        profiles.append(profile)
+        if len(profiles) > limit:
+            break
+    for current, previous in zip(profiles, profiles[1:]):
+        previous_walls = _run_profile_stage_walls(previous)
+        current["stage_wall_delta_seconds"] = {
+            name: round(wall - previous_walls[name], 3)
+            for name, wall in _run_profile_stage_walls(current).items()
+            if name in previous_walls
+        }
+    return {"ok": True, "profiles": profiles[:limit]}
+
+
+@app.get("/api/train/jobs")
+def list_training_jobs():
+    with TRAINING_QUEUE_LOCK:
+        jobs = [_public_training_job(job) for job in sorted(TRAINING_QUEUE, key=lambda job: int(job.get("sequence") or 0))]
+    with STATE_LOCK:
+        running_job_id = STATE["training"].get("job_id") if STATE["training"]["running"] else None
+    return {"ok": True, "jobs": jobs, "running_job_id": running_job_id}
+
+
+@app.post("/api/train/jobs")
+def create_training_job(payload: Dict[str, Any] = None):
+    payload = payload or {}
+    if TRAINING_SHUTDOWN_EVENT.is_set():
+        return JSONResponse(
+            {"ok": False, "error": "WakeWord Trainer is shutting down."},
+            status_code=503,
+        )
+    wake_phrase = str(payload.get("wake_phrase") or payload.get("phrase") or "").strip()
+    if not wake_phrase:
+        return JSONResponse({"ok": False, "error": "wake_phrase is required"}, status_code=400)
+    if not Path(TRAIN_SCRIPT).exists():
+        return JSONResponse({"ok": False, "error": f"TRAIN_SCRIPT not found: {TRAIN_SCRIPT}"}, status_code=500)
+
+    language = _normalize_language(payload.get("language"))
+    tts_mode = _resolve_tts_mode_for_language(
+        payload.get("tts_mode", DEFAULT_SERVER_TTS_MODE),
+        language,
+        _available_languages(),
+    )
+    english_accent = normalize_english_accent(
+        payload.get("english_accent", DEFAULT_SERVER_ENGLISH_ACCENT), language
+    )
+    priority = _bounded_int(payload.get("priority"), 0, -100, 100)
+    job = _enqueue_training_job(wake_phrase, language, tts_mode, english_accent, priority)
+    return {"ok": True, "job": job}
+
+
+@app.get("/api/train/jobs/{job_id}")
+def get_training_job(job_id: str):
+    with TRAINING_QUEUE_LOCK:
+        job = _training_job_locked(job_id)
+        if job is None:
+            return JSONResponse({"ok": False, "error": "Training job not found."}, status_code=404)
+        return {"ok": True, "job": _public_training_job(job)}
+
+
+@app.get("/api/train/jobs/{job_id}/log")
+def get_training_job_log(job_id: str, tail: int = 250):
+    with TRAINING_QUEUE_LOCK:
+        if _training_job_locked(job_id) is None:
+            return JSONResponse({"ok": False, "error": "Training job not found."}, status_code=404)
+    log_path = _training_job_log_path(job_id)
+    try:
+        lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+    except FileNotFoundError:
+        lines = []
+    limit = _bounded_int(tail, 250, 1, 5000)
+    return {"ok": True, "job_id": job_id, "log_lines": lines[-limit:], "line_count": len(lines)}
+
+
+@app.delete("/api/train/jobs/{job_id}")
+def cancel_training_job(job_id: str):
+    job = _cancel_training_job(job_id)
+    if job is None:
+        return JSONResponse({"ok": False, "error": "Training job not found."}, status_code=404)
+    return {"ok": True, "job": job}
+
+
+def _worker_unauthorized() -> JSONResponse:
+    return JSONResponse({"ok": False, "error": "Unknown worker or bad worker token."}, status_code=401)
+
+
+@app.post("/api/workers/register")
+def register_training_worker(payload: Dict[str, Any] = None):
+    payload = payload or {}
+    if not TRAINING_WORKER_SECRET:
+        return JSONResponse(
+            {"ok": False, "error": "Remote workers are disabled. Set TRAINING_WORKER_SECRET to enable them."},
+            status_code=403,
+        )
+    if not secrets.compare_digest(str(payload.get("secret") or ""), TRAINING_WORKER_SECRET):
+        return JSONResponse({"ok": False, "error": "Bad worker secret."}, status_code=401)
+    token = secrets.token_urlsafe(32)
+    # A worker the server no longer knows (its registry was lost) may reclaim
+    # its old id, and with it any job still leased to that id.
+    reclaimed = str(payload.get("worker_id") or "")
+    with TRAINING_QUEUE_LOCK:
+        if re.fullmatch(r"[0-9a-f]{12}", reclaimed) and reclaimed not in TRAINING_WORKERS:
+            worker_id = reclaimed
+        else:
+            worker_id = secrets.token_hex(6)
+        TRAINING_WORKERS[worker_id] = {
+            "id": worker_id,
+            "name": str(payload.get("name") or worker_id).strip()[:80],
+            "token_sha256": _worker_token_sha256(token),
+            "registered_at": _iso_now(),
+            "last_seen_at": _iso_now(),
+        }
+        _save_training_workers_locked()
+    return {
+        "ok": True,
+        "worker_id": worker_id,
+        "token": token,
+        "lease_seconds": TRAINING_WORKER_LEASE_SECONDS,
+    }
+
+
+@app.get("/api/workers")
+def list_training_workers():
+    with TRAINING_QUEUE_LOCK:
+        workers = [
+            {
+                **{key: value for key, value in worker.items() if key != "token_sha256"},
+                "job_id": next(
+                    (
+                        job["id"]
+                        for job in TRAINING_QUEUE
+                        if job.get("status") == "running" and job.get("worker_id") == worker_id
+                    ),
+                    None,
+                ),
+            }
+            for worker_id, worker in TRAINING_WORKERS.items()
+        ]
+    return {"ok": True, "executor": TRAINING_EXECUTOR, "workers": workers}
+
+
+@app.post("/api/workers/{worker_id}/lease")
+def lease_training_job(worker_id: str, x_worker_token: str | None = Header(default=None)):
+    if _authorized_training_worker(worker_id, x_worker_token) is None:
+        return _worker_unauthorized()
+    if TRAINING_EXECUTOR != "remote" or TRAINING_SHUTDOWN_EVENT.is_set():
+        return {"ok": True, "job": None}
+    with TRAINING_QUEUE_LOCK:
+        job = _next_queued_training_job_locked()
+        if job is None:
+            return {"ok": True, "job": None}
+        job.update(
+            status="running",
+            worker_id=worker_id,
+            started_at=_iso_now(),
+            finished_at="",
+            exit_code=None,
+            error="",
+            artifacts=[],
+        )
+        _renew_worker_lease_locked(job)
+        _save_training_queue_locked()
+        leased = dict(job)
+    with contextlib.suppress(OSError):
+        _training_job_log_path(leased["id"]).unlink()
+    shutil.rmtree(_training_job_staging_dir(leased["id"]), ignore_errors=True)
+    return {"ok": True, "job": leased, "manifest": _training_job_manifest(leased)}
+
+
+@app.get("/api/workers/{worker_id}/jobs/{job_id}/files/{kind}/{filename}")
+def download_training_job_file(
+    worker_id: str,
+    job_id: str,
+    kind: str,
+    filename: str,
+    x_worker_token: str | None = Header(default=None),
+):
+    if _authorized_training_worker(worker_id, x_worker_token) is None:
+        return _worker_unauthorized()
+    with TRAINING_QUEUE_LOCK:
+        if _worker_job_locked(worker_id, job_id) is None:
+            return JSONResponse({"ok": False, "error": "Job is not leased to this worker."}, status_code=409)
+    directory = {"personal": PERSONAL_DIR, "negative": NEGATIVE_DIR}.get(kind)
+    safe_filename = Path(filename).name
+    if directory is None or safe_filename != filename or not safe_filename.endswith(".wav"):
+        return JSONResponse({"ok": False, "error": "Unknown sample."}, status_code=404)
+    path = directory / safe_filename
+    if not path.is_file():
+        return JSONResponse({"ok": False, "error": "Unknown sample."}, status_code=404)
+    return FileResponse(str(path), media_type="audio/wav", filename=safe_filename)
+
+
+@app.post("/api/workers/{worker_id}/jobs/{job_id}/log")
+def append_training_job_log(
+    worker_id: str,
+    job_id: str,
+    payload: Dict[str, Any] = None,
+    x_worker_token: str | None = Header(default=None),
+):
+    if _authorized_training_worker(worker_id, x_worker_token) is None:
+        return _worker_unauthorized()
+    lines = [str(line).rstrip("\n") for line in (payload or {}).get("lines") or []]
+    with TRAINING_QUEUE_LOCK:
+        job = _worker_job_locked(worker_id, job_id)
+        if job is None:
+            return JSONResponse({"ok": False, "error": "Job is not leased to this worker."}, status_code=409)
+        cancelled = job.get("status") == "cancelled"
+        if not cancelled:
+            _renew_worker_lease_locked(job)
+            _save_training_queue_locked()
+    if lines:
+        log_path = _training_job_log_path(job_id)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        with log_path.open("a", encoding="utf-8") as log_file:
+            log_file.write("\n".join(lines) + "\n")
+    return {"ok": True, "cancel": cancelled}
+
+
+@app.post("/api/workers/{worker_id}/jobs/{job_id}/artifacts")
+async def upload_training_job_artifact(
+    worker_id: str,
+    job_id: str,
+    file: UploadFile = File(...),
+    x_worker_token: str | None = Header(default=None),
+):
+    if _authorized_training_worker(worker_id, x_worker_token) is None:
+        return _worker_unauthorized()
+    with TRAINING_QUEUE_LOCK:
+        job = _worker_job_locked(worker_id, job_id)
+        allowed = _training_job_artifact_names(job) if job is not None and job.get("status") == "running" else []
+    if not allowed:
+        return JSONResponse({"ok": False, "error": "Job is not leased to this worker."}, status_code=409)
+    filename = Path(file.filename or "").name
+    if filename not in allowed:
+        return JSONResponse(
+            {"ok": False, "error": f"Unexpected artifact '{filename}'. Expected one of: {', '.join(allowed)}"},
+            status_code=400,
+        )
+    # Staged, not published: a worker whose lease expires mid-upload must not
+    # overwrite the model another worker (or the local trainer) produced.
+    staging_dir = _training_job_staging_dir(job_id)
+    staging_dir.mkdir(parents=True, exist_ok=True)
+    artifact_path = staging_dir / filename
+    temp_path = artifact_path.with_name(f".{filename}.upload")
+    temp_path.write_bytes(await file.read())
+    temp_path.replace(artifact_path)
+    with TRAINING_QUEUE_LOCK:
+        job = _worker_job_locked(worker_id, job_id)
+        if job is None or job.get("status") != "running":
+            return JSONResponse({"ok": False, "error": "Job is not leased to this worker."}, status_code=409)
+        if filename not in job.setdefault("artifacts", []):
+            job["artifacts"].append(filename)
+            _save_training_queue_locked()
+    return {"ok": True, "artifact": filename, "bytes": artifact_path.stat().st_size}
+
+
+def _promote_training_job_artifacts_locked(job: Dict[str, Any]) -> List[Path]:
+    """Move a finished job's staged uploads into TRAINED_WAKE_WORDS_DIR.
+
+    The caller holds TRAINING_QUEUE_LOCK and has checked the lease, so a
+    requeued job cannot publish. The .tflite goes last: it is the file the
+    catalog keys on, and its metadata is already in place when it appears.
+    """
+
+    staging_dir = _training_job_staging_dir(str(job["id"]))
+    TRAINED_WAKE_WORDS_DIR.mkdir(parents=True, exist_ok=True)
+    promoted = []
+    for name in sorted(_training_job_artifact_names(job), key=lambda item: item.endswith(".tflite")):
+        target = TRAINED_WAKE_WORDS_DIR / name
+        os.replace(staging_dir / name, target)
+        promoted.append(target)
+    return promoted
+
+
+@app.post("/api/workers/{worker_id}/jobs/{job_id}/complete")
+def complete_training_job(
+    worker_id: str,
+    job_id: str,
+    payload: Dict[str, Any] = None,
+    x_worker_token: str | None = Header(default=None),
+):
+    if _authorized_training_worker(worker_id, x_worker_token) is None:
+        return _worker_unauthorized()
+    payload = payload or {}
+    rc = _parse_int(payload.get("exit_code"))
+    rc = 999 if rc is None else rc
+    with TRAINING_QUEUE_LOCK:
+        job = _worker_job_locked(worker_id, job_id)
+        if job is None:
+            return JSONResponse({"ok": False, "error": "Job is not leased to this worker."}, status_code=409)
+        if job.get("status") != "running":
+            shutil.rmtree(_training_job_staging_dir(job_id), ignore_errors=True)
+            return {"ok": True, "job": _public_training_job(job)}
+        missing = [name for name in _training_job_artifact_names(job) if name not in job.get("artifacts", [])]
+        error = str(payload.get("error") or "")
+        promoted: List[Path] = []
+        if rc == 0 and not missing:
+            try:
+                promoted = _promote_training_job_artifacts_locked(job)
+            except OSError as exc:
+                missing = list(_training_job_artifact_names(job))
+                error = f"Could not publish uploaded artifacts: {exc}"
+        elif rc == 0:
+            error = f"Worker finished without uploading: {', '.join(missing)}"
+        finished = dict(job)
+    shutil.rmtree(_training_job_staging_dir(job_id), ignore_errors=True)
+    for path in promoted:
+        _note_managed_usage_change(path)
+    if promoted:
+        _invalidate_trained_wake_word_catalog()
+    status = "succeeded" if rc == 0 and not missing else "failed"
+    _finish_training_job(job_id, status, exit_code=rc, error=error)
+    if finished.get("auto_run"):
+        succeeded = status == "succeeded"
+        log_path = _training_job_log_path(job_id)
+
+        def job_log(line: str) -> None:
+            with log_path.open("a", encoding="utf-8") as log_file:
+                log_file.write(line + "\n")
+
+        _finish_auto_training_run(
+            finished["safe_word"],
+            rc,
+            int(finished.get("pending_negatives_consumed") or 0) if succeeded else 0,
+            publish=succeeded,
+            log=job_log,
+        )
+    with TRAINING_QUEUE_LOCK:
+        job = _training_job_locked(job_id)
+        return {"ok": True, "job": _public_training_job(job) if job is not None else finished}
 
 
 @app.post("/api/reset_recordings")
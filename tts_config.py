@@ -7,6 +7,7 @@ large model environments have been installed.
 
 from __future__ import annotations
 
+import math
 from typing import Iterable
 
 
@@ -276,3 +277,106 @@ def distribute_samples(total: int, engines: Iterable[str]) -> dict[str, int]:
         engine: quotient + (1 if index < remainder else 0)
         for index, engine in enumerate(ordered)
     }
+
+
+def estimate_plan_seconds(
+    plan: dict[str, int],
+    throughput: dict[str, float],
+    acceptance: dict[str, float],
+) -> float:
+    """Wall time of ``plan`` for the engines that have measurements.
+
+    Engines run one after another, so an engine contributes the time it needs
+    to synthesize enough candidates for its share to survive QA.
+    """
+
+    return sum(
+        count / (throughput[engine] * acceptance[engine])
+        for engine, count in plan.items()
+        if throughput.get(engine, 0) > 0 and acceptance.get(engine, 0) > 0
+    )
+
+
+def parse_diversity_floors(value: str) -> dict[str, float]:
+    """Parse MWW_TTS_DIVERSITY_FLOOR, e.g. ``omnivoice:0.8,piper:0.3``.
+
+    Each floor is the share of its even split an engine keeps. A bare number
+    sets the floor for every engine not listed (stored under ``"*"``).
+    Engines without a floor keep their whole even share.
+    """
+
+    floors: dict[str, float] = {}
+    for item in str(value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        engine, _, share = item.rpartition(":")
+        floors[engine.strip().lower() or "*"] = min(1.0, max(0.0, float(share)))
+    return floors
+
+
+def plan_engine_allocation(
+    total: int,
+    engines: Iterable[str],
+    throughput: dict[str, float],
+    acceptance: dict[str, float],
+    *,
+    diversity_floor: float | dict[str, float] = 1.0,
+    deadline_seconds: float | None = None,
+) -> dict[str, int]:
+    """Split ``total`` across engines so the corpus is finished in minimum wall time.
+
+    ``throughput`` is candidates per second and ``acceptance`` the share of
+    candidates that pass QA, both measured on earlier runs. Every measured
+    engine keeps at least its ``diversity_floor`` (one value, or a map from
+    parse_diversity_floors) of its even share, and the rest goes to the
+    engine with the most accepted samples per second; engines without
+    measurements keep their even share. The default floor of 1.0 keeps the
+    even split. With a deadline the floors are lowered, never below zero,
+    until the measured estimate fits. MOSS only clones carriers accepted from
+    the other engines, so it never gets more than they do together.
+    """
+
+    even = distribute_samples(total, engines)
+    ordered = list(even)
+    measured = [
+        engine
+        for engine in ordered
+        if throughput.get(engine, 0) > 0 and acceptance.get(engine, 0) > 0
+    ]
+    if not measured:
+        return even
+    effective = {engine: throughput[engine] * acceptance[engine] for engine in measured}
+    fastest = max(measured, key=lambda engine: (effective[engine], -ordered.index(engine)))
+
+    def allocate(floors: dict[str, float]) -> dict[str, int]:
+        plan = {
+            engine: min(even[engine], math.ceil(even[engine] * floors[engine])) if engine in measured else even[engine]
+            for engine in ordered
+        }
+        plan[fastest] += total - sum(plan.values())
+        carriers = sum(count for engine, count in plan.items() if engine != ENGINE_MOSS)
+        if ENGINE_MOSS in plan and plan[ENGINE_MOSS] > carriers and len(plan) > 1:
+            excess = math.ceil((plan[ENGINE_MOSS] - carriers) / 2)
+            target = max(
+                (engine for engine in ordered if engine != ENGINE_MOSS),
+                key=lambda engine: (effective.get(engine, 0.0), -ordered.index(engine)),
+            )
+            plan[ENGINE_MOSS] -= excess
+            plan[target] += excess
+        return plan
+
+    configured = diversity_floor if isinstance(diversity_floor, dict) else {"*": diversity_floor}
+    floors = {
+        engine: min(1.0, max(0.0, float(configured.get(engine, configured.get("*", 1.0)))))
+        for engine in measured
+    }
+    plan = allocate(floors)
+    while (
+        deadline_seconds is not None
+        and any(floor > 0 for floor in floors.values())
+        and estimate_plan_seconds(plan, throughput, acceptance) > deadline_seconds
+    ):
+        floors = {engine: max(0.0, round(floor - 0.1, 6)) for engine, floor in floors.items()}
+        plan = allocate(floors)
+    return plan